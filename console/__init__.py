@@ -0,0 +1,6 @@
+"""
+Backend / Model API 콘솔 도구
+
+Streamlit 콘솔(test_streamlit.py)과 운영 스크립트가 공통으로 사용하는
+API 클라이언트 및 보조 모듈 패키지입니다.
+"""
@@ -0,0 +1,7 @@
+"""python -m console 진입점 (console.cli 참고)"""
+import sys
+
+from console.cli import main
+
+
+sys.exit(main())
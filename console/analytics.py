@@ -0,0 +1,287 @@
+"""
+게시판 참여도 분석
+
+스냅샷(JSON 파일 또는 열 단위 저장소)의 게시글 / 댓글을 NumPy 배열로 읽어
+참여도 지표를 반복문 없이 배열 연산으로 계산합니다. 게시글 10만 개도 수십 ms 안에 계산됩니다.
+
+- 요약: 게시글 / 댓글 수, 좋아요 / 조회수 합계, 좋아요 / 조회수 비율, 게시글당 댓글 수 분포
+- 상위 N개 게시글 (좋아요, 조회수, 댓글 수, 좋아요 / 조회수 비율)
+- 작성자별 집계 (게시글 수, 좋아요 / 조회수 / 댓글 합계)
+- 일별 댓글 감성 분포
+- 이미지 분류(강아지 / 고양이) 비율
+
+numpy / pyarrow는 이 모듈의 함수를 호출할 때 import합니다.
+"""
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence
+
+
+NO_IMAGE = "(없음)"
+TOP_METRICS = ("likes", "views", "comments", "ratio")
+
+
+class BoardArrays(NamedTuple):
+    """
+    게시판 배열 (게시글 / 댓글 행별)
+
+    문자열 열은 코드(int32, 없으면 -1)와 값 목록으로 나누어 저장합니다.
+    title_of(rows)는 행 번호 목록의 제목을 반환합니다 (열 단위 저장소는 해당 행만 읽음).
+    """
+    post_id: Any
+    likes: Any
+    views: Any
+    comments: Any
+    created: Any
+    author: Any
+    authors: Sequence[str]
+    image: Any
+    image_classes: Sequence[str]
+    comment_post: Any
+    comment_created: Any
+    comment_label: Any
+    labels: Sequence[str]
+    title_of: Callable[[List[int]], List[Optional[str]]]
+
+
+# ============================================================================
+# 읽기
+# ============================================================================
+
+def _codes(values: List[Optional[str]]):
+    """문자열 목록 → (코드 배열, 값 목록) - 없는 값은 -1"""
+    import numpy as np
+
+    mapping: Dict[str, int] = {}
+    codes = np.fromiter((-1 if value is None else mapping.setdefault(value, len(mapping)) for value in values),
+                        dtype=np.int32, count=len(values))
+    return codes, list(mapping)
+
+
+def _times(values: List[Optional[str]]):
+    """ISO 시각 문자열 목록 → datetime64[s] (없거나 해석할 수 없으면 NaT)"""
+    import numpy as np
+
+    try:
+        return np.array(values, dtype="datetime64[s]")
+    except ValueError:
+        from console.columnar import parse_time
+
+        seconds = [parse_time(value) for value in values]
+        return np.array([s if s is not None else np.datetime64("NaT") for s in seconds], dtype="datetime64[s]")
+
+
+def _ints(values: List[Optional[int]]):
+    import numpy as np
+
+    return np.fromiter((value or 0 for value in values), dtype=np.int64, count=len(values))
+
+
+def from_board(board: Dict[str, Any]) -> BoardArrays:
+    """스냅샷 dict → 배열"""
+    posts = board.get("posts", [])
+    comments = board.get("comments", [])
+    author, authors = _codes([post.get("nickname") for post in posts])
+    image, image_classes = _codes([post.get("image_class") for post in posts])
+    label, labels = _codes([(comment.get("sentiment") or {}).get("label") for comment in comments])
+    titles = [post.get("title") for post in posts]
+    return BoardArrays(
+        post_id=_ints([post.get("post_id") for post in posts]),
+        likes=_ints([post.get("like_count") for post in posts]),
+        views=_ints([post.get("view_count") for post in posts]),
+        comments=_ints([post.get("comment_count") for post in posts]),
+        created=_times([post.get("created_at") for post in posts]),
+        author=author,
+        authors=authors,
+        image=image,
+        image_classes=image_classes,
+        comment_post=_ints([comment.get("post_id") for comment in comments]),
+        comment_created=_times([comment.get("created_at") for comment in comments]),
+        comment_label=label,
+        labels=labels,
+        title_of=lambda rows: [titles[row] for row in rows],
+    )
+
+
+def _numpy(column, fill=0):
+    """pyarrow 열 → NumPy 배열 (null은 fill)"""
+    import pyarrow.compute as pc
+
+    return pc.fill_null(column, fill).to_numpy()
+
+
+def _dictionary(column):
+    """사전 열 → (코드 배열, 값 목록)"""
+    import pyarrow as pa
+
+    indices = pa.chunked_array([chunk.indices for chunk in column.chunks], pa.int32())
+    values = column.chunk(0).dictionary.to_pylist() if column.num_chunks else []
+    return _numpy(indices, -1), values
+
+
+def from_columnar(store) -> BoardArrays:
+    """열 단위 저장소(console.columnar.ColumnarSnapshot) → 배열 (텍스트 파일은 제목을 볼 때만 읽음)"""
+    posts, comments = store.posts, store.comments
+    author, authors = _dictionary(posts.column("nickname"))
+    image, image_classes = _dictionary(posts.column("image_class"))
+    label, labels = _dictionary(comments.column("sentiment"))
+
+    def title_of(rows: List[int]) -> List[Optional[str]]:
+        return store.post_text.column("title").take(rows).to_pylist()
+
+    return BoardArrays(
+        post_id=_numpy(posts.column("post_id")),
+        likes=_numpy(posts.column("like_count")),
+        views=_numpy(posts.column("view_count")),
+        comments=_numpy(posts.column("comment_count")),
+        created=posts.column("created_at").to_numpy(),
+        author=author,
+        authors=authors,
+        image=image,
+        image_classes=image_classes,
+        comment_post=_numpy(comments.column("post_id")),
+        comment_created=comments.column("created_at").to_numpy(),
+        comment_label=label,
+        labels=labels,
+        title_of=title_of,
+    )
+
+
+def load(path: str) -> BoardArrays:
+    """스냅샷 파일 또는 열 단위 저장소 경로 → 배열"""
+    from console import columnar, snapshot
+
+    if columnar.is_store(path):
+        return from_columnar(columnar.open_store(path))
+    return from_board(snapshot.load(path))
+
+
+# ============================================================================
+# 지표
+# ============================================================================
+
+def like_view_ratio(arrays: BoardArrays):
+    """게시글별 좋아요 / 조회수 비율 (조회수 0이면 NaN)"""
+    import numpy as np
+
+    views = arrays.views.astype(np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(views > 0, arrays.likes / views, np.nan)
+
+
+def summary(arrays: BoardArrays) -> Dict[str, Any]:
+    """전체 요약"""
+    import numpy as np
+
+    posts = len(arrays.post_id)
+    ratio = like_view_ratio(arrays)
+    comments = arrays.comments
+    total_views = int(arrays.views.sum())
+    return {
+        "posts": posts,
+        "comments": len(arrays.comment_post),
+        "likes": int(arrays.likes.sum()),
+        "views": total_views,
+        "like_view_ratio": float(arrays.likes.sum() / total_views) if total_views else None,
+        "mean_post_ratio": float(np.nanmean(ratio)) if posts and not np.isnan(ratio).all() else None,
+        "comments_per_post": float(comments.mean()) if posts else None,
+        "comments_median": float(np.median(comments)) if posts else None,
+        "comments_p90": float(np.percentile(comments, 90)) if posts else None,
+        "no_comment_share": float((comments == 0).mean()) if posts else None,
+    }
+
+
+def top_posts(arrays: BoardArrays, n: int = 10, by: str = "likes") -> List[Dict[str, Any]]:
+    """
+    지표 상위 n개 게시글 (내림차순, 같으면 최신 게시글 우선)
+
+    Raises:
+        ValueError: 지원하지 않는 지표
+    """
+    import numpy as np
+
+    if by not in TOP_METRICS:
+        raise ValueError(f"지원하지 않는 지표: {by} (가능: {', '.join(TOP_METRICS)})")
+    ratio = like_view_ratio(arrays)
+    values = {"likes": arrays.likes, "views": arrays.views, "comments": arrays.comments,
+              "ratio": np.nan_to_num(ratio, nan=-1.0)}[by]
+    n = min(n, len(values))
+    if n <= 0:
+        return []
+    candidates = np.argpartition(-values, n - 1)[:n] if n < len(values) else np.arange(len(values))
+    # 같은 값이 경계에 걸리면 argpartition이 임의로 고르므로 경계 값 이상을 모두 후보로 둠
+    candidates = np.flatnonzero(values >= values[candidates].min())
+    order = np.lexsort((-arrays.post_id[candidates], -values[candidates]))[:n]
+    rows = candidates[order].tolist()
+    titles = arrays.title_of(rows)
+    return [{
+        "post_id": int(arrays.post_id[row]),
+        "title": title,
+        "nickname": arrays.authors[arrays.author[row]] if arrays.author[row] >= 0 else None,
+        "likes": int(arrays.likes[row]),
+        "views": int(arrays.views[row]),
+        "comments": int(arrays.comments[row]),
+        "ratio": None if np.isnan(ratio[row]) else round(float(ratio[row]), 4),
+    } for row, title in zip(rows, titles)]
+
+
+def by_author(arrays: BoardArrays, n: int = 20) -> List[Dict[str, Any]]:
+    """작성자별 집계 상위 n명 (좋아요 합계 내림차순)"""
+    import numpy as np
+
+    known = arrays.author >= 0
+    codes = arrays.author[known]
+    size = len(arrays.authors)
+    posts = np.bincount(codes, minlength=size)
+    likes = np.bincount(codes, weights=arrays.likes[known], minlength=size)
+    views = np.bincount(codes, weights=arrays.views[known], minlength=size)
+    comments = np.bincount(codes, weights=arrays.comments[known], minlength=size)
+    order = np.lexsort((-posts, -likes))[:n]
+    return [{
+        "nickname": arrays.authors[code],
+        "posts": int(posts[code]),
+        "likes": int(likes[code]),
+        "views": int(views[code]),
+        "comments": int(comments[code]),
+        "likes_per_post": round(float(likes[code] / posts[code]), 2),
+    } for code in order.tolist() if posts[code]]
+
+
+def sentiment_by_day(arrays: BoardArrays) -> Dict[str, Dict[str, int]]:
+    """일별 댓글 감성 라벨 수 - st.bar_chart용 {"positive": {"2024-01-01": 3, ...}}"""
+    import numpy as np
+
+    valid = (arrays.comment_label >= 0) & ~np.isnat(arrays.comment_created)
+    days = arrays.comment_created[valid].astype("datetime64[D]")
+    labels = arrays.comment_label[valid]
+    unique_days, day_index = np.unique(days, return_inverse=True)
+    size = len(arrays.labels)
+    counts = np.bincount(day_index * size + labels, minlength=len(unique_days) * size)
+    counts = counts.reshape(len(unique_days), size)
+    day_names = [str(day) for day in unique_days]
+    return {
+        label: dict(zip(day_names, counts[:, code].tolist()))
+        for code, label in enumerate(arrays.labels)
+    }
+
+
+def image_share(arrays: BoardArrays) -> Dict[str, Dict[str, float]]:
+    """이미지 분류별 게시글 수와 비율 (이미지 분류가 없는 게시글 포함)"""
+    import numpy as np
+
+    counts = np.bincount(arrays.image + 1, minlength=len(arrays.image_classes) + 1)
+    total = int(counts.sum())
+    names = [NO_IMAGE] + list(arrays.image_classes)
+    return {
+        name: {"posts": int(count), "share": round(float(count / total), 4) if total else 0.0}
+        for name, count in zip(names, counts.tolist())
+    }
+
+
+def report(arrays: BoardArrays, top: int = 10, by: str = "likes", authors: int = 20) -> Dict[str, Any]:
+    """전체 지표 (CLI / 탭에서 한 번에 사용)"""
+    return {
+        "summary": summary(arrays),
+        "top_posts": top_posts(arrays, top, by),
+        "authors": by_author(arrays, authors),
+        "sentiment_by_day": sentiment_by_day(arrays),
+        "image_share": image_share(arrays),
+    }
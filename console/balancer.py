@@ -0,0 +1,155 @@
+"""
+지연 시간 기반 레플리카 부하 분산
+
+서비스별 레플리카 목록에서 power-of-two-choices로 요청을 보낼 인스턴스를 고릅니다.
+- 무작위로 두 레플리카를 뽑아 점수(EWMA 지연 시간 × (진행 중 요청 + 1))가 낮은 쪽 선택
+- 연속 실패가 eject_after 이상이면 eject_for초 동안 제외 (이후 다시 시도)
+- 헬스 체크 결과(HealthProber 리스너)로도 제외 / 복구
+- 모든 레플리카가 제외되면 전체를 후보로 사용 (fail open)
+"""
+import random
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+
+DEFAULT_DECAY = 0.3
+DEFAULT_EJECT_AFTER = 3
+DEFAULT_EJECT_FOR = 30.0
+
+
+class Replica:
+    """레플리카 상태"""
+
+    __slots__ = ("url", "ewma", "outstanding", "consecutive_failures", "ejected_until",
+                 "requests", "failures")
+
+    def __init__(self, url: str):
+        self.url = url
+        self.ewma: Optional[float] = None
+        self.outstanding = 0
+        self.consecutive_failures = 0
+        self.ejected_until = 0.0
+        self.requests = 0
+        self.failures = 0
+
+    def ejected(self, now: float) -> bool:
+        return self.ejected_until > now
+
+    def score(self) -> float:
+        """
+        선택 점수 (낮을수록 우선)
+
+        아직 측정값이 없는 레플리카는 0으로 취급해 먼저 시도되도록 합니다.
+        """
+        return (self.ewma or 0.0) * (self.outstanding + 1)
+
+
+class ReplicaPool:
+    """
+    서비스 하나의 레플리카 풀
+
+    acquire()로 레플리카를 받고, 요청이 끝나면 release()로 결과를 알려야 합니다.
+    """
+
+    def __init__(self, urls: List[str], decay: float = DEFAULT_DECAY,
+                 eject_after: int = DEFAULT_EJECT_AFTER, eject_for: float = DEFAULT_EJECT_FOR,
+                 rng: Optional[random.Random] = None, clock=time.monotonic):
+        if not urls:
+            raise ValueError("레플리카가 하나 이상 필요합니다")
+        self.replicas = [Replica(url) for url in urls]
+        self.decay = decay
+        self.eject_after = eject_after
+        self.eject_for = eject_for
+        self._rng = rng or random.Random()
+        self._clock = clock
+        self._lock = threading.Lock()
+
+    @property
+    def urls(self) -> List[str]:
+        return [replica.url for replica in self.replicas]
+
+    def _find(self, url: str) -> Optional[Replica]:
+        for replica in self.replicas:
+            if replica.url == url:
+                return replica
+        return None
+
+    # =========================================================================
+    # 선택
+    # =========================================================================
+
+    def acquire(self) -> Replica:
+        """요청을 보낼 레플리카 선택 (진행 중 요청 수 증가)"""
+        with self._lock:
+            now = self._clock()
+            candidates = [r for r in self.replicas if not r.ejected(now)] or self.replicas
+            if len(candidates) == 1:
+                chosen = candidates[0]
+            else:
+                first, second = self._rng.sample(candidates, 2)
+                chosen = first if first.score() <= second.score() else second
+            chosen.outstanding += 1
+            chosen.requests += 1
+            return chosen
+
+    def release(self, replica: Replica, latency: float, ok: bool):
+        """
+        요청 결과 반영
+
+        Args:
+            latency: 요청 소요 시간 (초)
+            ok: 응답을 받았고 5xx가 아니면 True
+        """
+        with self._lock:
+            replica.outstanding = max(0, replica.outstanding - 1)
+            self._record(replica, latency if ok else None, ok)
+
+    def _record(self, replica: Replica, latency: Optional[float], ok: bool):
+        if ok:
+            replica.consecutive_failures = 0
+            replica.ejected_until = 0.0
+            if latency is not None:
+                if replica.ewma is None:
+                    replica.ewma = latency
+                else:
+                    replica.ewma = self.decay * latency + (1 - self.decay) * replica.ewma
+            return
+
+        replica.failures += 1
+        replica.consecutive_failures += 1
+        if replica.consecutive_failures >= self.eject_after:
+            replica.ejected_until = self._clock() + self.eject_for
+
+    # =========================================================================
+    # 헬스 체크 연동
+    # =========================================================================
+
+    def observe_probe(self, url: str, ok: bool):
+        """
+        헬스 체크 결과 반영
+
+        지연 시간은 실제 요청으로만 측정하고, 헬스 체크는 제외 / 복구에만 사용합니다.
+        """
+        with self._lock:
+            replica = self._find(url)
+            if replica is not None:
+                self._record(replica, None, ok)
+
+    # =========================================================================
+    # 조회
+    # =========================================================================
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """레플리카별 상태 요약"""
+        with self._lock:
+            now = self._clock()
+            return [{
+                "url": r.url,
+                "ewma_ms": r.ewma * 1000 if r.ewma is not None else None,
+                "outstanding": r.outstanding,
+                "ejected": r.ejected(now),
+                "consecutive_failures": r.consecutive_failures,
+                "requests": r.requests,
+                "failures": r.failures,
+            } for r in self.replicas]
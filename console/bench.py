@@ -0,0 +1,293 @@
+"""
+마이크로 벤치마크
+
+입력 검증(console.validators)과 응답 구조 검사 함수를 대량의 생성 데이터에 대해 측정합니다.
+- 코퍼스는 seed로 결정적으로 생성 (유효 / 무효 입력을 섞음)
+- repeat번 반복 측정 후 min / median / mean / stdev / p95, 행당 ns, 초당 처리 행 수 계산
+- 실행 결과는 JSONL 이력 파일에 한 줄씩 추가하고, 직전 실행과 비교
+
+사용 예:
+    python -m console bench --rows 1000000
+    python -m console bench --only email password --repeat 10
+"""
+import json
+import os
+import platform
+import random
+import string
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+from console import validators
+
+
+DEFAULT_ROWS = 100_000
+DEFAULT_REPEAT = 5
+DEFAULT_HISTORY = os.path.join("benchmarks", "history.jsonl")
+
+POSTS_PER_PAGE = 20
+
+
+class BenchResult(NamedTuple):
+    """벤치마크 결과 (시간은 초)"""
+    name: str
+    rows: int
+    repeat: int
+    min: float
+    median: float
+    mean: float
+    stdev: float
+    p95: float
+
+    @property
+    def ns_per_row(self) -> float:
+        return self.median / self.rows * 1e9 if self.rows else 0.0
+
+    @property
+    def rows_per_sec(self) -> float:
+        return self.rows / self.median if self.median > 0 else float("inf")
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "rows": self.rows,
+            "repeat": self.repeat,
+            "min_ms": round(self.min * 1000, 3),
+            "median_ms": round(self.median * 1000, 3),
+            "mean_ms": round(self.mean * 1000, 3),
+            "stdev_ms": round(self.stdev * 1000, 3),
+            "p95_ms": round(self.p95 * 1000, 3),
+            "ns_per_row": round(self.ns_per_row, 1),
+            "rows_per_sec": round(self.rows_per_sec),
+        }
+
+
+def run_benchmark(name: str, fn: Callable[[Any], Any], corpus: List[Any],
+                  repeat: int = DEFAULT_REPEAT, warmup: int = 1) -> BenchResult:
+    """
+    corpus 전체에 fn을 적용하는 시간을 repeat번 측정
+
+    timeit과 같이 측정 중에는 GC를 끕니다.
+    """
+    import gc
+    import statistics
+    from collections import deque
+
+    def once() -> float:
+        started = time.perf_counter()
+        # 반복문 오버헤드를 줄이기 위해 map 결과를 바로 버림
+        deque(map(fn, corpus), maxlen=0)
+        return time.perf_counter() - started
+
+    for _ in range(warmup):
+        once()
+
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        timings = sorted(once() for _ in range(max(1, repeat)))
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    return BenchResult(
+        name=name,
+        rows=len(corpus),
+        repeat=len(timings),
+        min=timings[0],
+        median=statistics.median(timings),
+        mean=statistics.fmean(timings),
+        stdev=statistics.stdev(timings) if len(timings) > 1 else 0.0,
+        p95=timings[min(len(timings) - 1, int(round(0.95 * (len(timings) - 1))))],
+    )
+
+
+# ============================================================================
+# 코퍼스 생성
+# ============================================================================
+
+_NAME_CHARS = string.ascii_lowercase + string.digits + "._%+-"
+_SPECIAL = "!@#$%^&*()-_=+[]{}|;:'\",.<>/?`~"
+_HANGUL = "가나다라마바사아자차카타파하동물감정일기"
+
+
+def _word(rng: random.Random, chars: str, low: int, high: int) -> str:
+    return "".join(rng.choice(chars) for _ in range(rng.randint(low, high)))
+
+
+def email_corpus(rows: int, seed: int = 0, invalid_ratio: float = 0.2) -> List[str]:
+    """이메일 코퍼스 (invalid_ratio 비율만큼 잘못된 형식)"""
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(rows):
+        email = f"{_word(rng, _NAME_CHARS, 3, 16)}@{_word(rng, string.ascii_lowercase, 3, 10)}.com"
+        if rng.random() < invalid_ratio:
+            email = rng.choice([
+                email.replace("@", ""),
+                email.replace(".com", ".c"),
+                email.replace("@", "@@"),
+                " " + email,
+                "",
+            ])
+        corpus.append(email)
+    return corpus
+
+
+def password_corpus(rows: int, seed: int = 0, invalid_ratio: float = 0.2) -> List[str]:
+    """비밀번호 코퍼스 (invalid_ratio 비율만큼 규칙 위반)"""
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(rows):
+        chars = [
+            rng.choice(string.ascii_uppercase),
+            rng.choice(string.ascii_lowercase),
+            rng.choice(string.digits),
+            rng.choice(_SPECIAL),
+        ] + [rng.choice(string.ascii_letters + string.digits) for _ in range(rng.randint(4, 16))]
+        rng.shuffle(chars)
+        password = "".join(chars)
+        if rng.random() < invalid_ratio:
+            password = rng.choice([
+                password[:5],
+                password * 2,
+                password.lower(),
+                "".join(c for c in password if c not in _SPECIAL),
+                "",
+            ])
+        corpus.append(password)
+    return corpus
+
+
+def nickname_corpus(rows: int, seed: int = 0, invalid_ratio: float = 0.2) -> List[str]:
+    """닉네임 코퍼스 (한글 / 영문, invalid_ratio 비율만큼 공백 포함 / 길이 초과)"""
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(rows):
+        nickname = _word(rng, _HANGUL + string.ascii_letters, 2, 10)
+        if rng.random() < invalid_ratio:
+            nickname = rng.choice([nickname + " 님", nickname * 3, "   ", ""])
+        corpus.append(nickname)
+    return corpus
+
+
+def posts_response_corpus(rows: int, seed: int = 0, invalid_ratio: float = 0.05) -> List[Dict[str, Any]]:
+    """게시글 목록 응답 코퍼스 (rows개 페이지, 페이지당 게시글 20개)"""
+    rng = random.Random(seed)
+    corpus = []
+    for page in range(rows):
+        posts = [{
+            "post_id": page * POSTS_PER_PAGE + i,
+            "title": f"게시글 {i}",
+            "content": "내용",
+            "nickname": "작성자",
+            "like_count": rng.randint(0, 100),
+            "view_count": rng.randint(0, 1000),
+        } for i in range(POSTS_PER_PAGE)]
+        if rng.random() < invalid_ratio:
+            del posts[rng.randrange(POSTS_PER_PAGE)]["title"]
+        corpus.append({"message": "get_posts_success",
+                       "data": {"posts": posts, "total": POSTS_PER_PAGE, "page": page + 1}})
+    return corpus
+
+
+def comments_response_corpus(rows: int, seed: int = 0, invalid_ratio: float = 0.05) -> List[Dict[str, Any]]:
+    """댓글 목록 응답 코퍼스 (rows개 응답, 응답당 댓글 0~20개)"""
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(rows):
+        comments = [{
+            "comment_id": i,
+            "content": "댓글",
+            "sentiment": {"label": rng.choice(["positive", "negative", "neutral"]), "confidence": rng.random()},
+        } for i in range(rng.randint(0, POSTS_PER_PAGE))]
+        if comments and rng.random() < invalid_ratio:
+            del comments[0]["content"]
+        corpus.append({"message": "get_comments_success", "data": {"comments": comments}})
+    return corpus
+
+
+# 이름 → (측정 함수, 코퍼스 생성 함수, 행 수 배율)
+# 응답 검사는 항목 하나가 수십 개 레코드이므로 행 수를 줄여 비슷한 시간이 되도록 함
+SUITE: Dict[str, tuple] = {
+    "email": (validators.validate_email, email_corpus, 1.0),
+    "password": (validators.validate_password, password_corpus, 1.0),
+    "nickname": (validators.validate_nickname, nickname_corpus, 1.0),
+    "posts_response": (validators.check_posts_response, posts_response_corpus, 0.05),
+    "comments_response": (validators.check_comments_response, comments_response_corpus, 0.05),
+}
+
+
+def run_suite(rows: int = DEFAULT_ROWS, repeat: int = DEFAULT_REPEAT, only: Optional[List[str]] = None,
+              seed: int = 0, on_result: Optional[Callable[[BenchResult], None]] = None) -> List[BenchResult]:
+    """
+    벤치마크 모음 실행
+
+    Raises:
+        KeyError: only에 없는 벤치마크 이름
+    """
+    names = only or list(SUITE)
+    for name in names:
+        if name not in SUITE:
+            raise KeyError(f"알 수 없는 벤치마크: {name} (가능: {', '.join(SUITE)})")
+
+    results = []
+    for name in names:
+        fn, make_corpus, scale = SUITE[name]
+        corpus = make_corpus(max(1, int(rows * scale)), seed)
+        result = run_benchmark(name, fn, corpus, repeat)
+        results.append(result)
+        if on_result is not None:
+            on_result(result)
+    return results
+
+
+# ============================================================================
+# 이력
+# ============================================================================
+
+def append_history(results: List[BenchResult], path: str = DEFAULT_HISTORY,
+                   meta: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """실행 결과를 JSONL 이력 파일에 한 줄 추가"""
+    entry = {
+        "timestamp": time.time(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        **(meta or {}),
+        "results": [result.to_dict() for result in results],
+    }
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+    return entry
+
+
+def load_history(path: str = DEFAULT_HISTORY) -> List[Dict[str, Any]]:
+    """이력 로드 (오래된 순, 손상된 줄은 건너뜀)"""
+    if not os.path.exists(path):
+        return []
+    history = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                history.append(json.loads(line))
+            except ValueError:
+                continue
+    return history
+
+
+def previous_result(history: List[Dict[str, Any]], name: str) -> Optional[Dict[str, Any]]:
+    """이력에서 name 벤치마크의 가장 최근 결과"""
+    for entry in reversed(history):
+        for result in entry.get("results", []):
+            if result.get("name") == name:
+                return result
+    return None
+
+
+def change_vs(result: BenchResult, previous: Optional[Dict[str, Any]]) -> Optional[float]:
+    """직전 결과 대비 행당 시간 변화율 (0.1 = 10% 느려짐, 비교 불가면 None)"""
+    if not previous or not previous.get("ns_per_row"):
+        return None
+    return round(result.ns_per_row / previous["ns_per_row"] - 1, 4)
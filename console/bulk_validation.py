@@ -0,0 +1,232 @@
+"""
+사용자 일괄 가져오기 검증 (열 단위)
+
+다른 커뮤니티에서 옮겨오는 사용자 CSV / Parquet 파일(email, password, nickname 열)을
+행 단위 Python 반복 대신 pandas 문자열 연산(pyarrow가 있으면 Arrow 문자열)으로 한꺼번에 검사합니다.
+
+- 규칙은 console.validators와 같음 (이메일 패턴, 비밀번호 8~20자 / 문자 종류, 닉네임 공백 / 10자)
+- 행마다 오류 비트마스크(uint16)를 만들고, 비트는 ERRORS 순서의 오류 하나에 대응
+- 오류 메시지는 validators.ERROR_MESSAGES(프론트엔드 메시지) 사용
+- 큰 파일은 chunksize 행씩 나누어 읽어 메모리 사용량 제한
+
+pandas / numpy는 이 모듈의 함수를 호출할 때 import합니다.
+"""
+import os
+from typing import Any, Dict, Iterator, List, Optional
+
+from console.validators import (
+    EMAIL_PATTERN, ERROR_MESSAGES, NICKNAME_MAX_LENGTH, PASSWORD_MAX_LENGTH, PASSWORD_MIN_LENGTH,
+)
+
+
+EMAIL_REQUIRED = 1 << 0
+EMAIL_FORMAT = 1 << 1
+PASSWORD_REQUIRED = 1 << 2
+PASSWORD_TOO_SHORT = 1 << 3
+PASSWORD_TOO_LONG = 1 << 4
+PASSWORD_NO_UPPERCASE = 1 << 5
+PASSWORD_NO_LOWERCASE = 1 << 6
+PASSWORD_NO_DIGIT = 1 << 7
+PASSWORD_NO_SPECIAL = 1 << 8
+NICKNAME_REQUIRED = 1 << 9
+NICKNAME_SPACE = 1 << 10
+NICKNAME_TOO_LONG = 1 << 11
+
+# (비트, 이름, ERROR_MESSAGES 키) - 비밀번호 규칙 위반은 프론트엔드와 같이 한 메시지로 안내
+ERRORS = [
+    (EMAIL_REQUIRED, "email_required", "email_required"),
+    (EMAIL_FORMAT, "email_format", "invalid_email_format"),
+    (PASSWORD_REQUIRED, "password_required", "password_required"),
+    (PASSWORD_TOO_SHORT, "password_too_short", "invalid_password_format"),
+    (PASSWORD_TOO_LONG, "password_too_long", "invalid_password_format"),
+    (PASSWORD_NO_UPPERCASE, "password_no_uppercase", "invalid_password_format"),
+    (PASSWORD_NO_LOWERCASE, "password_no_lowercase", "invalid_password_format"),
+    (PASSWORD_NO_DIGIT, "password_no_digit", "invalid_password_format"),
+    (PASSWORD_NO_SPECIAL, "password_no_special", "invalid_password_format"),
+    (NICKNAME_REQUIRED, "nickname_required", "nickname_required"),
+    (NICKNAME_SPACE, "nickname_space", "nickname_contains_space"),
+    (NICKNAME_TOO_LONG, "nickname_too_long", "nickname_too_long"),
+]
+
+COLUMNS = ("email", "password", "nickname")
+
+DEFAULT_CHUNKSIZE = 1_000_000
+
+SPECIAL_CLASS = r'[!@#$%^&*()\-_=+\[\]{}|;:\'",.<>/?`~]'
+
+
+def _string_dtype() -> str:
+    """pyarrow가 있으면 Arrow 문자열(벡터 연산이 C++에서 실행), 없으면 Python 문자열"""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return "string[python]"
+    return "string[pyarrow]"
+
+
+def _flag(condition, bit: int):
+    """불리언 Series → 비트 배열 (결측은 False)"""
+    import numpy as np
+
+    return condition.to_numpy(dtype=bool, na_value=False).astype(np.uint16) * np.uint16(bit)
+
+
+# ============================================================================
+# 검사
+# ============================================================================
+
+def validate_frame(frame, email: str = "email", password: str = "password",
+                   nickname: str = "nickname"):
+    """
+    DataFrame의 사용자 행 검사
+
+    필수 입력 오류가 있는 필드는 다른 오류를 함께 표시하지 않습니다 (validators와 동일).
+
+    Returns:
+        numpy.ndarray: 행별 오류 비트마스크 (uint16, 0이면 유효)
+    """
+    import numpy as np
+
+    dtype = _string_dtype()
+    mask = np.zeros(len(frame), dtype=np.uint16)
+
+    emails = frame[email].astype(dtype).fillna("")
+    email_empty = emails == ""
+    mask |= _flag(email_empty, EMAIL_REQUIRED)
+    # fullmatch: Python 문자열(re)과 Arrow 문자열(RE2) 모두 끝의 줄바꿈을 허용하지 않음 (validators와 동일)
+    mask |= _flag(~email_empty & ~emails.str.fullmatch(EMAIL_PATTERN), EMAIL_FORMAT)
+
+    passwords = frame[password].astype(dtype).fillna("")
+    password_present = passwords != ""
+    lengths = passwords.str.len()
+    mask |= _flag(~password_present, PASSWORD_REQUIRED)
+    mask |= _flag(password_present & (lengths < PASSWORD_MIN_LENGTH), PASSWORD_TOO_SHORT)
+    mask |= _flag(password_present & (lengths > PASSWORD_MAX_LENGTH), PASSWORD_TOO_LONG)
+    mask |= _flag(password_present & ~passwords.str.contains(r"[A-Z]"), PASSWORD_NO_UPPERCASE)
+    mask |= _flag(password_present & ~passwords.str.contains(r"[a-z]"), PASSWORD_NO_LOWERCASE)
+    mask |= _flag(password_present & ~passwords.str.contains(r"[0-9]"), PASSWORD_NO_DIGIT)
+    mask |= _flag(password_present & ~passwords.str.contains(SPECIAL_CLASS), PASSWORD_NO_SPECIAL)
+
+    nicknames = frame[nickname].astype(dtype).fillna("")
+    nickname_present = nicknames.str.strip() != ""
+    mask |= _flag(~nickname_present, NICKNAME_REQUIRED)
+    mask |= _flag(nickname_present & nicknames.str.contains(" ", regex=False), NICKNAME_SPACE)
+    mask |= _flag(nickname_present & (nicknames.str.len() > NICKNAME_MAX_LENGTH), NICKNAME_TOO_LONG)
+
+    return mask
+
+
+def error_names(mask_value: int) -> List[str]:
+    """비트마스크 → 오류 이름 목록"""
+    return [name for bit, name, _ in ERRORS if mask_value & bit]
+
+
+def error_messages(mask_value: int) -> List[str]:
+    """비트마스크 → 프론트엔드 오류 메시지 목록 (중복 제거, ERRORS 순서)"""
+    messages = []
+    for bit, _, key in ERRORS:
+        if mask_value & bit and ERROR_MESSAGES[key] not in messages:
+            messages.append(ERROR_MESSAGES[key])
+    return messages
+
+
+def count_errors(mask) -> Dict[str, int]:
+    """오류 이름별 행 수"""
+    return {name: int(((mask & bit) != 0).sum()) for bit, name, _ in ERRORS}
+
+
+# ============================================================================
+# 파일
+# ============================================================================
+
+def read_table(path: str, columns=COLUMNS, chunksize: Optional[int] = DEFAULT_CHUNKSIZE) -> Iterator[Any]:
+    """
+    CSV / Parquet 파일을 chunksize 행씩 DataFrame으로 읽기
+
+    CSV의 모든 값은 문자열로 읽습니다 ("NA", 빈 칸을 결측값으로 바꾸지 않음).
+    """
+    import pandas as pd
+
+    columns = list(columns)
+    if path.endswith(".parquet"):
+        if chunksize is None:
+            yield pd.read_parquet(path, columns=columns)
+            return
+        import pyarrow.parquet as pq
+
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize, columns=columns):
+            yield batch.to_pandas()
+        return
+
+    # 처음부터 검사에 쓸 문자열 타입으로 읽어 변환 비용 제거
+    dtype = _string_dtype()
+    if chunksize is None:
+        yield pd.read_csv(path, usecols=columns, dtype=dtype, na_filter=False)
+        return
+    yield from pd.read_csv(path, usecols=columns, dtype=dtype, na_filter=False, chunksize=chunksize)
+
+
+def validate_file(path: str, report_path: Optional[str] = None, chunksize: Optional[int] = DEFAULT_CHUNKSIZE,
+                  columns=COLUMNS) -> Dict[str, Any]:
+    """
+    사용자 파일 검사
+
+    Args:
+        report_path: 유효하지 않은 행 보고서 (.csv / .parquet) - row, error_mask, errors, messages 열
+        columns: (email, password, nickname) 순서의 열 이름
+
+    Returns:
+        dict: rows, valid, invalid, errors(오류 이름별 행 수), report
+    """
+    import numpy as np
+    import pandas as pd
+
+    email, password, nickname = columns
+    summary = {"rows": 0, "valid": 0, "invalid": 0, "errors": {name: 0 for _, name, _ in ERRORS}}
+    reports = []
+    offset = 0
+    wrote_header = False
+
+    if report_path:
+        directory = os.path.dirname(report_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    for frame in read_table(path, columns, chunksize):
+        mask = validate_frame(frame, email, password, nickname)
+        invalid = mask != 0
+        summary["rows"] += len(mask)
+        summary["invalid"] += int(invalid.sum())
+        for name, count in count_errors(mask).items():
+            summary["errors"][name] += count
+
+        if report_path and invalid.any():
+            codes = mask[invalid]
+            # 서로 다른 비트마스크 값은 많지 않으므로 값별로 한 번만 메시지 생성
+            unique = np.unique(codes)
+            names = {int(code): ",".join(error_names(int(code))) for code in unique}
+            messages = {int(code): "; ".join(error_messages(int(code))) for code in unique}
+            codes = pd.Series(codes.astype(int))
+            report = pd.DataFrame({
+                "row": np.flatnonzero(invalid) + offset,
+                "error_mask": codes,
+                "errors": codes.map(names),
+                "messages": codes.map(messages),
+            })
+            if report_path.endswith(".parquet"):
+                reports.append(report)
+            else:
+                report.to_csv(report_path, mode="a" if wrote_header else "w", header=not wrote_header, index=False)
+                wrote_header = True
+        offset += len(mask)
+
+    if report_path:
+        if report_path.endswith(".parquet"):
+            columns_only = pd.DataFrame(columns=["row", "error_mask", "errors", "messages"])
+            pd.concat(reports or [columns_only], ignore_index=True).to_parquet(report_path, index=False)
+        elif not wrote_header:
+            pd.DataFrame(columns=["row", "error_mask", "errors", "messages"]).to_csv(report_path, index=False)
+
+    summary["valid"] = summary["rows"] - summary["invalid"]
+    summary["report"] = report_path
+    return summary
@@ -0,0 +1,244 @@
+"""
+요청 / 응답 녹화 및 재생 (카세트)
+
+실제 Backend / Model API와 주고받은 요청 / 응답을 JSON 카세트 파일로 녹화하고,
+테스트에서는 네트워크 없이 그대로 재생합니다.
+
+- RecordingTransport: 다른 전송 계층을 감싸 주고받은 내용을 Cassette에 기록
+- ReplayTransport: Cassette에서 요청과 일치하는 응답을 찾아 반환 (대기 시간 없음)
+- 일치 방식
+    - exact: 메서드, 경로, 쿼리 파라미터, JSON 본문이 모두 같아야 함
+    - template: 메서드와 경로 템플릿(/api/posts/{id})만 비교 (다른 ID, 다른 본문에도 재생)
+- 레플리카마다 호스트가 다르므로 URL은 경로만 저장 / 비교합니다.
+
+카세트는 작게 유지합니다.
+- JSON 응답은 파싱된 값 그대로, 그 외 본문은 base64로 저장
+- 업로드 파일은 내용 대신 (파일명, 크기, Content-Type)만 저장
+- 응답 헤더는 Content-Type / Retry-After만 저장
+"""
+import base64
+import json
+import os
+import re
+import threading
+from typing import Any, Dict, Iterator, List, Optional
+from urllib.parse import urlsplit
+
+from console.client import StreamResponse, TransportError, TransportResponse, open_stream
+
+
+EXACT = "exact"
+TEMPLATE = "template"
+
+CASSETTE_VERSION = 1
+
+KEPT_HEADERS = ("content-type", "retry-after")
+
+_ID_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+
+class CassetteMiss(LookupError):
+    """
+    카세트에 일치하는 요청이 없음
+
+    TransportError가 아니므로 ApiClient가 네트워크 오류(status 0)로 바꾸지 않고 그대로 전파됩니다.
+    """
+
+
+def path_of(url: str) -> str:
+    """URL에서 경로만 추출 (레플리카 호스트 무시)"""
+    return urlsplit(url).path or "/"
+
+
+def template_of(path: str) -> str:
+    """숫자 경로 세그먼트를 {id}로 치환 (/api/posts/3/comments → /api/posts/{id}/comments)"""
+    return _ID_SEGMENT.sub("/{id}", path)
+
+
+def _files_meta(files) -> Optional[Dict[str, List[Any]]]:
+    if not files:
+        return None
+    meta = {}
+    for field, value in files.items():
+        filename, content, content_type = value
+        meta[field] = [filename, len(content), content_type]
+    return meta
+
+
+# ============================================================================
+# 카세트
+# ============================================================================
+
+class Cassette:
+    """녹화된 요청 / 응답 목록"""
+
+    def __init__(self, interactions: Optional[List[Dict[str, Any]]] = None):
+        self.interactions: List[Dict[str, Any]] = interactions or []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.interactions)
+
+    def record(self, method: str, url: str, *, params=None, json_body=None, files=None,
+               response: Optional[TransportResponse] = None, error: Optional[str] = None):
+        """요청 / 응답 한 쌍 기록 (전송 실패면 error)"""
+        request = {"method": method, "path": path_of(url)}
+        if params:
+            request["params"] = params
+        if json_body is not None:
+            request["json"] = json_body
+        files = _files_meta(files)
+        if files:
+            request["files"] = files
+
+        if error is not None:
+            recorded = {"error": error}
+        else:
+            recorded = {"status": response.status}
+            headers = {k: v for k, v in response.headers.items() if k.lower() in KEPT_HEADERS}
+            if headers:
+                recorded["headers"] = headers
+            if response.content:
+                try:
+                    recorded["json"] = json.loads(response.content)
+                except ValueError:
+                    recorded["body_b64"] = base64.b64encode(response.content).decode("ascii")
+
+        with self._lock:
+            self.interactions.append({"request": request, "response": recorded})
+
+    # =========================================================================
+    # 저장 / 로드
+    # =========================================================================
+
+    def save(self, path: str) -> str:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._lock:
+            data = {"version": CASSETTE_VERSION, "interactions": self.interactions}
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=1)
+        return path
+
+    @classmethod
+    def load(cls, path: str) -> "Cassette":
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        return cls(data.get("interactions", []))
+
+
+def response_from(recorded: Dict[str, Any]) -> TransportResponse:
+    """녹화된 응답 → TransportResponse (전송 실패였다면 TransportError)"""
+    if "error" in recorded:
+        raise TransportError(recorded["error"])
+    if "json" in recorded:
+        content = json.dumps(recorded["json"], ensure_ascii=False).encode()
+    elif "body_b64" in recorded:
+        content = base64.b64decode(recorded["body_b64"])
+    else:
+        content = b""
+    return TransportResponse(recorded["status"], content, dict(recorded.get("headers", {})))
+
+
+# ============================================================================
+# 전송 계층
+# ============================================================================
+
+class RecordingTransport:
+    """전송 계층 래퍼 - 주고받은 요청 / 응답을 카세트에 기록"""
+
+    def __init__(self, inner, cassette: Optional[Cassette] = None):
+        self.inner = inner
+        self.cassette = cassette if cassette is not None else Cassette()
+
+    def send(self, method, url, *, params=None, json_body=None, files=None,
+             headers=None, timeout=None) -> TransportResponse:
+        try:
+            response = self.inner.send(method, url, params=params, json_body=json_body, files=files,
+                                       headers=headers, timeout=timeout)
+        except TransportError as e:
+            self.cassette.record(method, url, params=params, json_body=json_body, files=files, error=str(e))
+            raise
+        self.cassette.record(method, url, params=params, json_body=json_body, files=files, response=response)
+        return response
+
+    def stream(self, method, url, *, params=None, json_body=None, files=None,
+               headers=None, timeout=None) -> StreamResponse:
+        """스트리밍 응답은 본문을 다 읽은 뒤 send()와 같은 형태로 기록 (중간에 닫으면 기록 안 함)"""
+        request = {"params": params, "json_body": json_body, "files": files}
+        try:
+            response = open_stream(self.inner, method, url, headers=headers, timeout=timeout, **request)
+        except TransportError as e:
+            self.cassette.record(method, url, error=str(e), **request)
+            raise
+        return response._replace(chunks=self._recorded(method, url, request, response))
+
+    def _recorded(self, method, url, request: Dict[str, Any], response: StreamResponse) -> Iterator[bytes]:
+        body = []
+        try:
+            for chunk in response.chunks:
+                body.append(chunk)
+                yield chunk
+        except TransportError as e:
+            self.cassette.record(method, url, error=str(e), **request)
+            raise
+        recorded = TransportResponse(response.status, b"".join(body), response.headers)
+        self.cassette.record(method, url, response=recorded, **request)
+
+
+class ReplayTransport:
+    """
+    카세트 재생 전송 계층
+
+    같은 요청이 여러 번 녹화되어 있으면 녹화 순서대로 재생하고,
+    모두 사용한 뒤에는 allow_repeats가 True면 마지막 응답을 반복합니다.
+
+    Raises:
+        CassetteMiss: 일치하는 요청이 없음
+    """
+
+    def __init__(self, cassette: Cassette, mode: str = EXACT, allow_repeats: bool = True):
+        if mode not in (EXACT, TEMPLATE):
+            raise ValueError(f"지원하지 않는 일치 방식: {mode}")
+        self.cassette = cassette
+        self.mode = mode
+        self.allow_repeats = allow_repeats
+        self.calls: List[Dict[str, Any]] = []
+        self._queues: Dict[tuple, List[Dict[str, Any]]] = {}
+        self._last: Dict[tuple, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        for interaction in cassette.interactions:
+            key = self._key(interaction["request"])
+            self._queues.setdefault(key, []).append(interaction["response"])
+
+    def _key(self, request: Dict[str, Any]) -> tuple:
+        if self.mode == TEMPLATE:
+            return request["method"], template_of(request["path"])
+        return (
+            request["method"],
+            request["path"],
+            json.dumps(request.get("params") or None, sort_keys=True, default=str),
+            json.dumps(request.get("json"), sort_keys=True, ensure_ascii=False),
+        )
+
+    def send(self, method, url, *, params=None, json_body=None, files=None,
+             headers=None, timeout=None) -> TransportResponse:
+        request = {"method": method, "path": path_of(url), "params": params, "json": json_body}
+        key = self._key(request)
+        with self._lock:
+            self.calls.append(request)
+            queue = self._queues.get(key)
+            if queue:
+                recorded = queue.pop(0)
+                self._last[key] = recorded
+            elif self.allow_repeats and key in self._last:
+                recorded = self._last[key]
+            else:
+                raise CassetteMiss(f"카세트에 없는 요청 ({self.mode}): {method} {request['path']}")
+        return response_from(recorded)
+
+
+def load_replay(path: str, mode: str = EXACT, allow_repeats: bool = True) -> ReplayTransport:
+    """카세트 파일로 재생 전송 계층 생성"""
+    return ReplayTransport(Cassette.load(path), mode, allow_repeats)
@@ -0,0 +1,611 @@
+"""
+헤드리스 CLI
+
+Streamlit 콘솔의 주요 작업(로그인, 목록, 상세, 좋아요, 댓글, 이미지 업로드/분류, 상태)을
+같은 ApiClient로 실행합니다. cron 작업이나 벤치마크 스크립트에서 사용합니다.
+
+- 출력: --format json (기본, 명령 종료 후 한 번에 출력) / ndjson (결과가 나올 때마다 한 줄씩 출력)
+- 여러 대상을 받는 명령(detail, like, comments, upload)은 -j/--concurrency 개 스레드로 동시 실행
+- 모든 대상이 성공하면 종료 코드 0, 하나라도 실패하면 1
+- 서비스 주소는 console.config와 같은 환경 변수(BACKEND_URLS, MODEL_API_URLS) 사용
+- --record / --replay로 요청 / 응답 카세트 녹화 및 재생 (console.cassette)
+
+사용 예:
+    python -m console login --email user@example.com --password secret
+    python -m console --user-id 1 list --all --format ndjson
+    python -m console --user-id 1 detail 1 2 3 -j 8
+    python -m console --user-id 1 comment 1 --content "좋아요"
+    python -m console --user-id 1 upload dog.jpg cat.png
+    python -m console --user-id 1 upload *.jpg --image-cache snapshots/image_cache.sqlite
+    python -m console status
+    python -m console bench --rows 1000000
+    python -m console validate-users users.csv --report invalid.csv
+    python -m console analytics snapshots/board.columnar --by ratio
+    python -m console index snapshots/sync && python -m console search "산책" --kind comments
+    python -m console --record tests/cassettes/posts.json list
+"""
+import argparse
+import json
+import os
+import sys
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+from console import models, snapshot
+
+
+JSON = "json"
+NDJSON = "ndjson"
+
+EXIT_OK = 0
+EXIT_FAILED = 1
+
+DEFAULT_CONCURRENCY = 8
+
+USER_ID_ENV = "CONSOLE_USER_ID"
+
+
+# ============================================================================
+# 출력
+# ============================================================================
+
+def _jsonable(value: Any) -> Any:
+    """json.dump default - console.models 객체는 dict, 그 외는 repr"""
+    if isinstance(value, models.Model):
+        return value.to_dict()
+    return repr(value)
+
+
+class Output:
+    """
+    JSON / NDJSON 출력기
+
+    ndjson은 emit()마다 바로 한 줄을 쓰고, json은 close()에서 모아서 출력합니다.
+    여러 스레드에서 emit()을 호출해도 줄이 섞이지 않습니다.
+    """
+
+    def __init__(self, fmt: str = JSON, stream=None):
+        self.fmt = fmt
+        self.stream = stream or sys.stdout
+        self.failed = False
+        self._records: List[Any] = []
+        self._lock = threading.Lock()
+
+    def emit(self, record: Any, ok: bool = True):
+        with self._lock:
+            if not ok:
+                self.failed = True
+            if self.fmt == NDJSON:
+                self.stream.write(json.dumps(record, ensure_ascii=False, default=_jsonable) + "\n")
+                self.stream.flush()
+            else:
+                self._records.append(record)
+
+    def close(self, single: bool = False) -> int:
+        """
+        출력 마무리
+
+        Args:
+            single: json 형식에서 결과 하나를 배열 대신 객체로 출력
+
+        Returns:
+            int: 종료 코드
+        """
+        if self.fmt == JSON:
+            value = self._records[0] if single and len(self._records) == 1 else self._records
+            json.dump(value, self.stream, ensure_ascii=False, indent=2, default=_jsonable)
+            self.stream.write("\n")
+            self.stream.flush()
+        return EXIT_FAILED if self.failed else EXIT_OK
+
+
+def response_record(response, **fields) -> Dict[str, Any]:
+    """ApiResponse → 출력 레코드"""
+    return {
+        **fields,
+        "ok": response.ok,
+        "status": response.status,
+        "elapsed_ms": round(response.elapsed * 1000, 2),
+        "data": response.data,
+    }
+
+
+def run_many(items: List[Any], fn: Callable[[Any], Dict[str, Any]], out: Output, concurrency: int):
+    """
+    대상별 작업 동시 실행
+
+    ndjson은 끝나는 순서대로, json은 입력 순서대로 출력합니다.
+    """
+    from console.concurrency import bulk_map
+
+    def report(index, item, record, error):
+        if out.fmt != NDJSON:
+            return
+        if error is not None:
+            record = {"target": item, "ok": False, "error": str(error)}
+        out.emit(record, ok=record.get("ok", False))
+
+    results = bulk_map(fn, items, workers=concurrency, on_result=report)
+    if out.fmt == JSON:
+        for item, record in zip(items, results):
+            if isinstance(record, Exception):
+                record = {"target": item, "ok": False, "error": str(record)}
+            out.emit(record, ok=record.get("ok", False))
+
+
+# ============================================================================
+# 명령
+# ============================================================================
+
+def cmd_login(client, args, out: Output) -> int:
+    response = client.login(args.email, args.password)
+    data = response.data if isinstance(response.data, dict) else {}
+    ok = response.ok and data.get("message") == "login_success"
+    record = response_record(response)
+    record["ok"] = ok
+    record["user_id"] = (data.get("data") or {}).get("user_id") if ok else None
+    out.emit(record, ok=ok)
+    return out.close(single=True)
+
+
+def cmd_list(client, args, out: Output) -> int:
+    """
+    게시글 목록 (ndjson이면 응답을 받는 대로 게시글 단위로 출력)
+
+    json 형식은 --all 목록 전체를 모아 출력하므로 게시글을 console.models.Post로 받습니다.
+    """
+    try:
+        for post in snapshot.iter_posts(client.typed(), args.limit, start_page=args.page, all_pages=args.all):
+            out.emit(post)
+    except snapshot.SnapshotError as e:
+        out.emit({"ok": False, "error": str(e)}, ok=False)
+    return out.close()
+
+
+def cmd_detail(client, args, out: Output) -> int:
+    run_many(args.post_ids, lambda post_id: response_record(client.get_post(post_id), post_id=post_id),
+             out, args.concurrency)
+    return out.close(single=len(args.post_ids) == 1)
+
+
+def cmd_like(client, args, out: Output) -> int:
+    run_many(args.post_ids, lambda post_id: response_record(client.toggle_like(post_id), post_id=post_id),
+             out, args.concurrency)
+    return out.close(single=len(args.post_ids) == 1)
+
+
+def cmd_comments(client, args, out: Output) -> int:
+    run_many(args.post_ids, lambda post_id: response_record(client.get_comments(post_id), post_id=post_id),
+             out, args.concurrency)
+    return out.close(single=len(args.post_ids) == 1)
+
+
+def cmd_comment(client, args, out: Output) -> int:
+    response = client.create_comment(args.post_id, args.content)
+    out.emit(response_record(response, post_id=args.post_id), ok=response.ok)
+    return out.close(single=True)
+
+
+def upload_file(client, path: str, cache=None) -> Dict[str, Any]:
+    """
+    이미지 업로드 후 분류 결과 요약
+
+    cache(console.imagecache.ImageCache)가 있으면 같거나 거의 같은 이미지는 업로드 없이 저장된 결과를 사용합니다.
+    """
+    import mimetypes
+
+    with open(path, "rb") as f:
+        content = f.read()
+    content_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+    if cache is None:
+        response = client.upload_post_image(os.path.basename(path), content, content_type)
+    else:
+        response = cache.upload(client, os.path.basename(path), content, content_type)
+    data = (response.data.get("data") or {}) if isinstance(response.data, dict) else {}
+    prediction = data.get("prediction") or {}
+    result = {
+        "file": path,
+        "ok": response.ok,
+        "status": response.status,
+        "elapsed_ms": round(response.elapsed * 1000, 2),
+        "image_url": data.get("image_url"),
+        "class_name": prediction.get("class_name"),
+        "confidence": prediction.get("confidence_score"),
+        "error": data.get("prediction_error"),
+    }
+    if cache is not None:
+        from console import imagecache
+
+        result.update(imagecache.summary(response))
+    return result
+
+
+def cmd_upload(client, args, out: Output) -> int:
+    cache = None
+    if args.image_cache:
+        from console import imagecache
+
+        cache = imagecache.open_cache(args.image_cache, args.max_distance)
+    try:
+        run_many(args.files, lambda path: upload_file(client, path, cache), out, args.concurrency)
+    finally:
+        if cache is not None:
+            cache.close()
+    return out.close(single=len(args.files) == 1)
+
+
+def cmd_status(client, args, out: Output) -> int:
+    """인스턴스별 헬스 체크 1회"""
+    from console.health import HealthProber
+
+    prober = HealthProber(targets=client.urls, transport=client.transport, timeout=args.timeout)
+    prober.probe_once()
+    for instance in prober.snapshot():
+        out.emit(instance, ok=instance["state"] != "down")
+    return out.close()
+
+
+def cmd_bench(client, args, out: Output) -> int:
+    """입력 검증 / 응답 검사 마이크로 벤치마크 (API 요청 없음)"""
+    from console import bench
+
+    history = [] if args.no_history else bench.load_history(args.history)
+
+    def report(result):
+        record = result.to_dict()
+        record["change_vs_last"] = bench.change_vs(result, bench.previous_result(history, result.name))
+        out.emit(record)
+
+    try:
+        results = bench.run_suite(args.rows, args.repeat, args.only, args.seed, on_result=report)
+    except KeyError as e:
+        out.emit({"ok": False, "error": e.args[0]}, ok=False)
+        return out.close()
+    if not args.no_history:
+        bench.append_history(results, args.history, {"seed": args.seed})
+    return out.close()
+
+
+def cmd_validate_users(client, args, out: Output) -> int:
+    """사용자 가져오기 파일 일괄 검사 (API 요청 없음, 유효하지 않은 행이 있으면 종료 코드 1)"""
+    from console import bulk_validation
+
+    summary = bulk_validation.validate_file(
+        args.path,
+        report_path=args.report,
+        chunksize=args.chunksize or None,
+        columns=(args.email_column, args.password_column, args.nickname_column),
+    )
+    out.emit(summary, ok=summary["invalid"] == 0)
+    return out.close(single=True)
+
+
+def cmd_seed(client, args, out: Output) -> int:
+    """시드 데이터 적재 (같은 매니페스트로 다시 실행하면 이어서 진행)"""
+    from console import seed
+
+    config = seed.SeedConfig(users=args.users, posts=args.posts, comments=args.comments, likes=args.likes,
+                             image_ratio=args.image_ratio, alpha=args.alpha, seed=args.seed)
+    try:
+        summary = seed.run(client.for_user(None), config, args.manifest, workers=args.concurrency)
+    except ValueError as e:
+        out.emit({"ok": False, "error": str(e)}, ok=False)
+        return out.close(single=True)
+    out.emit(summary, ok=summary["errors"] == 0)
+    return out.close(single=True)
+
+
+def cmd_sync(client, args, out: Output) -> int:
+    """증분 스냅샷 동기화 (기준 스냅샷이 없으면 전체 크롤링)"""
+    from console import sync
+
+    store = sync.SyncStore(args.dir, compact_after=args.compact_after)
+    try:
+        stats = sync.sync(client, store, workers=args.concurrency, recheck_every=args.recheck_every,
+                          full=args.full)
+    except snapshot.SnapshotError as e:
+        out.emit({"ok": False, "error": str(e)}, ok=False)
+        return out.close(single=True)
+    if args.export:
+        stats["export"] = snapshot.save(store.load().to_snapshot(), args.export)
+    out.emit(stats, ok=not stats["errors"])
+    return out.close(single=True)
+
+
+def cmd_columnar(client, args, out: Output) -> int:
+    """스냅샷 파일 / 동기화 디렉터리 → 열 단위(Arrow IPC) 저장소 (API 요청 없음)"""
+    import time
+    from console import columnar, sync
+
+    started = time.perf_counter()
+    if os.path.isdir(args.source):
+        board = sync.SyncStore(args.source).load().to_snapshot()
+        target = args.out or os.path.join(snapshot.DEFAULT_DIR, f"sync{columnar.SUFFIX}")
+    else:
+        board = snapshot.load(args.source)
+        target = args.out or os.path.splitext(args.source)[0] + columnar.SUFFIX
+    try:
+        columnar.write(board, target, args.batch_size)
+    except FileExistsError as e:
+        out.emit({"ok": False, "error": str(e)}, ok=False)
+        return out.close(single=True)
+    store = columnar.open_store(target)
+    out.emit({"path": target, "posts": store.posts.num_rows, "comments": store.comments.num_rows,
+              "bytes": sum(os.path.getsize(os.path.join(target, name)) for name in os.listdir(target)),
+              "seconds": round(time.perf_counter() - started, 3)})
+    return out.close(single=True)
+
+
+def cmd_analytics(client, args, out: Output) -> int:
+    """스냅샷 파일 / 열 단위 저장소의 참여도 지표 (API 요청 없음)"""
+    import time
+    from console import analytics
+
+    started = time.perf_counter()
+    arrays = analytics.load(args.source)
+    try:
+        result = analytics.report(arrays, args.top, args.by, args.authors)
+    except ValueError as e:
+        out.emit({"ok": False, "error": str(e)}, ok=False)
+        return out.close(single=True)
+    result["seconds"] = round(time.perf_counter() - started, 3)
+    out.emit(result)
+    return out.close(single=True)
+
+
+def cmd_index(client, args, out: Output) -> int:
+    """스냅샷 파일 / 동기화 디렉터리 / 열 단위 저장소로 검색 색인 갱신 (API 요청 없음)"""
+    from console import search
+
+    index = search.open_index(args.index)
+    try:
+        stats = index.update(search.load_board(args.source))
+        stats.update(path=args.index, **index.count())
+    finally:
+        index.close()
+    out.emit(stats)
+    return out.close(single=True)
+
+
+def cmd_search(client, args, out: Output) -> int:
+    """검색 색인에서 게시글 / 댓글 검색 (API 요청 없음)"""
+    from console import search
+
+    if not os.path.exists(args.index):
+        out.emit({"ok": False, "error": f"검색 색인이 없습니다: {args.index} (index 명령으로 먼저 만드세요)"}, ok=False)
+        return out.close(single=True)
+    index = search.open_index(args.index)
+    try:
+        targets = index.search(args.query, args.kind, args.author, args.limit)
+    finally:
+        index.close()
+    for target in targets:
+        out.emit({"kind": target.kind, "post_id": target.post_id, "comment_id": target.comment_id, **target.item})
+    return out.close()
+
+
+def cmd_paginate(client, args, out: Output) -> int:
+    """페이지 깊이 / limit별 목록 조회 지연 시간 측정 후 limit별 니 분석"""
+    from console import pagination
+
+    try:
+        points = pagination.sweep(client, args.limits, args.points, args.samples, args.max_page)
+    except ValueError as e:
+        out.emit({"ok": False, "error": str(e)}, ok=False)
+        return out.close(single=True)
+    for point in points:
+        out.emit({"kind": "point", **point._asdict()}, ok=200 <= point.status < 300)
+    for knee in pagination.analyze(points, args.factor):
+        out.emit({"kind": "knee", **knee._asdict()})
+    return out.close()
+
+
+def cmd_dataset(client, args, out: Output) -> int:
+    """대용량 게시판 데이터 생성 후 SQLite 파일에 적재 (API 요청 없음)"""
+    import time
+    from console.dataset import DatasetConfig
+    from console.standin import SqliteStore
+
+    dataset = DatasetConfig(posts=args.posts, users=args.users, comments_mean=args.comments_mean,
+                            alpha=args.alpha, image_ratio=args.image_ratio, seed=args.seed)
+    started = time.perf_counter()
+    try:
+        store = SqliteStore.from_dataset(dataset, args.sqlite)
+    except (FileExistsError, ValueError) as e:
+        out.emit({"ok": False, "error": str(e)}, ok=False)
+        return out.close(single=True)
+    out.emit({"path": args.sqlite, "posts": store.post_count(), "comments": store.comment_count(),
+              "users": dataset.users,
+              "seconds": round(time.perf_counter() - started, 3)})
+    store.close()
+    return out.close(single=True)
+
+
+# ============================================================================
+# 진입점
+# ============================================================================
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m console", description="Backend / Model API 헤드리스 콘솔")
+    parser.add_argument("--user-id", type=int, default=os.environ.get(USER_ID_ENV) or None,
+                        help=f"X-User-Id 헤더 (기본: ${USER_ID_ENV})")
+    parser.add_argument("--format", choices=[JSON, NDJSON], default=JSON, help="출력 형식")
+    parser.add_argument("--timeout", type=float, default=10.0, help="요청 타임아웃(초)")
+    parser.add_argument("-j", "--concurrency", type=int, default=DEFAULT_CONCURRENCY,
+                        help="여러 대상을 처리할 때의 동시 실행 수")
+    cassette = parser.add_mutually_exclusive_group()
+    cassette.add_argument("--record", metavar="PATH", help="주고받은 요청 / 응답을 카세트 파일로 녹화")
+    cassette.add_argument("--replay", metavar="PATH", help="네트워크 대신 카세트 파일 재생")
+    cassette.add_argument("--standin", metavar="SQLITE",
+                          help="네트워크 대신 로컬 Backend 대역 사용 (dataset 명령으로 만든 SQLite 파일)")
+    parser.add_argument("--match", choices=["exact", "template"], default="exact",
+                        help="--replay 요청 일치 방식")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    login = commands.add_parser("login", help="로그인 (user_id 출력)")
+    login.add_argument("--email", required=True)
+    login.add_argument("--password", required=True)
+    login.set_defaults(handler=cmd_login)
+
+    posts = commands.add_parser("list", help="게시글 목록")
+    posts.add_argument("--page", type=int, default=1)
+    posts.add_argument("--limit", type=int, default=10, help="페이지 크기")
+    posts.add_argument("--all", action="store_true", help="page부터 마지막 페이지까지 순회")
+    posts.set_defaults(handler=cmd_list)
+
+    detail = commands.add_parser("detail", help="게시글 상세")
+    detail.add_argument("post_ids", type=int, nargs="+")
+    detail.set_defaults(handler=cmd_detail)
+
+    like = commands.add_parser("like", help="좋아요 토글")
+    like.add_argument("post_ids", type=int, nargs="+")
+    like.set_defaults(handler=cmd_like)
+
+    comments = commands.add_parser("comments", help="댓글 목록")
+    comments.add_argument("post_ids", type=int, nargs="+")
+    comments.set_defaults(handler=cmd_comments)
+
+    comment = commands.add_parser("comment", help="댓글 작성")
+    comment.add_argument("post_id", type=int)
+    comment.add_argument("--content", required=True)
+    comment.set_defaults(handler=cmd_comment)
+
+    upload = commands.add_parser("upload", help="이미지 업로드 및 분류")
+    upload.add_argument("files", nargs="+")
+    upload.add_argument("--image-cache", metavar="SQLITE",
+                        help="중복 이미지 분류 결과 캐시 파일 (같거나 거의 같은 이미지는 업로드 / 분류 생략)")
+    upload.add_argument("--max-distance", type=int, default=5,
+                        help="거의 같은 이미지로 볼 dHash 해밍 거리 (0이면 dHash가 같을 때만)")
+    upload.set_defaults(handler=cmd_upload)
+
+    status = commands.add_parser("status", help="인스턴스 헬스 체크")
+    status.set_defaults(handler=cmd_status)
+
+    bench = commands.add_parser("bench", help="입력 검증 / 응답 검사 벤치마크")
+    bench.add_argument("--rows", type=int, default=100_000, help="벤치마크별 코퍼스 크기")
+    bench.add_argument("--repeat", type=int, default=5)
+    bench.add_argument("--seed", type=int, default=0)
+    bench.add_argument("--only", nargs="+", metavar="NAME", help="실행할 벤치마크 이름")
+    bench.add_argument("--history", default=os.path.join("benchmarks", "history.jsonl"),
+                       help="결과 이력 JSONL 파일")
+    bench.add_argument("--no-history", action="store_true", help="이력 저장 / 비교 안 함")
+    bench.set_defaults(handler=cmd_bench)
+
+    users = commands.add_parser("validate-users", help="사용자 가져오기 CSV / Parquet 일괄 검사")
+    users.add_argument("path")
+    users.add_argument("--report", help="유효하지 않은 행 보고서 경로 (.csv / .parquet)")
+    users.add_argument("--chunksize", type=int, default=1_000_000, help="한 번에 읽을 행 수 (0이면 전체)")
+    users.add_argument("--email-column", default="email")
+    users.add_argument("--password-column", default="password")
+    users.add_argument("--nickname-column", default="nickname")
+    users.set_defaults(handler=cmd_validate_users)
+
+    sync = commands.add_parser("sync", help="증분 스냅샷 동기화 (바뀐 게시글의 댓글만 다시 조회)")
+    sync.add_argument("--dir", default=os.path.join("snapshots", "sync"), help="기준 스냅샷 / 변경 로그 디렉터리")
+    sync.add_argument("--full", action="store_true", help="전체 크롤링으로 기준 스냅샷 다시 만들기")
+    sync.add_argument("--recheck-every", type=int, default=7,
+                      help="댓글 수가 같아도 댓글을 다시 확인하는 주기 (동기화 횟수, 0이면 안 함)")
+    sync.add_argument("--compact-after", type=int, default=10_000, help="변경 로그가 이 줄 수를 넘으면 압축")
+    sync.add_argument("--export", metavar="PATH", help="동기화 후 스냅샷 파일로 내보내기")
+    sync.set_defaults(handler=cmd_sync)
+
+    columnar = commands.add_parser("columnar", help="스냅샷을 열 단위(Arrow IPC) 저장소로 변환")
+    columnar.add_argument("source", help="스냅샷 JSON 파일 또는 sync 디렉터리")
+    columnar.add_argument("--out", help="만들 저장소 디렉터리 (기본: 같은 이름의 .columnar)")
+    columnar.add_argument("--batch-size", type=int, default=65_536, help="레코드 배치 행 수")
+    columnar.set_defaults(handler=cmd_columnar)
+
+    analytics = commands.add_parser("analytics", help="스냅샷 참여도 분석 (상위 게시글 / 작성자 / 감성 / 이미지 분류)")
+    analytics.add_argument("source", help="스냅샷 JSON 파일 또는 .columnar 저장소")
+    analytics.add_argument("--top", type=int, default=10, help="상위 게시글 수")
+    analytics.add_argument("--by", choices=["likes", "views", "comments", "ratio"], default="likes",
+                           help="상위 게시글 기준 (ratio: 좋아요 / 조회수)")
+    analytics.add_argument("--authors", type=int, default=20, help="작성자 집계 수")
+    analytics.set_defaults(handler=cmd_analytics)
+
+    index = commands.add_parser("index", help="검색 색인 갱신 (바뀐 게시글 / 댓글만 다시 색인)")
+    index.add_argument("source", help="스냅샷 JSON 파일, sync 디렉터리 또는 .columnar 저장소")
+    index.add_argument("--index", default=os.path.join("snapshots", "search.sqlite"), help="검색 색인 파일")
+    index.set_defaults(handler=cmd_index)
+
+    search = commands.add_parser("search", help="게시글 / 댓글 전문 검색 (관련도 순)")
+    search.add_argument("query", help="검색어 (단어를 모두 포함한 항목)")
+    search.add_argument("--index", default=os.path.join("snapshots", "search.sqlite"), help="검색 색인 파일")
+    search.add_argument("--kind", choices=["both", "posts", "comments"], default="both")
+    search.add_argument("--author", help="작성자 닉네임")
+    search.add_argument("--limit", type=int, default=50)
+    search.set_defaults(handler=cmd_search)
+
+    paginate = commands.add_parser("paginate", help="페이지 깊이별 목록 조회 지연 시간 프로파일")
+    paginate.add_argument("--limits", type=int, nargs="+", default=[1, 10, 50, 100], help="측정할 limit (1~100)")
+    paginate.add_argument("--points", type=int, default=12, help="limit별 측정 페이지 수 (로그 간격)")
+    paginate.add_argument("--samples", type=int, default=3, help="페이지별 반복 요청 수")
+    paginate.add_argument("--max-page", type=int, help="측정할 최대 페이지")
+    paginate.add_argument("--factor", type=float, default=2.0, help="니 판정 배율 (얕은 페이지 대비)")
+    paginate.set_defaults(handler=cmd_paginate)
+
+    seed = commands.add_parser("seed", help="시드 데이터 적재 (사용자 / 게시글 / 댓글 / 좋아요)")
+    seed.add_argument("--users", type=int, default=100)
+    seed.add_argument("--posts", type=int, default=500)
+    seed.add_argument("--comments", type=int, default=5000)
+    seed.add_argument("--likes", type=int, default=2000)
+    seed.add_argument("--image-ratio", type=float, default=0.3, help="이미지를 첨부할 게시글 비율")
+    seed.add_argument("--alpha", type=float, default=1.1, help="댓글 / 좋아요 멱법칙 지수")
+    seed.add_argument("--seed", type=int, default=0)
+    seed.add_argument("--manifest", default=os.path.join("seeds", "manifest.json"),
+                      help="생성한 ID 매니페스트 (있으면 이어서 진행)")
+    seed.set_defaults(handler=cmd_seed)
+
+    dataset = commands.add_parser("dataset", help="대용량 게시판 데이터를 생성해 SQLite 파일에 적재")
+    dataset.add_argument("--sqlite", required=True, help="새로 만들 SQLite 파일 (--standin으로 사용)")
+    dataset.add_argument("--posts", type=int, default=100_000)
+    dataset.add_argument("--users", type=int, default=10_000)
+    dataset.add_argument("--comments-mean", type=float, default=20.0, help="게시글당 평균 댓글 수")
+    dataset.add_argument("--alpha", type=float, default=1.5, help="댓글 수 파레토 지수 (작을수록 치우침)")
+    dataset.add_argument("--image-ratio", type=float, default=0.3)
+    dataset.add_argument("--seed", type=int, default=0)
+    dataset.set_defaults(handler=cmd_dataset)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None, client=None, stdout=None) -> int:
+    """
+    CLI 실행
+
+    Args:
+        client: 사용할 ApiClient (테스트용, 기본은 환경 변수 설정으로 생성)
+        stdout: 출력 스트림 (기본 sys.stdout)
+
+    Returns:
+        int: 종료 코드
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.standin and not os.path.exists(args.standin):
+        parser.error(f"--standin 파일이 없습니다: {args.standin}")
+    if client is None:
+        from console.client import ApiClient
+
+        client = ApiClient(timeout=args.timeout)
+    client = client.for_user(args.user_id)
+
+    recorder = None
+    if args.standin:
+        from console.standin import SqliteStore, StandinTransport
+
+        client.transport = StandinTransport(SqliteStore(args.standin))
+    elif args.replay:
+        from console.cassette import load_replay
+
+        client.transport = load_replay(args.replay, args.match)
+    elif args.record:
+        from console.cassette import RecordingTransport
+
+        recorder = RecordingTransport(client.transport)
+        client.transport = recorder
+    try:
+        return args.handler(client, args, Output(args.format, stdout))
+    finally:
+        if recorder is not None:
+            recorder.cassette.save(args.record)
@@ -0,0 +1,489 @@
+"""
+Backend / Model API 클라이언트
+
+js/api.js의 apiRequest와 동일한 응답 구조(ok, status, data)를 Python에서 제공합니다.
+- 네트워크 오류 시 status 0, {"message": "network_error", "data": None}
+- 모든 요청에 타임아웃 적용
+- 서비스별 레플리카 중 지연 시간 기반으로 요청 대상 선택 (console.balancer)
+- 서비스별 동시 요청 수를 지연 시간 / 429 / 503 응답에 따라 조절 (console.concurrency)
+- 쿼터가 있는 Model API 엔드포인트는 우선순위 토큰 버킷으로 호출 속도 제한 (console.ratelimit)
+- 전송 계층(transport)은 교체 가능 (테스트, 녹화/재생 등)
+- 게시글 / 댓글 목록은 본문을 받는 대로 항목 단위로 디코딩 가능 (stream_posts / stream_comments, console.streaming)
+
+콘솔 시작 시간을 위해 이 모듈은 가볍게 유지합니다.
+requests, json 등은 첫 요청 시점에 import합니다 (tests/test_startup.py 참고).
+"""
+import copy
+import threading
+import time
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional
+
+from console import config
+from console.balancer import ReplicaPool
+from console.concurrency import AdaptiveLimiter
+from console.ratelimit import INTERACTIVE, PriorityTokenBucket
+
+
+DEFAULT_TIMEOUT = 10.0
+
+NETWORK_ERROR = {"message": "network_error", "data": None}
+
+
+# ============================================================================
+# 전송 계층
+# ============================================================================
+
+class TransportError(Exception):
+    """연결 실패, 타임아웃 등 HTTP 응답을 받지 못한 경우"""
+
+
+class TransportResponse(NamedTuple):
+    """전송 계층 원시 응답"""
+    status: int
+    content: bytes
+    headers: Dict[str, str]
+
+
+class StreamResponse(NamedTuple):
+    """전송 계층 스트리밍 응답 (본문은 청크 반복자)"""
+    status: int
+    headers: Dict[str, str]
+    chunks: Iterator[bytes]
+
+
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def open_stream(transport, method: str, url: str, **kwargs) -> StreamResponse:
+    """전송 계층의 stream() 호출 (없으면 send() 본문을 청크 하나로)"""
+    stream = getattr(transport, "stream", None)
+    if stream is not None:
+        return stream(method, url, **kwargs)
+    raw = transport.send(method, url, **kwargs)
+    return StreamResponse(raw.status, raw.headers, iter([raw.content]))
+
+
+class RequestsTransport:
+    """
+    requests 기반 기본 전송 계층
+
+    스레드마다 별도의 Session을 사용하므로 동시 호출에 안전합니다.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+
+    def _session(self):
+        session = getattr(self._local, "session", None)
+        if session is None:
+            import requests
+            session = requests.Session()
+            self._local.session = session
+        return session
+
+    def send(self, method: str, url: str, *, params=None, json_body=None,
+             files=None, headers=None, timeout: Optional[float] = None) -> TransportResponse:
+        import requests
+
+        try:
+            response = self._session().request(
+                method,
+                url,
+                params=params,
+                json=json_body,
+                files=files,
+                headers=headers,
+                timeout=timeout,
+            )
+        except requests.exceptions.RequestException as e:
+            raise TransportError(str(e)) from e
+        return TransportResponse(response.status_code, response.content, dict(response.headers))
+
+    def stream(self, method: str, url: str, *, params=None, json_body=None,
+               files=None, headers=None, timeout: Optional[float] = None) -> StreamResponse:
+        """헤더만 받은 뒤 반환하고, 본문은 chunks를 반복할 때 받음 (다 읽으면 연결 반환)"""
+        import requests
+
+        try:
+            response = self._session().request(
+                method,
+                url,
+                params=params,
+                json=json_body,
+                files=files,
+                headers=headers,
+                timeout=timeout,
+                stream=True,
+            )
+        except requests.exceptions.RequestException as e:
+            raise TransportError(str(e)) from e
+
+        def chunks():
+            try:
+                yield from response.iter_content(chunk_size=STREAM_CHUNK_SIZE)
+            except requests.exceptions.RequestException as e:
+                raise TransportError(str(e)) from e
+            finally:
+                response.close()
+
+        return StreamResponse(response.status_code, dict(response.headers), chunks())
+
+
+# ============================================================================
+# 응답
+# ============================================================================
+
+class ApiResponse(NamedTuple):
+    """
+    API 응답
+
+    js/api.js apiRequest의 반환값 {ok, status, data}에 경과 시간(초)을 더한 구조
+    """
+    ok: bool
+    status: int
+    data: Any
+    elapsed: float = 0.0
+
+
+def decode_body(content: bytes) -> Any:
+    """응답 본문 JSON 디코딩 (JSON이 아니면 None)"""
+    if not content:
+        return None
+    import json
+
+    try:
+        return json.loads(content)
+    except ValueError:
+        return None
+
+
+def retry_after(headers: Dict[str, str], default: float) -> float:
+    """Retry-After 헤더(초) 파싱 (없거나 잘못된 값이면 default)"""
+    for key, value in headers.items():
+        if key.lower() == "retry-after":
+            try:
+                return max(0.0, float(value))
+            except ValueError:
+                return default
+    return default
+
+
+# ============================================================================
+# 클라이언트
+# ============================================================================
+
+class ApiClient:
+    """
+    Backend / Model API 클라이언트
+
+    js/api.js의 함수들과 동일한 엔드포인트를 메서드로 제공합니다.
+    urls를 주지 않으면 console.config의 서비스별 레플리카 목록을 사용합니다.
+    """
+
+    def __init__(self, user_id: Optional[int] = None, transport=None,
+                 timeout: float = DEFAULT_TIMEOUT, prober=None,
+                 urls: Optional[Dict[str, List[str]]] = None):
+        self.user_id = user_id
+        self.transport = transport or RequestsTransport()
+        self.timeout = timeout
+        self.prober = prober
+        self.urls = urls or config.service_targets()
+        self.decode = decode_body
+        self.object_hook = None
+        self.pools = {service: ReplicaPool(service_urls) for service, service_urls in self.urls.items()}
+        self.limiters = {service: AdaptiveLimiter() for service in self.urls}
+        self.rate_limits = {
+            endpoint: PriorityTokenBucket(rate, burst)
+            for endpoint, (rate, burst) in config.model_rate_limits().items()
+        }
+        if prober is not None:
+            prober.add_listener(self._on_probe)
+
+    def _on_probe(self, service: str, url: str, result):
+        pool = self.pools.get(service)
+        if pool is not None:
+            pool.observe_probe(url, result.ok)
+
+    def for_user(self, user_id: Optional[int]) -> "ApiClient":
+        """
+        사용자별 클라이언트
+
+        전송 계층, 레플리카 풀(지연 시간 통계), 동시성 / 속도 제한기는 공유합니다.
+        """
+        client = copy.copy(self)
+        client.user_id = user_id
+        return client
+
+    def typed(self) -> "ApiClient":
+        """
+        응답의 게시글 / 댓글 / 사용자 / 분류 / 감성 결과를 console.models 객체로 디코딩하는 클라이언트
+
+        많은 게시글을 오래 들고 있는 경우에 사용합니다. 모델은 dict처럼 get으로도 읽을 수 있습니다.
+        나머지 상태(전송 계층, 레플리카 풀 등)는 for_user와 같이 공유합니다.
+        """
+        from console import models
+
+        client = copy.copy(self)
+        client.decode = models.decode
+        client.object_hook = models.to_model
+        return client
+
+    # =========================================================================
+    # 요청 헬퍼
+    # =========================================================================
+
+    def base_url(self, service: str = config.BACKEND) -> str:
+        """서비스 첫 번째 레플리카의 API 기본 URL (예: http://localhost:8000/api)"""
+        return f"{self.urls[service][0]}{config.API_PREFIX}"
+
+    def headers(self, extra: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+        """기본 헤더 (로그인 상태면 X-User-Id 포함)"""
+        headers = {}
+        if self.user_id:
+            headers["X-User-Id"] = str(self.user_id)
+        if extra:
+            headers.update(extra)
+        return headers
+
+    def request(self, method: str, endpoint: str, *, service: str = config.BACKEND,
+                params=None, json_body=None, files=None, headers=None,
+                priority: int = INTERACTIVE) -> ApiResponse:
+        """
+        API 요청
+
+        Args:
+            priority: 속도 제한 엔드포인트의 대기 우선순위 (INTERACTIVE / BATCH)
+
+        Returns:
+            ApiResponse: 네트워크 오류 시 status 0, data는 NETWORK_ERROR
+        """
+        bucket = self.rate_limits.get(endpoint) if service == config.MODEL else None
+        if bucket is not None:
+            bucket.acquire(priority)
+
+        pool = self.pools[service]
+        limiter = self.limiters[service]
+        with limiter.slot():
+            replica = pool.acquire()
+            url = f"{replica.url}{config.API_PREFIX}{endpoint}"
+            started = time.perf_counter()
+            try:
+                raw = self.transport.send(
+                    method,
+                    url,
+                    params=params,
+                    json_body=json_body,
+                    files=files,
+                    headers=self.headers(headers),
+                    timeout=self.timeout,
+                )
+            except TransportError:
+                elapsed = time.perf_counter() - started
+                pool.release(replica, elapsed, ok=False)
+                limiter.record(elapsed, 0)
+                return ApiResponse(False, 0, dict(NETWORK_ERROR), elapsed)
+            except BaseException:
+                # 전송 계층의 다른 예외(카세트 불일치 등)도 진행 중 요청 수는 돌려놓고 그대로 전파
+                elapsed = time.perf_counter() - started
+                pool.release(replica, elapsed, ok=False)
+                limiter.record(elapsed, 0)
+                raise
+
+            elapsed = time.perf_counter() - started
+            pool.release(replica, elapsed, ok=raw.status < 500)
+            limiter.record(elapsed, raw.status)
+            if bucket is not None and raw.status == 429:
+                bucket.pause(retry_after(raw.headers, default=1 / bucket.rate))
+        return ApiResponse(200 <= raw.status < 300, raw.status, self.decode(raw.content), elapsed)
+
+    def stream(self, method: str, endpoint: str, path, *, service: str = config.BACKEND,
+               params=None, headers=None):
+        """
+        목록 응답 스트리밍 요청 (path 위치의 배열을 항목 단위로 디코딩)
+
+        동시성 제한기 슬롯과 지연 시간 기록은 응답 헤더를 받을 때까지만 적용됩니다.
+        본문은 반환값을 반복하는 동안 받습니다.
+
+        Returns:
+            ListStream: 네트워크 오류 시 status 0, data는 NETWORK_ERROR
+        """
+        from console.streaming import ArrayStream, ListStream
+
+        pool = self.pools[service]
+        limiter = self.limiters[service]
+        with limiter.slot():
+            replica = pool.acquire()
+            url = f"{replica.url}{config.API_PREFIX}{endpoint}"
+            started = time.perf_counter()
+            try:
+                raw = open_stream(self.transport, method, url, params=params,
+                                  headers=self.headers(headers), timeout=self.timeout)
+            except TransportError:
+                elapsed = time.perf_counter() - started
+                pool.release(replica, elapsed, ok=False)
+                limiter.record(elapsed, 0)
+                return ListStream(False, 0, elapsed, dict(NETWORK_ERROR))
+            except BaseException:
+                elapsed = time.perf_counter() - started
+                pool.release(replica, elapsed, ok=False)
+                limiter.record(elapsed, 0)
+                raise
+
+            elapsed = time.perf_counter() - started
+            pool.release(replica, elapsed, ok=raw.status < 500)
+            limiter.record(elapsed, raw.status)
+        if not 200 <= raw.status < 300:
+            return ListStream(False, raw.status, elapsed, self.decode(b"".join(raw.chunks)))
+        return ListStream(True, raw.status, elapsed, items=ArrayStream(raw.chunks, path, self.object_hook))
+
+    def replica_snapshot(self) -> Dict[str, List[Dict[str, Any]]]:
+        """서비스별 레플리카 상태 (EWMA 지연 시간, 진행 중 요청, 제외 여부)"""
+        return {service: pool.snapshot() for service, pool in self.pools.items()}
+
+    def limiter_snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """서비스별 적응형 동시성 제한 상태"""
+        return {service: limiter.snapshot() for service, limiter in self.limiters.items()}
+
+    def rate_limit_snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Model API 엔드포인트별 토큰 버킷 상태"""
+        return {endpoint: bucket.snapshot() for endpoint, bucket in self.rate_limits.items()}
+
+    # =========================================================================
+    # 인증 API
+    # =========================================================================
+
+    def login(self, email: str, password: str) -> ApiResponse:
+        """로그인"""
+        return self.request("POST", "/auth/login", json_body={"email": email, "password": password})
+
+    def signup(self, email: str, password: str, password_check: str, nickname: str,
+               profile_image_url: str) -> ApiResponse:
+        """회원가입"""
+        return self.request("POST", "/auth/signup", json_body={
+            "email": email,
+            "password": password,
+            "password_check": password_check,
+            "nickname": nickname,
+            "profile_image_url": profile_image_url,
+        })
+
+    def upload_profile_image(self, filename: str, content: bytes, content_type: str) -> ApiResponse:
+        """프로필 이미지 업로드"""
+        return self.request("POST", "/users/profile/upload",
+                            files={"file": (filename, content, content_type)})
+
+    def delete_profile(self) -> ApiResponse:
+        """회원 탈퇴"""
+        return self.request("DELETE", "/users/profile")
+
+    # =========================================================================
+    # 게시글 API
+    # =========================================================================
+
+    def get_posts(self, page: int = 1, limit: int = 10) -> ApiResponse:
+        """게시글 목록 조회"""
+        return self.request("GET", "/posts", params={"page": page, "limit": limit})
+
+    def stream_posts(self, page: int = 1, limit: int = 10):
+        """게시글 목록 스트리밍 (반복하면 게시글, 반복 후 meta["data"]에 total / page / limit)"""
+        return self.stream("GET", "/posts", ("data", "posts"), params={"page": page, "limit": limit})
+
+    def get_post(self, post_id: int) -> ApiResponse:
+        """게시글 상세 조회"""
+        return self.request("GET", f"/posts/{post_id}")
+
+    def create_post(self, title: str, content: str, image_url: Optional[str] = None,
+                    image_class: Optional[str] = None) -> ApiResponse:
+        """게시글 작성"""
+        return self.request("POST", "/posts", json_body={
+            "title": title,
+            "content": content,
+            "image_url": image_url,
+            "image_class": image_class,
+        })
+
+    def update_post(self, post_id: int, title: str, content: str, image_url: Optional[str] = None,
+                    image_class: Optional[str] = None) -> ApiResponse:
+        """게시글 수정"""
+        return self.request("PATCH", f"/posts/{post_id}", json_body={
+            "title": title,
+            "content": content,
+            "image_url": image_url,
+            "image_class": image_class,
+        })
+
+    def delete_post(self, post_id: int) -> ApiResponse:
+        """게시글 삭제"""
+        return self.request("DELETE", f"/posts/{post_id}")
+
+    def toggle_like(self, post_id: int) -> ApiResponse:
+        """좋아요 토글"""
+        return self.request("POST", f"/posts/{post_id}/like")
+
+    def increment_view_count(self, post_id: int) -> ApiResponse:
+        """조회수 증가"""
+        return self.request("PATCH", f"/posts/{post_id}/view")
+
+    def upload_post_image(self, filename: str, content: bytes, content_type: str) -> ApiResponse:
+        """게시글 이미지 업로드 (Model API 이미지 분류 포함)"""
+        return self.request("POST", "/posts/upload",
+                            files={"file": (filename, content, content_type)})
+
+    # =========================================================================
+    # 댓글 API
+    # =========================================================================
+
+    def get_comments(self, post_id: int) -> ApiResponse:
+        """댓글 목록 조회"""
+        return self.request("GET", f"/posts/{post_id}/comments")
+
+    def stream_comments(self, post_id: int):
+        """댓글 목록 스트리밍 (반복하면 댓글)"""
+        return self.stream("GET", f"/posts/{post_id}/comments", ("data", "comments"))
+
+    def create_comment(self, post_id: int, content: str) -> ApiResponse:
+        """댓글 작성 (Model API 감성 분석 포함)"""
+        return self.request("POST", f"/posts/{post_id}/comments", json_body={"content": content})
+
+    def update_comment(self, post_id: int, comment_id: int, content: str) -> ApiResponse:
+        """댓글 수정"""
+        return self.request("PATCH", f"/posts/{post_id}/comments/{comment_id}",
+                            json_body={"content": content})
+
+    def delete_comment(self, post_id: int, comment_id: int) -> ApiResponse:
+        """댓글 삭제"""
+        return self.request("DELETE", f"/posts/{post_id}/comments/{comment_id}")
+
+    # =========================================================================
+    # Model API (AI 분석)
+    # =========================================================================
+
+    def analyze_sentiment(self, text: str) -> ApiResponse:
+        """감정 분석 (기존 ML 모델 - 영어만 지원)"""
+        return self.request("POST", "/sentiment", service=config.MODEL,
+                            json_body={"text": text, "explain": False})
+
+    def analyze_sentiment_gemini(self, text: str, priority: int = INTERACTIVE) -> ApiResponse:
+        """
+        Gemini 기반 감정 분석 (한글/영어 모두 지원)
+
+        Args:
+            priority: 게시글 조회 등 사용자 요청은 INTERACTIVE, 일괄 재분석은 BATCH
+        """
+        return self.request("POST", "/sentiment/gemini", service=config.MODEL,
+                            json_body={"text": text, "explain": False}, priority=priority)
+
+    # =========================================================================
+    # 상태
+    # =========================================================================
+
+    def health_snapshot(self):
+        """
+        백그라운드 헬스 체크 결과
+
+        Returns:
+            list: 인스턴스별 상태 요약 (prober가 없으면 빈 목록)
+        """
+        if self.prober is None:
+            return []
+        return self.prober.snapshot()
@@ -0,0 +1,471 @@
+"""
+열 단위(Arrow IPC) 스냅샷 저장소
+
+JSON 스냅샷을 Python dict로 모두 읽으면 게시글 / 댓글 수에 비례해 메모리를 크게 차지합니다.
+같은 내용을 Arrow IPC 파일로 저장해 두고 메모리 매핑으로 열면,
+파일 크기와 관계없이 바로 열리고 열 데이터는 복사 없이(zero-copy) 파일 페이지를 그대로 읽습니다.
+
+디렉터리 구조 (snapshots/<이름>.columnar/):
+- posts.arrow: post_id, user_id, like/view/comment_count, created_at, nickname / image_class / sentiment 코드
+- comments.arrow: comment_id, post_id, user_id, created_at, nickname / sentiment 코드, confidence
+- post_text.arrow, comment_text.arrow: 제목 / 내용 / 이미지 URL (행 순서는 posts / comments와 같음)
+- nicknames.arrow: 닉네임 사전 (코드 → 닉네임)
+- meta.json: taken_at, 행 수, 작은 사전(감성 라벨, 이미지 분류)
+
+닉네임 등 반복되는 문자열은 사전 코드(int32)로 저장하고, 열 때 DictionaryArray로 묶습니다.
+숫자 열만 쓰는 집계는 텍스트 파일을 건드리지 않습니다.
+파일은 압축하지 않습니다 (메모리 매핑 zero-copy 읽기를 위해).
+
+pyarrow는 이 모듈의 함수를 호출할 때 import합니다.
+"""
+import os
+import shutil
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional
+
+from console import snapshot
+from console.moderation import BOTH, COMMENTS, DELETE, POSTS, ModerationFilter, Target
+from console.snapshot import comment_id_of, post_id_of
+
+
+SUFFIX = ".columnar"
+VERSION = 1
+DEFAULT_BATCH_SIZE = 65_536
+TIME_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
+POSTS_FILE = "posts.arrow"
+COMMENTS_FILE = "comments.arrow"
+POST_TEXT_FILE = "post_text.arrow"
+COMMENT_TEXT_FILE = "comment_text.arrow"
+NICKNAMES_FILE = "nicknames.arrow"
+META_FILE = "meta.json"
+
+
+def _schemas() -> Dict[str, Any]:
+    import pyarrow as pa
+
+    timestamp = pa.timestamp("s")
+    return {
+        POSTS_FILE: pa.schema([
+            ("post_id", pa.int64()),
+            ("user_id", pa.int64()),
+            ("like_count", pa.int64()),
+            ("view_count", pa.int64()),
+            ("comment_count", pa.int64()),
+            ("created_at", timestamp),
+            ("nickname", pa.int32()),
+            ("image_class", pa.int32()),
+            ("sentiment", pa.int32()),
+            ("confidence", pa.float64()),
+        ]),
+        COMMENTS_FILE: pa.schema([
+            ("comment_id", pa.int64()),
+            ("post_id", pa.int64()),
+            ("user_id", pa.int64()),
+            ("created_at", timestamp),
+            ("nickname", pa.int32()),
+            ("sentiment", pa.int32()),
+            ("confidence", pa.float64()),
+        ]),
+        POST_TEXT_FILE: pa.schema([("title", pa.string()), ("content", pa.string()), ("image_url", pa.string())]),
+        COMMENT_TEXT_FILE: pa.schema([("content", pa.string())]),
+    }
+
+
+def parse_time(value: Optional[str]) -> Optional[int]:
+    """Backend 시각 문자열 → epoch 초 (시간대가 없으면 UTC, 해석할 수 없으면 None)"""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return int(parsed.timestamp())
+
+
+class _Codes:
+    """문자열 → 사전 코드 (처음 본 순서대로 0, 1, 2, ...)"""
+
+    def __init__(self):
+        self.codes: Dict[str, int] = {}
+        self.values: List[str] = []
+
+    def __call__(self, value: Optional[str]) -> Optional[int]:
+        if value is None:
+            return None
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+
+# ============================================================================
+# 쓰기
+# ============================================================================
+
+class ColumnarWriter:
+    """
+    게시글 / 댓글을 받아 batch_size 행씩 Arrow IPC 파일에 기록
+
+    임시 디렉터리에 쓴 뒤 close()에서 directory로 옮기므로, 중간에 실패하면 directory는 생기지 않습니다.
+
+    Usage:
+        with ColumnarWriter(path) as writer:
+            writer.add_posts(posts)
+            writer.add_comments(comments)
+    """
+
+    def __init__(self, directory: str, batch_size: int = DEFAULT_BATCH_SIZE, taken_at: Optional[float] = None):
+        import pyarrow as pa
+
+        if os.path.exists(directory):
+            raise FileExistsError(f"이미 있는 경로입니다: {directory}")
+        self.directory = directory
+        self.batch_size = batch_size
+        self.taken_at = taken_at
+        self._tmp = f"{directory}.tmp"
+        shutil.rmtree(self._tmp, ignore_errors=True)
+        os.makedirs(self._tmp)
+
+        self._schemas = _schemas()
+        self._writers = {
+            name: pa.ipc.new_file(os.path.join(self._tmp, name), schema)
+            for name, schema in self._schemas.items()
+        }
+        self._buffers: Dict[str, Dict[str, list]] = {
+            name: {field.name: [] for field in schema} for name, schema in self._schemas.items()
+        }
+        self._rows = {name: 0 for name in self._schemas}
+        self.nicknames = _Codes()
+        self.labels = _Codes()
+        self.image_classes = _Codes()
+
+    def __enter__(self) -> "ColumnarWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def _append(self, name: str, row: Dict[str, Any]):
+        buffer = self._buffers[name]
+        for key, values in buffer.items():
+            values.append(row[key])
+        self._rows[name] += 1
+        if len(buffer[next(iter(buffer))]) >= self.batch_size:
+            self._flush(name)
+
+    def _flush(self, name: str):
+        import pyarrow as pa
+
+        buffer = self._buffers[name]
+        if not buffer[next(iter(buffer))]:
+            return
+        batch = pa.RecordBatch.from_pydict(buffer, schema=self._schemas[name])
+        self._writers[name].write_batch(batch)
+        for values in buffer.values():
+            values.clear()
+
+    def add_posts(self, posts: Iterable[Dict[str, Any]]):
+        for post in posts:
+            sentiment = post.get("sentiment") or {}
+            self._append(POSTS_FILE, {
+                "post_id": post_id_of(post),
+                "user_id": post.get("user_id"),
+                "like_count": post.get("like_count"),
+                "view_count": post.get("view_count"),
+                "comment_count": post.get("comment_count"),
+                "created_at": parse_time(post.get("created_at")),
+                "nickname": self.nicknames(post.get("nickname")),
+                "image_class": self.image_classes(post.get("image_class")),
+                "sentiment": self.labels(sentiment.get("label")),
+                "confidence": sentiment.get("confidence"),
+            })
+            self._append(POST_TEXT_FILE, {
+                "title": post.get("title"),
+                "content": post.get("content"),
+                "image_url": post.get("image_url"),
+            })
+
+    def add_comments(self, comments: Iterable[Dict[str, Any]]):
+        for comment in comments:
+            sentiment = comment.get("sentiment") or {}
+            self._append(COMMENTS_FILE, {
+                "comment_id": comment_id_of(comment),
+                "post_id": comment.get("post_id"),
+                "user_id": comment.get("author_id", comment.get("user_id")),
+                "created_at": parse_time(comment.get("created_at")),
+                "nickname": self.nicknames(comment.get("author_nickname", comment.get("nickname"))),
+                "sentiment": self.labels(sentiment.get("label")),
+                "confidence": sentiment.get("confidence"),
+            })
+            self._append(COMMENT_TEXT_FILE, {"content": comment.get("content")})
+
+    def close(self) -> str:
+        import json
+
+        import pyarrow as pa
+
+        for name in self._writers:
+            self._flush(name)
+            self._writers[name].close()
+        with pa.ipc.new_file(os.path.join(self._tmp, NICKNAMES_FILE), pa.schema([("value", pa.string())])) as w:
+            w.write_table(pa.table({"value": pa.array(self.nicknames.values, pa.string())}))
+        meta = {
+            "version": VERSION,
+            "taken_at": self.taken_at,
+            "posts": self._rows[POSTS_FILE],
+            "comments": self._rows[COMMENTS_FILE],
+            "labels": self.labels.values,
+            "image_classes": self.image_classes.values,
+        }
+        with open(os.path.join(self._tmp, META_FILE), "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False)
+        os.replace(self._tmp, self.directory)
+        return self.directory
+
+    def abort(self):
+        for writer in self._writers.values():
+            try:
+                writer.close()
+            except Exception:
+                pass
+        shutil.rmtree(self._tmp, ignore_errors=True)
+
+
+def write(board: Dict[str, Any], directory: str, batch_size: int = DEFAULT_BATCH_SIZE) -> str:
+    """스냅샷 dict → 열 단위 저장소"""
+    with ColumnarWriter(directory, batch_size, taken_at=board.get("taken_at")) as writer:
+        writer.add_posts(board.get("posts", []))
+        writer.add_comments(board.get("comments", []))
+    return directory
+
+
+def convert(json_path: str, directory: Optional[str] = None, batch_size: int = DEFAULT_BATCH_SIZE) -> str:
+    """JSON 스냅샷 파일 → 열 단위 저장소 (기본 경로: 같은 이름의 .columnar 디렉터리)"""
+    if directory is None:
+        directory = os.path.splitext(json_path)[0] + SUFFIX
+    return write(snapshot.load(json_path), directory, batch_size)
+
+
+def list_stores(directory: str = snapshot.DEFAULT_DIR) -> List[str]:
+    """열 단위 저장소 경로 목록 (최신 순)"""
+    if not os.path.isdir(directory):
+        return []
+    paths = [os.path.join(directory, name) for name in os.listdir(directory)
+             if name.endswith(SUFFIX) and os.path.isdir(os.path.join(directory, name))]
+    return sorted(paths, reverse=True)
+
+
+def is_store(path: str) -> bool:
+    return os.path.isdir(path) and os.path.exists(os.path.join(path, META_FILE))
+
+
+# ============================================================================
+# 읽기
+# ============================================================================
+
+def _read(path: str):
+    """메모리 매핑으로 IPC 파일 열기 (버퍼는 파일 페이지를 그대로 참조)"""
+    import pyarrow as pa
+
+    return pa.ipc.open_file(pa.memory_map(path, "r")).read_all()
+
+
+def _dictionary(table, column: str, values):
+    """코드 열 → DictionaryArray 열 (청크별, 복사 없음)"""
+    import pyarrow as pa
+
+    dictionary = values if isinstance(values, pa.Array) else pa.array(values, pa.string())
+    chunks = [pa.DictionaryArray.from_arrays(chunk, dictionary) for chunk in table.column(column).chunks]
+    index = table.schema.get_field_index(column)
+    return table.set_column(index, column, pa.chunked_array(chunks, pa.dictionary(pa.int32(), pa.string())))
+
+
+class ColumnarSnapshot:
+    """
+    메모리 매핑된 열 단위 스냅샷
+
+    posts / comments는 숫자 열과 사전 열(nickname, image_class, sentiment)만 있는 pyarrow.Table이며,
+    텍스트 열은 post_text / comment_text를 처음 사용할 때 엽니다.
+    """
+
+    def __init__(self, directory: str):
+        import json
+
+        self.directory = directory
+        with open(os.path.join(directory, META_FILE), encoding="utf-8") as f:
+            self.meta = json.load(f)
+        nicknames = _read(os.path.join(directory, NICKNAMES_FILE)).column("value").combine_chunks()
+
+        posts = _read(os.path.join(directory, POSTS_FILE))
+        posts = _dictionary(posts, "nickname", nicknames)
+        posts = _dictionary(posts, "image_class", self.meta["image_classes"])
+        self.posts = _dictionary(posts, "sentiment", self.meta["labels"])
+
+        comments = _read(os.path.join(directory, COMMENTS_FILE))
+        comments = _dictionary(comments, "nickname", nicknames)
+        self.comments = _dictionary(comments, "sentiment", self.meta["labels"])
+
+        self._post_text = None
+        self._comment_text = None
+
+    @property
+    def taken_at(self) -> Optional[float]:
+        return self.meta.get("taken_at")
+
+    @property
+    def post_text(self):
+        if self._post_text is None:
+            self._post_text = _read(os.path.join(self.directory, POST_TEXT_FILE))
+        return self._post_text
+
+    @property
+    def comment_text(self):
+        if self._comment_text is None:
+            self._comment_text = _read(os.path.join(self.directory, COMMENT_TEXT_FILE))
+        return self._comment_text
+
+    # =========================================================================
+    # dict 변환 (선택된 행만)
+    # =========================================================================
+
+    def posts_at(self, rows: List[int]) -> List[Dict[str, Any]]:
+        """rows번째 게시글들 (스냅샷 JSON과 같은 형식, 선택된 행만 열 단위로 한 번에 변환)"""
+        indices = _int_array(rows)
+        values = _pylists(self.posts.take(indices))
+        texts = _pylists(self.post_text.take(indices))
+        posts = []
+        for i in range(len(rows)):
+            post = {
+                "post_id": values["post_id"][i],
+                "title": texts["title"][i],
+                "content": texts["content"][i],
+                "user_id": values["user_id"][i],
+                "nickname": values["nickname"][i],
+                "image_url": texts["image_url"][i],
+                "image_class": values["image_class"][i],
+                "like_count": values["like_count"][i],
+                "view_count": values["view_count"][i],
+                "comment_count": values["comment_count"][i],
+                "created_at": values["created_at"][i],
+            }
+            if values["sentiment"][i] is not None:
+                post["sentiment"] = {"label": values["sentiment"][i], "confidence": values["confidence"][i]}
+            posts.append(post)
+        return posts
+
+    def comments_at(self, rows: List[int]) -> List[Dict[str, Any]]:
+        """rows번째 댓글들 (스냅샷 JSON과 같은 형식, post_id 포함)"""
+        indices = _int_array(rows)
+        values = _pylists(self.comments.take(indices))
+        contents = self.comment_text.column("content").take(indices).to_pylist()
+        comments = []
+        for i, content in enumerate(contents):
+            sentiment = None
+            if values["sentiment"][i] is not None:
+                sentiment = {"label": values["sentiment"][i], "confidence": values["confidence"][i]}
+            comments.append({
+                "comment_id": values["comment_id"][i],
+                "post_id": values["post_id"][i],
+                "content": content,
+                "author_id": values["user_id"][i],
+                "author_nickname": values["nickname"][i],
+                "created_at": values["created_at"][i],
+                "sentiment": sentiment,
+            })
+        return comments
+
+    def to_board(self) -> Dict[str, Any]:
+        """전체를 스냅샷 dict로 (작은 스냅샷 / 호환용 - 큰 스냅샷에는 select 사용)"""
+        return {
+            "taken_at": self.taken_at,
+            "posts": self.posts_at(list(range(self.posts.num_rows))),
+            "comments": self.comments_at(list(range(self.comments.num_rows))),
+            "errors": [],
+        }
+
+    # =========================================================================
+    # 모더레이션
+    # =========================================================================
+
+    def _mask(self, table, text, flt: ModerationFilter, text_columns: List[str]):
+        """조건별 불리언 열을 AND로 결합 (flt는 비어 있지 않음)"""
+        import pyarrow.compute as pc
+
+        masks = []
+        if flt.author:
+            masks.append(pc.fill_null(pc.equal(table.column("nickname"), flt.author), False))
+        if flt.sentiment:
+            masks.append(pc.fill_null(pc.equal(table.column("sentiment"), flt.sentiment), False))
+        if flt.keyword:
+            found = None
+            for column in text_columns:
+                hit = pc.fill_null(pc.match_substring(text.column(column), flt.keyword, ignore_case=True), False)
+                found = hit if found is None else pc.or_(found, hit)
+            masks.append(found)
+        mask = masks[0]
+        for other in masks[1:]:
+            mask = pc.and_(mask, other)
+        return mask
+
+    def select(self, flt: ModerationFilter, action: str = DELETE) -> List[Target]:
+        """
+        moderation.select와 같은 대상 선택을 열 연산으로 수행 (일치한 행만 dict로 변환)
+
+        action이 DELETE면 선택된 게시글에 속한 댓글은 제외합니다.
+
+        키워드 검사는 제목 / 내용 각각에서 찾습니다 (제목과 내용에 걸친 문자열은 일치하지 않음).
+        """
+        import pyarrow.compute as pc
+
+        if flt.is_empty():
+            return []
+        targets: List[Target] = []
+        deleted = set()
+        if flt.target in (POSTS, BOTH):
+            mask = self._mask(self.posts, self.post_text if flt.keyword else None, flt, ["title", "content"])
+            for post in self.posts_at(pc.indices_nonzero(mask).to_pylist()):
+                if action == DELETE:
+                    deleted.add(post["post_id"])
+                targets.append(Target(POSTS, post["post_id"], None, post))
+        if flt.target in (COMMENTS, BOTH):
+            mask = self._mask(self.comments, self.comment_text if flt.keyword else None, flt, ["content"])
+            if deleted:
+                keep = pc.invert(pc.is_in(self.comments.column("post_id"), value_set=_int_array(sorted(deleted))))
+                mask = pc.and_(mask, keep)
+            for comment in self.comments_at(pc.indices_nonzero(mask).to_pylist()):
+                targets.append(Target(COMMENTS, comment["post_id"], comment["comment_id"], comment))
+        return targets
+
+
+def _pylists(table) -> Dict[str, list]:
+    """테이블 → 열 이름별 Python 목록 (사전 열은 문자열, 시각은 Backend 형식 문자열로)"""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    columns = {}
+    for name in table.column_names:
+        column = table.column(name)
+        if pa.types.is_dictionary(column.type):
+            column = pc.cast(column, pa.string())
+        elif pa.types.is_timestamp(column.type):
+            column = pc.strftime(column, format=TIME_FORMAT)
+        columns[name] = column.to_pylist()
+    return columns
+
+
+def _int_array(values: List[int]):
+    import pyarrow as pa
+
+    return pa.array(values, pa.int64())
+
+
+def open_store(directory: str) -> ColumnarSnapshot:
+    """열 단위 저장소 열기 (메모리 매핑 - 크기와 관계없이 바로 열림)"""
+    return ColumnarSnapshot(directory)
@@ -0,0 +1,173 @@
+"""
+적응형 동시성 제한
+
+관측한 지연 시간과 429 / 503 응답으로 서비스별 동시 요청 수를 조절합니다 (AIMD).
+- 지연 시간이 기준(최근 최소 지연 시간 × tolerance) 이내면 limit을 서서히 증가
+  (limit의 절반 이상을 사용 중일 때만)
+- 지연 시간이 기준을 넘으면 limit을 조금 감소
+- 429 / 503 / 네트워크 오류면 limit을 크게 감소
+
+bulk_map은 작업 목록을 스레드 풀로 실행하며, 실제 동시 요청 수는
+ApiClient 안의 서비스별 AdaptiveLimiter가 제한합니다.
+"""
+import threading
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+
+THROTTLE_STATUSES = (0, 429, 503)
+
+
+class AdaptiveLimiter:
+    """
+    AIMD 기반 적응형 동시성 제한기
+
+    slot() 컨텍스트 안에서 요청을 보내고, 결과를 record()로 알려야 합니다.
+    """
+
+    def __init__(self, initial: int = 4, min_limit: int = 1, max_limit: int = 64,
+                 tolerance: float = 2.0, backoff: float = 0.5, inflation_backoff: float = 0.9,
+                 window: int = 100):
+        self.limit = float(initial)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.tolerance = tolerance
+        self.backoff = backoff
+        self.inflation_backoff = inflation_backoff
+
+        self.in_flight = 0
+        self._samples = deque(maxlen=window)
+        self._cond = threading.Condition()
+
+        self.successes = 0
+        self.throttled = 0
+        self.inflated = 0
+        self.last_latency: Optional[float] = None
+
+    # =========================================================================
+    # 슬롯
+    # =========================================================================
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """
+        요청 슬롯 획득 (limit에 도달하면 대기)
+
+        Returns:
+            bool: timeout 안에 획득하면 True
+        """
+        with self._cond:
+            acquired = self._cond.wait_for(lambda: self.in_flight < int(self.limit), timeout)
+            if acquired:
+                self.in_flight += 1
+            return acquired
+
+    def release(self):
+        with self._cond:
+            self.in_flight = max(0, self.in_flight - 1)
+            self._cond.notify_all()
+
+    @contextmanager
+    def slot(self):
+        """요청 슬롯 컨텍스트"""
+        self.acquire()
+        try:
+            yield self
+        finally:
+            self.release()
+
+    # =========================================================================
+    # 조절
+    # =========================================================================
+
+    def baseline(self) -> Optional[float]:
+        """최근 최소 지연 시간 (부하 없는 상태의 추정치)"""
+        return min(self._samples) if self._samples else None
+
+    def record(self, latency: float, status: int):
+        """
+        요청 결과 반영
+
+        Args:
+            latency: 요청 소요 시간 (초)
+            status: HTTP 상태 코드 (네트워크 오류는 0)
+        """
+        with self._cond:
+            self.last_latency = latency
+            if status in THROTTLE_STATUSES:
+                self.throttled += 1
+                self.limit = max(self.min_limit, self.limit * self.backoff)
+                return
+
+            baseline = self.baseline()
+            self._samples.append(latency)
+            if baseline is not None and latency > baseline * self.tolerance:
+                self.inflated += 1
+                self.limit = max(self.min_limit, self.limit * self.inflation_backoff)
+            else:
+                self.successes += 1
+                if self.in_flight * 2 >= self.limit:
+                    self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+            self._cond.notify_all()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 limit, 진행 중 요청 수, 기준 지연 시간 등"""
+        with self._cond:
+            baseline = self.baseline()
+            return {
+                "limit": int(self.limit),
+                "in_flight": self.in_flight,
+                "baseline_ms": baseline * 1000 if baseline is not None else None,
+                "last_latency_ms": self.last_latency * 1000 if self.last_latency is not None else None,
+                "successes": self.successes,
+                "inflated": self.inflated,
+                "throttled": self.throttled,
+            }
+
+
+# ============================================================================
+# 대량 작업 실행
+# ============================================================================
+
+def bulk_map(fn: Callable[[Any], Any], items: Iterable[Any], workers: int = 32,
+             on_result: Optional[Callable[[int, Any, Any, Optional[BaseException]], None]] = None,
+             cancel: Optional[threading.Event] = None) -> List[Any]:
+    """
+    작업 목록 동시 실행
+
+    workers는 스레드 수의 상한일 뿐이며, API 요청의 실제 동시성은
+    클라이언트의 AdaptiveLimiter가 조절합니다.
+
+    Args:
+        on_result: 항목마다 (index, item, result, error)로 호출 (진행 상황 보고용)
+        cancel: 설정되면 아직 시작하지 않은 항목은 건너뜀
+
+    Returns:
+        list: 입력 순서대로의 결과 (예외가 난 항목은 예외 객체, 취소된 항목은 None)
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    items = list(items)
+    results: List[Any] = [None] * len(items)
+    lock = threading.Lock()
+
+    def run(index: int):
+        if cancel is not None and cancel.is_set():
+            return
+        item = items[index]
+        error = None
+        result = None
+        try:
+            result = fn(item)
+        except Exception as e:
+            error = e
+            result = e
+        results[index] = result
+        if on_result is not None:
+            with lock:
+                on_result(index, item, result if error is None else None, error)
+
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="bulk") as executor:
+        for future in [executor.submit(run, index) for index in range(len(items))]:
+            future.result()
+    return results
@@ -0,0 +1,74 @@
+"""
+서비스 엔드포인트 설정
+
+Backend / Model API 인스턴스 목록을 환경 변수에서 읽습니다.
+- BACKEND_URLS: 쉼표로 구분한 Backend 인스턴스 (기본 http://localhost:8000)
+- MODEL_API_URLS: 쉼표로 구분한 Model API 인스턴스 (기본 http://localhost:8001)
+- GEMINI_RATE_PER_MINUTE / GEMINI_BURST: /sentiment/gemini 호출 속도 제한 (기본 60회/분, 버스트 5)
+"""
+import os
+from typing import Dict, List, Tuple
+
+
+# ============================================================================
+# 기본 설정 상수
+# ============================================================================
+
+BACKEND = "backend"
+MODEL = "model"
+
+API_PREFIX = "/api"
+
+DEFAULT_URLS = {
+    BACKEND: ["http://localhost:8000"],
+    MODEL: ["http://localhost:8001"],
+}
+
+ENV_VARS = {
+    BACKEND: "BACKEND_URLS",
+    MODEL: "MODEL_API_URLS",
+}
+
+# 헬스 체크 경로 (인스턴스 루트 기준)
+HEALTH_PATHS = {
+    BACKEND: "/",
+    MODEL: "/",
+}
+
+
+def parse_urls(value: str) -> List[str]:
+    """
+    쉼표로 구분된 URL 문자열 파싱
+
+    Returns:
+        list: 끝의 '/'를 제거한 URL 목록 (빈 항목 제외)
+    """
+    return [url.strip().rstrip("/") for url in value.split(",") if url.strip()]
+
+
+def service_urls(service: str) -> List[str]:
+    """
+    서비스 인스턴스 URL 목록
+
+    환경 변수가 설정되어 있으면 우선 사용하고, 없으면 기본값을 반환합니다.
+    """
+    value = os.environ.get(ENV_VARS[service], "")
+    urls = parse_urls(value)
+    return urls or list(DEFAULT_URLS[service])
+
+
+def service_targets() -> Dict[str, List[str]]:
+    """전체 서비스 → 인스턴스 URL 목록"""
+    return {service: service_urls(service) for service in DEFAULT_URLS}
+
+
+def model_rate_limits() -> Dict[str, Tuple[float, int]]:
+    """
+    Model API 엔드포인트별 호출 속도 제한
+
+    Returns:
+        dict: 엔드포인트 → (초당 토큰 수, 버스트)
+    """
+    per_minute = float(os.environ.get("GEMINI_RATE_PER_MINUTE", "60"))
+    burst = int(os.environ.get("GEMINI_BURST", "5"))
+    return {"/sentiment/gemini": (per_minute / 60, burst)}
@@ -0,0 +1,134 @@
+"""
+대용량 게시판 데이터 생성
+
+로컬 Backend 대역(console.standin)에 적재할 게시글 / 댓글 데이터를 seed로 결정적으로 생성합니다.
+페이지네이션, 크롤링, 캐시 동작을 실제 규모(게시글 10만 개 이상, 댓글 수백만 개)에서 확인하는 용도입니다.
+
+- 게시글 작성자: 소수 사용자가 많이 작성 (멱 분포)
+- 조회수: 로그정규 분포, 좋아요: 조회수의 일부
+- 게시글별 댓글 수: 파레토 분포 (평균 comments_mean, 소수 게시글에 집중)
+- 생성은 CHUNK_SIZE 게시글 단위로 나누어 하며, 청크마다 독립된 난수 생성기를 사용하므로
+  적재 방식(메모리 / SQLite)과 관계없이 같은 seed면 같은 데이터
+- 한 번에 한 청크만 메모리에 두므로 최대 메모리는 청크 크기에 비례
+
+사용 예:
+    python -m console dataset --posts 100000 --sqlite board.db
+    python -m console --standin board.db list --page 5000
+"""
+import random
+from typing import Iterator, List, NamedTuple, Tuple
+
+from console.seed import POST_SENTENCES, POST_TITLES, nickname
+
+
+CHUNK_SIZE = 10_000
+
+# 2024-01-01T00:00:00Z
+DEFAULT_START = 1704067200.0
+DAY = 86400.0
+
+# 게시글당 댓글 수 상한 (파레토 분포의 극단값 제한)
+MAX_COMMENTS_PER_POST = 20_000
+
+# (내용, 감성 라벨, 신뢰도) - 댓글은 이 목록의 인덱스로 저장
+COMMENT_VOCAB: List[Tuple[str, str, float]] = [
+    ("너무 귀여워요!", "positive", 0.97),
+    ("사진 더 올려주세요", "positive", 0.81),
+    ("우리 애도 그래요 ㅎㅎ", "positive", 0.74),
+    ("정보 감사합니다", "positive", 0.88),
+    ("부럽습니다", "positive", 0.62),
+    ("빨리 나았으면 좋겠네요", "positive", 0.58),
+    ("잘 보고 갑니다", "neutral", 0.55),
+    ("어디서 사셨나요?", "neutral", 0.67),
+    ("저도 궁금했어요", "neutral", 0.52),
+    ("별로네요", "negative", 0.81),
+    ("광고 아닌가요?", "negative", 0.73),
+    ("최악이에요", "negative", 0.94),
+]
+
+IMAGE_CLASSES = ("Cat", "Dog")
+
+
+class DatasetConfig(NamedTuple):
+    """생성 설정"""
+    posts: int = 100_000
+    users: int = 10_000
+    comments_mean: float = 20.0
+    alpha: float = 1.5
+    image_ratio: float = 0.3
+    seed: int = 0
+    start: float = DEFAULT_START
+    span_days: float = 365.0
+
+
+class Chunk(NamedTuple):
+    """
+    생성 청크
+
+    posts: (post_id, user_id, title, content, image_url, image_class,
+            like_count, view_count, comment_count, created_at)
+    comments: (comment_id, post_id, user_id, vocab_index, created_at) - post_id 순서
+    created_at은 epoch 초
+    """
+    posts: List[tuple]
+    comments: List[tuple]
+
+
+def user_nickname(user_id: int) -> str:
+    """user_id(1부터)의 닉네임"""
+    return nickname(user_id - 1)
+
+
+def _skewed_user(rng: random.Random, users: int, power: float) -> int:
+    """앞쪽 user_id일수록 자주 뽑히는 사용자 (power가 클수록 치우침)"""
+    return int(users * rng.random() ** power) + 1
+
+
+def generate(config: DatasetConfig) -> Iterator[Chunk]:
+    """
+    청크 단위 데이터 생성
+
+    comment_id는 청크 순서대로 이어지며, 같은 설정이면 항상 같은 결과를 만듭니다.
+    """
+    if config.posts < 0 or config.users < 1:
+        raise ValueError("posts는 0 이상, users는 1 이상이어야 합니다")
+    if config.alpha <= 1:
+        raise ValueError("alpha는 1보다 커야 합니다 (평균이 유한한 파레토 분포)")
+
+    # 파레토(alpha) - 1의 평균은 1 / (alpha - 1)
+    comment_scale = config.comments_mean * (config.alpha - 1)
+    span = config.span_days * DAY
+    end = config.start + span
+    vocab = len(COMMENT_VOCAB)
+    comment_id = 0
+
+    for chunk_index, first in enumerate(range(0, config.posts, CHUNK_SIZE)):
+        rng = random.Random(config.seed * 1_000_003 + chunk_index)
+        posts = []
+        comments = []
+        for post_id in range(first + 1, min(first + CHUNK_SIZE, config.posts) + 1):
+            created_at = config.start + span * (post_id - 1 + rng.random()) / config.posts
+            views = int(rng.lognormvariate(4.0, 1.5))
+            likes = int(views * rng.random() * 0.15)
+            count = min(int((rng.paretovariate(config.alpha) - 1) * comment_scale), MAX_COMMENTS_PER_POST)
+            image_class = rng.choice(IMAGE_CLASSES) if rng.random() < config.image_ratio else None
+            posts.append((
+                post_id,
+                _skewed_user(rng, config.users, 3.0),
+                f"{rng.choice(POST_TITLES)} #{post_id}",
+                " ".join(rng.sample(POST_SENTENCES, 2)),
+                f"/uploads/posts/{post_id}.jpg" if image_class else None,
+                image_class,
+                likes,
+                views,
+                count,
+                created_at,
+            ))
+
+            # 댓글 시각은 게시글 이후로 점점 뜸해지도록 (지수 분포 간격, 평균 6시간)
+            at = created_at
+            for content in rng.choices(range(vocab), k=count):
+                comment_id += 1
+                at = min(at + rng.expovariate(1 / 21600.0), end)
+                comments.append((comment_id, post_id, _skewed_user(rng, config.users, 2.0), content, at))
+        yield Chunk(posts, comments)
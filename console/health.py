@@ -0,0 +1,245 @@
+"""
+백그라운드 헬스 체크
+
+Backend 및 모든 Model API 인스턴스를 주기적으로 동시에 확인하고,
+인스턴스별 가용성 / 지연 시간 이력을 유지합니다.
+
+상태 판정:
+- unknown: 아직 확인 결과 없음
+- down: 연속 실패 횟수가 down_after 이상
+- degraded: 최근 실패, 가용성 저하 또는 p95 지연 시간 초과
+- healthy: 그 외
+"""
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+from console import config
+from console.client import RequestsTransport, TransportError
+
+
+DEFAULT_INTERVAL = 5.0
+DEFAULT_TIMEOUT = 2.0
+DEFAULT_HISTORY = 60
+
+
+class ProbeResult(NamedTuple):
+    """단일 헬스 체크 결과"""
+    timestamp: float
+    ok: bool
+    latency: Optional[float]
+    status: int
+    error: Optional[str]
+
+
+def percentile(values: List[float], q: float) -> Optional[float]:
+    """정렬 기반 백분위수 (값이 없으면 None)"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))
+    return ordered[index]
+
+
+class InstanceHealth:
+    """
+    인스턴스별 헬스 체크 이력
+
+    최근 history개의 결과만 유지합니다.
+    """
+
+    def __init__(self, service: str, url: str, history: int = DEFAULT_HISTORY):
+        self.service = service
+        self.url = url
+        self.results = deque(maxlen=history)
+        self.consecutive_failures = 0
+
+    def record(self, result: ProbeResult):
+        self.results.append(result)
+        if result.ok:
+            self.consecutive_failures = 0
+        else:
+            self.consecutive_failures += 1
+
+    def availability(self) -> Optional[float]:
+        """최근 이력 중 성공 비율"""
+        if not self.results:
+            return None
+        return sum(1 for r in self.results if r.ok) / len(self.results)
+
+    def latencies(self) -> List[float]:
+        """성공한 확인의 지연 시간 (초)"""
+        return [r.latency for r in self.results if r.ok and r.latency is not None]
+
+    def state(self, down_after: int, min_availability: float, slow_threshold: float) -> str:
+        if not self.results:
+            return "unknown"
+        if self.consecutive_failures >= down_after:
+            return "down"
+        p95 = percentile(self.latencies(), 0.95)
+        if (self.consecutive_failures > 0
+                or self.availability() < min_availability
+                or (p95 is not None and p95 > slow_threshold)):
+            return "degraded"
+        return "healthy"
+
+
+class HealthProber:
+    """
+    백그라운드 헬스 체커
+
+    start()로 데몬 스레드를 띄우면 interval마다 모든 인스턴스를 동시에 확인합니다.
+    리스너를 등록하면 확인 결과마다 (service, url, result)로 호출됩니다.
+    """
+
+    def __init__(self, targets: Optional[Dict[str, List[str]]] = None, transport=None,
+                 interval: float = DEFAULT_INTERVAL, timeout: float = DEFAULT_TIMEOUT,
+                 history: int = DEFAULT_HISTORY, down_after: int = 3,
+                 min_availability: float = 0.9, slow_threshold: float = 1.0):
+        self.targets = targets or config.service_targets()
+        self.transport = transport or RequestsTransport()
+        self.interval = interval
+        self.timeout = timeout
+        self.down_after = down_after
+        self.min_availability = min_availability
+        self.slow_threshold = slow_threshold
+
+        self._instances: Dict[tuple, InstanceHealth] = {}
+        for service, urls in self.targets.items():
+            for url in urls:
+                self._instances[(service, url)] = InstanceHealth(service, url, history)
+
+        self._listeners: List[Callable[[str, str, ProbeResult], None]] = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, len(self._instances)),
+            thread_name_prefix="health-probe",
+        )
+
+    # =========================================================================
+    # 확인
+    # =========================================================================
+
+    def add_listener(self, listener: Callable[[str, str, ProbeResult], None]):
+        """확인 결과 리스너 등록"""
+        self._listeners.append(listener)
+
+    def probe(self, service: str, url: str) -> ProbeResult:
+        """
+        단일 인스턴스 확인
+
+        5xx 응답, 연결 실패, 타임아웃은 실패로 기록합니다.
+        """
+        started = time.perf_counter()
+        try:
+            raw = self.transport.send(
+                "GET",
+                f"{url}{config.HEALTH_PATHS.get(service, '/')}",
+                timeout=self.timeout,
+            )
+        except TransportError as e:
+            return ProbeResult(time.time(), False, None, 0, str(e))
+
+        latency = time.perf_counter() - started
+        if raw.status >= 500:
+            return ProbeResult(time.time(), False, latency, raw.status, f"HTTP {raw.status}")
+        if latency > self.timeout:
+            return ProbeResult(time.time(), False, latency, raw.status, "timeout")
+        return ProbeResult(time.time(), True, latency, raw.status, None)
+
+    def probe_once(self) -> Dict[tuple, ProbeResult]:
+        """
+        모든 인스턴스를 동시에 한 번 확인
+
+        Returns:
+            dict: (service, url) → ProbeResult
+        """
+        futures = {
+            key: self._executor.submit(self.probe, *key)
+            for key in self._instances
+        }
+        results = {}
+        for key, future in futures.items():
+            result = future.result()
+            with self._lock:
+                self._instances[key].record(result)
+            results[key] = result
+            for listener in self._listeners:
+                listener(key[0], key[1], result)
+        return results
+
+    # =========================================================================
+    # 백그라운드 실행
+    # =========================================================================
+
+    def start(self):
+        """백그라운드 확인 시작 (이미 실행 중이면 무시)"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="health-prober", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """백그라운드 확인 중지"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.probe_once()
+            self._stop.wait(self.interval)
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    # =========================================================================
+    # 조회
+    # =========================================================================
+
+    def state(self, service: str, url: str) -> str:
+        """인스턴스 상태 (unknown / healthy / degraded / down)"""
+        with self._lock:
+            return self._instances[(service, url)].state(
+                self.down_after, self.min_availability, self.slow_threshold)
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """
+        인스턴스별 상태 요약
+
+        Returns:
+            list: service, url, state, availability, 지연 시간(ms) p50/p95, 마지막 결과
+        """
+        summaries = []
+        with self._lock:
+            for instance in self._instances.values():
+                latencies = instance.latencies()
+                last = instance.results[-1] if instance.results else None
+                p50 = percentile(latencies, 0.5)
+                p95 = percentile(latencies, 0.95)
+                summaries.append({
+                    "service": instance.service,
+                    "url": instance.url,
+                    "state": instance.state(self.down_after, self.min_availability, self.slow_threshold),
+                    "availability": instance.availability(),
+                    "latency_p50_ms": p50 * 1000 if p50 is not None else None,
+                    "latency_p95_ms": p95 * 1000 if p95 is not None else None,
+                    "consecutive_failures": instance.consecutive_failures,
+                    "last_status": last.status if last else None,
+                    "last_error": last.error if last else None,
+                    "last_checked": last.timestamp if last else None,
+                    "samples": len(instance.results),
+                })
+        return summaries
+
+    def history(self, service: str, url: str) -> List[ProbeResult]:
+        """인스턴스 확인 이력 (오래된 순)"""
+        with self._lock:
+            return list(self._instances[(service, url)].results)
@@ -0,0 +1,235 @@
+"""
+중복 이미지 분류 결과 캐시
+
+같은 반려동물 사진을 다시 올리는 경우가 많으므로, 업로드 전에 이미지 지문을 계산해
+이전에 올린 이미지와 같거나 거의 같으면 업로드(/posts/upload)와 Model API 분류를 건너뛰고
+저장해 둔 image_url / 분류 결과를 그대로 사용합니다.
+
+이미지 지문:
+- sha256: 파일 내용 해시 (완전히 같은 파일)
+- dHash: 9x8 흑백으로 줄인 뒤 가로로 이웃한 픽셀의 밝기 비교 64비트 (크기 변경 / 재압축에도 거의 같음)
+  해밍 거리가 max_distance 이하이면 같은 이미지로 봄
+- PIL이 없거나 이미지를 읽을 수 없으면 sha256만 사용
+- 단색처럼 비트가 모두 같은 dHash는 서로 다른 이미지도 같게 나오므로 sha256으로만 비교
+
+캐시에는 분류에 성공한 업로드만 저장합니다 (분류 실패 / 업로드 실패는 다음에 다시 요청).
+캐시에서 돌려주는 image_url은 처음 업로드한 파일을 가리킵니다.
+"""
+import hashlib
+import os
+import threading
+import time
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from console.client import ApiResponse
+from console.snapshot import DEFAULT_DIR
+
+
+DEFAULT_PATH = os.path.join(DEFAULT_DIR, "image_cache.sqlite")
+DEFAULT_MAX_DISTANCE = 5
+HASH_BITS = 64
+CACHED_MESSAGE = "upload_cached"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS images (
+    sha256 TEXT PRIMARY KEY,
+    phash INTEGER,
+    image_url TEXT NOT NULL,
+    class_name TEXT NOT NULL,
+    confidence REAL,
+    hits INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL
+);
+"""
+
+
+class Fingerprint(NamedTuple):
+    """이미지 지문 (phash는 이미지를 읽을 수 없으면 None)"""
+    sha256: str
+    phash: Optional[int]
+
+
+class CacheHit(NamedTuple):
+    """캐시에서 찾은 분류 결과 (distance 0은 같은 파일 또는 같은 dHash)"""
+    image_url: str
+    class_name: str
+    confidence: Optional[float]
+    distance: int
+
+
+# ============================================================================
+# 지문
+# ============================================================================
+
+def dhash(content: bytes) -> Optional[int]:
+    """
+    64비트 difference hash (PIL이 없거나 이미지를 읽을 수 없으면 None)
+
+    PIL은 이 함수를 처음 호출할 때 import합니다.
+    """
+    try:
+        import io
+        from PIL import Image
+    except ImportError:
+        return None
+    try:
+        with Image.open(io.BytesIO(content)) as image:
+            pixels = list(image.convert("L").resize((9, 8), Image.Resampling.BILINEAR).getdata())
+    except (OSError, ValueError, Image.DecompressionBombError):
+        return None
+    value = 0
+    for row in range(8):
+        for col in range(8):
+            value = (value << 1) | (pixels[row * 9 + col] > pixels[row * 9 + col + 1])
+    return value
+
+
+def fingerprint(content: bytes) -> Fingerprint:
+    return Fingerprint(hashlib.sha256(content).hexdigest(), dhash(content))
+
+
+def distance(a: int, b: int) -> int:
+    """dHash 해밍 거리"""
+    return (a ^ b).bit_count()
+
+
+def _signed(value: int) -> int:
+    """64비트 부호 없는 정수 → SQLite INTEGER (부호 있는 64비트)"""
+    return value - (1 << HASH_BITS) if value >= 1 << (HASH_BITS - 1) else value
+
+
+def _unsigned(value: int) -> int:
+    return value + (1 << HASH_BITS) if value < 0 else value
+
+
+def _degenerate(phash: int) -> bool:
+    return phash in (0, (1 << HASH_BITS) - 1)
+
+
+# ============================================================================
+# 캐시
+# ============================================================================
+
+class ImageCache:
+    """
+    SQLite 분류 결과 캐시 파일
+
+    dHash 목록은 메모리에 두고 해밍 거리를 차례로 비교합니다 (10만 장에 수십 ms).
+    연결 하나를 잠금으로 보호해 여러 스레드(일괄 업로드 작업)에서 사용합니다.
+
+    Usage:
+        cache = ImageCache()
+        response = cache.upload(client, "dog.jpg", content, "image/jpeg")
+    """
+
+    def __init__(self, path: str = DEFAULT_PATH, max_distance: int = DEFAULT_MAX_DISTANCE):
+        import sqlite3
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.max_distance = max_distance
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(SCHEMA)
+        self._lock = threading.Lock()
+        self._hashes: List[Tuple[int, str]] = [
+            (_unsigned(phash), sha256)
+            for sha256, phash in self._conn.execute("SELECT sha256, phash FROM images WHERE phash IS NOT NULL")
+        ]
+
+    def close(self):
+        self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM images").fetchone()[0]
+
+    def stats(self) -> Dict[str, int]:
+        """저장된 이미지 수 / 캐시로 건너뛴 업로드 수"""
+        with self._lock:
+            images, hits = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(hits), 0) FROM images").fetchone()
+        return {"images": images, "hits": hits}
+
+    def _nearest(self, phash: int) -> Optional[Tuple[str, int]]:
+        best = None
+        for stored, sha256 in self._hashes:
+            d = distance(stored, phash)
+            if d <= self.max_distance and (best is None or d < best[1]):
+                best = (sha256, d)
+                if d == 0:
+                    break
+        return best
+
+    def lookup(self, fp: Fingerprint) -> Optional[CacheHit]:
+        """같은 파일, 없으면 dHash 거리가 가장 가까운 이미지의 분류 결과 (hits 증가)"""
+        with self._lock:
+            match: Optional[Tuple[str, int]] = None
+            if self._conn.execute("SELECT 1 FROM images WHERE sha256 = ?", (fp.sha256,)).fetchone():
+                match = (fp.sha256, 0)
+            elif fp.phash is not None and not _degenerate(fp.phash):
+                match = self._nearest(fp.phash)
+            if match is None:
+                return None
+            with self._conn:
+                self._conn.execute("UPDATE images SET hits = hits + 1 WHERE sha256 = ?", (match[0],))
+                image_url, class_name, confidence = self._conn.execute(
+                    "SELECT image_url, class_name, confidence FROM images WHERE sha256 = ?", (match[0],)).fetchone()
+        return CacheHit(image_url, class_name, confidence, match[1])
+
+    def store(self, fp: Fingerprint, image_url: str, class_name: str, confidence: Optional[float]):
+        """분류 결과 저장 (같은 파일이 이미 있으면 덮어씀)"""
+        near = fp.phash is not None and not _degenerate(fp.phash)
+        with self._lock:
+            with self._conn:
+                exists = self._conn.execute("SELECT 1 FROM images WHERE sha256 = ?", (fp.sha256,)).fetchone()
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO images (sha256, phash, image_url, class_name, confidence, created_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (fp.sha256, _signed(fp.phash) if near else None, image_url, class_name, confidence,
+                     time.time()))
+            if near and not exists:
+                self._hashes.append((fp.phash, fp.sha256))
+
+    def upload(self, client, filename: str, content: bytes, content_type: str) -> ApiResponse:
+        """
+        ApiClient.upload_post_image와 같은 응답 구조로 업로드
+
+        캐시에 있으면 요청 없이 {"message": "upload_cached", "data": {"image_url", "prediction", "cache"}}를
+        돌려줍니다. 없으면 업로드하고, 분류에 성공했으면 결과를 저장합니다.
+        """
+        started = time.perf_counter()
+        fp = fingerprint(content)
+        hit = self.lookup(fp)
+        if hit is not None:
+            return ApiResponse(True, 200, {
+                "message": CACHED_MESSAGE,
+                "data": {
+                    "image_url": hit.image_url,
+                    "prediction": {"class_name": hit.class_name, "confidence_score": hit.confidence},
+                    "cache": {"distance": hit.distance},
+                },
+            }, time.perf_counter() - started)
+
+        response = client.upload_post_image(filename, content, content_type)
+        data = (response.data.get("data") or {}) if response.ok and isinstance(response.data, dict) else {}
+        prediction = data.get("prediction") or {}
+        if data.get("image_url") and prediction.get("class_name"):
+            self.store(fp, data["image_url"], prediction["class_name"], prediction.get("confidence_score"))
+        return response
+
+
+def is_cached(response: ApiResponse) -> bool:
+    """ImageCache.upload 응답이 캐시에서 온 것인지"""
+    return isinstance(response.data, dict) and response.data.get("message") == CACHED_MESSAGE
+
+
+def open_cache(path: str = DEFAULT_PATH, max_distance: int = DEFAULT_MAX_DISTANCE) -> ImageCache:
+    return ImageCache(path, max_distance)
+
+
+def summary(response: ApiResponse) -> Dict[str, Any]:
+    """업로드 응답 → 캐시 여부 (cached, distance)"""
+    if not is_cached(response):
+        return {"cached": False, "distance": None}
+    return {"cached": True, "distance": response.data["data"]["cache"]["distance"]}
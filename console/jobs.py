@@ -0,0 +1,261 @@
+"""
+백그라운드 작업 실행기
+
+크롤링, 일괄 업로드, 대량 삭제처럼 오래 걸리는 작업을 프로세스 단위 스레드 풀에서 실행합니다.
+Streamlit 스크립트 실행과 분리되어 있으므로 다른 탭으로 이동해도 작업이 계속됩니다.
+
+- submit(name, fn, ...)으로 작업을 등록하면 작업 ID 반환
+- 작업 함수는 첫 인자로 JobContext를 받아 진행 상황 보고 / 취소 확인
+- 끝난 작업은 results_dir/<job_id>.json으로 저장되어 재시작 후에도 조회 가능
+"""
+import os
+import threading
+import time
+import traceback
+import uuid
+from typing import Any, Callable, Dict, List, Optional
+
+
+PENDING = "pending"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+FINISHED_STATES = (SUCCEEDED, FAILED, CANCELLED)
+
+DEFAULT_RESULTS_DIR = "jobs"
+
+
+class JobCancelled(Exception):
+    """작업 함수가 취소 요청을 확인하고 중단할 때 사용"""
+
+
+class Job:
+    """작업 상태"""
+
+    def __init__(self, job_id: str, name: str):
+        self.id = job_id
+        self.name = name
+        self.status = PENDING
+        self.done = 0
+        self.total: Optional[int] = None
+        self.message = ""
+        self.result: Any = None
+        self.error: Optional[str] = None
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.cancel_event = threading.Event()
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATES
+
+    @property
+    def fraction(self) -> Optional[float]:
+        """진행률 (0~1, 전체 개수를 모르면 None)"""
+        if not self.total:
+            return None
+        return min(1.0, self.done / self.total)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "name": self.name,
+            "status": self.status,
+            "done": self.done,
+            "total": self.total,
+            "message": self.message,
+            "result": self.result,
+            "error": self.error,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Job":
+        job = cls(data["id"], data["name"])
+        for key in ("status", "done", "total", "message", "result", "error",
+                    "created_at", "started_at", "finished_at"):
+            setattr(job, key, data.get(key))
+        return job
+
+
+class JobContext:
+    """작업 함수에 전달되는 진행 상황 보고 / 취소 확인 객체"""
+
+    def __init__(self, job: Job, lock: threading.Lock):
+        self._job = job
+        self._lock = lock
+
+    @property
+    def job_id(self) -> str:
+        return self._job.id
+
+    @property
+    def cancel_event(self) -> threading.Event:
+        """bulk_map(cancel=...)에 그대로 넘길 수 있는 취소 이벤트"""
+        return self._job.cancel_event
+
+    @property
+    def cancelled(self) -> bool:
+        return self._job.cancel_event.is_set()
+
+    def check_cancelled(self):
+        """취소 요청이 있으면 JobCancelled 발생"""
+        if self.cancelled:
+            raise JobCancelled()
+
+    def progress(self, done: Optional[int] = None, total: Optional[int] = None,
+                 message: Optional[str] = None, advance: int = 0):
+        """진행 상황 갱신 (advance는 done에 더할 개수)"""
+        with self._lock:
+            if total is not None:
+                self._job.total = total
+            if done is not None:
+                self._job.done = done
+            self._job.done += advance
+            if message is not None:
+                self._job.message = message
+
+
+class JobRunner:
+    """
+    프로세스 단위 작업 실행기
+
+    작업은 I/O(API 요청) 위주이므로 스레드 풀에서 실행하며,
+    작업 내부의 동시 요청 수는 ApiClient의 동시성 제한기가 조절합니다.
+    """
+
+    def __init__(self, max_workers: int = 4, results_dir: Optional[str] = DEFAULT_RESULTS_DIR):
+        from concurrent.futures import ThreadPoolExecutor
+
+        self.results_dir = results_dir
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="job")
+        self._jobs: Dict[str, Job] = {}
+        self._futures = {}
+        self._lock = threading.Lock()
+        self._load_persisted()
+
+    # =========================================================================
+    # 실행
+    # =========================================================================
+
+    def submit(self, name: str, fn: Callable[..., Any], *args, **kwargs) -> str:
+        """
+        작업 등록
+
+        Args:
+            fn: fn(ctx: JobContext, *args, **kwargs) 형태의 작업 함수
+
+        Returns:
+            str: 작업 ID
+        """
+        job = Job(uuid.uuid4().hex[:12], name)
+        with self._lock:
+            self._jobs[job.id] = job
+        self._futures[job.id] = self._executor.submit(self._run, job, fn, args, kwargs)
+        return job.id
+
+    def _run(self, job: Job, fn, args, kwargs):
+        with self._lock:
+            if job.cancel_event.is_set():
+                job.status = CANCELLED
+                job.finished_at = time.time()
+        if job.status == CANCELLED:
+            self._persist(job)
+            return
+
+        with self._lock:
+            job.status = RUNNING
+            job.started_at = time.time()
+        try:
+            result = fn(JobContext(job, self._lock), *args, **kwargs)
+            status = CANCELLED if job.cancel_event.is_set() else SUCCEEDED
+            error = None
+        except JobCancelled:
+            result, status, error = None, CANCELLED, None
+        except Exception as e:
+            result, status, error = None, FAILED, f"{e}\n{traceback.format_exc()}"
+
+        with self._lock:
+            job.result = result
+            job.status = status
+            job.error = error
+            job.finished_at = time.time()
+        self._persist(job)
+
+    def cancel(self, job_id: str) -> bool:
+        """
+        작업 취소 요청
+
+        실행 중인 작업은 작업 함수가 취소를 확인하는 시점에 중단됩니다.
+
+        Returns:
+            bool: 아직 끝나지 않은 작업이면 True
+        """
+        job = self.get(job_id)
+        if job is None or job.finished:
+            return False
+        job.cancel_event.set()
+        return True
+
+    def wait(self, job_id: str, timeout: Optional[float] = None) -> Optional[Job]:
+        """작업 완료 대기"""
+        future = self._futures.get(job_id)
+        if future is not None:
+            future.result(timeout)
+        return self.get(job_id)
+
+    def shutdown(self, wait: bool = True):
+        """실행 중인 작업 모두 취소 후 종료"""
+        for job in self.list():
+            if not job.finished:
+                job.cancel_event.set()
+        self._executor.shutdown(wait=wait)
+
+    # =========================================================================
+    # 조회
+    # =========================================================================
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def list(self) -> List[Job]:
+        """전체 작업 (최근 등록 순)"""
+        with self._lock:
+            return sorted(self._jobs.values(), key=lambda job: job.created_at, reverse=True)
+
+    # =========================================================================
+    # 저장
+    # =========================================================================
+
+    def _persist(self, job: Job):
+        import json
+
+        if not self.results_dir:
+            return
+        os.makedirs(self.results_dir, exist_ok=True)
+        path = os.path.join(self.results_dir, f"{job.id}.json")
+        with self._lock:
+            data = job.to_dict()
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, default=repr)
+
+    def _load_persisted(self):
+        import json
+
+        if not self.results_dir or not os.path.isdir(self.results_dir):
+            return
+        for filename in os.listdir(self.results_dir):
+            if not filename.endswith(".json"):
+                continue
+            try:
+                with open(os.path.join(self.results_dir, filename), encoding="utf-8") as f:
+                    job = Job.from_dict(json.load(f))
+            except (OSError, ValueError, KeyError):
+                continue
+            self._jobs[job.id] = job
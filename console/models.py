@@ -0,0 +1,223 @@
+"""
+API 응답 모델 (__slots__)
+
+Backend / Model API 응답의 게시글 / 댓글 / 사용자 / 분류 결과 / 감성 분석 결과를
+dict 대신 __slots__ 객체로 표현합니다.
+- 인스턴스마다 dict를 만들지 않으므로 게시글 목록을 오래 들고 있어도 메모리가 적음
+- 닉네임 / 이미지 분류 / 감성 라벨 등 반복되는 문자열은 sys.intern으로 공유
+- get / [] / in / keys를 지원해 기존 dict 사용 코드(post.get("like_count"))를 그대로 사용 가능
+- 알 수 없는 필드는 버림 (to_dict()는 FIELDS만 반환)
+
+decode()는 json.loads의 object_hook으로 객체를 만들기 때문에
+응답 전체를 dict로 만든 뒤 변환하지 않고, 객체 하나를 읽을 때마다 바로 모델로 바꿉니다.
+응답 본문의 나머지 구조(message, data, total 등)는 dict 그대로입니다.
+
+콘솔 시작 시간을 위해 json은 decode() 호출 시점에 import합니다.
+"""
+import sys
+from typing import Any, Dict, Optional, Tuple
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class Model:
+    """
+    모델 공통 동작 (dict 호환 읽기, 비교, dict 변환)
+
+    하위 클래스는 FIELDS에 필드 이름을 응답 JSON과 같은 순서로 나열합니다.
+    """
+
+    __slots__ = ()
+    FIELDS: Tuple[str, ...] = ()
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Model":
+        raise NotImplementedError
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key not in self.FIELDS:
+            return default
+        return getattr(self, key)
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.FIELDS
+
+    def keys(self) -> Tuple[str, ...]:
+        return self.FIELDS
+
+    def to_dict(self) -> Dict[str, Any]:
+        """응답 JSON과 같은 형식의 dict (중첩 모델 포함)"""
+        result = {}
+        for name in self.FIELDS:
+            value = getattr(self, name)
+            result[name] = value.to_dict() if isinstance(value, Model) else value
+        return result
+
+    def __eq__(self, other) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.FIELDS)
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.FIELDS)
+        return f"{type(self).__name__}({values})"
+
+
+class Sentiment(Model):
+    """댓글 감성 분석 결과"""
+
+    __slots__ = ("label", "confidence")
+    FIELDS = __slots__
+
+    def __init__(self, label: Optional[str] = None, confidence: Optional[float] = None):
+        self.label = _intern(label)
+        self.confidence = confidence
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Sentiment":
+        return cls(data.get("label"), data.get("confidence"))
+
+
+class Prediction(Model):
+    """이미지 분류 결과"""
+
+    __slots__ = ("class_name", "confidence_score")
+    FIELDS = __slots__
+
+    def __init__(self, class_name: Optional[str] = None, confidence_score: Optional[float] = None):
+        self.class_name = _intern(class_name)
+        self.confidence_score = confidence_score
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Prediction":
+        return cls(data.get("class_name"), data.get("confidence_score"))
+
+
+class User(Model):
+    """로그인 사용자"""
+
+    __slots__ = ("user_id", "nickname", "profile_image_url")
+    FIELDS = __slots__
+
+    def __init__(self, user_id: Optional[int] = None, nickname: Optional[str] = None,
+                 profile_image_url: Optional[str] = None):
+        self.user_id = user_id
+        self.nickname = _intern(nickname)
+        self.profile_image_url = profile_image_url
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "User":
+        return cls(data.get("user_id"), data.get("nickname"), data.get("profile_image_url"))
+
+
+class Post(Model):
+    """게시글 (목록 / 상세)"""
+
+    __slots__ = ("post_id", "title", "content", "user_id", "nickname", "image_url", "image_class",
+                 "like_count", "view_count", "comment_count", "created_at")
+    FIELDS = __slots__
+
+    def __init__(self, post_id: Optional[int] = None, title: Optional[str] = None,
+                 content: Optional[str] = None, user_id: Optional[int] = None,
+                 nickname: Optional[str] = None, image_url: Optional[str] = None,
+                 image_class: Optional[str] = None, like_count: Optional[int] = None,
+                 view_count: Optional[int] = None, comment_count: Optional[int] = None,
+                 created_at: Optional[str] = None):
+        self.post_id = post_id
+        self.title = title
+        self.content = content
+        self.user_id = user_id
+        self.nickname = _intern(nickname)
+        self.image_url = image_url
+        self.image_class = _intern(image_class)
+        self.like_count = like_count
+        self.view_count = view_count
+        self.comment_count = comment_count
+        self.created_at = created_at
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Post":
+        get = data.get
+        return cls(get("post_id"), get("title"), get("content"), get("user_id"), get("nickname"),
+                   get("image_url"), get("image_class"), get("like_count"), get("view_count"),
+                   get("comment_count"), get("created_at"))
+
+
+class Comment(Model):
+    """
+    댓글
+
+    post_id는 응답에 없으며, 스냅샷처럼 게시글 ID를 붙인 dict에서 만들 때만 채워집니다.
+    """
+
+    __slots__ = ("comment_id", "content", "author_id", "author_nickname", "created_at", "sentiment",
+                 "post_id")
+    FIELDS = __slots__
+
+    def __init__(self, comment_id: Optional[int] = None, content: Optional[str] = None,
+                 author_id: Optional[int] = None, author_nickname: Optional[str] = None,
+                 created_at: Optional[str] = None, sentiment: Optional[Sentiment] = None,
+                 post_id: Optional[int] = None):
+        self.comment_id = comment_id
+        self.content = content
+        self.author_id = author_id
+        self.author_nickname = _intern(author_nickname)
+        self.created_at = created_at
+        self.sentiment = Sentiment.from_dict(sentiment) if isinstance(sentiment, dict) else sentiment
+        self.post_id = post_id
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Comment":
+        get = data.get
+        return cls(get("comment_id"), get("content"), get("author_id"), get("author_nickname"),
+                   get("created_at"), get("sentiment"), get("post_id"))
+
+
+# ============================================================================
+# 디코딩
+# ============================================================================
+
+def to_model(data: Dict[str, Any]) -> Any:
+    """
+    JSON 객체 하나 → 모델 (해당하는 모델이 없으면 dict 그대로)
+
+    필드 이름으로 종류를 판단합니다. object_hook은 안쪽 객체부터 호출되므로
+    댓글의 sentiment는 댓글보다 먼저 Sentiment가 됩니다.
+    """
+    if "post_id" in data and "title" in data:
+        return Post.from_dict(data)
+    if "comment_id" in data and "content" in data:
+        return Comment.from_dict(data)
+    if "class_name" in data:
+        return Prediction.from_dict(data)
+    if "label" in data and "confidence" in data:
+        return Sentiment.from_dict(data)
+    if "user_id" in data and "nickname" in data:
+        return User.from_dict(data)
+    return data
+
+
+def decode(content: bytes) -> Any:
+    """응답 본문 JSON → 모델이 들어 있는 구조 (JSON이 아니면 None)"""
+    if not content:
+        return None
+    import json
+
+    try:
+        return json.loads(content, object_hook=to_model)
+    except ValueError:
+        return None
+
+
+def to_json(value: Any) -> Dict[str, Any]:
+    """json.dump(default=to_json) - 모델을 dict로 저장"""
+    if isinstance(value, Model):
+        return value.to_dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
@@ -0,0 +1,155 @@
+"""
+대량 모더레이션
+
+스냅샷 또는 실시간 목록에서 조건(작성자, 감성 라벨, 키워드)에 맞는 게시글 / 댓글을 골라
+삭제하거나 내용을 수정합니다.
+
+- 항목별 성공 / 실패를 모두 기록 (일부 실패해도 나머지는 계속 처리)
+- 동시 요청 수는 bulk_map 스레드 수와 ApiClient의 동시성 제한기로 제한
+- 삭제할 게시글에 속한 댓글은 따로 처리하지 않음 (게시글과 함께 삭제됨)
+  수정은 게시글이 남아 있으므로 그 아래 댓글도 각각 수정
+"""
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+from console.concurrency import bulk_map
+from console.snapshot import comment_id_of, post_id_of
+
+
+POSTS = "posts"
+COMMENTS = "comments"
+BOTH = "both"
+
+DELETE = "delete"
+EDIT = "edit"
+
+DEFAULT_REPLACEMENT = "관리자에 의해 숨김 처리된 내용입니다."
+
+
+class ModerationFilter(NamedTuple):
+    """모더레이션 조건 (지정한 조건을 모두 만족하는 항목만 선택)"""
+    author: Optional[str] = None
+    sentiment: Optional[str] = None
+    keyword: Optional[str] = None
+    target: str = BOTH
+
+    def is_empty(self) -> bool:
+        return not (self.author or self.sentiment or self.keyword)
+
+    def matches(self, item: Dict[str, Any]) -> bool:
+        if self.author:
+            nickname = item.get("nickname", item.get("author_nickname"))
+            if nickname != self.author:
+                return False
+        if self.sentiment:
+            sentiment = item.get("sentiment") or {}
+            if sentiment.get("label") != self.sentiment:
+                return False
+        if self.keyword:
+            text = f"{item.get('title') or ''}\n{item.get('content') or ''}".lower()
+            if self.keyword.lower() not in text:
+                return False
+        return True
+
+
+class Target(NamedTuple):
+    """모더레이션 대상 항목"""
+    kind: str
+    post_id: int
+    comment_id: Optional[int]
+    item: Dict[str, Any]
+
+
+def select(board: Dict[str, Any], flt: ModerationFilter, action: str = DELETE) -> List[Target]:
+    """
+    스냅샷에서 조건에 맞는 대상 선택
+
+    조건이 하나도 없으면 빈 목록을 반환합니다 (전체 삭제 방지).
+    action이 DELETE면 선택된 게시글에 속한 댓글은 제외합니다 (게시글과 함께 삭제됨).
+    """
+    if flt.is_empty():
+        return []
+
+    targets: List[Target] = []
+    deleted_posts = set()
+    if flt.target in (POSTS, BOTH):
+        for post in board.get("posts", []):
+            if flt.matches(post):
+                post_id = post_id_of(post)
+                if action == DELETE:
+                    deleted_posts.add(post_id)
+                targets.append(Target(POSTS, post_id, None, post))
+    if flt.target in (COMMENTS, BOTH):
+        for comment in board.get("comments", []):
+            if comment.get("post_id") in deleted_posts:
+                continue
+            if flt.matches(comment):
+                targets.append(Target(COMMENTS, comment["post_id"], comment_id_of(comment), comment))
+    return targets
+
+
+def apply_action(client, target: Target, action: str, replacement: str = DEFAULT_REPLACEMENT):
+    """대상 하나에 삭제 / 수정 요청"""
+    if target.kind == POSTS:
+        if action == DELETE:
+            return client.delete_post(target.post_id)
+        return client.update_post(
+            target.post_id,
+            target.item.get("title", ""),
+            replacement,
+            image_url=target.item.get("image_url"),
+            image_class=target.item.get("image_class"),
+        )
+    if action == DELETE:
+        return client.delete_comment(target.post_id, target.comment_id)
+    return client.update_comment(target.post_id, target.comment_id, replacement)
+
+
+def run(client, targets: List[Target], action: str = DELETE, replacement: str = DEFAULT_REPLACEMENT,
+        workers: int = 8, progress: Optional[Callable] = None, cancel=None) -> Dict[str, Any]:
+    """
+    대상 일괄 처리
+
+    Args:
+        progress: JobContext.progress 호환 콜백
+        cancel: threading.Event - 설정되면 남은 항목은 skipped로 기록
+
+    Returns:
+        dict: succeeded / failed / skipped 개수와 항목별 결과(items)
+    """
+    if action not in (DELETE, EDIT):
+        raise ValueError(f"지원하지 않는 작업: {action}")
+    if progress is not None:
+        progress(done=0, total=len(targets), message=f"{action} 처리 중")
+
+    def report(index, target, result, error):
+        if progress is not None:
+            progress(advance=1)
+
+    responses = bulk_map(lambda target: apply_action(client, target, action, replacement),
+                         targets, workers=workers, on_result=report, cancel=cancel)
+
+    items = []
+    for target, response in zip(targets, responses):
+        entry = {
+            "kind": target.kind,
+            "post_id": target.post_id,
+            "comment_id": target.comment_id,
+        }
+        if response is None:
+            entry.update(status="skipped", http_status=None, error=None)
+        elif isinstance(response, Exception):
+            entry.update(status="failed", http_status=None, error=str(response))
+        elif response.ok:
+            entry.update(status="succeeded", http_status=response.status, error=None)
+        else:
+            message = (response.data or {}).get("message") if isinstance(response.data, dict) else None
+            entry.update(status="failed", http_status=response.status, error=message)
+        items.append(entry)
+
+    return {
+        "action": action,
+        "succeeded": sum(1 for item in items if item["status"] == "succeeded"),
+        "failed": sum(1 for item in items if item["status"] == "failed"),
+        "skipped": sum(1 for item in items if item["status"] == "skipped"),
+        "items": items,
+    }
@@ -0,0 +1,238 @@
+"""
+페이지 깊이별 목록 조회 지연 시간 프로파일러
+
+게시글 목록(GET /posts?page=&limit=)은 오프셋 페이지네이션이므로 Backend가 앞쪽 행을 모두 건너뛰어야 하면
+깊은 페이지일수록 느려집니다(O(offset)). 페이지 깊이와 limit를 바꿔 가며 측정해 그 근거를 수치로 남깁니다.
+
+- limit는 Streamlit 게시글 목록 입력 범위(1~100) 안에서 선택
+- 페이지는 첫 페이지부터 마지막 페이지까지 로그 간격으로 선택 (깊은 쪽도 고르게 측정)
+- 지점마다 워밍업 후 samples번 요청해 지연 시간 중앙값 / 최댓값과 응답 크기 기록
+- 니(knee): 얕은 페이지 지연 시간의 factor배를 넘은 뒤 계속 그 이상인 첫 지점
+- 오프셋 대비 지연 시간 선형 회귀(기울기, R²)로 O(offset) 여부 판단
+
+요청은 동시 요청 없이 하나씩 보냅니다 (측정끼리 간섭하지 않도록).
+"""
+import statistics
+import threading
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from console.client import StreamResponse, open_stream
+
+
+MIN_LIMIT = 1
+MAX_LIMIT = 100
+DEFAULT_LIMITS = (1, 10, 50, 100)
+DEFAULT_POINTS = 12
+DEFAULT_SAMPLES = 3
+DEFAULT_FACTOR = 2.0
+
+
+class DepthPoint(NamedTuple):
+    """페이지 하나의 측정 결과"""
+    limit: int
+    page: int
+    offset: int
+    latency_ms: float
+    max_ms: float
+    bytes: int
+    items: int
+    status: int
+
+
+class KneeReport(NamedTuple):
+    """
+    limit별 분석 결과
+
+    knee_page / knee_offset: 지연 시간이 base_ms의 factor배를 넘기 시작한 지점 (없으면 None)
+    ms_per_1k_rows: 오프셋 1000행당 늘어나는 지연 시간 (선형 회귀 기울기)
+    """
+    limit: int
+    knee_page: Optional[int]
+    knee_offset: Optional[int]
+    base_ms: float
+    deepest_ms: float
+    slowdown: float
+    ms_per_1k_rows: float
+    r2: float
+
+
+class SizingTransport:
+    """전송 계층을 감싸 스레드별 마지막 응답 본문 크기(바이트) 기록"""
+
+    def __init__(self, inner):
+        self.inner = inner
+        self._local = threading.local()
+
+    @property
+    def last_bytes(self) -> int:
+        return getattr(self._local, "size", 0)
+
+    def send(self, method, url, **kwargs):
+        response = self.inner.send(method, url, **kwargs)
+        self._local.size = len(response.content)
+        return response
+
+    def stream(self, method, url, **kwargs) -> StreamResponse:
+        """스트리밍 응답은 청크를 읽는 동안 크기 누적"""
+        response = open_stream(self.inner, method, url, **kwargs)
+        self._local.size = 0
+        return response._replace(chunks=self._sized(response.chunks))
+
+    def _sized(self, chunks: Iterator[bytes]) -> Iterator[bytes]:
+        for chunk in chunks:
+            self._local.size = getattr(self._local, "size", 0) + len(chunk)
+            yield chunk
+
+
+# ============================================================================
+# 측정
+# ============================================================================
+
+def log_pages(last_page: int, points: int = DEFAULT_POINTS) -> List[int]:
+    """1부터 last_page까지 로그 간격의 페이지 번호 (양 끝 포함, 중복 제거)"""
+    if last_page <= 1 or points <= 1:
+        return [1]
+    pages = {round(last_page ** (i / (points - 1))) for i in range(points)}
+    return sorted(pages | {1, last_page})
+
+
+def probe_page(client, sizing: SizingTransport, page: int, limit: int,
+               samples: int = DEFAULT_SAMPLES, warmup: int = 1) -> DepthPoint:
+    """페이지 하나 측정 (실패하면 status에 마지막 상태 코드)"""
+    latencies = []
+    response = None
+    for attempt in range(warmup + max(1, samples)):
+        response = client.get_posts(page, limit)
+        if attempt >= warmup:
+            latencies.append(response.elapsed * 1000)
+    data = (response.data or {}).get("data") if isinstance(response.data, dict) else None
+    return DepthPoint(
+        limit=limit,
+        page=page,
+        offset=(page - 1) * limit,
+        latency_ms=round(statistics.median(latencies), 3),
+        max_ms=round(max(latencies), 3),
+        bytes=sizing.last_bytes,
+        items=len((data or {}).get("posts") or []),
+        status=response.status,
+    )
+
+
+def sweep(client, limits: Sequence[int] = DEFAULT_LIMITS, points: int = DEFAULT_POINTS,
+          samples: int = DEFAULT_SAMPLES, max_page: Optional[int] = None,
+          progress: Optional[Callable] = None, cancel=None) -> List[DepthPoint]:
+    """
+    limit별로 페이지 깊이를 바꿔 가며 측정
+
+    첫 페이지 응답의 total로 마지막 페이지를 정합니다.
+
+    Args:
+        max_page: 측정할 최대 페이지 (기본: 마지막 페이지)
+        progress: JobContext.progress 호환 콜백
+        cancel: threading.Event - 설정되면 남은 측정을 건너뜀
+
+    Raises:
+        ValueError: limit가 1~100 범위 밖
+    """
+    for limit in limits:
+        if not MIN_LIMIT <= limit <= MAX_LIMIT:
+            raise ValueError(f"limit는 {MIN_LIMIT}~{MAX_LIMIT} 사이여야 합니다: {limit}")
+
+    sizing = SizingTransport(client.transport)
+    probe = client.for_user(client.user_id)
+    probe.transport = sizing
+
+    plan: List[Tuple[int, int]] = []
+    for limit in limits:
+        first = probe.get_posts(1, limit)
+        total = ((first.data or {}).get("data") or {}).get("total") if isinstance(first.data, dict) else None
+        last_page = max(1, -(-int(total or 0) // limit))
+        if max_page is not None:
+            last_page = min(last_page, max_page)
+        plan.extend((limit, page) for page in log_pages(last_page, points))
+
+    if progress is not None:
+        progress(done=0, total=len(plan), message="페이지 깊이 측정 중")
+    results = []
+    for limit, page in plan:
+        if cancel is not None and cancel.is_set():
+            break
+        results.append(probe_page(probe, sizing, page, limit, samples))
+        if progress is not None:
+            progress(advance=1)
+    return results
+
+
+# ============================================================================
+# 분석
+# ============================================================================
+
+def linear_fit(xs: Sequence[float], ys: Sequence[float]) -> Tuple[float, float, float]:
+    """최소제곱 직선 (절편, 기울기, R²)"""
+    n = len(xs)
+    if n < 2:
+        return (ys[0] if ys else 0.0), 0.0, 0.0
+    mean_x, mean_y = sum(xs) / n, sum(ys) / n
+    sxx = sum((x - mean_x) ** 2 for x in xs)
+    if sxx == 0:
+        return mean_y, 0.0, 0.0
+    slope = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / sxx
+    intercept = mean_y - slope * mean_x
+    ss_tot = sum((y - mean_y) ** 2 for y in ys)
+    ss_res = sum((y - intercept - slope * x) ** 2 for x, y in zip(xs, ys))
+    return intercept, slope, (1 - ss_res / ss_tot) if ss_tot else 0.0
+
+
+def find_knee(points: Sequence[DepthPoint], factor: float = DEFAULT_FACTOR) -> KneeReport:
+    """
+    limit 하나의 측정 결과에서 니 찾기
+
+    기준 지연 시간은 가장 얕은 지점이며, 한 번 튄 값은 무시하도록
+    그 지점부터 가장 깊은 지점까지 모두 기준의 factor배 이상인 첫 지점을 니로 봅니다.
+    """
+    ordered = sorted((p for p in points if 200 <= p.status < 300), key=lambda p: p.offset)
+    if not ordered:
+        raise ValueError("성공한 측정이 없습니다")
+    base = ordered[0].latency_ms
+    threshold = base * factor
+
+    knee = None
+    for point in reversed(ordered):
+        if point.latency_ms < threshold:
+            break
+        knee = point
+
+    _, slope, r2 = linear_fit([p.offset for p in ordered], [p.latency_ms for p in ordered])
+    deepest = ordered[-1].latency_ms
+    return KneeReport(
+        limit=ordered[0].limit,
+        knee_page=knee.page if knee is not None and knee is not ordered[0] else None,
+        knee_offset=knee.offset if knee is not None and knee is not ordered[0] else None,
+        base_ms=base,
+        deepest_ms=deepest,
+        slowdown=round(deepest / base, 2) if base > 0 else float("inf"),
+        ms_per_1k_rows=round(slope * 1000, 4),
+        r2=round(r2, 4),
+    )
+
+
+def analyze(points: Sequence[DepthPoint], factor: float = DEFAULT_FACTOR) -> List[KneeReport]:
+    """limit별 니 분석 (limit 오름차순)"""
+    by_limit: Dict[int, List[DepthPoint]] = {}
+    for point in points:
+        by_limit.setdefault(point.limit, []).append(point)
+    knees = []
+    for limit in sorted(by_limit):
+        try:
+            knees.append(find_knee(by_limit[limit], factor))
+        except ValueError:
+            continue
+    return knees
+
+
+def chart_data(points: Sequence[DepthPoint], field: str = "latency_ms") -> Dict[str, Dict[int, Any]]:
+    """오프셋별 값 (limit별 열) - st.line_chart용 {"limit=10": {offset: 값}}"""
+    series: Dict[str, Dict[int, Any]] = {}
+    for point in sorted(points, key=lambda p: (p.limit, p.offset)):
+        series.setdefault(f"limit={point.limit}", {})[point.offset] = getattr(point, field)
+    return series
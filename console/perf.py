@@ -0,0 +1,182 @@
+"""
+흐름 단위 성능 측정 / 회귀 판정
+
+로그인, 게시글 조회처럼 사용자 흐름 하나를 함수로 실행하면서
+- 벽시계 시간 (반복 실행의 중앙값, ms) 및 처리량 (초당 실행 횟수)
+- 요청 수 (흐름 한 번에 보낸 API 요청 수)
+- 메모리 할당 (tracemalloc 최대 사용량, KB)
+를 측정하고, 저장된 기준값(baseline)과 비교해 허용 범위를 넘으면 회귀로 판정합니다.
+
+pytest 플러그인(tests/perf_plugin.py)과 벤치마크 스크립트에서 사용합니다.
+"""
+import json
+import os
+import statistics
+import threading
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+from console.client import StreamResponse, open_stream
+
+
+# 지표별 허용 증가율 (0.5 = 기준값보다 50%까지 증가 허용)
+DEFAULT_TOLERANCE = {
+    "wall_ms": 1.0,
+    "requests": 0.0,
+    "alloc_kb": 0.25,
+}
+
+# 아주 짧은 흐름은 상대 오차가 커서 절대 여유값도 함께 적용
+MIN_SLACK = {
+    "wall_ms": 5.0,
+    "requests": 0.0,
+    "alloc_kb": 16.0,
+}
+
+
+class CountingTransport:
+    """전송 계층 래퍼 - 보낸 요청 수를 (메서드, URL) 별로 집계"""
+
+    def __init__(self, inner):
+        self.inner = inner
+        self.count = 0
+        self.by_endpoint: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def reset(self):
+        with self._lock:
+            self.count = 0
+            self.by_endpoint = {}
+
+    def _add(self, method, url):
+        with self._lock:
+            self.count += 1
+            key = f"{method} {url}"
+            self.by_endpoint[key] = self.by_endpoint.get(key, 0) + 1
+
+    def send(self, method, url, **kwargs):
+        self._add(method, url)
+        return self.inner.send(method, url, **kwargs)
+
+    def stream(self, method, url, **kwargs) -> StreamResponse:
+        self._add(method, url)
+        return open_stream(self.inner, method, url, **kwargs)
+
+
+class FlowMeasurement(NamedTuple):
+    """흐름 측정 결과"""
+    name: str
+    wall_ms: float
+    ops_per_sec: float
+    requests: int
+    alloc_kb: float
+    runs: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "wall_ms": round(self.wall_ms, 3),
+            "ops_per_sec": round(self.ops_per_sec, 1),
+            "requests": self.requests,
+            "alloc_kb": round(self.alloc_kb, 1),
+        }
+
+
+def measure_flow(name: str, flow: Callable[[], Any], counter: Optional[CountingTransport] = None,
+                 repeat: int = 5, warmup: int = 1) -> FlowMeasurement:
+    """
+    흐름 측정
+
+    시간은 tracemalloc 없이 repeat번 실행한 중앙값, 메모리는 별도 1회 실행으로 측정합니다.
+
+    Args:
+        counter: 흐름이 사용하는 클라이언트의 CountingTransport (요청 수 집계)
+    """
+    import tracemalloc
+
+    for _ in range(warmup):
+        flow()
+
+    timings = []
+    requests = 0
+    for _ in range(max(1, repeat)):
+        if counter is not None:
+            counter.reset()
+        started = time.perf_counter()
+        flow()
+        timings.append(time.perf_counter() - started)
+        if counter is not None:
+            requests = counter.count
+
+    if counter is not None:
+        counter.reset()
+    already_tracing = tracemalloc.is_tracing()
+    if not already_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline, _ = tracemalloc.get_traced_memory()
+    flow()
+    _, peak = tracemalloc.get_traced_memory()
+    if not already_tracing:
+        tracemalloc.stop()
+
+    wall = statistics.median(timings)
+    return FlowMeasurement(
+        name=name,
+        wall_ms=wall * 1000,
+        ops_per_sec=1 / wall if wall > 0 else float("inf"),
+        requests=requests,
+        alloc_kb=max(0, peak - baseline) / 1024,
+        runs=len(timings),
+    )
+
+
+def compare(measurement: FlowMeasurement, baseline: Optional[Dict[str, Any]],
+            tolerance: Optional[Dict[str, float]] = None) -> List[str]:
+    """
+    기준값 대비 회귀 항목
+
+    Returns:
+        list: 회귀 설명 문자열 (기준값이 없거나 회귀가 없으면 빈 목록)
+    """
+    if not baseline:
+        return []
+    tolerance = {**DEFAULT_TOLERANCE, **(tolerance or {})}
+    current = measurement.to_dict()
+    regressions = []
+    for metric, allowed_ratio in tolerance.items():
+        if metric not in baseline:
+            continue
+        base = baseline[metric]
+        limit = max(base * (1 + allowed_ratio), base + MIN_SLACK.get(metric, 0.0))
+        if current[metric] > limit:
+            regressions.append(
+                f"{measurement.name}: {metric} {current[metric]} > 허용 {limit:.3f} "
+                f"(기준 {base}, 허용 증가율 {allowed_ratio:.0%})"
+            )
+    return regressions
+
+
+# ============================================================================
+# 기준값 파일
+# ============================================================================
+
+def load_baseline(path: str) -> Dict[str, Dict[str, Any]]:
+    """기준값 로드 (파일이 없으면 빈 dict)"""
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f).get("flows", {})
+
+
+def save_baseline(path: str, measurements: List[FlowMeasurement]) -> str:
+    """측정 결과를 기존 기준값에 덮어써 저장"""
+    flows = load_baseline(path)
+    for measurement in measurements:
+        flows[measurement.name] = measurement.to_dict()
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"flows": dict(sorted(flows.items()))}, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+    return path
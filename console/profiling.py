@@ -0,0 +1,248 @@
+"""
+Streamlit 콘솔 rerun 프로파일러
+
+rerun마다 탭별 소요 시간을 네트워크 / 이미지 디코딩 / 렌더링으로 나누어 기록하고,
+최근 keep번의 rerun에 대한 cProfile 통계를 pstats 파일로 저장할 수 있습니다.
+
+- section(name): 탭 등 구간 측정 (중첩 가능, 가장 안쪽 구간에 시간 귀속)
+- measure(category): 현재 구간 안의 세부 항목 측정 (예: "image")
+- fragment(name): st.fragment 함수 데코레이터 - fragment만 다시 실행될 때도 별도 rerun으로 측정
+- ProfilingTransport: 전송 계층을 감싸 네트워크 시간을 "network"로 기록 (스트리밍은 본문을 다 읽을 때까지)
+- 렌더링 시간 = 구간 전체 시간 - 세부 항목 시간
+"""
+import cProfile
+import functools
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+from console.client import StreamResponse, open_stream
+
+
+NETWORK = "network"
+IMAGE = "image"
+
+OTHER_SECTION = "(기타)"
+
+
+class RerunProfile:
+    """rerun 한 번의 측정 결과 (fragment: fragment만 다시 실행된 경우 그 이름)"""
+
+    def __init__(self, fragment: Optional[str] = None):
+        self.fragment = fragment
+        self.started = time.time()
+        self.total = 0.0
+        self.sections: Dict[str, Dict[str, float]] = {}
+        self.requests = 0
+        self.stats = None  # pstats.Stats
+
+    def add(self, section: str, category: str, seconds: float):
+        categories = self.sections.setdefault(section, {})
+        categories[category] = categories.get(category, 0.0) + seconds
+
+    def breakdown(self) -> List[Dict[str, Any]]:
+        """
+        구간별 시간 분해 (ms)
+
+        Returns:
+            list: section, total, network, image, render
+        """
+        rows = []
+        for section, categories in self.sections.items():
+            total = categories.get("total", 0.0)
+            network = categories.get(NETWORK, 0.0)
+            image = categories.get(IMAGE, 0.0)
+            rows.append({
+                "section": section,
+                "total_ms": total * 1000,
+                "network_ms": network * 1000,
+                "image_ms": image * 1000,
+                "render_ms": max(0.0, total - network - image) * 1000,
+            })
+        return rows
+
+
+class RerunProfiler:
+    """
+    rerun 프로파일러
+
+    begin() / end() 사이가 rerun 한 번이며, enabled가 False면 모든 측정이 무시됩니다.
+    fragment rerun은 history와 별도로 fragment_history에 보관합니다 (주기적으로 갱신되는 fragment가
+    전체 rerun 이력을 밀어내지 않도록).
+    """
+
+    def __init__(self, keep: int = 10, enabled: bool = True, use_cprofile: bool = True):
+        self.enabled = enabled
+        self.use_cprofile = use_cprofile
+        self.history = deque(maxlen=keep)
+        self.fragment_history = deque(maxlen=keep)
+        self.current: Optional[RerunProfile] = None
+
+        self._cprofile: Optional[cProfile.Profile] = None
+        self._started = 0.0
+        self._stack: List[str] = []
+        self._lock = threading.Lock()
+
+    # =========================================================================
+    # rerun 경계
+    # =========================================================================
+
+    def begin(self, fragment: Optional[str] = None):
+        """rerun 측정 시작 (fragment: fragment rerun이면 그 이름)"""
+        if not self.enabled:
+            return
+        # st.rerun() 등으로 이전 rerun이 end() 없이 끝난 경우 정리
+        if self._cprofile is not None:
+            self._cprofile.disable()
+        self.current = RerunProfile(fragment)
+        self._stack = []
+        self._started = time.perf_counter()
+        self._cprofile = None
+        if self.use_cprofile:
+            profile = cProfile.Profile()
+            try:
+                profile.enable()
+                self._cprofile = profile
+            except ValueError:
+                # 다른 프로파일러가 이미 활성화된 경우
+                self._cprofile = None
+
+    def end(self) -> Optional[RerunProfile]:
+        """rerun 측정 종료 후 이력에 추가"""
+        if not self.enabled or self.current is None:
+            return None
+        if self._cprofile is not None:
+            import pstats
+
+            self._cprofile.disable()
+            self.current.stats = pstats.Stats(self._cprofile)
+            self._cprofile = None
+        self.current.total = time.perf_counter() - self._started
+        profile = self.current
+        (self.fragment_history if profile.fragment else self.history).append(profile)
+        self.current = None
+        return profile
+
+    def fragment(self, name: str):
+        """
+        fragment 함수 데코레이터 (@st.fragment 안쪽에 적용)
+
+        전체 rerun 중(구간 안)에 호출되면 name 구간으로만 측정하고,
+        fragment만 다시 실행되면 begin(name) / end()로 별도 rerun을 측정합니다.
+        """
+        def decorator(fn):
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                if not self.enabled or (self.current is not None and self._stack):
+                    with self.section(name):
+                        return fn(*args, **kwargs)
+                self.begin(fragment=name)
+                try:
+                    with self.section(name):
+                        return fn(*args, **kwargs)
+                finally:
+                    self.end()
+            return wrapper
+        return decorator
+
+    # =========================================================================
+    # 구간 측정
+    # =========================================================================
+
+    @contextmanager
+    def section(self, name: str):
+        """구간 측정 (탭 등)"""
+        if not self.enabled or self.current is None:
+            yield
+            return
+        self._stack.append(name)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._stack.pop()
+            self.record("total", time.perf_counter() - started, section=name)
+
+    @contextmanager
+    def measure(self, category: str):
+        """현재 구간 안의 세부 항목 측정"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(category, time.perf_counter() - started)
+
+    def record(self, category: str, seconds: float, section: Optional[str] = None):
+        """측정값 기록 (section을 생략하면 현재 구간)"""
+        if not self.enabled or self.current is None:
+            return
+        with self._lock:
+            if section is None:
+                section = self._stack[-1] if self._stack else OTHER_SECTION
+            self.current.add(section, category, seconds)
+            if category == NETWORK:
+                self.current.requests += 1
+
+    # =========================================================================
+    # 조회 / 저장
+    # =========================================================================
+
+    def last(self) -> Optional[RerunProfile]:
+        return self.history[-1] if self.history else None
+
+    def dump_stats(self, path: str) -> int:
+        """
+        최근 rerun들(fragment rerun 포함)의 cProfile 통계를 합쳐 pstats 파일로 저장
+
+        Returns:
+            int: 포함된 rerun 수
+        """
+        import pstats
+
+        profiles = [p for p in (*self.history, *self.fragment_history) if p.stats is not None]
+        if not profiles:
+            return 0
+        merged = pstats.Stats()
+        for profile in profiles:
+            merged.add(profile.stats)
+        merged.dump_stats(path)
+        return len(profiles)
+
+
+class ProfilingTransport:
+    """전송 계층 래퍼 - 요청 시간을 프로파일러의 network 항목으로 기록"""
+
+    def __init__(self, inner, profiler: RerunProfiler):
+        self.inner = inner
+        self.profiler = profiler
+
+    def send(self, method, url, **kwargs):
+        with self.profiler.measure(NETWORK):
+            return self.inner.send(method, url, **kwargs)
+
+    def stream(self, method, url, **kwargs) -> StreamResponse:
+        """헤더 대기 + 청크 수신 시간을 요청 하나로 기록 (본문을 다 읽거나 닫을 때, 요청한 구간에 귀속)"""
+        section = self.profiler._stack[-1] if self.profiler._stack else None
+        started = time.perf_counter()
+        try:
+            response = open_stream(self.inner, method, url, **kwargs)
+        except BaseException:
+            self.profiler.record(NETWORK, time.perf_counter() - started, section)
+            raise
+        return response._replace(chunks=self._timed(response.chunks, time.perf_counter() - started, section))
+
+    def _timed(self, chunks: Iterator[bytes], elapsed: float, section: Optional[str]) -> Iterator[bytes]:
+        try:
+            while True:
+                started = time.perf_counter()
+                try:
+                    chunk = next(chunks)
+                except StopIteration:
+                    return
+                finally:
+                    elapsed += time.perf_counter() - started
+                yield chunk
+        finally:
+            self.profiler.record(NETWORK, elapsed, section)
@@ -0,0 +1,114 @@
+"""
+우선순위 토큰 버킷
+
+유료 / 쿼터 제한이 있는 Model API 엔드포인트(예: /sentiment/gemini) 호출 속도를
+클라이언트에서 제한합니다.
+- 초당 rate개 토큰 충전, 최대 burst개까지 적립
+- 대기 요청은 (우선순위, 도착 순서)로 정렬되어 INTERACTIVE가 BATCH보다 먼저 토큰을 받음
+- BATCH 요청은 버리지 않고 대기열에서 기다림
+- 429 응답을 받으면 pause()로 잠시 모든 발급을 멈춤
+"""
+import heapq
+import itertools
+import threading
+import time
+from typing import Any, Dict, Optional
+
+
+INTERACTIVE = 0
+BATCH = 1
+
+PRIORITY_NAMES = {
+    INTERACTIVE: "interactive",
+    BATCH: "batch",
+}
+
+
+class PriorityTokenBucket:
+    """
+    우선순위 대기열을 가진 토큰 버킷
+
+    acquire()는 토큰을 받을 때까지 대기하며, 대기열 맨 앞의 요청만 토큰을 가져갈 수 있습니다.
+    """
+
+    def __init__(self, rate: float, burst: int = 1, clock=time.monotonic):
+        if rate <= 0:
+            raise ValueError("rate는 0보다 커야 합니다")
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._clock = clock
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        self._paused_until = 0.0
+
+        self._cond = threading.Condition()
+        self._queue = []
+        self._seq = itertools.count()
+        self.granted = {priority: 0 for priority in PRIORITY_NAMES}
+
+    def _refill(self, now: float):
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, priority: int = INTERACTIVE, timeout: Optional[float] = None) -> bool:
+        """
+        토큰 획득
+
+        Returns:
+            bool: timeout 안에 토큰을 받으면 True (timeout None이면 항상 True)
+        """
+        deadline = None if timeout is None else self._clock() + timeout
+        with self._cond:
+            entry = (priority, next(self._seq))
+            heapq.heappush(self._queue, entry)
+            try:
+                while True:
+                    now = self._clock()
+                    self._refill(now)
+                    is_head = self._queue[0] == entry
+                    if is_head and now >= self._paused_until and self._tokens >= 1:
+                        self._tokens -= 1
+                        self.granted[priority] = self.granted.get(priority, 0) + 1
+                        return True
+
+                    if deadline is not None and now >= deadline:
+                        return False
+
+                    if is_head:
+                        wait = max(self._paused_until - now, (1 - self._tokens) / self.rate, 0.001)
+                    else:
+                        wait = None
+                    if deadline is not None:
+                        remaining = deadline - now
+                        wait = remaining if wait is None else min(wait, remaining)
+                    self._cond.wait(wait)
+            finally:
+                self._queue.remove(entry)
+                heapq.heapify(self._queue)
+                self._cond.notify_all()
+
+    def pause(self, seconds: float):
+        """seconds초 동안 토큰 발급 중지 (업스트림 429 대응)"""
+        with self._cond:
+            now = self._clock()
+            self._paused_until = max(self._paused_until, now + seconds)
+            self._tokens = 0.0
+            self._updated = now
+            self._cond.notify_all()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """남은 토큰, 우선순위별 대기 / 발급 수"""
+        with self._cond:
+            now = self._clock()
+            self._refill(now)
+            waiting = {name: 0 for name in PRIORITY_NAMES.values()}
+            for priority, _ in self._queue:
+                waiting[PRIORITY_NAMES.get(priority, str(priority))] += 1
+            return {
+                "rate": self.rate,
+                "burst": self.burst,
+                "tokens": round(self._tokens, 2),
+                "paused_for": max(0.0, self._paused_until - now),
+                "waiting": waiting,
+                "granted": {PRIORITY_NAMES.get(p, str(p)): n for p, n in self.granted.items()},
+            }
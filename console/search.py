@@ -0,0 +1,323 @@
+"""
+게시글 / 댓글 전문 검색 색인
+
+스냅샷(JSON 파일, 동기화 디렉터리, 열 단위 저장소)의 게시글 / 댓글을 SQLite FTS5 색인 파일에 넣어
+게시판 전체를 1초 안에 검색합니다.
+
+토큰화 (한국어는 띄어쓰기 단위가 짧고 조사가 붙으므로 형태소 대신 문자 n-gram 사용):
+- 글자 / 숫자가 이어진 부분(단어)을 소문자로 바꿔 2글자씩 겹쳐 자름 (bigram) + 단어의 마지막 글자
+  예: "산책로" → "산책 책로 로"
+- 검색어 단어는 bigram 구(phrase)로 찾으므로 단어 안의 부분 문자열이면 일치 ("책로", "산책로"),
+  한 글자 검색어는 그 글자로 시작하는 토큰(접두어)으로 찾음
+- 검색어 단어가 여러 개면 모두 포함한 항목 (순서 / 인접 여부는 보지 않음)
+
+증분 갱신: 항목마다 색인한 필드의 해시를 저장해 두고, 스냅샷과 비교해 바뀐 항목만 다시 토큰화하고
+스냅샷에 없는 항목은 지웁니다.
+
+select(flt)는 moderation.select와 같은 대상을 돌려줍니다 (색인으로 후보를 고른 뒤 원래 키워드 조건으로 다시 확인).
+"""
+import hashlib
+import itertools
+import os
+import re
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from console.moderation import BOTH, COMMENTS, DELETE, POSTS, ModerationFilter, Target
+from console.snapshot import DEFAULT_DIR, comment_id_of, post_id_of
+
+
+DEFAULT_PATH = os.path.join(DEFAULT_DIR, "search.sqlite")
+DEFAULT_LIMIT = 50
+
+WORD = re.compile(r"[^\W_]+")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS docs (
+    rowid INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    item_id INTEGER NOT NULL,
+    post_id INTEGER NOT NULL,
+    nickname TEXT,
+    title TEXT,
+    content TEXT,
+    image_url TEXT,
+    image_class TEXT,
+    label TEXT,
+    created_at TEXT,
+    hash INTEGER NOT NULL,
+    UNIQUE (kind, item_id)
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS grams USING fts5(
+    tokens, content='', tokenize="unicode61 remove_diacritics 0"
+);
+"""
+
+DOC_COLUMNS = "kind, item_id, post_id, nickname, title, content, image_url, image_class, label, created_at"
+
+
+# ============================================================================
+# 토큰화
+# ============================================================================
+
+def words(text: Optional[str]) -> List[str]:
+    """텍스트 → 단어 목록 (글자 / 숫자가 이어진 부분, 소문자)"""
+    return WORD.findall((text or "").lower())
+
+
+def grams(text: Optional[str]) -> str:
+    """색인할 토큰 (공백으로 구분한 bigram + 단어 마지막 글자)"""
+    tokens: List[str] = []
+    for word in words(text):
+        tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+        tokens.append(word[-1])
+    return " ".join(tokens)
+
+
+def match_expression(query: str) -> Optional[str]:
+    """검색어 → FTS5 MATCH 식 (검색할 단어가 없으면 None)"""
+    parts = []
+    for word in words(query):
+        if len(word) == 1:
+            parts.append(f'"{word}"*')
+        else:
+            parts.append('"' + " ".join(word[i:i + 2] for i in range(len(word) - 1)) + '"')
+    return " AND ".join(parts) or None
+
+
+# ============================================================================
+# 문서
+# ============================================================================
+
+def _docs(board: Dict[str, Any]) -> Iterator[tuple]:
+    """스냅샷 → 색인 문서 행 (DOC_COLUMNS 순서)"""
+    for post in board.get("posts", []):
+        yield (POSTS, post_id_of(post), post_id_of(post), post.get("nickname"), post.get("title"),
+               post.get("content"), post.get("image_url"), post.get("image_class"), None, post.get("created_at"))
+    for comment in board.get("comments", []):
+        label = (comment.get("sentiment") or {}).get("label")
+        yield (COMMENTS, comment_id_of(comment), comment.get("post_id"), comment.get("author_nickname"), None,
+               comment.get("content"), None, None, label, comment.get("created_at"))
+
+
+def _tokens(title: Optional[str], content: Optional[str]) -> str:
+    """문서 토큰 (제목과 내용)"""
+    return grams(f"{title or ''}\n{content or ''}")
+
+
+def _hash(row: tuple) -> int:
+    """문서 행 해시 (부호 있는 64비트 - SQLite INTEGER)"""
+    encoded = "\x1f".join("" if value is None else str(value) for value in row).encode("utf-8")
+    return int.from_bytes(hashlib.blake2b(encoded, digest_size=8).digest(), "big", signed=True)
+
+
+def _item(row: tuple) -> Dict[str, Any]:
+    """색인 행 → 모더레이션 / 화면용 항목 dict (스냅샷 항목과 같은 키)"""
+    kind, item_id, post_id, nickname, title, content, image_url, image_class, label, created_at = row
+    if kind == POSTS:
+        return {"post_id": post_id, "title": title, "content": content, "nickname": nickname,
+                "image_url": image_url, "image_class": image_class, "created_at": created_at}
+    return {"comment_id": item_id, "post_id": post_id, "content": content, "author_nickname": nickname,
+            "sentiment": {"label": label} if label else None, "created_at": created_at}
+
+
+def _target(row: tuple) -> Target:
+    item = _item(row)
+    return Target(row[0], row[2], item.get("comment_id"), item)
+
+
+# ============================================================================
+# 색인
+# ============================================================================
+
+class SearchIndex:
+    """
+    SQLite FTS5 검색 색인 파일
+
+    연결 하나를 잠금으로 보호해 여러 스레드(Streamlit 세션, 작업)에서 사용합니다.
+
+    Usage:
+        index = SearchIndex("snapshots/search.sqlite")
+        index.update(board)        # 바뀐 항목만 다시 색인
+        index.search("산책")       # 관련도 순 Target 목록
+        index.select(ModerationFilter(keyword="산책"))
+    """
+
+    def __init__(self, path: str = DEFAULT_PATH):
+        import sqlite3
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(SCHEMA)
+        self._lock = threading.Lock()
+
+    def close(self):
+        self._conn.close()
+
+    def count(self) -> Dict[str, int]:
+        """종류별 색인 항목 수"""
+        with self._lock:
+            rows = self._conn.execute("SELECT kind, COUNT(*) FROM docs GROUP BY kind").fetchall()
+        counts = {POSTS: 0, COMMENTS: 0}
+        counts.update(rows)
+        return counts
+
+    def update(self, board: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        스냅샷과 같아지도록 색인 갱신
+
+        해시가 같은 항목은 건너뛰고, 바뀐 항목은 같은 rowid로 다시 색인하며, 스냅샷에 없는 항목은 지웁니다.
+        토큰 표는 토큰을 저장하지 않으므로(contentless) 지우거나 바꿀 때는 저장된 제목 / 내용으로 이전 토큰을 다시 만듭니다.
+        빈 색인에 처음 넣을 때는 SqliteStore.load와 같이 저널 / 동기화를 끕니다.
+
+        Returns:
+            dict: added / updated / removed / unchanged 개수, seconds
+        """
+        started = time.perf_counter()
+        added: List[tuple] = []
+        changed: List[Tuple[int, tuple, int]] = []
+        unchanged = 0
+        with self._lock:
+            conn = self._conn
+            initial = conn.execute("SELECT NOT EXISTS (SELECT 1 FROM docs)").fetchone()[0]
+            if initial:
+                conn.execute("PRAGMA journal_mode=OFF")
+                conn.execute("PRAGMA synchronous=OFF")
+            with conn:
+                known: Dict[Tuple[str, int], Tuple[int, int]] = {
+                    (kind, item_id): (rowid, digest)
+                    for rowid, kind, item_id, digest in conn.execute("SELECT rowid, kind, item_id, hash FROM docs")
+                }
+                next_rowid = conn.execute("SELECT COALESCE(MAX(rowid), 0) + 1 FROM docs").fetchone()[0]
+                for row in _docs(board):
+                    if row[1] is None:
+                        continue
+                    digest = _hash(row)
+                    current = known.pop((row[0], row[1]), None)
+                    if current is None:
+                        added.append((next_rowid, *row, digest))
+                        next_rowid += 1
+                    elif current[1] != digest:
+                        changed.append((current[0], row, digest))
+                    else:
+                        unchanged += 1
+
+                removed = [(rowid,) for rowid, _ in known.values()]
+                self._unindex(removed + [(rowid,) for rowid, _, _ in changed])
+                conn.executemany("DELETE FROM docs WHERE rowid = ?", removed)
+                conn.executemany(
+                    "UPDATE docs SET post_id = ?, nickname = ?, title = ?, content = ?, image_url = ?, "
+                    "image_class = ?, label = ?, created_at = ?, hash = ? WHERE rowid = ?",
+                    ((*row[2:], digest, rowid) for rowid, row, digest in changed))
+                conn.executemany(f"INSERT INTO docs (rowid, {DOC_COLUMNS}, hash) VALUES ({', '.join('?' * 12)})",
+                                 added)
+                conn.executemany("INSERT INTO grams (rowid, tokens) VALUES (?, ?)", itertools.chain(
+                    ((doc[0], _tokens(doc[5], doc[6])) for doc in added),
+                    ((rowid, _tokens(row[4], row[5])) for rowid, row, _ in changed),
+                ))
+            if initial:
+                conn.execute("PRAGMA journal_mode=DELETE")
+                conn.execute("PRAGMA synchronous=FULL")
+        return {"added": len(added), "updated": len(changed), "removed": len(removed), "unchanged": unchanged,
+                "seconds": round(time.perf_counter() - started, 3)}
+
+    def _unindex(self, rowids: List[Tuple[int]]):
+        """토큰 표에서 항목 제거 (docs 행을 바꾸기 전에 호출 - 저장된 제목 / 내용으로 이전 토큰 계산)"""
+        conn = self._conn
+        for start in range(0, len(rowids), 500):
+            batch = [rowid for rowid, in rowids[start:start + 500]]
+            rows = conn.execute(f"SELECT rowid, title, content FROM docs WHERE rowid IN ({', '.join('?' * len(batch))})",
+                                batch).fetchall()
+            conn.executemany("INSERT INTO grams (grams, rowid, tokens) VALUES ('delete', ?, ?)",
+                             [(rowid, _tokens(title, content)) for rowid, title, content in rows])
+
+    def _rows(self, where: str, args: tuple, order: str, limit: Optional[int] = None) -> List[tuple]:
+        sql = f"SELECT {DOC_COLUMNS} FROM docs WHERE {where} ORDER BY {order}"
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        with self._lock:
+            return self._conn.execute(sql, args).fetchall()
+
+    def search(self, query: str, kind: str = BOTH, author: Optional[str] = None,
+               limit: int = DEFAULT_LIMIT) -> List[Target]:
+        """
+        검색어의 단어를 모두 포함한 게시글 / 댓글 (관련도 순, 같으면 최신 항목 우선)
+
+        검색할 단어가 없으면 빈 목록을 반환합니다.
+        """
+        expression = match_expression(query)
+        if expression is None:
+            return []
+        where = "grams MATCH ?"
+        args: tuple = (expression,)
+        if kind != BOTH:
+            where += " AND d.kind = ?"
+            args += (kind,)
+        if author:
+            where += " AND d.nickname = ?"
+            args += (author,)
+        columns = ", ".join(f"d.{column}" for column in DOC_COLUMNS.split(", "))
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {columns} FROM grams JOIN docs d ON d.rowid = grams.rowid WHERE {where} "
+                f"ORDER BY grams.rank, d.created_at DESC LIMIT ?",
+                (*args, int(limit))).fetchall()
+        return [_target(row) for row in rows]
+
+    def select(self, flt: ModerationFilter, action: str = DELETE) -> List[Target]:
+        """
+        moderation.select와 같은 대상 선택 (키워드는 색인으로 후보를 고른 뒤 부분 문자열로 다시 확인)
+
+        조건이 하나도 없으면 빈 목록을 반환합니다 (전체 삭제 방지).
+        action이 DELETE면 선택된 게시글에 속한 댓글은 제외합니다.
+        """
+        if flt.is_empty():
+            return []
+        where, args = [], []
+        if flt.keyword:
+            expression = match_expression(flt.keyword)
+            if expression is not None:
+                where.append("rowid IN (SELECT rowid FROM grams WHERE grams MATCH ?)")
+                args.append(expression)
+        if flt.author:
+            where.append("nickname = ?")
+            args.append(flt.author)
+        if flt.sentiment:
+            where.append("label = ?")
+            args.append(flt.sentiment)
+
+        targets: List[Target] = []
+        deleted = set()
+        for kind in (POSTS, COMMENTS):
+            if flt.target not in (kind, BOTH):
+                continue
+            rows = self._rows(" AND ".join(["kind = ?"] + where), (kind, *args), "rowid")
+            for row in rows:
+                target = _target(row)
+                if kind == COMMENTS and target.post_id in deleted:
+                    continue
+                if not flt.matches(target.item):
+                    continue
+                if kind == POSTS and action == DELETE:
+                    deleted.add(target.post_id)
+                targets.append(target)
+        return targets
+
+
+def open_index(path: str = DEFAULT_PATH) -> SearchIndex:
+    return SearchIndex(path)
+
+
+def load_board(source: str) -> Dict[str, Any]:
+    """스냅샷 JSON 파일 / 동기화 디렉터리 / 열 단위 저장소 → 스냅샷 dict"""
+    from console import columnar, snapshot, sync
+
+    if columnar.is_store(source):
+        return columnar.open_store(source).to_board()
+    if os.path.isdir(source):
+        return sync.SyncStore(source).load().to_snapshot()
+    return snapshot.load(source)
@@ -0,0 +1,409 @@
+"""
+스테이징 / 성능 테스트용 시드 데이터 적재
+
+/auth/signup, /users/profile/upload, /posts, /posts/{id}/comments, /posts/{id}/like API로
+사용자 N명, 게시글 M개(일부 이미지 포함), 댓글 / 좋아요를 만듭니다.
+
+- 생성 계획은 seed로 결정적으로 만들어지므로 같은 설정이면 항상 같은 데이터
+- 댓글 / 좋아요 수는 게시글 순위에 대한 멱법칙(Zipf) 분포 - 소수 게시글에 집중
+- 동시 요청 수는 bulk_map 스레드 수와 ApiClient 동시성 제한기로 제한
+- 생성한 ID는 매니페스트(JSON)에 기록하며, 같은 매니페스트로 다시 실행하면 끝난 항목은 건너뜀 (재개)
+  항목이 끝날 때마다 변경 로그(매니페스트 경로 + ".log")에 한 줄씩 추가하므로 중단되어도 완료 기록이 남음
+  (게시글 / 댓글 / 좋아요는 같은 요청을 다시 보내면 중복 / 취소되므로 주기적 저장만으로는 부족)
+- 좋아요는 토글이므로 응답의 liked가 False면 (이미 눌러 둔 좋아요를 취소한 것이므로) 다시 토글
+- 종료 순간 응답을 받지 못한 게시글 / 댓글 요청(스레드당 최대 1개)은 API에 멱등 키가 없어 재개 시 한 번 더 생성될 수 있음
+
+사용 예:
+    python -m console seed --users 1000 --posts 5000 --comments 50000 --likes 20000
+"""
+import json
+import os
+import random
+import struct
+import threading
+import time
+import zlib
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+from console.concurrency import bulk_map
+
+
+DEFAULT_MANIFEST = os.path.join("seeds", "manifest.json")
+
+ADJECTIVES = ["행복한", "용감한", "졸린", "배고픈", "수줍은", "신나는", "느긋한", "똑똑한"]
+ANIMALS = ["고양이", "강아지", "햄스터", "토끼", "다람쥐", "수달", "펭귄", "여우"]
+
+POST_TITLES = ["오늘의 산책", "간식 리뷰", "우리 집 막내", "병원 다녀왔어요", "첫 목욕", "새 장난감", "낮잠 시간"]
+POST_SENTENCES = [
+    "오늘은 날씨가 좋아서 오래 산책했어요.",
+    "새로 산 간식을 정말 좋아하네요.",
+    "조금 아파서 걱정했는데 지금은 괜찮아요.",
+    "하루 종일 잠만 자고 있어요.",
+    "친구를 만나서 신나게 놀았어요.",
+    "목욕을 너무 싫어해서 힘들었어요.",
+]
+COMMENTS = ["너무 귀여워요!", "사진 더 올려주세요", "우리 애도 그래요 ㅎㅎ", "빨리 나았으면 좋겠네요",
+            "별로네요", "정보 감사합니다", "부럽습니다"]
+
+# 최대 닉네임 수 (형용사 x 동물 x 0~9999, 10자 이하 유지)
+MAX_USERS = len(ADJECTIVES) * len(ANIMALS) * 10000
+
+
+class SeedConfig(NamedTuple):
+    """시드 설정 (매니페스트에 기록되어 재개 시 같은 설정인지 확인)"""
+    users: int = 100
+    posts: int = 500
+    comments: int = 5000
+    likes: int = 2000
+    image_ratio: float = 0.3
+    alpha: float = 1.1
+    seed: int = 0
+
+
+# ============================================================================
+# 생성 계획
+# ============================================================================
+
+def nickname(index: int) -> str:
+    """index번째 사용자의 한글 닉네임 (공백 없음, 10자 이하, index마다 고유)"""
+    adjective = ADJECTIVES[index % len(ADJECTIVES)]
+    animal = ANIMALS[(index // len(ADJECTIVES)) % len(ANIMALS)]
+    return f"{adjective}{animal}{index // (len(ADJECTIVES) * len(ANIMALS))}"
+
+
+def user_spec(config: SeedConfig, index: int) -> Dict[str, str]:
+    return {
+        "email": f"seed{config.seed}.user{index}@example.com",
+        "password": f"Seed{index}pass!",
+        "nickname": nickname(index),
+    }
+
+
+def zipf_weights(count: int, alpha: float, rng: random.Random) -> List[float]:
+    """무작위 순위에 대한 Zipf 가중치 (순위 k의 가중치 1 / k^alpha)"""
+    ranks = list(range(1, count + 1))
+    rng.shuffle(ranks)
+    return [1 / rank ** alpha for rank in ranks]
+
+
+def solid_png(width: int, height: int, rgb) -> bytes:
+    """단색 PNG (이미지 라이브러리 없이 생성)"""
+    row = b"\x00" + bytes(rgb) * width
+    raw = zlib.compress(row * height)
+
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data) & 0xFFFFFFFF)
+
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header) + chunk(b"IDAT", raw) + chunk(b"IEND", b"")
+
+
+def build_plan(config: SeedConfig) -> Dict[str, List[Any]]:
+    """
+    생성 계획 (API 요청 없음)
+
+    Returns:
+        dict: posts [(작성자, 제목, 내용, 이미지 여부)], comments [(게시글, 작성자, 내용)],
+              likes [(게시글, 사용자)] - 모두 인덱스 기준
+    """
+    if not 0 < config.users <= MAX_USERS:
+        raise ValueError(f"users는 1 이상 {MAX_USERS} 이하여야 합니다")
+    rng = random.Random(config.seed)
+
+    author_weights = zipf_weights(config.users, config.alpha, rng)
+    authors = rng.choices(range(config.users), weights=author_weights, k=config.posts)
+    posts = [
+        (
+            author,
+            f"{rng.choice(POST_TITLES)} #{index}",
+            " ".join(rng.sample(POST_SENTENCES, 2)),
+            rng.random() < config.image_ratio,
+        )
+        for index, author in enumerate(authors)
+    ]
+
+    comments = []
+    likes = []
+    if config.posts:
+        post_weights = zipf_weights(config.posts, config.alpha, rng)
+        for post in rng.choices(range(config.posts), weights=post_weights, k=config.comments):
+            comments.append((post, rng.randrange(config.users), rng.choice(COMMENTS)))
+
+        # 좋아요는 토글이므로 (게시글, 사용자) 쌍이 겹치지 않게 선택
+        liked = set()
+        attempts = 0
+        while len(likes) < config.likes and attempts < config.likes * 10:
+            attempts += 1
+            pair = (rng.choices(range(config.posts), weights=post_weights)[0], rng.randrange(config.users))
+            if pair not in liked:
+                liked.add(pair)
+                likes.append(pair)
+
+    return {"posts": posts, "comments": comments, "likes": likes}
+
+
+# ============================================================================
+# 매니페스트
+# ============================================================================
+
+class Manifest:
+    """
+    생성한 ID 기록 (재개용)
+
+    users: 사용자 인덱스 → user_id, posts: 게시글 인덱스 → post_id,
+    comments: 댓글 인덱스 → comment_id, likes: 완료한 좋아요 인덱스
+
+    set()은 변경 로그에 바로 추가하고, save()는 전체를 매니페스트에 쓴 뒤 변경 로그를 비웁니다.
+    open()은 매니페스트에 변경 로그를 다시 적용합니다 (같은 값을 여러 번 적용해도 결과 같음).
+    """
+
+    def __init__(self, path: str, config: SeedConfig):
+        self.path = path
+        self.journal_path = f"{path}.log"
+        self.config = config
+        self.users: Dict[int, int] = {}
+        self.posts: Dict[int, int] = {}
+        self.comments: Dict[int, Optional[int]] = {}
+        self.likes = set()
+        self.errors: List[str] = []
+        self._lock = threading.RLock()
+        self._journal = None
+
+    @classmethod
+    def open(cls, path: str, config: SeedConfig) -> "Manifest":
+        """
+        매니페스트 열기 (없으면 새로 생성)
+
+        Raises:
+            ValueError: 기존 매니페스트의 설정이 다름
+        """
+        manifest = cls(path, config)
+        if not os.path.exists(path):
+            return manifest
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("config") != config._asdict():
+            raise ValueError(f"매니페스트 설정이 다릅니다: {data.get('config')}")
+        manifest.users = {int(k): v for k, v in data.get("users", {}).items()}
+        manifest.posts = {int(k): v for k, v in data.get("posts", {}).items()}
+        manifest.comments = {int(k): v for k, v in data.get("comments", {}).items()}
+        manifest.likes = set(data.get("likes", []))
+        if os.path.exists(manifest.journal_path):
+            with open(manifest.journal_path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        kind, index, value = json.loads(line)
+                    except ValueError:
+                        break  # 기록 중 중단된 마지막 줄
+                    manifest._apply(kind, index, value)
+        return manifest
+
+    def _apply(self, kind: str, index: int, value):
+        if kind == "likes":
+            self.likes.add(index)
+        else:
+            getattr(self, kind)[index] = value
+
+    def set(self, kind: str, index: int, value=None):
+        """완료한 항목 기록 (변경 로그에 바로 추가)"""
+        with self._lock:
+            self._apply(kind, index, value)
+            if self._journal is None:
+                self._journal = open(self.journal_path, "a", encoding="utf-8")
+            self._journal.write(json.dumps([kind, index, value]) + "\n")
+            self._journal.flush()
+
+    def error(self, message: str):
+        with self._lock:
+            self.errors.append(message)
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "config": self.config._asdict(),
+                "updated_at": time.time(),
+                "users": {str(k): v for k, v in sorted(self.users.items())},
+                "posts": {str(k): v for k, v in sorted(self.posts.items())},
+                "comments": {str(k): v for k, v in sorted(self.comments.items())},
+                "likes": sorted(self.likes),
+                "errors": list(self.errors),
+            }
+
+    def save(self) -> str:
+        """임시 파일에 쓴 뒤 교체하고 변경 로그 비우기 (중단되어도 이전 매니페스트 + 변경 로그 유지)"""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp = f"{self.path}.tmp"
+        with self._lock:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self.to_dict(), f, ensure_ascii=False)
+            os.replace(tmp, self.path)
+            if self._journal is not None:
+                self._journal.close()
+            self._journal = open(self.journal_path, "w", encoding="utf-8")
+        return self.path
+
+    def close(self):
+        with self._lock:
+            if self._journal is not None:
+                self._journal.close()
+                self._journal = None
+
+    def summary(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "manifest": self.path,
+                "users": len(self.users),
+                "posts": len(self.posts),
+                "comments": len(self.comments),
+                "likes": len(self.likes),
+                "errors": len(self.errors),
+            }
+
+
+# ============================================================================
+# 적재
+# ============================================================================
+
+class SeedError(Exception):
+    """개별 항목 생성 실패"""
+
+
+def _data(response) -> Dict[str, Any]:
+    return ((response.data or {}).get("data") or {}) if isinstance(response.data, dict) else {}
+
+
+def _check(response, action: str):
+    if not response.ok:
+        message = response.data.get("message") if isinstance(response.data, dict) else None
+        raise SeedError(f"{action} 실패: {response.status} {message}")
+
+
+def create_user(client, spec: Dict[str, str], index: int) -> int:
+    """
+    프로필 이미지 업로드 후 회원가입 (이미 가입된 이메일이면 로그인으로 user_id 확인)
+
+    Returns:
+        int: user_id
+    """
+    profile_image_url = "https://example.com/default.jpg"
+    image = solid_png(8, 8, ((index * 37) % 256, (index * 91) % 256, (index * 53) % 256))
+    upload = client.upload_profile_image(f"profile-{index}.png", image, "image/png")
+    if upload.ok:
+        profile_image_url = _data(upload).get("profile_image_url", profile_image_url)
+
+    response = client.signup(spec["email"], spec["password"], spec["password"], spec["nickname"],
+                             profile_image_url)
+    if response.status == 409:
+        response = client.login(spec["email"], spec["password"])
+    _check(response, f"사용자 {index} 생성")
+    user_id = _data(response).get("user_id")
+    if user_id is None:
+        raise SeedError(f"사용자 {index} 생성 응답에 user_id 없음")
+    return user_id
+
+
+def create_post(client, post, index: int) -> int:
+    """이미지(선택) 업로드 후 게시글 작성, post_id 반환"""
+    _, title, content, with_image = post
+    image_url = image_class = None
+    if with_image:
+        image = solid_png(16, 16, ((index * 13) % 256, (index * 29) % 256, (index * 71) % 256))
+        upload = client.upload_post_image(f"post-{index}.png", image, "image/png")
+        if upload.ok:
+            data = _data(upload)
+            image_url = data.get("image_url")
+            image_class = (data.get("prediction") or {}).get("class_name")
+    response = client.create_post(title, content, image_url=image_url, image_class=image_class)
+    _check(response, f"게시글 {index} 작성")
+    post_id = _data(response).get("post_id")
+    if post_id is None:
+        raise SeedError(f"게시글 {index} 작성 응답에 post_id 없음")
+    return post_id
+
+
+def run(client, config: SeedConfig, manifest_path: str = DEFAULT_MANIFEST, workers: int = 16,
+        progress: Optional[Callable] = None, cancel=None, save_every: int = 200) -> Dict[str, Any]:
+    """
+    시드 데이터 적재 (사용자 → 게시글 → 댓글 → 좋아요 순서)
+
+    이전 단계에서 실패한 사용자 / 게시글에 의존하는 항목은 건너뛰고 errors에 기록합니다.
+
+    Args:
+        client: 로그인하지 않은 ApiClient (사용자별로 for_user()로 복사해 사용)
+        progress: JobContext.progress 호환 콜백
+        cancel: threading.Event - 설정되면 남은 항목은 건너뜀 (매니페스트는 저장)
+        save_every: 이 개수마다 매니페스트 전체를 저장하고 변경 로그를 비움 (완료 기록은 항목마다 변경 로그에 남음)
+
+    Returns:
+        dict: 매니페스트 요약 (생성된 항목 수, 오류 수)
+    """
+    plan = build_plan(config)
+    manifest = Manifest.open(manifest_path, config)
+    manifest.save()
+    counter = {"done": 0}
+
+    def phase(kind: str, items: List[Any], fn: Callable[[int, Any], Any], done):
+        pending = [(index, item) for index, item in enumerate(items) if index not in done]
+        if progress is not None:
+            progress(done=len(items) - len(pending), total=len(items), message=f"{kind} 생성 중")
+
+        def work(entry):
+            index, item = entry
+            return index, fn(index, item)
+
+        def report(_, entry, result, error):
+            if error is not None:
+                manifest.error(f"{kind}[{entry[0]}]: {error}")
+            else:
+                manifest.set(kind, *result)
+            counter["done"] += 1
+            if counter["done"] % save_every == 0:
+                manifest.save()
+            if progress is not None:
+                progress(advance=1)
+
+        bulk_map(work, pending, workers=workers, on_result=report, cancel=cancel)
+        manifest.save()
+
+    def user(index, _):
+        return create_user(client, user_spec(config, index), index)
+
+    def post(index, item):
+        author = manifest.users.get(item[0])
+        if author is None:
+            raise SeedError(f"작성자 {item[0]} 없음")
+        return create_post(client.for_user(author), item, index)
+
+    def comment(index, item):
+        post_index, author_index, content = item
+        post_id, author = manifest.posts.get(post_index), manifest.users.get(author_index)
+        if post_id is None or author is None:
+            raise SeedError("게시글 또는 작성자 없음")
+        response = client.for_user(author).create_comment(post_id, content)
+        _check(response, f"댓글 {index} 작성")
+        return _data(response).get("comment_id")
+
+    def like(index, item):
+        post_index, user_index = item
+        post_id, user_id = manifest.posts.get(post_index), manifest.users.get(user_index)
+        if post_id is None or user_id is None:
+            raise SeedError("게시글 또는 사용자 없음")
+        user_client = client.for_user(user_id)
+        response = user_client.toggle_like(post_id)
+        _check(response, f"좋아요 {index}")
+        if _data(response).get("liked") is False:
+            # 이전 실행에서 누른 뒤 기록 전에 중단된 좋아요를 취소한 것 - 다시 눌러 되돌림
+            response = user_client.toggle_like(post_id)
+            _check(response, f"좋아요 {index}")
+        return None
+
+    try:
+        phase("users", [None] * config.users, user, manifest.users)
+        phase("posts", plan["posts"], post, manifest.posts)
+        phase("comments", plan["comments"], comment, manifest.comments)
+        phase("likes", plan["likes"], like, manifest.likes)
+    finally:
+        manifest.close()
+    return manifest.summary()
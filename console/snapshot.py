@@ -0,0 +1,209 @@
+"""
+게시판 스냅샷
+
+게시글 목록과 게시글별 댓글을 모두 수집(크롤링)해 JSON 파일로 저장합니다.
+
+스냅샷 구조:
+{
+    "taken_at": 1700000000.0,
+    "posts": [{...게시글 목록 항목...}],
+    "comments": [{...댓글..., "post_id": 1}]
+}
+"""
+import os
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from console import models
+from console.concurrency import bulk_map
+
+
+DEFAULT_DIR = "snapshots"
+DEFAULT_PAGE_SIZE = 100
+
+
+class SnapshotError(Exception):
+    """크롤링 중 API 오류"""
+
+
+def post_id_of(post: Dict[str, Any]) -> Optional[int]:
+    """게시글 ID (Backend 응답은 post_id, 일부 응답은 id)"""
+    return post.get("post_id", post.get("id"))
+
+
+def comment_id_of(comment: Dict[str, Any]) -> Optional[int]:
+    """댓글 ID (comment_id 또는 id)"""
+    return comment.get("comment_id", comment.get("id"))
+
+
+# ============================================================================
+# 크롤링
+# ============================================================================
+
+def iter_post_pages(client, page_size: int = DEFAULT_PAGE_SIZE, start_page: int = 1,
+                    cancel=None) -> Iterator[Tuple[List[Dict[str, Any]], Optional[int]]]:
+    """
+    게시글 목록 페이지 순회
+
+    페이지를 받을 때마다 (게시글 목록, 전체 개수)를 반환합니다.
+
+    Raises:
+        SnapshotError: 목록 조회 실패
+    """
+    fetched = 0
+    page = start_page
+    while cancel is None or not cancel.is_set():
+        response = client.get_posts(page, page_size)
+        if not response.ok:
+            raise SnapshotError(f"게시글 목록 조회 실패 (page {page}): {response.status}")
+        data = (response.data or {}).get("data") or {}
+        batch = data.get("posts", [])
+        total = data.get("total")
+        fetched += len(batch)
+        yield batch, total
+        if len(batch) < page_size or (total is not None and fetched + (start_page - 1) * page_size >= total):
+            break
+        page += 1
+
+
+def iter_posts(client, page_size: int = DEFAULT_PAGE_SIZE, start_page: int = 1, all_pages: bool = True,
+               cancel=None) -> Iterator[Dict[str, Any]]:
+    """
+    게시글 단위 순회
+
+    목록 응답을 스트리밍 디코딩하므로 페이지 전체를 받기 전에 첫 게시글을 돌려줍니다.
+
+    Raises:
+        SnapshotError: 목록 조회 실패
+    """
+    page = start_page
+    while cancel is None or not cancel.is_set():
+        stream = client.stream_posts(page, page_size)
+        if not stream.ok:
+            raise SnapshotError(f"게시글 목록 조회 실패 (page {page}): {stream.status}")
+        count = 0
+        for post in stream:
+            count += 1
+            yield post
+        total = ((stream.meta or {}).get("data") or {}).get("total")
+        if not all_pages or count < page_size or (total is not None and page * page_size >= total):
+            break
+        page += 1
+
+
+def fetch_all_posts(client, page_size: int = DEFAULT_PAGE_SIZE,
+                    progress: Optional[Callable] = None, cancel=None) -> List[Dict[str, Any]]:
+    """
+    게시글 목록 전체 조회 (페이지 순회)
+
+    Raises:
+        SnapshotError: 목록 조회 실패
+    """
+    posts: List[Dict[str, Any]] = []
+    for batch, total in iter_post_pages(client, page_size, cancel=cancel):
+        posts.extend(batch)
+        if progress is not None:
+            progress(message=f"게시글 목록 {len(posts)}/{total if total is not None else '?'}")
+    return posts
+
+
+def fetch_comments(client, post_id: int) -> List[Dict[str, Any]]:
+    """
+    게시글 댓글 조회 (각 댓글에 post_id 추가)
+
+    client.typed()로 받은 console.models.Comment는 dict로 바꾸지 않고 post_id만 채웁니다.
+
+    Raises:
+        SnapshotError: 댓글 조회 실패
+    """
+    response = client.get_comments(post_id)
+    if not response.ok:
+        raise SnapshotError(f"댓글 조회 실패 (post {post_id}): {response.status}")
+    comments = ((response.data or {}).get("data") or {}).get("comments", [])
+    result = []
+    for comment in comments:
+        if isinstance(comment, models.Comment):
+            comment.post_id = post_id
+        else:
+            comment = {**comment, "post_id": post_id}
+        result.append(comment)
+    return result
+
+
+def crawl(client, page_size: int = DEFAULT_PAGE_SIZE, workers: int = 16,
+          progress: Optional[Callable] = None, cancel=None) -> Dict[str, Any]:
+    """
+    게시판 전체 크롤링
+
+    게시글 목록을 순회한 뒤 게시글별 댓글을 동시에 조회합니다.
+
+    Args:
+        progress: progress(done=, total=, message=, advance=) 형태의 진행 상황 콜백
+            (JobContext.progress와 호환)
+        cancel: threading.Event - 설정되면 남은 댓글 조회를 건너뜀
+
+    Returns:
+        dict: 스냅샷 (taken_at, posts, comments, errors)
+    """
+    taken_at = time.time()
+    posts = fetch_all_posts(client, page_size, progress, cancel)
+    if progress is not None:
+        progress(done=0, total=len(posts), message="댓글 수집 중")
+
+    comments: List[Dict[str, Any]] = []
+    errors: List[str] = []
+
+    def collect(index, post, result, error):
+        if error is not None:
+            errors.append(str(error))
+        elif result is not None:
+            comments.extend(result)
+        if progress is not None:
+            progress(advance=1)
+
+    bulk_map(lambda post: fetch_comments(client, post_id_of(post)), posts,
+             workers=workers, on_result=collect, cancel=cancel)
+
+    return {
+        "taken_at": taken_at,
+        "posts": posts,
+        "comments": comments,
+        "errors": errors,
+    }
+
+
+# ============================================================================
+# 저장 / 로드
+# ============================================================================
+
+def save(snapshot: Dict[str, Any], path: str) -> str:
+    """스냅샷 JSON 저장 (console.models 객체는 dict로 저장)"""
+    import json
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(snapshot, f, ensure_ascii=False, default=models.to_json)
+    return path
+
+
+def load(path: str) -> Dict[str, Any]:
+    """스냅샷 JSON 로드"""
+    import json
+
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def default_path(directory: str = DEFAULT_DIR) -> str:
+    """시각 기반 기본 스냅샷 경로"""
+    return os.path.join(directory, f"board-{time.strftime('%Y%m%d-%H%M%S')}.json")
+
+
+def list_snapshots(directory: str = DEFAULT_DIR) -> List[str]:
+    """저장된 스냅샷 경로 목록 (최신 순)"""
+    if not os.path.isdir(directory):
+        return []
+    paths = [os.path.join(directory, name) for name in os.listdir(directory) if name.endswith(".json")]
+    return sorted(paths, reverse=True)
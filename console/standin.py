@@ -0,0 +1,487 @@
+"""
+로컬 Backend 대역 (stand-in)
+
+실제 Backend 없이 ApiClient가 요청을 보낼 수 있는 전송 계층입니다.
+console.dataset이 생성한 대용량 데이터를 메모리 또는 SQLite 파일에 적재해 두고,
+게시글 / 댓글 조회와 좋아요 / 조회수 / 게시글 / 댓글 작성 요청에 Backend와 같은 형식으로 응답합니다.
+
+- MemoryStore: 열 단위 배열(array)에 저장 - 댓글 수백만 개도 댓글당 수십 바이트
+- SqliteStore: SQLite 파일 - 프로세스 간 공유, 목록 조회는 Backend처럼 LIMIT / OFFSET
+- StandinTransport: 요청 경로를 저장소 메서드로 연결 (레플리카 호스트는 무시)
+
+사용 예:
+    store = MemoryStore.from_dataset(DatasetConfig(posts=100_000))
+    client = ApiClient(transport=StandinTransport(store))
+"""
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from array import array
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from console import config
+from console.cassette import path_of
+from console.client import TransportResponse
+from console.dataset import COMMENT_VOCAB, Chunk, DatasetConfig, generate, user_nickname
+
+
+def iso(timestamp: float) -> str:
+    """epoch 초 → Backend 응답 형식 시각 (2024-01-01T12:00:00)"""
+    return datetime.fromtimestamp(timestamp, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+
+
+def _comment(comment_id: int, user_id: int, content: str, label: Optional[str],
+             confidence: Optional[float], created_at: float) -> Dict[str, Any]:
+    return {
+        "comment_id": comment_id,
+        "content": content,
+        "author_id": user_id,
+        "author_nickname": user_nickname(user_id),
+        "created_at": iso(created_at),
+        "sentiment": {"label": label, "confidence": confidence} if label else None,
+    }
+
+
+# ============================================================================
+# 메모리 저장소
+# ============================================================================
+
+class MemoryStore:
+    """
+    열 단위 메모리 저장소
+
+    post_id는 1부터 연속이며 배열 인덱스 + 1입니다.
+    생성된 댓글은 게시글 순서로 이어 붙이고 comment_start[post_id - 1]:comment_start[post_id] 범위로 찾으며,
+    실행 중 작성된 댓글은 게시글별 목록(extra_comments)에 따로 보관합니다.
+    """
+
+    def __init__(self, users: int):
+        self.users = users
+        self.post_user = array("l")
+        self.titles: List[str] = []
+        self.contents: List[str] = []
+        self.image_urls: List[Optional[str]] = []
+        self.image_classes: List[Optional[str]] = []
+        self.like_counts = array("l")
+        self.view_counts = array("l")
+        self.post_created = array("d")
+        self.comment_start = array("q", [0])
+        self.comment_user = array("l")
+        self.comment_vocab = array("B")
+        self.comment_created = array("d")
+        self.extra_comments: Dict[int, List[Dict[str, Any]]] = {}
+        self.liked = set()
+        self.next_comment_id = 1
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_dataset(cls, dataset: DatasetConfig) -> "MemoryStore":
+        return cls(dataset.users).load(generate(dataset))
+
+    def load(self, chunks: Iterable[Chunk]) -> "MemoryStore":
+        """생성 청크 적재 (청크를 하나씩 받아 바로 배열에 추가)"""
+        for chunk in chunks:
+            for post_id, user_id, title, content, image_url, image_class, likes, views, count, created in chunk.posts:
+                self.post_user.append(user_id)
+                self.titles.append(title)
+                self.contents.append(content)
+                self.image_urls.append(image_url)
+                self.image_classes.append(image_class)
+                self.like_counts.append(likes)
+                self.view_counts.append(views)
+                self.post_created.append(created)
+                self.comment_start.append(self.comment_start[-1] + count)
+            self.comment_user.extend(comment[2] for comment in chunk.comments)
+            self.comment_vocab.extend(comment[3] for comment in chunk.comments)
+            self.comment_created.extend(comment[4] for comment in chunk.comments)
+        self.next_comment_id = len(self.comment_user) + 1
+        return self
+
+    def post_count(self) -> int:
+        return len(self.post_user)
+
+    def comment_count(self) -> int:
+        return len(self.comment_user) + sum(len(comments) for comments in self.extra_comments.values())
+
+    def _exists(self, post_id: int) -> bool:
+        return 1 <= post_id <= len(self.post_user)
+
+    def _post(self, post_id: int) -> Dict[str, Any]:
+        i = post_id - 1
+        user_id = self.post_user[i]
+        return {
+            "post_id": post_id,
+            "title": self.titles[i],
+            "content": self.contents[i],
+            "user_id": user_id,
+            "nickname": user_nickname(user_id),
+            "image_url": self.image_urls[i],
+            "image_class": self.image_classes[i],
+            "like_count": self.like_counts[i],
+            "view_count": self.view_counts[i],
+            "comment_count": self.comment_start[post_id] - self.comment_start[i]
+            + len(self.extra_comments.get(post_id, ())),
+            "created_at": iso(self.post_created[i]),
+        }
+
+    def list_posts(self, offset: int, limit: int) -> List[Dict[str, Any]]:
+        """최신순 목록"""
+        with self._lock:
+            newest = len(self.post_user) - offset
+            return [self._post(post_id) for post_id in range(newest, max(newest - limit, 0), -1)]
+
+    def get_post(self, post_id: int) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._post(post_id) if self._exists(post_id) else None
+
+    def list_comments(self, post_id: int) -> Optional[List[Dict[str, Any]]]:
+        with self._lock:
+            if not self._exists(post_id):
+                return None
+            comments = []
+            for i in range(self.comment_start[post_id - 1], self.comment_start[post_id]):
+                content, label, confidence = COMMENT_VOCAB[self.comment_vocab[i]]
+                comments.append(_comment(i + 1, self.comment_user[i], content, label, confidence,
+                                         self.comment_created[i]))
+            return comments + list(self.extra_comments.get(post_id, ()))
+
+    def toggle_like(self, post_id: int, user_id: int) -> Optional[Tuple[bool, int]]:
+        with self._lock:
+            if not self._exists(post_id):
+                return None
+            key = (post_id, user_id)
+            liked = key not in self.liked
+            if liked:
+                self.liked.add(key)
+                self.like_counts[post_id - 1] += 1
+            else:
+                self.liked.discard(key)
+                self.like_counts[post_id - 1] -= 1
+            return liked, self.like_counts[post_id - 1]
+
+    def increment_view(self, post_id: int) -> Optional[int]:
+        with self._lock:
+            if not self._exists(post_id):
+                return None
+            self.view_counts[post_id - 1] += 1
+            return self.view_counts[post_id - 1]
+
+    def add_post(self, user_id: int, title: str, content: str, image_url: Optional[str] = None,
+                 image_class: Optional[str] = None) -> int:
+        with self._lock:
+            self.post_user.append(user_id)
+            self.titles.append(title)
+            self.contents.append(content)
+            self.image_urls.append(image_url)
+            self.image_classes.append(image_class)
+            self.like_counts.append(0)
+            self.view_counts.append(0)
+            self.post_created.append(time.time())
+            self.comment_start.append(self.comment_start[-1])
+            return len(self.post_user)
+
+    def add_comment(self, post_id: int, user_id: int, content: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            if not self._exists(post_id):
+                return None
+            comment = _comment(self.next_comment_id, user_id, content, None, None, time.time())
+            self.next_comment_id += 1
+            self.extra_comments.setdefault(post_id, []).append(comment)
+            return comment
+
+
+# ============================================================================
+# SQLite 저장소
+# ============================================================================
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    user_id INTEGER PRIMARY KEY,
+    nickname TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS posts (
+    post_id INTEGER PRIMARY KEY,
+    user_id INTEGER NOT NULL,
+    title TEXT NOT NULL,
+    content TEXT NOT NULL,
+    image_url TEXT,
+    image_class TEXT,
+    like_count INTEGER NOT NULL DEFAULT 0,
+    view_count INTEGER NOT NULL DEFAULT 0,
+    comment_count INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS comments (
+    comment_id INTEGER PRIMARY KEY,
+    post_id INTEGER NOT NULL,
+    user_id INTEGER NOT NULL,
+    content TEXT NOT NULL,
+    label TEXT,
+    confidence REAL,
+    created_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS likes (
+    post_id INTEGER NOT NULL,
+    user_id INTEGER NOT NULL,
+    PRIMARY KEY (post_id, user_id)
+) WITHOUT ROWID;
+"""
+
+POST_COLUMNS = ("post_id, title, content, p.user_id, nickname, image_url, image_class, "
+                "like_count, view_count, comment_count, created_at")
+
+
+class SqliteStore:
+    """
+    SQLite 저장소
+
+    목록 조회는 Backend와 같이 ORDER BY ... LIMIT / OFFSET을 사용하므로
+    깊은 페이지일수록 느려지는 특성도 그대로 재현됩니다.
+    연결 하나를 잠금으로 보호해 여러 스레드(bulk_map)에서 사용합니다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(SCHEMA)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_dataset(cls, dataset: DatasetConfig, path: str) -> "SqliteStore":
+        """
+        새 SQLite 파일에 생성 데이터 적재
+
+        Raises:
+            FileExistsError: path에 파일이 이미 있음
+        """
+        if os.path.exists(path):
+            raise FileExistsError(f"이미 있는 파일입니다: {path}")
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        return cls(path).load(dataset.users, generate(dataset))
+
+    def load(self, users: int, chunks: Iterable[Chunk]) -> "SqliteStore":
+        """
+        생성 청크 적재
+
+        적재 중에는 저널 / 동기화를 끄고, 댓글 인덱스는 모두 넣은 뒤에 만듭니다.
+        """
+        vocab = COMMENT_VOCAB
+        with self._lock:
+            conn = self._conn
+            conn.execute("PRAGMA journal_mode=OFF")
+            conn.execute("PRAGMA synchronous=OFF")
+            with conn:
+                conn.executemany("INSERT INTO users VALUES (?, ?)",
+                                 ((user_id, user_nickname(user_id)) for user_id in range(1, users + 1)))
+                for chunk in chunks:
+                    conn.executemany("INSERT INTO posts VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", chunk.posts)
+                    conn.executemany(
+                        "INSERT INTO comments VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        ((comment_id, post_id, user_id, *vocab[index], created)
+                         for comment_id, post_id, user_id, index, created in chunk.comments),
+                    )
+                conn.execute("CREATE INDEX IF NOT EXISTS comments_post ON comments (post_id, comment_id)")
+            conn.execute("PRAGMA journal_mode=DELETE")
+            conn.execute("PRAGMA synchronous=FULL")
+        return self
+
+    def close(self):
+        self._conn.close()
+
+    def _query(self, sql: str, args: tuple = ()) -> List[tuple]:
+        with self._lock:
+            return self._conn.execute(sql, args).fetchall()
+
+    @staticmethod
+    def _post(row: tuple) -> Dict[str, Any]:
+        post_id, title, content, user_id, nickname, image_url, image_class, likes, views, comments, created = row
+        return {
+            "post_id": post_id,
+            "title": title,
+            "content": content,
+            "user_id": user_id,
+            "nickname": nickname,
+            "image_url": image_url,
+            "image_class": image_class,
+            "like_count": likes,
+            "view_count": views,
+            "comment_count": comments,
+            "created_at": iso(created),
+        }
+
+    def post_count(self) -> int:
+        return self._query("SELECT count(*) FROM posts")[0][0]
+
+    def comment_count(self) -> int:
+        return self._query("SELECT count(*) FROM comments")[0][0]
+
+    def list_posts(self, offset: int, limit: int) -> List[Dict[str, Any]]:
+        rows = self._query(
+            f"SELECT {POST_COLUMNS} FROM posts p JOIN users u ON u.user_id = p.user_id "
+            "ORDER BY post_id DESC LIMIT ? OFFSET ?", (limit, offset))
+        return [self._post(row) for row in rows]
+
+    def get_post(self, post_id: int) -> Optional[Dict[str, Any]]:
+        rows = self._query(
+            f"SELECT {POST_COLUMNS} FROM posts p JOIN users u ON u.user_id = p.user_id WHERE post_id = ?",
+            (post_id,))
+        return self._post(rows[0]) if rows else None
+
+    def _exists(self, post_id: int) -> bool:
+        return self._conn.execute("SELECT 1 FROM posts WHERE post_id = ?", (post_id,)).fetchone() is not None
+
+    def list_comments(self, post_id: int) -> Optional[List[Dict[str, Any]]]:
+        with self._lock:
+            if not self._exists(post_id):
+                return None
+            rows = self._conn.execute(
+                "SELECT comment_id, user_id, content, label, confidence, created_at FROM comments "
+                "WHERE post_id = ? ORDER BY comment_id", (post_id,)).fetchall()
+        return [_comment(*row) for row in rows]
+
+    def toggle_like(self, post_id: int, user_id: int) -> Optional[Tuple[bool, int]]:
+        with self._lock, self._conn as conn:
+            if not self._exists(post_id):
+                return None
+            removed = conn.execute("DELETE FROM likes WHERE post_id = ? AND user_id = ?", (post_id, user_id)).rowcount
+            if not removed:
+                conn.execute("INSERT INTO likes VALUES (?, ?)", (post_id, user_id))
+            conn.execute("UPDATE posts SET like_count = like_count + ? WHERE post_id = ?",
+                         (-1 if removed else 1, post_id))
+            count = conn.execute("SELECT like_count FROM posts WHERE post_id = ?", (post_id,)).fetchone()[0]
+            return not removed, count
+
+    def increment_view(self, post_id: int) -> Optional[int]:
+        with self._lock, self._conn as conn:
+            if not conn.execute("UPDATE posts SET view_count = view_count + 1 WHERE post_id = ?",
+                                (post_id,)).rowcount:
+                return None
+            return conn.execute("SELECT view_count FROM posts WHERE post_id = ?", (post_id,)).fetchone()[0]
+
+    def add_post(self, user_id: int, title: str, content: str, image_url: Optional[str] = None,
+                 image_class: Optional[str] = None) -> int:
+        with self._lock, self._conn as conn:
+            conn.execute("INSERT OR IGNORE INTO users VALUES (?, ?)", (user_id, user_nickname(user_id)))
+            return conn.execute(
+                "INSERT INTO posts (user_id, title, content, image_url, image_class, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)", (user_id, title, content, image_url, image_class, time.time())).lastrowid
+
+    def add_comment(self, post_id: int, user_id: int, content: str) -> Optional[Dict[str, Any]]:
+        created = time.time()
+        with self._lock, self._conn as conn:
+            if not self._exists(post_id):
+                return None
+            comment_id = conn.execute(
+                "INSERT INTO comments (post_id, user_id, content, created_at) VALUES (?, ?, ?, ?)",
+                (post_id, user_id, content, created)).lastrowid
+            conn.execute("UPDATE posts SET comment_count = comment_count + 1 WHERE post_id = ?", (post_id,))
+        return _comment(comment_id, user_id, content, None, None, created)
+
+
+# ============================================================================
+# 전송 계층
+# ============================================================================
+
+_POST = re.compile(r"/posts/(\d+)$")
+_POST_ACTION = re.compile(r"/posts/(\d+)/(comments|like|view)$")
+
+
+class StandinTransport:
+    """
+    저장소에 요청을 연결하는 전송 계층 (ApiClient transport 인터페이스)
+
+    등록되지 않은 요청은 404 not_found, 로그인이 필요한 요청에 X-User-Id가 없으면 401을 반환합니다.
+
+    Args:
+        latency: 요청마다 더할 지연 시간(초) - 네트워크 왕복 흉내
+    """
+
+    def __init__(self, store, latency: float = 0.0):
+        self.store = store
+        self.latency = latency
+
+    @staticmethod
+    def _reply(status: int, message: str, data: Any = None) -> TransportResponse:
+        body = json.dumps({"message": message, "data": data}, ensure_ascii=False).encode()
+        return TransportResponse(status, body, {"Content-Type": "application/json"})
+
+    def send(self, method, url, *, params=None, json_body=None, files=None, headers=None, timeout=None):
+        if self.latency:
+            time.sleep(self.latency)
+        path = path_of(url)
+        if path in ("/", ""):
+            return TransportResponse(200, b'{"status": "ok"}', {"Content-Type": "application/json"})
+        if not path.startswith(config.API_PREFIX):
+            return self._reply(404, "not_found")
+        path = path[len(config.API_PREFIX):]
+        user_id = int((headers or {}).get("X-User-Id") or 0)
+
+        if path == "/posts":
+            if method == "GET":
+                return self._list_posts(params or {})
+            if method == "POST":
+                if not user_id:
+                    return self._reply(401, "unauthorized")
+                body = json_body or {}
+                if not body.get("title") or not body.get("content"):
+                    return self._reply(400, "title_required" if not body.get("title") else "content_required")
+                post_id = self.store.add_post(user_id, body["title"], body["content"],
+                                              body.get("image_url"), body.get("image_class"))
+                return self._reply(201, "create_post_success", {"post_id": post_id})
+
+        match = _POST.match(path)
+        if match and method == "GET":
+            post = self.store.get_post(int(match.group(1)))
+            return self._reply(200, "get_post_success", post) if post else self._reply(404, "post_not_found")
+
+        match = _POST_ACTION.match(path)
+        if match:
+            post_id, action = int(match.group(1)), match.group(2)
+            if action == "comments" and method == "GET":
+                comments = self.store.list_comments(post_id)
+                if comments is None:
+                    return self._reply(404, "post_not_found")
+                return self._reply(200, "get_comments_success", {"comments": comments, "total": len(comments)})
+            if action == "view" and method == "PATCH":
+                views = self.store.increment_view(post_id)
+                if views is None:
+                    return self._reply(404, "post_not_found")
+                return self._reply(200, "view_count_incremented", {"view_count": views})
+            if method == "POST" and action in ("comments", "like"):
+                if not user_id:
+                    return self._reply(401, "unauthorized")
+                if action == "like":
+                    result = self.store.toggle_like(post_id, user_id)
+                    if result is None:
+                        return self._reply(404, "post_not_found")
+                    return self._reply(200, "like_success", {"liked": result[0], "like_count": result[1]})
+                content = (json_body or {}).get("content")
+                if not content:
+                    return self._reply(400, "content_required")
+                comment = self.store.add_comment(post_id, user_id, content)
+                if comment is None:
+                    return self._reply(404, "post_not_found")
+                return self._reply(201, "create_comment_success", comment)
+
+        return self._reply(404, "not_found")
+
+    def _list_posts(self, params: Dict[str, Any]) -> TransportResponse:
+        try:
+            page, limit = int(params.get("page", 1)), int(params.get("limit", 10))
+        except (TypeError, ValueError):
+            return self._reply(400, "invalid_request")
+        if page < 1 or limit < 1:
+            return self._reply(400, "invalid_request")
+        posts = self.store.list_posts((page - 1) * limit, limit)
+        return self._reply(200, "get_posts_success", {
+            "posts": posts,
+            "total": self.store.post_count(),
+            "page": page,
+            "limit": limit,
+        })
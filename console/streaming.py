@@ -0,0 +1,190 @@
+"""
+목록 응답 스트리밍 디코딩
+
+게시글 목록(data.posts)과 댓글 목록(data.comments)을 응답 본문 전체를 받기 전에 항목 단위로 디코딩합니다.
+- 본문은 청크(bytes) 단위로 받아 UTF-8 증분 디코딩
+- 대상 배열까지는 구조만 따라가고, 배열 안에서는 항목 하나씩 json.JSONDecoder.raw_decode로 디코딩
+- 이미 읽은 부분은 버퍼에서 버리므로 메모리는 청크 크기 + 항목 하나 정도로 유지
+- 대상 배열 밖의 값(message, total, page 등)은 meta에 모음 (배열 뒤에 오는 값은 반복이 끝난 뒤에 채워짐)
+
+전송 계층에 stream()이 없으면(테스트 / 녹화 재생 등) 본문 전체를 청크 하나로 처리합니다.
+콘솔 시작 시간을 위해 json은 첫 디코딩 시점에 import합니다.
+"""
+import codecs
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+
+# 버퍼 앞쪽에서 이만큼(문자) 이상 읽었으면 잘라냄
+COMPACT_AT = 64 * 1024
+
+WHITESPACE = " \t\r\n"
+
+
+class _Reader:
+    """청크 단위 UTF-8 텍스트 버퍼"""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self.peak = 0
+
+    def more(self) -> bool:
+        """다음 청크를 버퍼에 추가 (더 받을 것이 없으면 False)"""
+        while not self.eof:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                text = self._decoder.decode(b"", final=True)
+                self.eof = True
+            else:
+                text = self._decoder.decode(chunk)
+            if text:
+                if self.pos >= COMPACT_AT:
+                    self.buffer = self.buffer[self.pos:]
+                    self.pos = 0
+                self.buffer += text
+                self.peak = max(self.peak, len(self.buffer))
+                return True
+        return False
+
+    def peek(self) -> str:
+        """공백을 건너뛴 다음 문자 (본문 끝이면 빈 문자열)"""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.more():
+                return ""
+
+    def take(self, expected: str) -> str:
+        """다음 문자를 읽음 (expected 중 하나가 아니면 ValueError)"""
+        char = self.peek()
+        if not char or char not in expected:
+            raise ValueError(f"잘못된 JSON: {expected!r} 중 하나가 와야 하는 위치에 {char!r}")
+        self.pos += 1
+        return char
+
+    def value(self, decoder) -> Any:
+        """JSON 값 하나 (끝까지 받지 못했으면 다음 청크를 받아 다시 시도)"""
+        self.peek()
+        while True:
+            try:
+                value, end = decoder.raw_decode(self.buffer, self.pos)
+            except ValueError:
+                if self.more():
+                    continue
+                raise
+            # 숫자는 버퍼 끝에서 끝났다면 다음 청크에 이어질 수 있음
+            if end == len(self.buffer) and self.more():
+                continue
+            self.pos = end
+            return value
+
+
+class ArrayStream:
+    """
+    JSON 본문의 path 위치 배열을 항목 단위로 반복
+
+    Usage:
+        stream = ArrayStream(chunks, ("data", "posts"))
+        for post in stream:
+            ...
+        stream.meta  # {"message": ..., "data": {"total": ..., ...}}
+
+    Raises (반복 중):
+        ValueError: 본문이 올바른 JSON이 아님
+    """
+
+    def __init__(self, chunks: Iterable[bytes], path: Tuple[str, ...],
+                 object_hook: Optional[Callable[[Dict[str, Any]], Any]] = None):
+        import json
+
+        self.path = tuple(path)
+        self.meta: Any = None
+        self.count = 0
+        self._reader = _Reader(chunks)
+        self._items = json.JSONDecoder(object_hook=object_hook)
+        self._keys = json.JSONDecoder()
+        self._started = False
+
+    @property
+    def peak_buffer(self) -> int:
+        """반복 중 버퍼의 최대 크기 (문자)"""
+        return self._reader.peak
+
+    def __iter__(self) -> Iterator[Any]:
+        if self._started:
+            raise RuntimeError("ArrayStream은 한 번만 반복할 수 있습니다")
+        self._started = True
+        for item in self._walk(()):
+            self.count += 1
+            yield item
+        if self._reader.peek():
+            raise ValueError("잘못된 JSON: 본문 끝에 남은 데이터가 있습니다")
+
+    def _set(self, path: Tuple[str, ...], value: Any):
+        if not path:
+            self.meta = value
+            return
+        parent = self.meta
+        for key in path[:-1]:
+            parent = parent[key]
+        parent[path[-1]] = value
+
+    def _walk(self, path: Tuple[str, ...]) -> Iterator[Any]:
+        reader = self._reader
+        char = reader.peek()
+        if path == self.path and char == "[":
+            reader.take("[")
+            if reader.peek() == "]":
+                reader.take("]")
+                return
+            while True:
+                yield reader.value(self._items)
+                if reader.take(",]") == "]":
+                    return
+        if char == "{" and self.path[:len(path)] == path:
+            self._set(path, {})
+            reader.take("{")
+            if reader.peek() == "}":
+                reader.take("}")
+                return
+            while True:
+                if reader.peek() != '"':
+                    reader.take('"')
+                key = reader.value(self._keys)
+                reader.take(":")
+                yield from self._walk(path + (key,))
+                if reader.take(",}") == "}":
+                    return
+        self._set(path, reader.value(self._items))
+
+
+class ListStream:
+    """
+    스트리밍 목록 응답
+
+    성공(2xx)이면 반복할 때 항목을 받는 대로 돌려주고, 반복이 끝나면 meta에 나머지 응답 구조가 있습니다.
+    실패면 data에 응답 본문(오류 메시지)이 있고 반복 결과는 비어 있습니다.
+    elapsed는 응답 헤더를 받기까지의 시간(초)입니다.
+    """
+
+    def __init__(self, ok: bool, status: int, elapsed: float, data: Any = None,
+                 items: Optional[ArrayStream] = None):
+        self.ok = ok
+        self.status = status
+        self.elapsed = elapsed
+        self.data = data
+        self.items = items
+
+    @property
+    def meta(self) -> Any:
+        return self.items.meta if self.items is not None else self.data
+
+    def __iter__(self) -> Iterator[Any]:
+        if self.items is None:
+            return iter(())
+        return iter(self.items)
@@ -0,0 +1,288 @@
+"""
+증분 스냅샷 동기화
+
+첫 동기화는 전체 크롤링(console.snapshot.crawl)으로 기준 스냅샷을 만들고,
+이후에는 게시글 목록만 다시 훑어 바뀐 게시글의 댓글만 다시 조회합니다.
+게시글마다 댓글을 조회하는 요청이 크롤링 요청의 대부분이므로 변경이 적으면 요청 수가 크게 줄어듭니다.
+
+변경 판단 (게시글 목록 항목 기준):
+- 처음 보는 post_id, 또는 created_at이 달라진 게시글(ID 재사용) → 새 게시글, 댓글 조회
+- comment_count가 저장된 댓글 수와 다름 → 댓글 다시 조회
+- 항목 내용 해시(제목 / 내용 / 좋아요 / 조회수 등)가 다름 → 게시글만 갱신 (추가 요청 없음)
+- 목록에서 사라진 게시글 → 삭제 (목록을 끝까지 훑은 경우에만)
+- 댓글 수가 같은 채 수정 / 삭제+작성된 댓글은 목록으로 알 수 없으므로,
+  recheck_every번의 동기화에 걸쳐 모든 게시글의 댓글을 나누어 다시 확인
+
+저장 구조 (directory 아래):
+- base.json: 기준 스냅샷 (console.snapshot과 같은 형식)
+- deltas.jsonl: 추가 전용 변경 로그 - 한 줄에 변경 하나 (post / post_delete / comments / sync)
+- 로그가 compact_after줄을 넘으면 압축: 로그를 적용한 스냅샷을 base.json으로 교체하고 로그를 비움
+  (변경은 모두 멱등이므로 교체와 비우기 사이에 중단되어도 다시 적용하면 같은 결과)
+"""
+import hashlib
+import os
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from console import models, snapshot
+from console.concurrency import bulk_map
+from console.snapshot import post_id_of
+
+
+DEFAULT_DIR = os.path.join(snapshot.DEFAULT_DIR, "sync")
+BASE_FILE = "base.json"
+DELTA_FILE = "deltas.jsonl"
+
+DEFAULT_COMPACT_AFTER = 10_000
+DEFAULT_RECHECK_EVERY = 7
+
+
+def content_hash(value: Any) -> str:
+    """JSON 값의 해시 (키 순서 무관, console.models 객체는 dict와 같은 값)"""
+    import json
+
+    encoded = json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(",", ":"), default=models.to_json)
+    return hashlib.sha1(encoded.encode("utf-8")).hexdigest()
+
+
+class BoardState:
+    """
+    메모리의 게시판 상태 (게시글 ID별 게시글 / 댓글 목록)
+
+    댓글에는 스냅샷과 같이 post_id가 붙어 있습니다.
+    """
+
+    def __init__(self):
+        self.posts: Dict[int, Dict[str, Any]] = {}
+        self.comments: Dict[int, List[Dict[str, Any]]] = {}
+        self.taken_at: Optional[float] = None
+        self.syncs = 0
+
+    @classmethod
+    def from_snapshot(cls, board: Dict[str, Any]) -> "BoardState":
+        state = cls()
+        state.taken_at = board.get("taken_at")
+        state.syncs = board.get("syncs", 0)
+        for post in board.get("posts", []):
+            state.posts[post_id_of(post)] = post
+            state.comments.setdefault(post_id_of(post), [])
+        for comment in board.get("comments", []):
+            state.comments.setdefault(comment["post_id"], []).append(comment)
+        return state
+
+    def apply(self, delta: Dict[str, Any]):
+        """변경 하나 적용 (멱등)"""
+        op = delta["op"]
+        if op == "post":
+            self.posts[post_id_of(delta["post"])] = delta["post"]
+        elif op == "post_delete":
+            self.posts.pop(delta["post_id"], None)
+            self.comments.pop(delta["post_id"], None)
+        elif op == "comments":
+            self.comments[delta["post_id"]] = delta["comments"]
+        elif op == "sync":
+            self.taken_at = delta["taken_at"]
+            self.syncs = delta["syncs"]
+
+    def to_snapshot(self) -> Dict[str, Any]:
+        """스냅샷 형식 (게시글은 최신순)"""
+        order = sorted(self.posts, reverse=True)
+        return {
+            "taken_at": self.taken_at,
+            "syncs": self.syncs,
+            "posts": [self.posts[post_id] for post_id in order],
+            "comments": [comment for post_id in order for comment in self.comments.get(post_id, [])],
+            "errors": [],
+        }
+
+
+# ============================================================================
+# 저장소
+# ============================================================================
+
+class SyncStore:
+    """기준 스냅샷 + 변경 로그"""
+
+    def __init__(self, directory: str = DEFAULT_DIR, compact_after: int = DEFAULT_COMPACT_AFTER):
+        self.directory = directory
+        self.compact_after = compact_after
+        self.base_path = os.path.join(directory, BASE_FILE)
+        self.delta_path = os.path.join(directory, DELTA_FILE)
+
+    def exists(self) -> bool:
+        return os.path.exists(self.base_path)
+
+    def delta_count(self) -> int:
+        if not os.path.exists(self.delta_path):
+            return 0
+        with open(self.delta_path, encoding="utf-8") as f:
+            return sum(1 for _ in f)
+
+    def load(self) -> BoardState:
+        """기준 스냅샷에 변경 로그 적용 (마지막 줄이 잘려 있으면 무시)"""
+        import json
+
+        state = BoardState.from_snapshot(snapshot.load(self.base_path)) if self.exists() else BoardState()
+        if os.path.exists(self.delta_path):
+            with open(self.delta_path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        delta = json.loads(line)
+                    except ValueError:
+                        break
+                    state.apply(delta)
+        return state
+
+    def append(self, deltas: List[Dict[str, Any]]):
+        """변경 로그에 추가 (디스크에 기록될 때까지 대기)"""
+        import json
+
+        if not deltas:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        with open(self.delta_path, "a", encoding="utf-8") as f:
+            for delta in deltas:
+                f.write(json.dumps(delta, ensure_ascii=False, default=models.to_json) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def compact(self, state: Optional[BoardState] = None) -> BoardState:
+        """변경 로그를 적용한 스냅샷을 기준으로 교체하고 로그 비우기"""
+        state = state or self.load()
+        os.makedirs(self.directory, exist_ok=True)
+        tmp = f"{self.base_path}.tmp"
+        snapshot.save(state.to_snapshot(), tmp)
+        os.replace(tmp, self.base_path)
+        if os.path.exists(self.delta_path):
+            os.remove(self.delta_path)
+        return state
+
+
+# ============================================================================
+# 동기화
+# ============================================================================
+
+def _comments_changed(old: List[Dict[str, Any]], new: List[Dict[str, Any]]) -> bool:
+    return content_hash(old) != content_hash(new)
+
+
+def _recheck(post_id: int, syncs: int, every: int) -> bool:
+    """이번 동기화에서 댓글을 다시 확인할 게시글 (every번에 걸쳐 모든 게시글 한 번씩)"""
+    return every > 0 and post_id % every == syncs % every
+
+
+def sync(client, store: SyncStore, page_size: int = snapshot.DEFAULT_PAGE_SIZE, workers: int = 16,
+         recheck_every: int = DEFAULT_RECHECK_EVERY, full: bool = False,
+         progress: Optional[Callable] = None, cancel=None) -> Dict[str, Any]:
+    """
+    증분 동기화
+
+    Args:
+        recheck_every: 댓글 수가 같아도 댓글을 다시 확인하는 주기 (0이면 하지 않음)
+        full: 기준 스냅샷이 있어도 전체 크롤링으로 다시 만듦
+        progress: JobContext.progress 호환 콜백
+        cancel: threading.Event - 설정되면 남은 댓글 조회를 건너뛰고 삭제 판정을 하지 않음
+
+    Returns:
+        dict: full, posts, new, updated, deleted, comments_fetched, comments_changed, deltas, compacted, errors
+
+    Raises:
+        SnapshotError: 게시글 목록 조회 실패 (변경 로그는 바뀌지 않음)
+    """
+    if full or not store.exists():
+        board = snapshot.crawl(client, page_size, workers, progress, cancel)
+        state = BoardState.from_snapshot(board)
+        state.syncs = 1
+        store.compact(state)
+        return {
+            "full": True,
+            "posts": len(state.posts),
+            "new": len(state.posts),
+            "updated": 0,
+            "deleted": 0,
+            "comments_fetched": len(state.posts),
+            "comments_changed": len(state.posts),
+            "deltas": 0,
+            "compacted": True,
+            "errors": board["errors"],
+        }
+
+    state = store.load()
+    taken_at = time.time()
+    syncs = state.syncs + 1
+    deltas: List[Dict[str, Any]] = []
+    seen = set()
+    refetch: List[int] = []
+    counts = {"new": 0, "updated": 0}
+
+    listed = 0
+    completed = True
+    for batch, total in snapshot.iter_post_pages(client, page_size, cancel=cancel):
+        for post in batch:
+            post_id = post_id_of(post)
+            seen.add(post_id)
+            old = state.posts.get(post_id)
+            if old is None or old.get("created_at") != post.get("created_at"):
+                counts["new"] += 1
+                deltas.append({"op": "post", "post": post})
+                if post.get("comment_count", 1):
+                    refetch.append(post_id)
+                else:
+                    # 댓글이 없는 새 게시글은 조회하지 않음
+                    deltas.append({"op": "comments", "post_id": post_id, "comments": []})
+                continue
+            if content_hash(old) != content_hash(post):
+                counts["updated"] += 1
+                deltas.append({"op": "post", "post": post})
+            stored = len(state.comments.get(post_id, []))
+            if post.get("comment_count", stored) != stored or _recheck(post_id, syncs, recheck_every):
+                refetch.append(post_id)
+        listed += len(batch)
+        if progress is not None:
+            progress(message=f"게시글 목록 {listed}/{total if total is not None else '?'}")
+    if cancel is not None and cancel.is_set():
+        completed = False
+
+    deleted = [post_id for post_id in state.posts if post_id not in seen] if completed else []
+    deltas.extend({"op": "post_delete", "post_id": post_id} for post_id in deleted)
+
+    if progress is not None:
+        progress(done=0, total=len(refetch), message="바뀐 게시글 댓글 조회 중")
+    errors: List[str] = []
+    changed = 0
+
+    def collect(index, post_id, comments, error):
+        nonlocal changed
+        if error is not None:
+            errors.append(str(error))
+        elif comments is not None and _comments_changed(state.comments.get(post_id, []), comments):
+            changed += 1
+            deltas.append({"op": "comments", "post_id": post_id, "comments": comments})
+        if progress is not None:
+            progress(advance=1)
+
+    bulk_map(lambda post_id: snapshot.fetch_comments(client, post_id), refetch,
+             workers=workers, on_result=collect, cancel=cancel)
+
+    deltas.append({"op": "sync", "taken_at": taken_at, "syncs": syncs})
+    store.append(deltas)
+    for delta in deltas:
+        state.apply(delta)
+
+    compacted = store.delta_count() > store.compact_after
+    if compacted:
+        store.compact(state)
+
+    return {
+        "full": False,
+        "posts": len(state.posts),
+        "new": counts["new"],
+        "updated": counts["updated"],
+        "deleted": len(deleted),
+        "comments_fetched": len(refetch),
+        "comments_changed": changed,
+        "deltas": len(deltas),
+        "compacted": compacted,
+        "errors": errors,
+    }
+
@@ -0,0 +1,190 @@
+"""
+입력 / 응답 유효성 검사
+
+프론트엔드(js/auth.js, js/posts.js)의 입력 검증 규칙과 API 응답 구조 검사를 Python으로 제공합니다.
+테스트 fixture(tests/conftest.py), 벤치마크(console.bench), 일괄 가져오기에서 같은 함수를 사용합니다.
+
+패턴은 모듈 로드 시 한 번만 컴파일하고, 비밀번호 문자 종류 검사는 문자 집합을 한 번만 만들어
+(정규식 4번 대신) 집합 연산으로 처리합니다. 결과와 오류 메시지는 정규식 구현과 같습니다.
+"""
+import re
+import string
+from typing import Any, Dict, Iterable, List, Optional
+
+
+EMAIL_PATTERN = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+EMAIL_RE = re.compile(EMAIL_PATTERN)
+
+# 비밀번호 문자 종류 (정규식 [A-Z], [a-z], [0-9], 특수문자 클래스와 같은 ASCII 문자)
+UPPERCASE = frozenset(string.ascii_uppercase)
+LOWERCASE = frozenset(string.ascii_lowercase)
+DIGITS = frozenset(string.digits)
+SPECIAL_CHARACTERS = frozenset("!@#$%^&*()-_=+[]{}|;:'\",.<>/?`~")
+
+PASSWORD_MIN_LENGTH = 8
+PASSWORD_MAX_LENGTH = 20
+NICKNAME_MAX_LENGTH = 10
+
+# 프론트엔드 에러 메시지 (JavaScript의 에러 메시지와 동기화)
+ERROR_MESSAGES = {
+    # 로그인 에러
+    "email_required": "이메일을 입력해주세요",
+    "invalid_email_format": "올바른 이메일 주소 형식을 입력해주세요",
+    "password_required": "비밀번호를 입력해주세요",
+    "invalid_credentials": "아이디 또는 비밀번호를 확인해주세요",
+
+    # 회원가입 에러
+    "invalid_email_character": "이메일은 영문과 @, .만 사용이 가능합니다",
+    "duplicate_email": "중복된 이메일입니다",
+    "invalid_password_format": "비밀번호는 8자 이상, 20자 이하이며 대문자, 소문자, 특수문자를 각각 1개 포함해야 합니다",
+    "password_check_required": "비밀번호를 한번 더 입력해주세요",
+    "password_mismatch": "비밀번호가 다릅니다",
+    "nickname_required": "닉네임을 입력해주세요",
+    "nickname_contains_space": "띄어쓰기를 없애주세요",
+    "nickname_too_long": "닉네임은 최대 10자까지 작성 가능합니다",
+    "duplicate_nickname": "중복된 닉네임입니다",
+    "profile_image_url_required": "프로필 사진을 추가해주세요",
+
+    # 게시글 에러
+    "title_required": "제목을 입력해주세요",
+    "content_required": "내용을 입력해주세요",
+    "post_not_found": "게시글을 찾을 수 없습니다",
+
+    # 일반 에러
+    "network_error": "네트워크 오류가 발생했습니다",
+    "server_error": "서버 오류가 발생했습니다"
+}
+
+REQUIRED_POST_FIELDS = ("post_id", "title", "content")
+REQUIRED_COMMENT_FIELDS = ("comment_id", "content")
+
+
+# ============================================================================
+# 입력 검증
+# ============================================================================
+
+def validate_email(email: str) -> bool:
+    """
+    이메일 형식 검사 (JavaScript 정규식과 동일)
+
+    Python re의 $는 끝의 줄바꿈 앞에서도 맞으므로 fullmatch로 JavaScript처럼 문자열 끝에서만 맞게 합니다.
+    """
+    if not email or not isinstance(email, str):
+        return False
+    return EMAIL_RE.fullmatch(email) is not None
+
+
+def validate_password(password: str) -> Dict[str, Any]:
+    """
+    비밀번호 검사
+
+    규칙:
+    - 8자 이상 20자 이하
+    - 대문자, 소문자, 숫자, 특수문자 각 1개 이상
+
+    Returns:
+        dict: valid, errors
+    """
+    errors = []
+
+    if not password:
+        return {"valid": False, "errors": ["비밀번호를 입력해주세요"]}
+
+    length = len(password)
+    if length < PASSWORD_MIN_LENGTH:
+        errors.append("8자 이상이어야 합니다")
+    if length > PASSWORD_MAX_LENGTH:
+        errors.append("20자 이하여야 합니다")
+
+    # 문자열을 한 번만 훑어 문자 집합 생성 후 종류별 포함 여부 확인
+    chars = set(password)
+    if chars.isdisjoint(UPPERCASE):
+        errors.append("대문자가 필요합니다")
+    if chars.isdisjoint(LOWERCASE):
+        errors.append("소문자가 필요합니다")
+    if chars.isdisjoint(DIGITS):
+        errors.append("숫자가 필요합니다")
+    if chars.isdisjoint(SPECIAL_CHARACTERS):
+        errors.append("특수문자가 필요합니다")
+
+    return {"valid": len(errors) == 0, "errors": errors}
+
+
+def validate_nickname(nickname: str) -> Dict[str, Any]:
+    """
+    닉네임 검사
+
+    규칙:
+    - 필수 입력
+    - 공백 불가
+    - 최대 10자
+
+    Returns:
+        dict: valid, errors
+    """
+    errors = []
+
+    if not nickname or not nickname.strip():
+        return {"valid": False, "errors": ["닉네임을 입력해주세요"]}
+
+    if " " in nickname:
+        errors.append("공백을 포함할 수 없습니다")
+    if len(nickname) > NICKNAME_MAX_LENGTH:
+        errors.append("10자 이하여야 합니다")
+
+    return {"valid": len(errors) == 0, "errors": errors}
+
+
+# ============================================================================
+# 응답 구조 검사
+# ============================================================================
+
+def missing_fields(item: Dict[str, Any], fields: Iterable[str]) -> List[str]:
+    """item에 없는 필드 목록"""
+    return [field for field in fields if field not in item]
+
+
+def check_envelope(body: Any, message: Optional[str] = None) -> List[str]:
+    """
+    {"message", "data"} 응답 봉투 검사
+
+    Returns:
+        list: 문제 설명 (정상이면 빈 목록)
+    """
+    if not isinstance(body, dict):
+        return ["응답이 객체가 아닙니다"]
+    problems = [f"{field} 없음" for field in missing_fields(body, ("message", "data"))]
+    if message is not None and body.get("message") != message:
+        problems.append(f"message가 {message}가 아닙니다: {body.get('message')}")
+    return problems
+
+
+def check_posts_response(body: Any) -> List[str]:
+    """게시글 목록 응답 검사 (봉투, data.posts, 게시글별 필수 필드)"""
+    problems = check_envelope(body, "get_posts_success")
+    if problems:
+        return problems
+    posts = (body.get("data") or {}).get("posts")
+    if not isinstance(posts, list):
+        return ["data.posts 없음"]
+    for index, post in enumerate(posts):
+        for field in missing_fields(post, REQUIRED_POST_FIELDS):
+            # 일부 응답은 post_id 대신 id 사용
+            if field == "post_id" and "id" in post:
+                continue
+            problems.append(f"posts[{index}].{field} 없음")
+    return problems
+
+
+def check_comments_response(body: Any) -> List[str]:
+    """댓글 목록 응답 검사 (봉투, data.comments, 댓글별 필수 필드)"""
+    problems = check_envelope(body, "get_comments_success")
+    if problems:
+        return problems
+    comments = (body.get("data") or {}).get("comments")
+    if not isinstance(comments, list):
+        return ["data.comments 없음"]
+    for index, comment in enumerate(comments):
+        for field in missing_fields(comment, REQUIRED_COMMENT_FIELDS):
+            problems.append(f"comments[{index}].{field} 없음")
+    return problems
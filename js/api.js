@@ -3,14 +3,102 @@
  * Backend API와의 통신을 담당합니다.
  */
 
-const API_BASE_URL = 'http://172.20.4.42:8000/api';
-const MODEL_API_URL = 'http://172.20.4.42:8001/api';
+// 서비스별 레플리카 목록 (여러 인스턴스를 운영하면 배열에 추가)
+const API_BASE_URLS = ['http://172.20.4.42:8000/api'];
+const MODEL_API_URLS = ['http://172.20.4.42:8001/api'];
+
+// ========================================
+// 레플리카 부하 분산
+// ========================================
+
+const EWMA_DECAY = 0.3;
+const EJECT_AFTER_FAILURES = 3;
+const EJECT_DURATION_MS = 30000;
+
+function createReplicaPool(urls) {
+  return urls.map(url => ({
+    url,
+    ewma: null,
+    outstanding: 0,
+    consecutiveFailures: 0,
+    ejectedUntil: 0,
+  }));
+}
+
+const replicaPools = {
+  backend: createReplicaPool(API_BASE_URLS),
+  model: createReplicaPool(MODEL_API_URLS),
+};
+
+/**
+ * 레플리카 선택 (power-of-two-choices)
+ * 무작위 두 개 중 EWMA 지연 시간 × (진행 중 요청 + 1)이 작은 쪽을 선택합니다.
+ * 연속 실패로 제외된 레플리카는 건너뛰고, 모두 제외되면 전체에서 선택합니다.
+ */
+function pickReplica(service) {
+  const pool = replicaPools[service];
+  const now = Date.now();
+  const healthy = pool.filter(replica => replica.ejectedUntil <= now);
+  const candidates = healthy.length > 0 ? healthy : pool;
+
+  if (candidates.length === 1) {
+    return candidates[0];
+  }
+
+  const first = candidates[Math.floor(Math.random() * candidates.length)];
+  let second = first;
+  while (second === first) {
+    second = candidates[Math.floor(Math.random() * candidates.length)];
+  }
+
+  const score = replica => (replica.ewma || 0) * (replica.outstanding + 1);
+  return score(first) <= score(second) ? first : second;
+}
+
+/**
+ * 레플리카 요청 결과 반영
+ */
+function releaseReplica(replica, latency, ok) {
+  replica.outstanding = Math.max(0, replica.outstanding - 1);
+
+  if (ok) {
+    replica.consecutiveFailures = 0;
+    replica.ejectedUntil = 0;
+    replica.ewma = replica.ewma === null
+      ? latency
+      : EWMA_DECAY * latency + (1 - EWMA_DECAY) * replica.ewma;
+    return;
+  }
+
+  replica.consecutiveFailures += 1;
+  if (replica.consecutiveFailures >= EJECT_AFTER_FAILURES) {
+    replica.ejectedUntil = Date.now() + EJECT_DURATION_MS;
+  }
+}
+
+/**
+ * 선택한 레플리카로 fetch
+ * 네트워크 오류와 5xx 응답은 레플리카 실패로 기록합니다.
+ */
+async function fetchReplica(service, endpoint, config) {
+  const replica = pickReplica(service);
+  replica.outstanding += 1;
+  const startedAt = performance.now();
+
+  try {
+    const response = await fetch(`${replica.url}${endpoint}`, config);
+    releaseReplica(replica, performance.now() - startedAt, response.status < 500);
+    return response;
+  } catch (error) {
+    releaseReplica(replica, performance.now() - startedAt, false);
+    throw error;
+  }
+}
 
 /**
  * API 요청 헬퍼 함수
  */
 async function apiRequest(endpoint, options = {}) {
-  const url = `${API_BASE_URL}${endpoint}`;
 
   const defaultHeaders = {
     'Content-Type': 'application/json',
@@ -41,7 +129,7 @@ async function apiRequest(endpoint, options = {}) {
   }
 
   try {
-    const response = await fetch(url, config);
+    const response = await fetchReplica('backend', endpoint, config);
     const data = await response.json();
 
     return {
@@ -237,7 +325,7 @@ async function deleteComment(postId, commentId) {
  */
 async function analyzeSentiment(text) {
   try {
-    const response = await fetch(`${MODEL_API_URL}/sentiment`, {
+    const response = await fetchReplica('model', '/sentiment', {
       method: 'POST',
       headers: {
         'Content-Type': 'application/json',
@@ -260,7 +348,7 @@ async function analyzeSentiment(text) {
  */
 async function analyzeSentimentGemini(text) {
   try {
-    const response = await fetch(`${MODEL_API_URL}/sentiment/gemini`, {
+    const response = await fetchReplica('model', '/sentiment/gemini', {
       method: 'POST',
       headers: {
         'Content-Type': 'application/json',
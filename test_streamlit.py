@@ -1,14 +1,81 @@
 """
 Backend API 테스트용 Streamlit 앱
-포트 8000에서 실행 중인 Backend API를 테스트합니다.
+BACKEND_URLS / MODEL_API_URLS 환경 변수로 지정한 Backend API 레플리카를 테스트합니다.
+(기본: 포트 8000에서 실행 중인 Backend API)
 """
-import requests
+import os
+import time
+
 import streamlit as st
-from PIL import Image
-import json
 
-# Backend API Base URL
-BASE_URL = "http://localhost:8000/api"
+from console import analytics, columnar, imagecache, moderation, pagination, search, snapshot, sync
+from console.client import ApiClient
+from console.concurrency import bulk_map
+from console.health import HealthProber
+from console.jobs import JobRunner
+from console.profiling import IMAGE, ProfilingTransport, RerunProfiler
+
+# 무거운 의존성(PIL 등)은 처음 사용하는 경로에서 import합니다.
+# 최상위 import 목록은 tests/test_startup.py의 시작 시간 예산으로 검사합니다.
+
+# 프로파일링 모드 (CONSOLE_PROFILE=1 또는 사이드바 토글)
+PROFILE_KEEP = 10
+PROFILE_DIR = "profiles"
+
+
+def open_image(file):
+    """업로드 이미지 열기 (PIL은 업로드 경로에서만 필요하므로 처음 사용할 때 import)"""
+    from PIL import Image
+    return Image.open(file)
+
+
+@st.cache_resource
+def get_health_prober():
+    """
+    프로세스 단위 백그라운드 헬스 체커
+
+    Backend 및 모든 Model API 인스턴스를 주기적으로 확인합니다.
+    """
+    prober = HealthProber()
+    prober.start()
+    return prober
+
+
+@st.cache_resource
+def get_api_client():
+    """
+    프로세스 단위 API 클라이언트
+
+    레플리카별 지연 시간 통계를 모든 세션이 공유하며,
+    헬스 체크 결과로 비정상 레플리카를 제외합니다.
+    """
+    return ApiClient(prober=get_health_prober())
+
+
+@st.cache_resource
+def get_job_runner():
+    """
+    프로세스 단위 백그라운드 작업 실행기
+
+    스크립트 실행과 분리되어 다른 탭으로 이동해도 작업이 계속됩니다.
+    """
+    return JobRunner()
+
+
+health_prober = get_health_prober()
+job_runner = get_job_runner()
+
+# rerun 프로파일러 (세션별)
+if "rerun_profiler" not in st.session_state:
+    st.session_state.rerun_profiler = RerunProfiler(
+        keep=PROFILE_KEEP,
+        enabled=os.environ.get("CONSOLE_PROFILE") == "1"
+    )
+profiler = st.session_state.rerun_profiler
+profiler.enabled = st.session_state.get("profiling_enabled", profiler.enabled)
+profiler.begin()
+
+STATE_ICONS = {"healthy": "🟢", "degraded": "🟡", "down": "🔴", "unknown": "⚪"}
 
 # 세션 상태 초기화
 if "user_id" not in st.session_state:
@@ -23,12 +90,23 @@ if "post_detail_id" not in st.session_state:
     st.session_state.post_detail_id = None
 if "post_detail_data" not in st.session_state:
     st.session_state.post_detail_data = None
+if "job_ids" not in st.session_state:
+    st.session_state.job_ids = []
+
+# 로그인 사용자 기준 클라이언트 (X-User-Id 헤더 자동 포함)
+client = get_api_client().for_user(st.session_state.user_id)
+# 백그라운드 작업용 클라이언트 (rerun 프로파일링 대상에서 제외)
+job_client = client
+if profiler.enabled:
+    client = client.for_user(st.session_state.user_id)
+    client.transport = ProfilingTransport(client.transport, profiler)
+BASE_URL = client.base_url()
 
 st.title("🚀 Backend API 테스트")
 st.markdown("---")
 
 # 사이드바 - 인증 상태
-with st.sidebar:
+with st.sidebar, profiler.section("사이드바"):
     st.header("🔐 인증 상태")
     if st.session_state.user_id:
         st.success(f"✅ 로그인됨\n👤 {st.session_state.nickname}\n🆔 ID: {st.session_state.user_id}")
@@ -53,21 +131,17 @@ with st.sidebar:
             with col_yes:
                 if st.button("탈퇴하기", type="primary", key="confirm_delete"):
                     try:
-                        headers = {"X-User-Id": str(st.session_state.user_id)}
-                        response = requests.delete(
-                            f"{BASE_URL}/users/profile",
-                            headers=headers
-                        )
+                        response = client.delete_profile()
                         
-                        if response.status_code == 200:
+                        if response.status == 200:
                             st.success("✅ 회원 탈퇴 완료")
                             st.session_state.user_id = None
                             st.session_state.nickname = None
                             st.session_state.show_delete_confirm = False
                             st.rerun()
                         else:
-                            st.error(f"에러: {response.status_code}")
-                            st.json(response.json())
+                            st.error(f"에러: {response.status}")
+                            st.json(response.data)
                     except Exception as e:
                         st.error(f"요청 실패: {e}")
             
@@ -78,17 +152,321 @@ with st.sidebar:
     else:
         st.info("❌ 로그인 필요")
 
+# ========== 독립 실행 영역 (fragment) ==========
+# 좋아요 / 댓글 위젯은 클릭해도 스크립트 전체(모든 탭, 사이드바, 이미지 디코딩)가 아니라
+# 해당 fragment만 다시 실행됩니다.
+
+def toggle_like(post_id):
+    """
+    좋아요 토글 (post_like_fragment 본문에서 호출)
+
+    on_click 콜백은 rerun 측정(profiler.begin) 전에 실행되어 요청 시간이 빠지므로 fragment 본문에서 요청합니다.
+    """
+    try:
+        like_response = client.toggle_like(post_id)
+        if like_response.status == 200:
+            like_data = like_response.data.get("data", {})
+            like_count = like_data.get("like_count", st.session_state.post_detail_like_count)
+            liked = like_data.get("liked", False)
+            st.session_state.post_detail_like_count = like_count
+            # post_data는 dict이므로 바로 업데이트
+            st.session_state.post_detail_data["like_count"] = like_count
+            st.session_state.like_feedback = ("success", f"👍 좋아요 {'등록' if liked else '취소'} (총 {like_count}개)", None)
+        else:
+            st.session_state.like_feedback = ("error", f"좋아요 실패: {like_response.status}", like_response.data)
+    except Exception as e:
+        st.session_state.like_feedback = ("error", f"좋아요 요청 실패: {e}", None)
+
+
+@st.fragment
+@profiler.fragment("좋아요")
+def post_like_fragment(post_id):
+    """게시글 상세 - 좋아요 수 및 토글 버튼"""
+    # 좋아요 수는 버튼 처리 후에 채움 (토글 결과가 바로 표시되도록)
+    like_summary = st.empty()
+    
+    if st.session_state.user_id:
+        like_col1, like_col2 = st.columns([1, 3])
+        with like_col1:
+            if st.button("👍 좋아요 토글", key="toggle_like_button"):
+                toggle_like(post_id)
+        
+        feedback = st.session_state.pop("like_feedback", None)
+        if feedback:
+            level, message, detail = feedback
+            if level == "success":
+                st.success(message)
+            else:
+                st.error(message)
+                if detail is not None:
+                    st.json(detail)
+    else:
+        st.info("👍 좋아요를 사용하려면 로그인하세요.")
+    
+    post_data = st.session_state.post_detail_data
+    current_like_count = post_data.get('like_count', 0)
+    if st.session_state.post_detail_like_count is not None:
+        current_like_count = st.session_state.post_detail_like_count
+    like_summary.write(f"👍 좋아요: {current_like_count} | 👁️ 조회수: {post_data.get('view_count')}")
+
+
+@st.fragment
+@profiler.fragment("댓글 목록")
+def comment_list_fragment(comment_post_id):
+    """댓글 탭 - 댓글 목록 조회"""
+    if st.button("조회", type="primary", key="get_comments"):
+        try:
+            # 긴 댓글 목록도 받는 대로 표시 (console.streaming)
+            response = client.stream_comments(comment_post_id)
+            
+            if response.status == 200:
+                summary = st.empty()
+                count = 0
+                for comment in response:
+                    count += 1
+                    st.write(f"**{comment.get('author_nickname', comment.get('nickname'))}:** {comment.get('content')}")
+                
+                summary.success(f"✅ {count}개 댓글")
+            else:
+                st.error(f"에러: {response.status}")
+                st.json(response.data)
+        except Exception as e:
+            st.error(f"요청 실패: {e}")
+
+
+@st.fragment
+@profiler.fragment("댓글 작성")
+def comment_form_fragment(comment_post_id):
+    """댓글 탭 - 댓글 작성 (감성 분석 결과 표시)"""
+    comment_content = st.text_area("댓글 내용", key="comment_content", height=100)
+    
+    if st.button("작성", type="primary", key="create_comment"):
+        try:
+            response = client.create_comment(comment_post_id, comment_content)
+            
+            if response.status == 201:
+                data = response.data
+                st.success("✅ 댓글 작성 성공!")
+                
+                # Model API 결과 표시
+                sentiment_data = data.get("data", {}).get("sentiment")
+                if sentiment_data:
+                    st.info("🎯 **Model API 감성 분석 결과:**")
+                    label = sentiment_data.get("label", "unknown")
+                    confidence = sentiment_data.get("confidence", 0)
+                    
+                    if label == "positive":
+                        st.success(f"😊 긍정적 (신뢰도: {confidence:.2%})")
+                    elif label == "negative":
+                        st.error(f"😞 부정적 (신뢰도: {confidence:.2%})")
+                    else:
+                        st.info(f"😐 {label} (신뢰도: {confidence:.2%})")
+                
+                st.json(data)
+            else:
+                st.error(f"에러: {response.status}")
+                st.json(response.data)
+        except Exception as e:
+            st.error(f"요청 실패: {e}")
+
+
+# ========== 백그라운드 작업 ==========
+
+JOB_STATUS_ICONS = {
+    "pending": "⏳",
+    "running": "🔄",
+    "succeeded": "✅",
+    "failed": "❌",
+    "cancelled": "🚫",
+}
+
+
+def crawl_snapshot_job(ctx, job_client):
+    """게시글 / 댓글 전체를 크롤링해 스냅샷으로 저장 (게시글 / 댓글은 console.models 객체로 보관)"""
+    board = snapshot.crawl(job_client.typed(), progress=ctx.progress, cancel=ctx.cancel_event)
+    ctx.check_cancelled()
+    path = snapshot.save(board, snapshot.default_path())
+    return {
+        "path": path,
+        "posts": len(board["posts"]),
+        "comments": len(board["comments"]),
+        "errors": board["errors"],
+    }
+
+
+def sync_snapshot_job(ctx, job_client):
+    """바뀐 게시글만 다시 조회해 스냅샷을 갱신하고 모더레이션용 스냅샷 파일 / 열 단위 저장소로 저장"""
+    store = sync.SyncStore()
+    stats = sync.sync(job_client, store, progress=ctx.progress, cancel=ctx.cancel_event)
+    ctx.check_cancelled()
+    board = store.load().to_snapshot()
+    stats["path"] = snapshot.save(board, snapshot.default_path())
+    stats["columnar"] = columnar.write(board, os.path.splitext(stats["path"])[0] + columnar.SUFFIX)
+    stats["search"] = open_search_index(search.DEFAULT_PATH).update(board)
+    return stats
+
+
+def search_index_job(ctx, source_path):
+    """스냅샷으로 검색 색인 갱신 (바뀐 게시글 / 댓글만 다시 색인)"""
+    ctx.progress(message="스냅샷 읽는 중")
+    board = search.load_board(source_path)
+    ctx.check_cancelled()
+    ctx.progress(message="색인 갱신 중")
+    return open_search_index(search.DEFAULT_PATH).update(board)
+
+
+def batch_upload_job(ctx, job_client, files, use_cache=True):
+    """이미지 여러 장을 업로드하고 파일별 분류 결과 반환 (use_cache면 중복 이미지는 저장된 분류 결과 사용)"""
+    ctx.progress(done=0, total=len(files), message="업로드 중")
+    cache = get_image_cache() if use_cache else None
+    
+    def upload(file):
+        name, content, content_type = file
+        if cache is None:
+            response = job_client.upload_post_image(name, content, content_type)
+        else:
+            response = cache.upload(job_client, name, content, content_type)
+        data = (response.data or {}).get("data") or {}
+        prediction = data.get("prediction") or {}
+        return {
+            "file": name,
+            "ok": response.ok,
+            "status": response.status,
+            "image_url": data.get("image_url"),
+            "class_name": prediction.get("class_name"),
+            "confidence": prediction.get("confidence_score"),
+            "error": data.get("prediction_error"),
+            "cached": imagecache.is_cached(response),
+        }
+    
+    return bulk_map(upload, files, on_result=lambda *_: ctx.progress(advance=1), cancel=ctx.cancel_event)
+
+
+def moderation_job(ctx, job_client, source_path, flt, action, replacement):
+    """스냅샷 또는 실시간 목록에서 조건에 맞는 게시글 / 댓글 일괄 삭제 / 수정"""
+    if source_path == search.DEFAULT_PATH:
+        targets = open_search_index(source_path).select(flt, action)
+    elif source_path and columnar.is_store(source_path):
+        targets = columnar.open_store(source_path).select(flt, action)
+    else:
+        if source_path:
+            board = snapshot.load(source_path)
+        else:
+            board = snapshot.crawl(job_client.typed(), progress=ctx.progress, cancel=ctx.cancel_event)
+        ctx.check_cancelled()
+        targets = moderation.select(board, flt, action)
+    return moderation.run(job_client, targets, action, replacement,
+                          progress=ctx.progress, cancel=ctx.cancel_event)
+
+
+def pagination_sweep_job(ctx, job_client, limits, points, samples):
+    """페이지 깊이별 목록 조회 지연 시간 / 응답 크기 측정 (결과는 DepthPoint dict 목록 - 작업 결과 파일에 저장)"""
+    ctx.progress(message="페이지 깊이 측정 중")
+    depth_points = pagination.sweep(job_client, limits, points, samples,
+                                    progress=ctx.progress, cancel=ctx.cancel_event)
+    return [point._asdict() for point in depth_points]
+
+
+@st.cache_data(max_entries=4)
+def load_snapshot(path):
+    """스냅샷 파일 로드 (경로별 캐시)"""
+    return snapshot.load(path)
+
+
+@st.cache_resource(max_entries=4)
+def open_columnar(path):
+    """열 단위 저장소 열기 (메모리 매핑 - 복사 없이 세션 간 공유)"""
+    return columnar.open_store(path)
+
+
+@st.cache_resource
+def get_image_cache():
+    """중복 이미지 분류 결과 캐시 (세션 / 작업 간 공유)"""
+    return imagecache.open_cache()
+
+
+@st.cache_resource
+def open_search_index(path):
+    """검색 색인 열기 (세션 / 작업 간 연결 하나 공유)"""
+    return search.open_index(path)
+
+
+@st.cache_resource(max_entries=4)
+def load_analytics(path):
+    """분석용 배열 로드 (경로별 캐시 - 열 단위 저장소는 메모리 매핑)"""
+    if columnar.is_store(path):
+        return analytics.from_columnar(open_columnar(path))
+    return analytics.from_board(load_snapshot(path))
+
+
+def select_targets(path, flt, action):
+    """스냅샷 파일 / 열 단위 저장소에서 모더레이션 대상 선택 (삭제면 선택된 게시글의 댓글 제외)"""
+    if path == search.DEFAULT_PATH:
+        return open_search_index(path).select(flt, action)
+    if columnar.is_store(path):
+        return open_columnar(path).select(flt, action)
+    return moderation.select(load_snapshot(path), flt, action)
+
+
+def start_job(name, fn, *args):
+    """작업 등록 후 현재 세션의 작업 목록에 추가"""
+    job_id = job_runner.submit(name, fn, *args)
+    st.session_state.job_ids.insert(0, job_id)
+    return job_id
+
+
+@st.fragment(run_every=1.0)
+@profiler.fragment("작업 목록")
+def jobs_fragment():
+    """현재 세션의 작업 진행 상황 (1초마다 이 영역만 갱신)"""
+    jobs = [job_runner.get(job_id) for job_id in st.session_state.job_ids]
+    jobs = [job for job in jobs if job is not None]
+    if not jobs:
+        st.info("실행한 작업이 없습니다.")
+        return
+    
+    for job in jobs:
+        with st.container(border=True):
+            st.write(f"{JOB_STATUS_ICONS.get(job.status, '')} **{job.name}** (`{job.id}`) — {job.status}")
+            if job.fraction is not None:
+                st.progress(job.fraction, text=f"{job.done}/{job.total} {job.message}")
+            elif job.message:
+                st.caption(job.message)
+            
+            if not job.finished:
+                if st.button("취소", key=f"cancel_job_{job.id}"):
+                    job_runner.cancel(job.id)
+            elif job.status == "succeeded":
+                with st.expander("결과"):
+                    if isinstance(job.result, dict) and "items" in job.result:
+                        # 항목별 결과 (모더레이션)
+                        st.write(
+                            f"성공 {job.result['succeeded']} | 실패 {job.result['failed']}"
+                            f" | 건너뜀 {job.result['skipped']}"
+                        )
+                        st.dataframe(job.result["items"], hide_index=True)
+                    else:
+                        st.json(job.result)
+            elif job.error:
+                with st.expander("오류"):
+                    st.code(job.error)
+
+
 # 탭 구성
-tab1, tab2, tab3, tab4, tab5 = st.tabs([
+tab1, tab2, tab3, tab4, tab5, tab6, tab7, tab8, tab9 = st.tabs([
     "🔐 인증", 
     "📝 게시글", 
     "💬 댓글", 
     "🖼️ 이미지 업로드 (Model API)", 
-    "📊 API 상태"
+    "📊 API 상태",
+    "⚙️ 작업",
+    "🛡️ 모더레이션",
+    "📈 분석",
+    "🔎 검색"
 ])
 
 # ========== 탭 1: 인증 ==========
-with tab1:
+with tab1, profiler.section("🔐 인증"):
     st.header("인증")
     
     auth_tab1, auth_tab2 = st.tabs(["로그인", "회원가입"])
@@ -100,13 +478,10 @@ with tab1:
         
         if st.button("로그인", type="primary"):
             try:
-                response = requests.post(
-                    f"{BASE_URL}/auth/login",
-                    json={"email": login_email, "password": login_password}
-                )
+                response = client.login(login_email, login_password)
                 
-                if response.status_code == 200:
-                    data = response.json()
+                if response.status == 200:
+                    data = response.data
                     if data.get("message") == "login_success":
                         user_data = data.get("data", {})
                         st.session_state.user_id = user_data.get("user_id")
@@ -117,8 +492,8 @@ with tab1:
                     else:
                         st.error(f"로그인 실패: {data.get('message')}")
                 else:
-                    st.error(f"에러: {response.status_code}")
-                    st.json(response.json())
+                    st.error(f"에러: {response.status}")
+                    st.json(response.data)
             except Exception as e:
                 st.error(f"요청 실패: {e}")
     
@@ -140,8 +515,9 @@ with tab1:
         
         if profile_image is not None:
             # 이미지 미리보기
-            image = Image.open(profile_image)
-            st.image(image, caption="프로필 이미지 미리보기", width=200)
+            with profiler.measure(IMAGE):
+                image = open_image(profile_image)
+                st.image(image, caption="프로필 이미지 미리보기", width=200)
         
         if st.button("회원가입", type="primary"):
             try:
@@ -151,14 +527,12 @@ with tab1:
                 if profile_image is not None:
                     try:
                         # 프로필 이미지 업로드
-                        files = {"file": (profile_image.name, profile_image.getvalue(), profile_image.type)}
-                        upload_response = requests.post(
-                            f"{BASE_URL}/users/profile/upload",
-                            files=files
+                        upload_response = client.upload_profile_image(
+                            profile_image.name, profile_image.getvalue(), profile_image.type
                         )
                         
-                        if upload_response.status_code == 200:
-                            upload_data = upload_response.json()
+                        if upload_response.status == 200:
+                            upload_data = upload_response.data
                             profile_image_url = upload_data.get("data", {}).get("profile_image_url", profile_image_url)
                             st.info("✅ 프로필 이미지 업로드 완료")
                         else:
@@ -167,28 +541,25 @@ with tab1:
                         st.warning(f"⚠️ 프로필 이미지 업로드 실패: {e}, 기본 이미지 사용")
                 
                 # 회원가입 요청
-                response = requests.post(
-                    f"{BASE_URL}/auth/signup",
-                    json={
-                        "email": signup_email,
-                        "password": signup_password,
-                        "password_check": signup_password_check,
-                        "nickname": signup_nickname,
-                        "profile_image_url": profile_image_url
-                    }
+                response = client.signup(
+                    signup_email,
+                    signup_password,
+                    signup_password_check,
+                    signup_nickname,
+                    profile_image_url
                 )
                 
-                if response.status_code == 201:
+                if response.status == 201:
                     st.success("✅ 회원가입 성공!")
-                    st.json(response.json())
+                    st.json(response.data)
                 else:
-                    st.error(f"에러: {response.status_code}")
-                    st.json(response.json())
+                    st.error(f"에러: {response.status}")
+                    st.json(response.data)
             except Exception as e:
                 st.error(f"요청 실패: {e}")
 
 # ========== 탭 2: 게시글 ==========
-with tab2:
+with tab2, profiler.section("📝 게시글"):
     st.header("게시글 관리")
     
     post_tab1, post_tab2, post_tab3 = st.tabs(["게시글 목록", "게시글 작성", "게시글 상세"])
@@ -198,34 +569,26 @@ with tab2:
         page = st.number_input("페이지", min_value=1, value=1, key="post_page")
         limit = st.number_input("개수", min_value=1, max_value=100, value=10, key="post_limit")
         
-        headers = {}
-        if st.session_state.user_id:
-            headers["X-User-Id"] = str(st.session_state.user_id)
-        
         if st.button("조회", type="primary", key="get_posts_list"):
             try:
-                response = requests.get(
-                    f"{BASE_URL}/posts",
-                    params={"page": page, "limit": limit},
-                    headers=headers
-                )
+                # 게시글을 받는 대로 표시 (total은 목록 뒤에 오므로 반복 후 표시)
+                response = client.stream_posts(page, limit)
                 
-                if response.status_code == 200:
-                    data = response.json()
-                    posts = data.get("data", {}).get("posts", [])
-                    
-                    st.success(f"✅ 총 {data.get('data', {}).get('total', 0)}개 게시글")
+                if response.status == 200:
+                    summary = st.empty()
                     
-                    for post in posts:
+                    for post in response:
                         with st.expander(f"📌 {post.get('title', '제목 없음')} (ID: {post.get('post_id')})"):
                             st.write(f"**작성자:** {post.get('nickname')}")
                             st.write(f"**내용:** {post.get('content')}")
                             st.write(f"👍 좋아요: {post.get('like_count')} | 👁️ 조회수: {post.get('view_count')} | 💬 댓글: {post.get('comment_count')}")
                             if post.get('image_url'):
                                 st.image(post.get('image_url'), width=200)
+                    
+                    summary.success(f"✅ 총 {((response.meta or {}).get('data') or {}).get('total', 0)}개 게시글")
                 else:
-                    st.error(f"에러: {response.status_code}")
-                    st.json(response.json())
+                    st.error(f"에러: {response.status}")
+                    st.json(response.data)
             except Exception as e:
                 st.error(f"요청 실패: {e}")
     
@@ -238,26 +601,20 @@ with tab2:
             post_content = st.text_area("내용", key="create_post_content", height=150)
             post_image_url = st.text_input("이미지 URL (선택)", key="create_post_image_url")
             
-            headers = {"X-User-Id": str(st.session_state.user_id)}
-            
             if st.button("작성", type="primary", key="create_post"):
                 try:
-                    response = requests.post(
-                        f"{BASE_URL}/posts",
-                        json={
-                            "title": post_title,
-                            "content": post_content,
-                            "image_url": post_image_url if post_image_url else None
-                        },
-                        headers=headers
+                    response = client.create_post(
+                        post_title,
+                        post_content,
+                        image_url=post_image_url if post_image_url else None
                     )
                     
-                    if response.status_code == 201:
+                    if response.status == 201:
                         st.success("✅ 게시글 작성 성공!")
-                        st.json(response.json())
+                        st.json(response.data)
                     else:
-                        st.error(f"에러: {response.status_code}")
-                        st.json(response.json())
+                        st.error(f"에러: {response.status}")
+                        st.json(response.data)
                 except Exception as e:
                     st.error(f"요청 실패: {e}")
     
@@ -268,27 +625,20 @@ with tab2:
             st.session_state.post_detail_like_count = None
             st.session_state.post_detail_data = None
         
-        headers = {}
-        if st.session_state.user_id:
-            headers["X-User-Id"] = str(st.session_state.user_id)
-        
         if st.button("조회", type="primary", key="get_post_detail"):
             try:
-                response = requests.get(
-                    f"{BASE_URL}/posts/{post_id}",
-                    headers=headers
-                )
+                response = client.get_post(post_id)
                 
-                if response.status_code == 200:
-                    data = response.json()
+                if response.status == 200:
+                    data = response.data
                     post_data = data.get("data", {})
                     st.session_state.post_detail_id = post_id
                     st.session_state.post_detail_like_count = post_data.get('like_count', 0)
                     st.session_state.post_detail_data = post_data
                     st.success("✅ 게시글 조회 성공!")
                 else:
-                    st.error(f"에러: {response.status_code}")
-                    st.json(response.json())
+                    st.error(f"에러: {response.status}")
+                    st.json(response.data)
             except Exception as e:
                 st.error(f"요청 실패: {e}")
 
@@ -298,39 +648,11 @@ with tab2:
             st.write(f"**제목:** {post_data.get('title')}")
             st.write(f"**작성자:** {post_data.get('nickname')}")
             st.write(f"**내용:** {post_data.get('content')}")
-            current_like_count = post_data.get('like_count', 0)
-            if st.session_state.post_detail_like_count is not None:
-                current_like_count = st.session_state.post_detail_like_count
-            st.write(f"👍 좋아요: {current_like_count} | 👁️ 조회수: {post_data.get('view_count')}")
-            
             if post_data.get('image_url'):
                 st.image(post_data.get('image_url'), width=300)
             
-            if st.session_state.user_id:
-                like_col1, like_col2 = st.columns([1, 3])
-                with like_col1:
-                    if st.button("👍 좋아요 토글", key="toggle_like_button"):
-                        try:
-                            headers = {"X-User-Id": str(st.session_state.user_id)}
-                            like_response = requests.post(
-                                f"{BASE_URL}/posts/{post_id}/like",
-                                headers=headers
-                            )
-                            if like_response.status_code == 200:
-                                like_data = like_response.json().get("data", {})
-                                like_count = like_data.get("like_count", current_like_count)
-                                liked = like_data.get("liked", False)
-                                st.session_state.post_detail_like_count = like_count
-                                # post_data는 dict이므로 바로 업데이트
-                                st.session_state.post_detail_data["like_count"] = like_count
-                                st.success(f"👍 좋아요 {'등록' if liked else '취소'} (총 {like_count}개)")
-                            else:
-                                st.error(f"좋아요 실패: {like_response.status_code}")
-                                st.json(like_response.json())
-                        except Exception as e:
-                            st.error(f"좋아요 요청 실패: {e}")
-            else:
-                st.info("👍 좋아요를 사용하려면 로그인하세요.")
+            # 좋아요 영역만 독립적으로 다시 실행
+            post_like_fragment(post_id)
             
             comments = post_data.get('comments', [])
             if comments:
@@ -339,7 +661,7 @@ with tab2:
                     st.write(f"- **{comment.get('nickname')}:** {comment.get('content')}")
 
 # ========== 탭 3: 댓글 ==========
-with tab3:
+with tab3, profiler.section("💬 댓글"):
     st.header("댓글 관리")
     
     if not st.session_state.user_id:
@@ -351,70 +673,14 @@ with tab3:
         
         with comment_tab1:
             st.subheader("댓글 목록")
-            headers = {}
-            
-            if st.button("조회", type="primary", key="get_comments"):
-                try:
-                    response = requests.get(
-                        f"{BASE_URL}/posts/{comment_post_id}/comments",
-                        headers=headers
-                    )
-                    
-                    if response.status_code == 200:
-                        data = response.json()
-                        comments = data.get("data", {}).get("comments", [])
-                        
-                        st.success(f"✅ {len(comments)}개 댓글")
-                        
-                        for comment in comments:
-                            st.write(f"**{comment.get('nickname')}:** {comment.get('content')}")
-                    else:
-                        st.error(f"에러: {response.status_code}")
-                        st.json(response.json())
-                except Exception as e:
-                    st.error(f"요청 실패: {e}")
+            comment_list_fragment(comment_post_id)
         
         with comment_tab2:
             st.subheader("댓글 작성 (감성 분석 포함)")
-            comment_content = st.text_area("댓글 내용", key="comment_content", height=100)
-            
-            headers = {"X-User-Id": str(st.session_state.user_id)}
-            
-            if st.button("작성", type="primary", key="create_comment"):
-                try:
-                    response = requests.post(
-                        f"{BASE_URL}/posts/{comment_post_id}/comments",
-                        json={"content": comment_content},
-                        headers=headers
-                    )
-                    
-                    if response.status_code == 201:
-                        data = response.json()
-                        st.success("✅ 댓글 작성 성공!")
-                        
-                        # Model API 결과 표시
-                        sentiment_data = data.get("data", {}).get("sentiment")
-                        if sentiment_data:
-                            st.info("🎯 **Model API 감성 분석 결과:**")
-                            label = sentiment_data.get("label", "unknown")
-                            confidence = sentiment_data.get("confidence", 0)
-                            
-                            if label == "positive":
-                                st.success(f"😊 긍정적 (신뢰도: {confidence:.2%})")
-                            elif label == "negative":
-                                st.error(f"😞 부정적 (신뢰도: {confidence:.2%})")
-                            else:
-                                st.info(f"😐 {label} (신뢰도: {confidence:.2%})")
-                        
-                        st.json(data)
-                    else:
-                        st.error(f"에러: {response.status_code}")
-                        st.json(response.json())
-                except Exception as e:
-                    st.error(f"요청 실패: {e}")
+            comment_form_fragment(comment_post_id)
 
 # ========== 탭 4: 이미지 업로드 (Model API 연동) ==========
-with tab4:
+with tab4, profiler.section("🖼️ 이미지 업로드"):
     st.header("🖼️ 이미지 업로드 (Model API 연동)")
     st.markdown("이미지를 업로드하면 **자동으로 이미지 분류 (강아지/고양이)**가 실행됩니다.")
     
@@ -426,20 +692,36 @@ with tab4:
     
     if uploaded_file is not None:
         # 이미지 미리보기
-        image = Image.open(uploaded_file)
-        st.image(image, caption="업로드할 이미지", width=300)
+        with profiler.measure(IMAGE):
+            image = open_image(uploaded_file)
+            st.image(image, caption="업로드할 이미지", width=300)
         
+        use_image_cache = st.checkbox(
+            "중복 이미지는 저장된 분류 결과 사용",
+            value=True,
+            help="이전에 올린 이미지와 같거나 거의 같으면(dHash) 업로드 / 분류 요청 없이 저장된 결과를 사용합니다.",
+            key="use_image_cache"
+        )
         if st.button("업로드 및 분류", type="primary"):
             try:
-                files = {"file": (uploaded_file.name, uploaded_file.getvalue(), uploaded_file.type)}
-                response = requests.post(
-                    f"{BASE_URL}/posts/upload",
-                    files=files
-                )
+                if use_image_cache:
+                    response = get_image_cache().upload(
+                        client, uploaded_file.name, uploaded_file.getvalue(), uploaded_file.type
+                    )
+                else:
+                    response = client.upload_post_image(
+                        uploaded_file.name, uploaded_file.getvalue(), uploaded_file.type
+                    )
                 
-                if response.status_code == 200:
-                    data = response.json()
-                    st.success("✅ 이미지 업로드 성공!")
+                if response.status == 200:
+                    data = response.data
+                    if imagecache.is_cached(response):
+                        st.success(
+                            f"♻️ 이전에 올린 이미지와 같은 이미지입니다 (dHash 거리 "
+                            f"{data['data']['cache']['distance']}). 저장된 이미지 / 분류 결과를 사용합니다."
+                        )
+                    else:
+                        st.success("✅ 이미지 업로드 성공!")
                     
                     # Model API 결과 표시
                     response_data = data.get("data", {})
@@ -464,41 +746,163 @@ with tab4:
                         st.success(result_text)
                     elif prediction_error:
                         st.warning(f"⚠️ **이미지 분류 실패:** {prediction_error}")
-                        # 에러 메시지에서 포트 정보 추출 (있는 경우)
-                        if "포트" in prediction_error or "port" in prediction_error.lower():
-                            st.info("💡 Model API 서버가 실행 중인지 확인하세요.")
-                        else:
-                            st.info("💡 Model API 서버(포트 8002 또는 8001)가 실행 중인지 확인하세요.")
+                        # 백그라운드 헬스 체크 결과로 Model API 인스턴스 상태 표시
+                        model_status = [s for s in health_prober.snapshot() if s["service"] == "model"]
+                        st.info("💡 Model API 인스턴스 상태:\n" + "\n".join(
+                            f"{STATE_ICONS[s['state']]} {s['url']} ({s['state']})" for s in model_status
+                        ))
                     
                     st.json(data)
                 else:
-                    st.error(f"에러: {response.status_code}")
-                    st.json(response.json())
+                    st.error(f"에러: {response.status}")
+                    st.json(response.data)
             except Exception as e:
                 st.error(f"요청 실패: {e}")
+    
+    st.markdown("---")
+    st.subheader("📦 일괄 업로드 (백그라운드)")
+    batch_files = st.file_uploader(
+        "이미지 여러 장을 선택하세요",
+        type=["jpg", "jpeg", "png"],
+        accept_multiple_files=True,
+        key="batch_upload_files"
+    )
+    
+    batch_use_cache = st.checkbox("중복 이미지는 저장된 분류 결과 사용", value=True, key="batch_use_image_cache")
+    
+    if batch_files and st.button("일괄 업로드 시작", key="start_batch_upload"):
+        files = [(f.name, f.getvalue(), f.type) for f in batch_files]
+        start_job(f"일괄 업로드 ({len(files)}장)", batch_upload_job, job_client, files, batch_use_cache)
+        st.success("✅ 작업을 시작했습니다. '⚙️ 작업' 탭에서 진행 상황을 확인하세요.")
 
 # ========== 탭 5: API 상태 ==========
-with tab5:
+with tab5, profiler.section("📊 API 상태"):
     st.header("📊 API 상태 확인")
     
     if st.button("상태 확인", type="primary"):
-        try:
-            response = requests.get("http://localhost:8000/")
-            
-            if response.status_code == 200:
-                st.success("✅ Backend API 서버 정상 작동 중")
-                st.json(response.json())
+        health_prober.probe_once()
+    
+    st.caption(f"{health_prober.interval:.0f}초마다 백그라운드에서 모든 인스턴스를 확인합니다.")
+    
+    health_summaries = health_prober.snapshot()
+    for summary in health_summaries:
+        availability = summary["availability"]
+        p95 = summary["latency_p95_ms"]
+        message = f"{STATE_ICONS[summary['state']]} **{summary['service']}** {summary['url']} — {summary['state']}"
+        if availability is not None:
+            message += f" | 가용성: {availability:.0%}"
+        if p95 is not None:
+            message += f" | p95: {p95:.0f}ms"
+        if summary["last_error"]:
+            message += f" | 마지막 오류: {summary['last_error']}"
+        
+        if summary["state"] == "healthy":
+            st.success(message)
+        elif summary["state"] == "degraded":
+            st.warning(message)
+        elif summary["state"] == "down":
+            st.error(message)
+        else:
+            st.info(message)
+    
+    # 인스턴스별 지연 시간 이력 (ms)
+    latency_history = {}
+    for summary in health_summaries:
+        history = health_prober.history(summary["service"], summary["url"])
+        latency_history[f"{summary['service']} {summary['url']}"] = [
+            r.latency * 1000 if r.ok and r.latency is not None else None for r in history
+        ]
+    max_samples = max((len(values) for values in latency_history.values()), default=0)
+    if max_samples:
+        st.subheader("⏱️ 지연 시간 이력 (ms)")
+        st.line_chart({
+            label: [None] * (max_samples - len(values)) + values
+            for label, values in latency_history.items()
+        })
+    
+    # 레플리카별 부하 분산 상태
+    st.subheader("⚖️ 레플리카 부하 분산")
+    for service, replicas in client.replica_snapshot().items():
+        for replica in replicas:
+            ewma = f"{replica['ewma_ms']:.0f}ms" if replica["ewma_ms"] is not None else "-"
+            status_text = "제외됨" if replica["ejected"] else "사용 중"
+            st.write(
+                f"**{service}** {replica['url']} — {status_text} | EWMA: {ewma}"
+                f" | 진행 중: {replica['outstanding']} | 요청: {replica['requests']} | 실패: {replica['failures']}"
+            )
+    
+    # 서비스별 적응형 동시성 제한
+    st.subheader("🚦 동시성 제한")
+    for service, limiter in client.limiter_snapshot().items():
+        baseline = f"{limiter['baseline_ms']:.0f}ms" if limiter["baseline_ms"] is not None else "-"
+        st.write(
+            f"**{service}** limit: {limiter['limit']} | 진행 중: {limiter['in_flight']} | 기준 지연: {baseline}"
+            f" | 지연 증가: {limiter['inflated']} | 429/503: {limiter['throttled']}"
+        )
+    
+    # Model API 엔드포인트별 호출 속도 제한 (토큰 버킷)
+    st.subheader("🪣 Model API 호출 속도 제한")
+    for endpoint, bucket in client.rate_limit_snapshot().items():
+        st.write(
+            f"**{endpoint}** {bucket['rate'] * 60:.0f}회/분 (버스트 {bucket['burst']}) | 남은 토큰: {bucket['tokens']}"
+            f" | 대기: interactive {bucket['waiting']['interactive']}, batch {bucket['waiting']['batch']}"
+            f" | 발급: interactive {bucket['granted']['interactive']}, batch {bucket['granted']['batch']}"
+        )
+    
+    # 오프셋 페이지네이션 깊이별 지연 시간 (GET /posts?page=&limit=)
+    st.subheader("📉 페이지 깊이 프로파일")
+    st.caption("페이지 깊이와 limit를 바꿔 가며 목록 조회 지연 시간 / 응답 크기를 측정합니다. 요청은 하나씩 보냅니다.")
+    depth_limits = st.multiselect("limit", [1, 10, 20, 50, 100], default=list(pagination.DEFAULT_LIMITS),
+                                  key="depth_limits")
+    depth_points = st.slider("limit별 측정 페이지 수", 3, 30, pagination.DEFAULT_POINTS, key="depth_points")
+    depth_samples = st.slider("페이지별 반복 요청 수", 1, 10, pagination.DEFAULT_SAMPLES, key="depth_samples")
+    depth_factor = st.number_input("니 판정 배율 (얕은 페이지 대비)", min_value=1.1, value=pagination.DEFAULT_FACTOR,
+                                   step=0.5, key="depth_factor")
+    
+    if st.button("측정", key="depth_sweep", disabled=not depth_limits):
+        st.session_state.depth_sweep_job_id = start_job(
+            f"페이지 깊이 측정 (limit {', '.join(map(str, sorted(depth_limits)))})",
+            pagination_sweep_job, job_client, sorted(depth_limits), depth_points, depth_samples,
+        )
+    
+    # 측정은 백그라운드 작업으로 실행 - 결과는 작업 기록에서 읽음
+    depth_job = job_runner.get(st.session_state.get("depth_sweep_job_id", ""))
+    depth_result = None
+    if depth_job is not None and not depth_job.finished:
+        if depth_job.fraction is not None:
+            st.progress(depth_job.fraction, text=f"{depth_job.done}/{depth_job.total} {depth_job.message}")
+        else:
+            st.info(f"측정 중... {depth_job.message}")
+        st.caption("'⚙️ 작업' 탭에서 진행 상황을 확인하거나 취소할 수 있습니다.")
+        st.button("결과 새로고침", key="depth_sweep_refresh")
+    elif depth_job is not None and depth_job.error:
+        st.error("페이지 깊이 측정에 실패했습니다. '⚙️ 작업' 탭에서 오류를 확인하세요.")
+    elif depth_job is not None and depth_job.result:
+        if depth_job.status == "cancelled":
+            st.warning("취소되어 측정한 페이지까지만 표시합니다.")
+        depth_result = [pagination.DepthPoint(**point) for point in depth_job.result]
+    
+    if depth_result:
+        st.write("**지연 시간 중앙값 (ms) / 오프셋**")
+        st.line_chart(pagination.chart_data(depth_result, "latency_ms"))
+        st.write("**응답 크기 (bytes) / 오프셋**")
+        st.line_chart(pagination.chart_data(depth_result, "bytes"))
+        for knee in pagination.analyze(depth_result, depth_factor):
+            message = (
+                f"**limit={knee.limit}** 기준 {knee.base_ms:.1f}ms → 최심 {knee.deepest_ms:.1f}ms "
+                f"(x{knee.slowdown}) | 1000행당 +{knee.ms_per_1k_rows:.3f}ms (R² {knee.r2:.2f})"
+            )
+            if knee.knee_page is not None:
+                st.warning(f"{message} | 니: page {knee.knee_page} (offset {knee.knee_offset})")
             else:
-                st.error(f"❌ 서버 응답 오류: {response.status_code}")
-        except requests.exceptions.ConnectionError:
-            st.error("❌ Backend API 서버에 연결할 수 없습니다.\n포트 8000에서 서버가 실행 중인지 확인하세요.")
-        except Exception as e:
-            st.error(f"❌ 오류: {e}")
+                st.success(f"{message} | 니 없음")
     
     st.markdown("---")
     st.subheader("🔗 API 엔드포인트")
     st.code(f"""
 Base URL: {BASE_URL}
+Backend 레플리카: {", ".join(client.urls["backend"])}
+Model API 레플리카: {", ".join(client.urls["model"])}
 
 인증:
   POST {BASE_URL}/auth/login
@@ -515,3 +919,253 @@ Base URL: {BASE_URL}
   POST {BASE_URL}/posts/{{post_id}}/comments (Model API 연동)
     """)
 
+# ========== 탭 6: 백그라운드 작업 ==========
+with tab6, profiler.section("⚙️ 작업"):
+    st.header("⚙️ 백그라운드 작업")
+    st.caption("작업은 서버 프로세스에서 실행되므로 다른 탭으로 이동해도 계속됩니다.")
+    
+    if st.button("📸 게시판 스냅샷 크롤링", type="primary", key="start_crawl"):
+        start_job("게시판 스냅샷 크롤링", crawl_snapshot_job, job_client)
+    if st.button("🔄 증분 동기화", key="start_sync",
+                 help="첫 실행은 전체 크롤링, 이후에는 바뀐 게시글의 댓글만 다시 조회합니다."):
+        start_job("게시판 증분 동기화", sync_snapshot_job, job_client)
+    
+    jobs_fragment()
+
+# ========== 탭 7: 대량 모더레이션 ==========
+with tab7, profiler.section("🛡️ 모더레이션"):
+    st.header("🛡️ 대량 모더레이션")
+    
+    if not st.session_state.user_id:
+        st.warning("⚠️ 로그인이 필요합니다.")
+    else:
+        LIVE_SOURCE = "실시간 목록 (실행 시 크롤링)"
+        source = st.selectbox(
+            "대상 목록",
+            [LIVE_SOURCE]
+            + ([search.DEFAULT_PATH] if os.path.exists(search.DEFAULT_PATH) else [])
+            + columnar.list_stores() + snapshot.list_snapshots(),
+            help="`.columnar` 저장소는 메모리 매핑으로 열어 큰 스냅샷도 바로 검색합니다. "
+                 "검색 색인(`search.sqlite`)은 키워드를 색인으로 찾습니다.",
+            key="moderation_source"
+        )
+        
+        filter_col1, filter_col2, filter_col3 = st.columns(3)
+        with filter_col1:
+            moderation_author = st.text_input("작성자 닉네임", key="moderation_author")
+        with filter_col2:
+            moderation_sentiment = st.selectbox(
+                "감성 라벨", ["", "positive", "negative", "neutral"], key="moderation_sentiment"
+            )
+        with filter_col3:
+            moderation_keyword = st.text_input("키워드", key="moderation_keyword")
+        
+        moderation_target = st.radio(
+            "대상",
+            [moderation.BOTH, moderation.POSTS, moderation.COMMENTS],
+            format_func={moderation.BOTH: "게시글 + 댓글", moderation.POSTS: "게시글", moderation.COMMENTS: "댓글"}.get,
+            horizontal=True,
+            key="moderation_target"
+        )
+        moderation_action = st.radio(
+            "작업",
+            [moderation.DELETE, moderation.EDIT],
+            format_func={moderation.DELETE: "삭제", moderation.EDIT: "내용 수정"}.get,
+            horizontal=True,
+            key="moderation_action"
+        )
+        moderation_replacement = moderation.DEFAULT_REPLACEMENT
+        if moderation_action == moderation.EDIT:
+            moderation_replacement = st.text_input(
+                "수정할 내용", value=moderation.DEFAULT_REPLACEMENT, key="moderation_replacement"
+            )
+        
+        moderation_filter = moderation.ModerationFilter(
+            author=moderation_author or None,
+            sentiment=moderation_sentiment or None,
+            keyword=moderation_keyword or None,
+            target=moderation_target
+        )
+        
+        if moderation_filter.is_empty():
+            st.info("조건을 하나 이상 입력하세요.")
+        elif source != LIVE_SOURCE:
+            matched = select_targets(source, moderation_filter, moderation_action)
+            st.write(f"일치 항목: **{len(matched)}개**")
+            st.dataframe([{
+                "종류": target.kind,
+                "게시글 ID": target.post_id,
+                "댓글 ID": target.comment_id,
+                "작성자": target.item.get("nickname", target.item.get("author_nickname")),
+                "내용": (target.item.get("title") or target.item.get("content") or "")[:50],
+            } for target in matched], hide_index=True)
+        
+        moderation_confirm = st.checkbox("처리 대상과 작업을 확인했습니다", key="moderation_confirm")
+        if st.button(
+            "🛡️ 모더레이션 실행",
+            type="primary",
+            disabled=moderation_filter.is_empty() or not moderation_confirm,
+            key="start_moderation"
+        ):
+            start_job(
+                f"모더레이션 ({moderation_action})",
+                moderation_job,
+                job_client,
+                None if source == LIVE_SOURCE else source,
+                moderation_filter,
+                moderation_action,
+                moderation_replacement
+            )
+            st.success("✅ 작업을 시작했습니다. '⚙️ 작업' 탭에서 항목별 결과를 확인하세요.")
+
+# ========== 탭 8: 참여도 분석 ==========
+with tab8, profiler.section("📈 분석"):
+    st.header("📈 참여도 분석")
+    
+    analytics_sources = columnar.list_stores() + snapshot.list_snapshots()
+    if not analytics_sources:
+        st.info("분석할 스냅샷이 없습니다. '⚙️ 작업' 탭에서 스냅샷을 먼저 만드세요.")
+    else:
+        analytics_source = st.selectbox(
+            "스냅샷",
+            analytics_sources,
+            help="`.columnar` 저장소는 메모리 매핑으로 바로 열립니다.",
+            key="analytics_source"
+        )
+        analytics_col1, analytics_col2 = st.columns(2)
+        with analytics_col1:
+            analytics_by = st.selectbox(
+                "상위 게시글 기준",
+                list(analytics.TOP_METRICS),
+                format_func={"likes": "좋아요", "views": "조회수", "comments": "댓글 수", "ratio": "좋아요 / 조회수"}.get,
+                key="analytics_by"
+            )
+        with analytics_col2:
+            analytics_top = st.number_input("상위 게시글 수", min_value=1, max_value=100, value=10, key="analytics_top")
+        
+        analytics_started = time.perf_counter()
+        arrays = load_analytics(analytics_source)
+        analytics_report = analytics.report(arrays, int(analytics_top), analytics_by)
+        analytics_elapsed = time.perf_counter() - analytics_started
+        
+        overview = analytics_report["summary"]
+        metric_col1, metric_col2, metric_col3, metric_col4 = st.columns(4)
+        metric_col1.metric("게시글", f"{overview['posts']:,}")
+        metric_col2.metric("댓글", f"{overview['comments']:,}")
+        metric_col3.metric(
+            "좋아요 / 조회수",
+            "-" if overview["like_view_ratio"] is None else f"{overview['like_view_ratio']:.2%}"
+        )
+        metric_col4.metric(
+            "게시글당 댓글",
+            "-" if overview["comments_per_post"] is None else f"{overview['comments_per_post']:.1f}",
+            help=None if overview["comments_per_post"] is None else
+            f"중앙값 {overview['comments_median']:.0f} / p90 {overview['comments_p90']:.0f} / "
+            f"댓글 없는 게시글 {overview['no_comment_share']:.1%}"
+        )
+        
+        st.subheader("상위 게시글")
+        st.dataframe(analytics_report["top_posts"], hide_index=True)
+        
+        st.subheader("작성자별 집계")
+        st.dataframe(analytics_report["authors"], hide_index=True)
+        
+        chart_col1, chart_col2 = st.columns(2)
+        with chart_col1:
+            st.subheader("일별 댓글 감성")
+            if analytics_report["sentiment_by_day"]:
+                st.bar_chart(analytics_report["sentiment_by_day"])
+            else:
+                st.caption("감성 라벨이 있는 댓글이 없습니다.")
+        with chart_col2:
+            st.subheader("이미지 분류 비율")
+            st.bar_chart({
+                "게시글": {name: share["posts"] for name, share in analytics_report["image_share"].items()}
+            })
+        
+        st.caption(f"계산 시간: {analytics_elapsed * 1000:.0f}ms")
+
+# ========== 탭 9: 전문 검색 ==========
+with tab9, profiler.section("🔎 검색"):
+    st.header("🔎 게시글 / 댓글 검색")
+    
+    index_sources = columnar.list_stores() + snapshot.list_snapshots()
+    with st.expander("색인 갱신", expanded=not os.path.exists(search.DEFAULT_PATH)):
+        st.caption("'⚙️ 작업' 탭의 '🔄 증분 동기화'(작업 이름: 게시판 증분 동기화)는 끝날 때 색인도 함께 갱신합니다. 바뀐 게시글 / 댓글만 다시 색인합니다.")
+        if not index_sources:
+            st.info("색인할 스냅샷이 없습니다. '⚙️ 작업' 탭에서 스냅샷을 먼저 만드세요.")
+        else:
+            index_source = st.selectbox("스냅샷", index_sources, key="search_index_source")
+            if st.button("🗂️ 색인 갱신", key="start_search_index"):
+                start_job("검색 색인 갱신", search_index_job, index_source)
+                st.success("✅ 작업을 시작했습니다. '⚙️ 작업' 탭에서 진행 상황을 확인하세요.")
+    
+    if not os.path.exists(search.DEFAULT_PATH):
+        st.info("검색 색인이 없습니다. 위에서 스냅샷으로 색인을 만드세요.")
+    else:
+        search_index = open_search_index(search.DEFAULT_PATH)
+        search_col1, search_col2, search_col3 = st.columns([3, 1, 1])
+        with search_col1:
+            search_query = st.text_input("검색어", placeholder="예: 산책 간식", key="search_query")
+        with search_col2:
+            search_kind = st.selectbox(
+                "대상",
+                [moderation.BOTH, moderation.POSTS, moderation.COMMENTS],
+                format_func={moderation.BOTH: "게시글 + 댓글", moderation.POSTS: "게시글", moderation.COMMENTS: "댓글"}.get,
+                key="search_kind"
+            )
+        with search_col3:
+            search_author = st.text_input("작성자 닉네임", key="search_author")
+        
+        counts = search_index.count()
+        st.caption(f"색인: 게시글 {counts[moderation.POSTS]:,}개 / 댓글 {counts[moderation.COMMENTS]:,}개")
+        
+        if search_query:
+            search_started = time.perf_counter()
+            hits = search_index.search(search_query, search_kind, search_author or None, limit=100)
+            search_elapsed = time.perf_counter() - search_started
+            st.write(f"검색 결과: **{len(hits)}개** ({search_elapsed * 1000:.0f}ms, 최대 100개)")
+            st.dataframe([{
+                "종류": hit.kind,
+                "게시글 ID": hit.post_id,
+                "댓글 ID": hit.comment_id,
+                "작성자": hit.item.get("nickname", hit.item.get("author_nickname")),
+                "제목": hit.item.get("title"),
+                "내용": (hit.item.get("content") or "")[:80],
+                "작성일": hit.item.get("created_at"),
+            } for hit in hits], hide_index=True)
+
+# ========== 사이드바: rerun 프로파일링 ==========
+last_profile = profiler.end()
+
+with st.sidebar:
+    st.markdown("---")
+    st.toggle("🔬 rerun 프로파일링", value=profiler.enabled, key="profiling_enabled")
+    
+    if profiler.enabled and last_profile is not None:
+        st.caption(
+            f"마지막 rerun: {last_profile.total * 1000:.0f}ms | 요청 {last_profile.requests}건"
+            f" | 최근 {len(profiler.history)}회 평균: "
+            f"{sum(p.total for p in profiler.history) / len(profiler.history) * 1000:.0f}ms"
+        )
+        st.dataframe(last_profile.breakdown(), hide_index=True)
+        
+        # fragment만 다시 실행된 rerun (좋아요 / 댓글 / 1초마다 갱신되는 작업 목록)
+        if profiler.fragment_history:
+            st.caption("최근 fragment rerun")
+            st.dataframe([{
+                "fragment": p.fragment,
+                "total_ms": p.total * 1000,
+                "requests": p.requests,
+            } for p in reversed(profiler.fragment_history)], hide_index=True)
+        
+        if st.button(f"📥 최근 {PROFILE_KEEP}회 cProfile 캡처", key="capture_profile"):
+            os.makedirs(PROFILE_DIR, exist_ok=True)
+            stats_path = os.path.join(PROFILE_DIR, f"console-{time.strftime('%Y%m%d-%H%M%S')}.pstats")
+            captured = profiler.dump_stats(stats_path)  # fragment rerun 포함
+            if captured:
+                st.success(f"✅ {captured}회 rerun 저장: {stats_path}")
+                with open(stats_path, "rb") as f:
+                    st.download_button("pstats 다운로드", f.read(), file_name=os.path.basename(stats_path))
+            else:
+                st.warning("⚠️ 저장할 cProfile 통계가 없습니다.")
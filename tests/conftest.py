@@ -11,20 +11,36 @@ pytest configuration and fixtures for FASTAPI_Project_front
 2. API 요청/응답 구조 테스트
 3. 에러 처리 및 메시지 테스트
 """
+import json
+import os
+import time
+
 import pytest
-import re
-from typing import Dict, Any
+from typing import Any
+
+from console import config, validators
+from console.cassette import EXACT, load_replay
+from console.client import ApiClient, TransportError, TransportResponse
+from console.dataset import DatasetConfig
+from console.standin import MemoryStore, StandinTransport
 
 
 # ============================================================================
 # 테스트 설정 상수
 # ============================================================================
 
-BACKEND_URL = "http://localhost:8000"
-API_BASE_URL = f"{BACKEND_URL}/api"
-MODEL_API_URL = "http://localhost:8001/api"
+# 서비스별 기본 레플리카 목록은 console.config에서 관리
+BACKEND_URLS = config.DEFAULT_URLS[config.BACKEND]
+MODEL_API_URLS = config.DEFAULT_URLS[config.MODEL]
+
+BACKEND_URL = BACKEND_URLS[0]
+API_BASE_URL = f"{BACKEND_URL}{config.API_PREFIX}"
+MODEL_API_URL = f"{MODEL_API_URLS[0]}{config.API_PREFIX}"
 FRONTEND_URL = "http://localhost:3000"
 
+# 녹화된 요청 / 응답 카세트 (python -m console --record 로 갱신)
+CASSETTE_DIR = os.path.join(os.path.dirname(__file__), "cassettes")
+
 
 # ============================================================================
 # 기본 데이터 Fixture
@@ -258,15 +274,9 @@ def email_validator():
     """
     이메일 유효성 검사 함수
 
-    JavaScript의 이메일 검증 로직과 동일
+    JavaScript의 이메일 검증 로직과 동일 (console.validators.validate_email)
     """
-    def validate(email: str) -> bool:
-        if not email or not isinstance(email, str):
-            return False
-        # JavaScript 정규식과 동일
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return bool(re.match(pattern, email))
-    return validate
+    return validators.validate_email
 
 
 @pytest.fixture
@@ -280,27 +290,7 @@ def password_validator():
     - 소문자 1개 이상
     - 특수문자 1개 이상
     """
-    def validate(password: str) -> Dict[str, Any]:
-        errors = []
-
-        if not password:
-            return {"valid": False, "errors": ["비밀번호를 입력해주세요"]}
-
-        if len(password) < 8:
-            errors.append("8자 이상이어야 합니다")
-        if len(password) > 20:
-            errors.append("20자 이하여야 합니다")
-        if not re.search(r'[A-Z]', password):
-            errors.append("대문자가 필요합니다")
-        if not re.search(r'[a-z]', password):
-            errors.append("소문자가 필요합니다")
-        if not re.search(r'[0-9]', password):
-            errors.append("숫자가 필요합니다")
-        if not re.search(r'[!@#$%^&*()\-_=+\[\]{}|;:\'",.<>/?`~]', password):
-            errors.append("특수문자가 필요합니다")
-
-        return {"valid": len(errors) == 0, "errors": errors}
-    return validate
+    return validators.validate_password
 
 
 @pytest.fixture
@@ -313,19 +303,7 @@ def nickname_validator():
     - 공백 불가
     - 최대 10자
     """
-    def validate(nickname: str) -> Dict[str, Any]:
-        errors = []
-
-        if not nickname or not nickname.strip():
-            return {"valid": False, "errors": ["닉네임을 입력해주세요"]}
-
-        if " " in nickname:
-            errors.append("공백을 포함할 수 없습니다")
-        if len(nickname) > 10:
-            errors.append("10자 이하여야 합니다")
-
-        return {"valid": len(errors) == 0, "errors": errors}
-    return validate
+    return validators.validate_nickname
 
 
 # ============================================================================
@@ -339,34 +317,7 @@ def error_messages():
 
     JavaScript의 에러 메시지와 동기화
     """
-    return {
-        # 로그인 에러
-        "email_required": "이메일을 입력해주세요",
-        "invalid_email_format": "올바른 이메일 주소 형식을 입력해주세요",
-        "password_required": "비밀번호를 입력해주세요",
-        "invalid_credentials": "아이디 또는 비밀번호를 확인해주세요",
-
-        # 회원가입 에러
-        "invalid_email_character": "이메일은 영문과 @, .만 사용이 가능합니다",
-        "duplicate_email": "중복된 이메일입니다",
-        "invalid_password_format": "비밀번호는 8자 이상, 20자 이하이며 대문자, 소문자, 특수문자를 각각 1개 포함해야 합니다",
-        "password_check_required": "비밀번호를 한번 더 입력해주세요",
-        "password_mismatch": "비밀번호가 다릅니다",
-        "nickname_required": "닉네임을 입력해주세요",
-        "nickname_contains_space": "띄어쓰기를 없애주세요",
-        "nickname_too_long": "닉네임은 최대 10자까지 작성 가능합니다",
-        "duplicate_nickname": "중복된 닉네임입니다",
-        "profile_image_url_required": "프로필 사진을 추가해주세요",
-
-        # 게시글 에러
-        "title_required": "제목을 입력해주세요",
-        "content_required": "내용을 입력해주세요",
-        "post_not_found": "게시글을 찾을 수 없습니다",
-
-        # 일반 에러
-        "network_error": "네트워크 오류가 발생했습니다",
-        "server_error": "서버 오류가 발생했습니다"
-    }
+    return dict(validators.ERROR_MESSAGES)
 
 
 # ============================================================================
@@ -438,3 +389,91 @@ def api_endpoints():
             return f"{MODEL_API_URL}/sentiment/gemini"
 
     return APIEndpoints()
+
+
+# ============================================================================
+# 가짜 전송 계층 Fixture
+# ============================================================================
+
+class FakeTransport:
+    """
+    ApiClient / HealthProber용 가짜 전송 계층
+
+    (method, url) 별로 응답을 등록하고, 호출 기록을 calls에 남깁니다.
+    등록되지 않은 요청은 404를 반환합니다.
+    """
+
+    def __init__(self):
+        self.routes = {}
+        self.calls = []
+
+    def add(self, method: str, url: str, status: int = 200, body: Any = None,
+            delay: float = 0.0, error: str = None, handler=None):
+        """
+        응답 등록
+
+        error가 있으면 TransportError 발생,
+        handler가 있으면 handler(call) → (status, body)로 응답 생성
+        """
+        self.routes[(method, url)] = (status, body, delay, error, handler)
+
+    def send(self, method, url, *, params=None, json_body=None, files=None,
+             headers=None, timeout=None):
+        call = {
+            "method": method,
+            "url": url,
+            "params": params,
+            "json": json_body,
+            "files": files,
+            "headers": headers,
+            "timeout": timeout,
+        }
+        self.calls.append(call)
+        status, body, delay, error, handler = self.routes.get(
+            (method, url), (404, {"message": "not_found"}, 0.0, None, None))
+        if delay:
+            time.sleep(delay)
+        if error:
+            raise TransportError(error)
+        if handler is not None:
+            status, body = handler(call)
+        content = json.dumps(body).encode() if body is not None else b""
+        return TransportResponse(status, content, {"Content-Type": "application/json"})
+
+
+@pytest.fixture
+def fake_transport():
+    """가짜 전송 계층"""
+    return FakeTransport()
+
+
+@pytest.fixture
+def replay_client():
+    """
+    카세트 재생 ApiClient 생성 함수
+
+    Usage:
+        client = replay_client("posts", user_id=1)
+        client = replay_client("posts", mode="template")
+    """
+    def make(name: str, mode: str = EXACT, user_id: int = None) -> ApiClient:
+        transport = load_replay(os.path.join(CASSETTE_DIR, f"{name}.json"), mode)
+        return ApiClient(user_id=user_id, transport=transport,
+                         urls={config.BACKEND: BACKEND_URLS, config.MODEL: MODEL_API_URLS})
+    return make
+
+
+@pytest.fixture
+def standin_client():
+    """
+    로컬 Backend 대역(메모리 저장소) ApiClient 생성 함수
+
+    Usage:
+        client = standin_client(posts=500, comments_mean=5.0)
+        client.transport.store  # MemoryStore
+    """
+    def make(user_id: int = None, **dataset) -> ApiClient:
+        store = MemoryStore.from_dataset(DatasetConfig(**{"posts": 200, "users": 50, **dataset}))
+        return ApiClient(user_id=user_id, transport=StandinTransport(store),
+                         urls={config.BACKEND: BACKEND_URLS, config.MODEL: MODEL_API_URLS})
+    return make
@@ -0,0 +1,80 @@
+"""
+성능 회귀 게이트 pytest 플러그인
+
+pytest.ini에서 -p tests.perf_plugin으로 로드합니다.
+
+- @pytest.mark.perf: 성능 흐름 테스트 표시 (-m perf / -m "not perf"로 선택)
+- perf_flow fixture: perf_flow(name, flow, counter)로 흐름을 측정하고 기준값과 비교
+- 기준값: tests/perf_baseline.json (--perf-baseline로 변경)
+- --perf-update: 비교 대신 현재 측정값으로 기준값 갱신
+- --perf-tolerance: 시간 / 메모리 허용 증가율 일괄 변경 (예: 0.5 = 50%)
+
+요청 수 허용 증가율은 항상 0입니다 (페이지 조회당 요청 수가 늘면 바로 실패).
+"""
+import os
+
+import pytest
+
+from console import perf
+
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "perf_baseline.json")
+
+_measurements = []
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("perf", "성능 회귀 게이트")
+    group.addoption("--perf-baseline", default=DEFAULT_BASELINE, help="기준값 파일 경로")
+    group.addoption("--perf-update", action="store_true", help="현재 측정값으로 기준값 갱신")
+    group.addoption("--perf-tolerance", type=float, default=None,
+                    help="시간 / 메모리 허용 증가율 (기본: console.perf.DEFAULT_TOLERANCE)")
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "perf: 성능 회귀 게이트 흐름 테스트")
+
+
+@pytest.fixture
+def perf_flow(request):
+    """
+    흐름 측정 함수
+
+    Usage:
+        measurement = perf_flow("login", lambda: client.login(...), counter)
+    """
+    config = request.config
+    baseline = perf.load_baseline(config.getoption("--perf-baseline"))
+    tolerance = None
+    if config.getoption("--perf-tolerance") is not None:
+        value = config.getoption("--perf-tolerance")
+        tolerance = {"wall_ms": value, "alloc_kb": value}
+
+    def run(name, flow, counter=None, repeat=5):
+        measurement = perf.measure_flow(name, flow, counter, repeat=repeat)
+        _measurements.append(measurement)
+        if not config.getoption("--perf-update"):
+            regressions = perf.compare(measurement, baseline.get(name), tolerance)
+            if regressions:
+                pytest.fail("성능 회귀:\n" + "\n".join(regressions), pytrace=False)
+        return measurement
+
+    return run
+
+
+def pytest_sessionfinish(session, exitstatus):
+    if session.config.getoption("--perf-update") and _measurements:
+        perf.save_baseline(session.config.getoption("--perf-baseline"), _measurements)
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    if not _measurements:
+        return
+    terminalreporter.section("성능 흐름")
+    terminalreporter.write_line(f"{'flow':<16}{'wall_ms':>10}{'ops/s':>10}{'requests':>10}{'alloc_kb':>10}")
+    for m in _measurements:
+        terminalreporter.write_line(
+            f"{m.name:<16}{m.wall_ms:>10.3f}{m.ops_per_sec:>10.1f}{m.requests:>10}{m.alloc_kb:>10.1f}"
+        )
+    if config.getoption("--perf-update"):
+        terminalreporter.write_line(f"기준값 갱신: {config.getoption('--perf-baseline')}")
@@ -0,0 +1,195 @@
+"""
+참여도 분석 테스트 케이스
+
+테스트 대상:
+- 배열 연산 지표가 반복문으로 계산한 값과 같음 (요약, 상위 게시글, 작성자, 일별 감성, 이미지 분류)
+- 스냅샷 dict와 열 단위 저장소에서 같은 결과
+- 게시글 10만 개 지표 계산 시간
+- CLI analytics
+"""
+import io
+import json
+import time
+from collections import Counter, defaultdict
+
+import pytest
+
+from console import analytics, cli, columnar, snapshot
+
+np = pytest.importorskip("numpy")
+
+
+@pytest.fixture
+def board(standin_client):
+    """게시글 60개 대역을 크롤링한 스냅샷"""
+    return snapshot.crawl(standin_client(posts=60, users=8, comments_mean=4.0), page_size=25)
+
+
+@pytest.fixture
+def arrays(board):
+    return analytics.from_board(board)
+
+
+def synthetic(posts, comments, seed=0):
+    """게시글 / 댓글 수만큼의 무작위 배열"""
+    rng = np.random.default_rng(seed)
+    start = np.datetime64("2024-01-01T00:00:00")
+    return analytics.BoardArrays(
+        post_id=np.arange(1, posts + 1),
+        likes=rng.integers(0, 500, posts),
+        views=rng.integers(0, 5000, posts),
+        comments=rng.integers(0, 40, posts),
+        created=start + rng.integers(0, 86400 * 90, posts).astype("timedelta64[s]"),
+        author=rng.integers(0, 10_000, posts).astype(np.int32),
+        authors=[f"작성자{i}" for i in range(10_000)],
+        image=rng.integers(-1, 2, posts).astype(np.int32),
+        image_classes=["Dog", "Cat"],
+        comment_post=rng.integers(1, posts + 1, comments),
+        comment_created=start + rng.integers(0, 86400 * 90, comments).astype("timedelta64[s]"),
+        comment_label=rng.integers(-1, 3, comments).astype(np.int32),
+        labels=["positive", "negative", "neutral"],
+        title_of=lambda rows: [f"제목 {row}" for row in rows],
+    )
+
+
+class TestMetrics:
+    """지표 정확성 테스트"""
+
+    def test_summary(self, board, arrays):
+        """
+        [확인] 요약 지표가 반복문 계산과 같음
+        """
+        posts = board["posts"]
+        counts = sorted(post["comment_count"] for post in posts)
+
+        result = analytics.summary(arrays)
+
+        assert result["posts"] == len(posts)
+        assert result["comments"] == len(board["comments"])
+        assert result["likes"] == sum(post["like_count"] for post in posts)
+        assert result["like_view_ratio"] == pytest.approx(
+            result["likes"] / sum(post["view_count"] for post in posts))
+        assert result["comments_per_post"] == pytest.approx(sum(counts) / len(counts))
+        assert result["no_comment_share"] == pytest.approx(counts.count(0) / len(counts))
+
+    @pytest.mark.parametrize("by,key", [("likes", "like_count"), ("views", "view_count"),
+                                        ("comments", "comment_count")])
+    def test_top_posts(self, board, arrays, by, key):
+        """
+        [확인] 상위 게시글이 정렬 결과와 같음 (같은 값이면 최신 게시글 우선)
+        """
+        expected = sorted(board["posts"], key=lambda post: (-post[key], -post["post_id"]))[:5]
+
+        result = analytics.top_posts(arrays, 5, by)
+
+        assert [post["post_id"] for post in result] == [post["post_id"] for post in expected]
+        assert [post["title"] for post in result] == [post["title"] for post in expected]
+
+    def test_top_posts_unknown_metric(self, arrays):
+        """
+        [실패] 지원하지 않는 지표는 ValueError
+        """
+        with pytest.raises(ValueError):
+            analytics.top_posts(arrays, 5, "shares")
+
+    def test_by_author(self, board, arrays):
+        """
+        [확인] 작성자별 게시글 수 / 좋아요 합계가 반복문 집계와 같음
+        """
+        posts, likes = Counter(), Counter()
+        for post in board["posts"]:
+            posts[post["nickname"]] += 1
+            likes[post["nickname"]] += post["like_count"]
+
+        result = analytics.by_author(arrays, 100)
+
+        assert {row["nickname"]: (row["posts"], row["likes"]) for row in result} == \
+            {name: (posts[name], likes[name]) for name in posts}
+        assert [row["likes"] for row in result] == sorted(likes.values(), reverse=True)
+
+    def test_sentiment_by_day(self, board, arrays):
+        """
+        [확인] 일별 감성 라벨 수가 반복문 집계와 같음
+        """
+        expected = defaultdict(Counter)
+        for comment in board["comments"]:
+            expected[comment["sentiment"]["label"]][comment["created_at"][:10]] += 1
+
+        result = analytics.sentiment_by_day(arrays)
+
+        assert {label: {day: n for day, n in days.items() if n} for label, days in result.items()} == \
+            {label: dict(days) for label, days in expected.items()}
+
+    def test_image_share(self, board, arrays):
+        """
+        [확인] 이미지 분류별 게시글 수 (분류 없는 게시글 포함), 비율 합계 1
+        """
+        expected = Counter(post.get("image_class") or analytics.NO_IMAGE for post in board["posts"])
+
+        result = analytics.image_share(arrays)
+
+        assert {name: share["posts"] for name, share in result.items() if share["posts"]} == dict(expected)
+        assert sum(share["share"] for share in result.values()) == pytest.approx(1, abs=1e-3)
+
+    def test_empty_board(self):
+        """
+        [확인] 게시글 / 댓글이 없으면 빈 결과 (오류 없음)
+        """
+        result = analytics.report(analytics.from_board({"posts": [], "comments": []}))
+
+        assert result["summary"]["posts"] == 0
+        assert result["summary"]["like_view_ratio"] is None
+        assert result["top_posts"] == [] and result["authors"] == []
+        assert result["sentiment_by_day"] == {}
+
+
+class TestSources:
+    """입력 형식 테스트"""
+
+    def test_columnar_matches_board(self, board, tmp_path):
+        """
+        [확인] 열 단위 저장소에서 읽은 배열의 지표가 스냅샷 dict와 같음
+        """
+        pytest.importorskip("pyarrow")
+        path = columnar.write(board, str(tmp_path / f"board{columnar.SUFFIX}"))
+
+        from_store = analytics.report(analytics.load(path), by="ratio")
+        from_board = analytics.report(analytics.from_board(board), by="ratio")
+
+        assert from_store == from_board
+
+
+class TestPerformance:
+    """계산 시간 테스트"""
+
+    def test_100k_posts(self):
+        """
+        [확인] 게시글 10만 개 / 댓글 100만 개 전체 지표를 1초 안에 계산
+        """
+        arrays = synthetic(100_000, 1_000_000)
+
+        started = time.perf_counter()
+        result = analytics.report(arrays, 20, "ratio", 50)
+        elapsed = time.perf_counter() - started
+
+        assert result["summary"]["posts"] == 100_000
+        assert len(result["top_posts"]) == 20
+        assert elapsed < 1.0
+
+
+class TestCli:
+    """CLI 테스트"""
+
+    def test_analytics(self, board, tmp_path):
+        """
+        [확인] analytics 명령은 스냅샷 파일의 지표를 JSON으로 출력
+        """
+        path = snapshot.save(board, str(tmp_path / "board.json"))
+        stdout = io.StringIO()
+
+        code = cli.main(["analytics", path, "--top", "3", "--by", "views"], stdout=stdout)
+
+        result = json.loads(stdout.getvalue())
+        assert code == 0
+        assert result["summary"]["posts"] == len(board["posts"])
+        assert len(result["top_posts"]) == 3
@@ -407,3 +407,50 @@ class TestSessionStorage:
         assert "userId" in session_data
         assert "nickname" in session_data
         assert "profileImageUrl" in session_data
+
+
+class TestAuthApiReplay:
+    """녹화된 카세트로 ApiClient 인증 API 재생 테스트"""
+
+    def test_login_success(self, replay_client, test_user_credentials):
+        """
+        [성공] 로그인 성공
+
+        Given: 녹화된 로그인 성공 응답
+        When: 올바른 이메일 / 비밀번호로 로그인
+        Then: login_success와 user_id 반환
+        """
+        response = replay_client("auth").login(
+            test_user_credentials["email"], test_user_credentials["password"])
+
+        assert response.data["message"] == "login_success"
+        assert response.data["data"]["user_id"] == 1
+
+    def test_login_wrong_password(self, replay_client, test_user_credentials):
+        """
+        [실패] 잘못된 비밀번호
+
+        Given: 녹화된 로그인 실패 응답
+        When: 틀린 비밀번호로 로그인
+        Then: 401, invalid_credentials
+        """
+        response = replay_client("auth").login(test_user_credentials["email"], "WrongPassword1!")
+
+        assert response.status == 401
+        assert response.data["message"] == "invalid_credentials"
+
+    def test_signup_duplicate_email(self, replay_client, test_user_credentials):
+        """
+        [실패] 중복 이메일 회원가입
+
+        Given: 이미 가입된 이메일
+        When: 같은 이메일로 회원가입
+        Then: 409, duplicate_email
+        """
+        password = test_user_credentials["password"]
+        response = replay_client("auth").signup(
+            test_user_credentials["email"], password, password,
+            test_user_credentials["nickname"], "/uploads/profile/default.png")
+
+        assert response.status == 409
+        assert response.data["message"] == "duplicate_email"
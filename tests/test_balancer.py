@@ -0,0 +1,195 @@
+"""
+레플리카 부하 분산 테스트 케이스
+
+테스트 대상:
+- EWMA 지연 시간 / 진행 중 요청 수 기반 선택
+- 연속 실패 시 제외 및 복구
+- 헬스 체크 연동
+- 클라이언트 레플리카 라우팅
+"""
+import random
+
+import pytest
+
+from console.balancer import ReplicaPool
+from console.client import ApiClient
+
+
+class FakeClock:
+    """수동으로 진행하는 시계"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def pool(clock):
+    """레플리카 두 개짜리 풀"""
+    return ReplicaPool(["http://r1", "http://r2"], eject_after=2, eject_for=10.0,
+                       rng=random.Random(0), clock=clock)
+
+
+class TestReplicaSelection:
+    """레플리카 선택 테스트"""
+
+    def test_empty_pool_rejected(self):
+        """
+        [실패] 레플리카 없는 풀 생성 불가
+        """
+        with pytest.raises(ValueError):
+            ReplicaPool([])
+
+    def test_prefers_faster_replica(self, pool):
+        """
+        [확인] EWMA 지연 시간이 낮은 레플리카 선택
+
+        Given: r1 100ms, r2 10ms
+        When: 레플리카 선택
+        Then: r2 선택
+        """
+        r1, r2 = pool.replicas
+        r1.ewma, r2.ewma = 0.1, 0.01
+
+        chosen = set()
+        for _ in range(10):
+            replica = pool.acquire()
+            chosen.add(replica.url)
+            replica.outstanding -= 1
+
+        assert chosen == {"http://r2"}
+
+    def test_outstanding_requests_penalized(self, pool):
+        """
+        [확인] 진행 중 요청이 많은 레플리카는 지연 시간이 같아도 후순위
+        """
+        r1, r2 = pool.replicas
+        r1.ewma = r2.ewma = 0.05
+        r1.outstanding = 5
+
+        assert pool.acquire().url == "http://r2"
+
+    def test_ewma_update(self, pool):
+        """
+        [확인] 지연 시간 EWMA 갱신
+        """
+        replica = pool.replicas[0]
+        pool.release(replica, 0.1, True)
+        pool.release(replica, 0.2, True)
+
+        assert replica.ewma == pytest.approx(0.3 * 0.2 + 0.7 * 0.1)
+
+    def test_outstanding_tracking(self, pool):
+        """
+        [확인] acquire/release에 따라 진행 중 요청 수 증감
+        """
+        replica = pool.acquire()
+        assert replica.outstanding == 1
+
+        pool.release(replica, 0.01, True)
+        assert replica.outstanding == 0
+
+    def test_load_spreads_across_replicas(self):
+        """
+        [확인] 측정값이 같으면 두 레플리카 모두 사용
+        """
+        pool = ReplicaPool(["http://r1", "http://r2", "http://r3"], rng=random.Random(1))
+        for replica in pool.replicas:
+            replica.ewma = 0.01
+
+        used = {pool.acquire().url for _ in range(30)}
+
+        assert len(used) > 1
+
+
+class TestReplicaEjection:
+    """제외 / 복구 테스트"""
+
+    def test_ejected_after_consecutive_failures(self, pool, clock):
+        """
+        [확인] 연속 실패 시 제외되어 다른 레플리카로 라우팅
+        """
+        r1 = pool.replicas[0]
+        pool.release(r1, 0.0, False)
+        pool.release(r1, 0.0, False)
+
+        assert all(pool.acquire().url == "http://r2" for _ in range(10))
+        assert pool.snapshot()[0]["ejected"] is True
+
+    def test_returns_after_eject_period(self, pool, clock):
+        """
+        [확인] 제외 기간이 지나면 다시 후보
+        """
+        r1 = pool.replicas[0]
+        pool.release(r1, 0.0, False)
+        pool.release(r1, 0.0, False)
+
+        clock.now = 11.0
+
+        assert pool.snapshot()[0]["ejected"] is False
+
+    def test_fail_open_when_all_ejected(self, pool):
+        """
+        [확인] 모든 레플리카가 제외되면 전체를 후보로 사용
+        """
+        for replica in pool.replicas:
+            pool.release(replica, 0.0, False)
+            pool.release(replica, 0.0, False)
+
+        assert pool.acquire().url in {"http://r1", "http://r2"}
+
+    def test_probe_failure_and_recovery(self, pool):
+        """
+        [확인] 헬스 체크 실패로 제외, 성공으로 즉시 복구
+        """
+        pool.observe_probe("http://r1", False)
+        pool.observe_probe("http://r1", False)
+        assert pool.snapshot()[0]["ejected"] is True
+
+        pool.observe_probe("http://r1", True)
+        assert pool.snapshot()[0]["ejected"] is False
+        assert pool.replicas[0].ewma is None
+
+
+class TestClientRouting:
+    """클라이언트 레플리카 라우팅 테스트"""
+
+    def test_routes_away_from_failing_replica(self, fake_transport):
+        """
+        [확인] 연결 실패하는 레플리카를 제외하고 정상 레플리카로 라우팅
+
+        Given: b1 연결 실패, b2 정상
+        When: 게시글 목록 20회 조회
+        Then: 제외 이후에는 b2로만 요청
+        """
+        fake_transport.add("GET", "http://b1/api/posts", error="refused")
+        fake_transport.add("GET", "http://b2/api/posts", body={"data": {"posts": []}})
+        client = ApiClient(transport=fake_transport, urls={
+            "backend": ["http://b1", "http://b2"],
+            "model": ["http://m1"],
+        })
+
+        results = [client.get_posts() for _ in range(20)]
+
+        b1_calls = [c for c in fake_transport.calls if c["url"].startswith("http://b1")]
+        assert len(b1_calls) <= 3
+        assert all(r.ok for r in results[-10:])
+
+    def test_for_user_shares_pools(self, fake_transport):
+        """
+        [확인] 사용자별 클라이언트는 레플리카 통계를 공유
+        """
+        client = ApiClient(transport=fake_transport, urls={"backend": ["http://b1"], "model": ["http://m1"]})
+
+        user_client = client.for_user(7)
+
+        assert user_client.pools is client.pools
+        assert user_client.headers()["X-User-Id"] == "7"
+        assert client.user_id is None
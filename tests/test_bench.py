@@ -0,0 +1,114 @@
+"""
+마이크로 벤치마크 테스트 케이스
+
+테스트 대상:
+- 코퍼스 결정적 생성 / 유효·무효 혼합
+- 측정 통계
+- 이력 저장 / 직전 결과 비교
+- CLI bench 명령
+"""
+import io
+import json
+
+import pytest
+
+from console import bench, cli, validators
+
+
+class TestCorpus:
+    """코퍼스 생성 테스트"""
+
+    def test_deterministic(self):
+        """
+        [확인] 같은 seed면 같은 코퍼스
+        """
+        assert bench.email_corpus(100, seed=1) == bench.email_corpus(100, seed=1)
+        assert bench.email_corpus(100, seed=1) != bench.email_corpus(100, seed=2)
+
+    def test_mixes_valid_and_invalid(self):
+        """
+        [확인] 유효 / 무효 입력이 섞여 있음
+        """
+        emails = [validators.validate_email(e) for e in bench.email_corpus(1000)]
+        passwords = [validators.validate_password(p)["valid"] for p in bench.password_corpus(1000)]
+        nicknames = [validators.validate_nickname(n)["valid"] for n in bench.nickname_corpus(1000)]
+
+        for results in (emails, passwords, nicknames):
+            assert 600 < sum(results) < 950
+
+    def test_response_corpus_is_mostly_valid(self):
+        """
+        [확인] 응답 코퍼스는 대부분 구조 검사 통과
+        """
+        pages = bench.posts_response_corpus(200)
+
+        assert all(len(page["data"]["posts"]) == bench.POSTS_PER_PAGE for page in pages)
+        assert sum(1 for page in pages if not validators.check_posts_response(page)) > 150
+
+
+class TestRunBenchmark:
+    """측정 테스트"""
+
+    def test_statistics(self):
+        """
+        [확인] 반복 횟수와 통계 값의 관계 (min ≤ median ≤ p95)
+        """
+        result = bench.run_benchmark("len", len, ["a"] * 1000, repeat=5)
+
+        assert result.rows == 1000
+        assert result.repeat == 5
+        assert result.min <= result.median <= result.p95
+        assert result.ns_per_row > 0
+        assert result.to_dict()["rows_per_sec"] > 0
+
+    def test_unknown_benchmark(self):
+        """
+        [실패] 없는 벤치마크 이름은 KeyError
+        """
+        with pytest.raises(KeyError):
+            bench.run_suite(10, 1, only=["missing"])
+
+
+class TestHistory:
+    """이력 테스트"""
+
+    def test_append_and_compare_previous(self, tmp_path):
+        """
+        [확인] 이력 추가 후 직전 결과 대비 변화율 계산
+        """
+        path = str(tmp_path / "history.jsonl")
+        first = bench.run_suite(100, 1, only=["nickname"])
+        bench.append_history(first, path)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write("손상된 줄\n")
+        bench.append_history(first, path, {"seed": 0})
+
+        history = bench.load_history(path)
+        previous = bench.previous_result(history, "nickname")
+
+        assert len(history) == 2
+        assert history[-1]["seed"] == 0
+        assert bench.change_vs(first[0], previous) == pytest.approx(0, abs=0.01)
+        assert bench.change_vs(first[0], None) is None
+
+
+class TestCliBench:
+    """CLI bench 명령 테스트"""
+
+    def test_bench_records_history(self, tmp_path):
+        """
+        [확인] 벤치마크 결과 출력 및 이력 저장, 두 번째 실행은 직전 대비 변화율 포함
+        """
+        path = str(tmp_path / "history.jsonl")
+        argv = ["--format", "ndjson", "bench", "--rows", "200", "--repeat", "1",
+                "--only", "email", "posts_response", "--history", path]
+
+        for _ in range(2):
+            stdout = io.StringIO()
+            assert cli.main(argv, stdout=stdout) == 0
+
+        records = [json.loads(line) for line in stdout.getvalue().splitlines()]
+        assert [r["name"] for r in records] == ["email", "posts_response"]
+        assert records[1]["rows"] == 10
+        assert all(r["change_vs_last"] is not None for r in records)
+        assert len(bench.load_history(path)) == 2
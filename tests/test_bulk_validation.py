@@ -0,0 +1,177 @@
+"""
+사용자 일괄 가져오기 검증 테스트 케이스
+
+테스트 대상:
+- 열 단위 검사 결과가 행 단위 validators와 일치
+- 오류 비트마스크 / 메시지 (error_messages fixture)
+- CSV / Parquet 파일 검사, 청크 단위 읽기, 보고서
+"""
+import io
+import json
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+from console import bench, bulk_validation, cli, validators  # noqa: E402
+from console.bulk_validation import (  # noqa: E402
+    EMAIL_FORMAT, EMAIL_REQUIRED, NICKNAME_REQUIRED, NICKNAME_SPACE, NICKNAME_TOO_LONG,
+    PASSWORD_NO_DIGIT, PASSWORD_NO_SPECIAL, PASSWORD_NO_UPPERCASE, PASSWORD_REQUIRED, PASSWORD_TOO_SHORT,
+)
+
+
+VALID = {"email": "user@example.com", "password": "TestPass1!", "nickname": "유저"}
+
+
+def frame(*rows):
+    return pd.DataFrame([{**VALID, **row} for row in rows])
+
+
+class TestValidateFrame:
+    """열 단위 검사 테스트"""
+
+    def test_valid_row(self):
+        """
+        [성공] 모든 규칙을 만족하면 비트마스크 0
+        """
+        assert bulk_validation.validate_frame(frame({})).tolist() == [0]
+
+    def test_error_bits(self):
+        """
+        [실패] 필드별 오류 비트
+        """
+        mask = bulk_validation.validate_frame(frame(
+            {"email": ""},
+            {"email": "invalid-email"},
+            {"password": ""},
+            {"password": "short"},
+            {"password": "testpass1!"},
+            {"password": "TestPass!!"},
+            {"nickname": "   "},
+            {"nickname": "공백 있음"},
+            {"nickname": "열한글자닉네임입니다요"},
+        )).tolist()
+
+        assert mask == [
+            EMAIL_REQUIRED,
+            EMAIL_FORMAT,
+            PASSWORD_REQUIRED,
+            PASSWORD_TOO_SHORT | PASSWORD_NO_UPPERCASE | PASSWORD_NO_DIGIT | PASSWORD_NO_SPECIAL,
+            PASSWORD_NO_UPPERCASE,
+            PASSWORD_NO_DIGIT,
+            NICKNAME_REQUIRED,
+            NICKNAME_SPACE,
+            NICKNAME_TOO_LONG,
+        ]
+
+    def test_missing_values_are_required_errors(self):
+        """
+        [실패] 결측값(None)은 필수 입력 오류
+        """
+        mask = bulk_validation.validate_frame(frame({"email": None, "password": None, "nickname": None}))
+
+        assert mask.tolist() == [EMAIL_REQUIRED | PASSWORD_REQUIRED | NICKNAME_REQUIRED]
+
+    @pytest.mark.parametrize("dtype", ["string[pyarrow]", "string[python]"])
+    def test_matches_row_validators(self, dtype, monkeypatch):
+        """
+        [확인] 생성 코퍼스와 공백 경계 사례에서 필드별 유효 여부가 validators와 일치
+        Given: 끝 / 앞의 줄바꿈, 탭, 전각 공백 등이 붙은 이메일 / 닉네임 행 추가
+        Then: Arrow 문자열(RE2)과 Python 문자열(re) 모두 같은 결과
+        """
+        if dtype == "string[pyarrow]":
+            pytest.importorskip("pyarrow")
+        monkeypatch.setattr(bulk_validation, "_string_dtype", lambda: dtype)
+        rows = 3000
+        emails = ["a@b.com\n", "a@b.com\r\n", "\na@b.com", "a@b.com ", " a@b.com", "a@b.com\t",
+                  "a@b.com\u3000", "a@b.com\x0b", "a@b.com\n\n"]
+        nicknames = ["\u3000", "\t\n", "\x1c", "\x85", "\xa0", "\u2028", "\u200b", "유저\n", " 유저"]
+        data = pd.DataFrame({
+            "email": bench.email_corpus(rows, 1) + emails,
+            "password": bench.password_corpus(rows, 2) + ["TestPass1!\n"] * len(emails),
+            "nickname": bench.nickname_corpus(rows, 3) + nicknames,
+        })
+        mask = bulk_validation.validate_frame(data)
+
+        for i, (email, password, nickname) in enumerate(zip(data.email, data.password, data.nickname)):
+            names = bulk_validation.error_names(int(mask[i]))
+            assert validators.validate_email(email) == (not any(n.startswith("email") for n in names))
+            assert validators.validate_password(password)["valid"] == (
+                not any(n.startswith("password") for n in names))
+            assert validators.validate_nickname(nickname)["valid"] == (
+                not any(n.startswith("nickname") for n in names))
+
+
+class TestMessages:
+    """오류 메시지 테스트"""
+
+    def test_messages_from_error_messages_fixture(self, error_messages):
+        """
+        [확인] 비밀번호 규칙 위반 여러 개는 메시지 하나로 안내
+        """
+        messages = bulk_validation.error_messages(EMAIL_FORMAT | PASSWORD_TOO_SHORT | PASSWORD_NO_SPECIAL)
+
+        assert messages == [error_messages["invalid_email_format"], error_messages["invalid_password_format"]]
+
+    def test_count_errors(self):
+        """
+        [확인] 오류 이름별 행 수
+        """
+        mask = bulk_validation.validate_frame(frame({"email": ""}, {"email": ""}, {}))
+
+        counts = bulk_validation.count_errors(mask)
+
+        assert counts["email_required"] == 2
+        assert sum(counts.values()) == 2
+
+
+class TestValidateFile:
+    """파일 검사 테스트"""
+
+    @pytest.fixture
+    def users_csv(self, tmp_path):
+        path = tmp_path / "users.csv"
+        frame({}, {"email": "NA"}, {}, {"nickname": "공백 있음"}, {}).to_csv(path, index=False)
+        return str(path)
+
+    def test_csv_in_chunks_with_report(self, users_csv, tmp_path, error_messages):
+        """
+        [확인] 청크 단위로 읽어도 행 번호가 전체 기준으로 기록
+        """
+        report = str(tmp_path / "out" / "invalid.csv")
+
+        summary = bulk_validation.validate_file(users_csv, report_path=report, chunksize=2)
+
+        assert (summary["rows"], summary["valid"], summary["invalid"]) == (5, 3, 2)
+        assert summary["errors"]["email_format"] == 1
+        rows = pd.read_csv(report)
+        assert rows["row"].tolist() == [1, 3]
+        assert rows["messages"].tolist() == [
+            error_messages["invalid_email_format"],
+            error_messages["nickname_contains_space"],
+        ]
+
+    def test_parquet(self, tmp_path):
+        """
+        [확인] Parquet 파일 검사 및 Parquet 보고서
+        """
+        pytest.importorskip("pyarrow")
+        path = str(tmp_path / "users.parquet")
+        frame({}, {"password": "weak"}).to_parquet(path)
+        report = str(tmp_path / "invalid.parquet")
+
+        summary = bulk_validation.validate_file(path, report_path=report, chunksize=1)
+
+        assert summary["invalid"] == 1
+        assert pd.read_parquet(report)["row"].tolist() == [1]
+
+    def test_cli(self, users_csv):
+        """
+        [확인] CLI validate-users - 유효하지 않은 행이 있으면 종료 코드 1
+        """
+        stdout = io.StringIO()
+
+        code = cli.main(["validate-users", users_csv], stdout=stdout)
+
+        assert code == 1
+        assert json.loads(stdout.getvalue())["invalid"] == 2
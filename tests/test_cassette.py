@@ -0,0 +1,201 @@
+"""
+요청 / 응답 카세트 테스트 케이스
+
+테스트 대상:
+- 녹화 (JSON / 바이너리 본문, 업로드 파일 요약, 전송 실패)
+- 재생 (exact / template 일치, 녹화 순서, 반복, 불일치)
+- CLI --record / --replay
+"""
+import io
+import json
+
+import pytest
+
+from console import cli
+from console.cassette import (
+    EXACT, TEMPLATE, Cassette, CassetteMiss, RecordingTransport, ReplayTransport, template_of,
+)
+from console.client import ApiClient, TransportError
+
+
+URLS = {"backend": ["http://b1", "http://b2"], "model": ["http://m1"]}
+
+
+def recorded(fake_transport, calls):
+    """fake_transport로 calls(client → None)를 실행하며 녹화한 카세트"""
+    recorder = RecordingTransport(fake_transport)
+    calls(ApiClient(transport=recorder, urls=URLS))
+    return recorder.cassette
+
+
+class TestRecord:
+    """녹화 테스트"""
+
+    def test_records_path_params_and_json(self, fake_transport):
+        """
+        [확인] 호스트를 제외한 경로, 쿼리 파라미터, JSON 본문 / 응답 저장
+        """
+        fake_transport.add("GET", "http://b1/api/posts", body={"data": {"posts": []}})
+        fake_transport.add("GET", "http://b2/api/posts", body={"data": {"posts": []}})
+
+        cassette = recorded(fake_transport, lambda client: client.get_posts(2, 5))
+
+        interaction = cassette.interactions[0]
+        assert interaction["request"] == {"method": "GET", "path": "/api/posts", "params": {"page": 2, "limit": 5}}
+        assert interaction["response"]["status"] == 200
+        assert interaction["response"]["json"] == {"data": {"posts": []}}
+
+    def test_upload_stores_file_summary(self, fake_transport):
+        """
+        [확인] 업로드 파일은 내용 대신 (파일명, 크기, Content-Type)만 저장
+        """
+        for host in URLS["backend"]:
+            fake_transport.add("POST", f"{host}/api/posts/upload", body={"data": {}})
+
+        cassette = recorded(fake_transport,
+                            lambda client: client.upload_post_image("a.png", b"x" * 1000, "image/png"))
+
+        assert cassette.interactions[0]["request"]["files"] == {"file": ["a.png", 1000, "image/png"]}
+
+    def test_transport_error_recorded_and_replayed(self, fake_transport):
+        """
+        [실패] 전송 실패도 녹화되어 재생 시 네트워크 오류(status 0)로 재현
+        """
+        for host in URLS["backend"]:
+            fake_transport.add("GET", f"{host}/api/posts/1", error="connection refused")
+
+        cassette = recorded(fake_transport, lambda client: client.get_post(1))
+        response = ApiClient(transport=ReplayTransport(cassette), urls=URLS).get_post(1)
+
+        assert cassette.interactions[0]["response"] == {"error": "connection refused"}
+        assert response.status == 0
+        assert response.data["message"] == "network_error"
+
+    def test_save_load_roundtrip(self, fake_transport, tmp_path):
+        """
+        [확인] 파일 저장 후 로드하면 같은 내용
+        """
+        for host in URLS["backend"]:
+            fake_transport.add("GET", f"{host}/api/posts/1", body={"data": {"title": "제목"}})
+        cassette = recorded(fake_transport, lambda client: client.get_post(1))
+
+        loaded = Cassette.load(cassette.save(str(tmp_path / "c" / "posts.json")))
+
+        assert loaded.interactions == cassette.interactions
+
+
+class TestReplay:
+    """재생 테스트"""
+
+    @pytest.fixture
+    def cassette(self):
+        cassette = Cassette()
+        cassette.interactions = [
+            {"request": {"method": "POST", "path": "/api/posts/1/like"},
+             "response": {"status": 200, "json": {"data": {"liked": True}}}},
+            {"request": {"method": "POST", "path": "/api/posts/1/like"},
+             "response": {"status": 200, "json": {"data": {"liked": False}}}},
+            {"request": {"method": "POST", "path": "/api/posts/1/comments", "json": {"content": "안녕"}},
+             "response": {"status": 201, "json": {"data": {"comment_id": 5}}}},
+            {"request": {"method": "GET", "path": "/api/image"},
+             "response": {"status": 200, "body_b64": "iVBORw=="}},
+        ]
+        return cassette
+
+    def test_replays_in_recorded_order_then_repeats(self, cassette):
+        """
+        [확인] 같은 요청은 녹화 순서대로 재생하고, 다 쓰면 마지막 응답 반복
+        """
+        client = ApiClient(transport=ReplayTransport(cassette), urls=URLS)
+
+        liked = [client.toggle_like(1).data["data"]["liked"] for _ in range(3)]
+
+        assert liked == [True, False, False]
+
+    def test_no_repeats_raises_miss(self, cassette):
+        """
+        [실패] allow_repeats=False면 녹화된 횟수를 넘는 요청은 CassetteMiss
+        """
+        client = ApiClient(transport=ReplayTransport(cassette, allow_repeats=False), urls=URLS)
+        client.toggle_like(1)
+        client.toggle_like(1)
+
+        with pytest.raises(CassetteMiss):
+            client.toggle_like(1)
+
+    def test_exact_requires_same_body(self, cassette):
+        """
+        [실패] exact 방식은 JSON 본문이 다르면 CassetteMiss (네트워크 오류로 바뀌지 않음)
+        """
+        client = ApiClient(transport=ReplayTransport(cassette, EXACT), urls=URLS)
+
+        assert client.create_comment(1, "안녕").status == 201
+        with pytest.raises(CassetteMiss):
+            client.create_comment(1, "다른 내용")
+
+    def test_template_ignores_ids_and_body(self, cassette):
+        """
+        [확인] template 방식은 다른 ID / 본문에도 재생
+        """
+        client = ApiClient(transport=ReplayTransport(cassette, TEMPLATE), urls=URLS)
+
+        response = client.create_comment(77, "다른 내용")
+
+        assert response.status == 201
+        assert response.data["data"]["comment_id"] == 5
+
+    def test_binary_body(self, cassette):
+        """
+        [확인] base64로 저장된 바이너리 본문 복원
+        """
+        transport = ReplayTransport(cassette)
+
+        raw = transport.send("GET", "http://anywhere/api/image")
+
+        assert raw.content == b"\x89PNG"
+
+    def test_template_of(self):
+        """
+        [확인] 숫자 경로 세그먼트만 {id}로 치환
+        """
+        assert template_of("/api/posts/3/comments/12") == "/api/posts/{id}/comments/{id}"
+        assert template_of("/api/posts/upload") == "/api/posts/upload"
+
+    def test_unknown_mode(self, cassette):
+        """
+        [실패] 지원하지 않는 일치 방식은 ValueError
+        """
+        with pytest.raises(ValueError):
+            ReplayTransport(cassette, "fuzzy")
+
+    def test_recorded_error_is_transport_error(self):
+        """
+        [확인] 녹화된 전송 실패는 TransportError로 재생
+        """
+        cassette = Cassette([{"request": {"method": "GET", "path": "/"}, "response": {"error": "timeout"}}])
+
+        with pytest.raises(TransportError):
+            ReplayTransport(cassette).send("GET", "http://m1/")
+
+
+class TestCliCassette:
+    """CLI --record / --replay 테스트"""
+
+    def test_record_then_replay(self, fake_transport, tmp_path):
+        """
+        [확인] --record로 녹화한 카세트를 --replay로 네트워크 없이 재생
+        """
+        path = str(tmp_path / "detail.json")
+        for host in URLS["backend"]:
+            fake_transport.add("GET", f"{host}/api/posts/1", body={"data": {"post_id": 1}})
+        client = ApiClient(transport=fake_transport, urls=URLS)
+
+        stdout = io.StringIO()
+        assert cli.main(["--record", path, "detail", "1"], client=client, stdout=stdout) == 0
+        calls = len(fake_transport.calls)
+
+        replayed = io.StringIO()
+        assert cli.main(["--replay", path, "detail", "1"], client=client, stdout=replayed) == 0
+
+        assert len(fake_transport.calls) == calls
+        assert json.loads(replayed.getvalue())["data"] == {"data": {"post_id": 1}}
@@ -0,0 +1,214 @@
+"""
+헤드리스 CLI 테스트 케이스
+
+테스트 대상:
+- 로그인 / 목록 / 상세 / 좋아요 / 댓글 / 업로드 / 상태 명령
+- JSON / NDJSON 출력
+- 동시 실행, 종료 코드
+"""
+import io
+import json
+
+import pytest
+
+from console import cli
+from console.client import ApiClient
+
+
+BACKEND = "http://b1/api"
+
+
+@pytest.fixture
+def client(fake_transport):
+    return ApiClient(transport=fake_transport, urls={"backend": ["http://b1"], "model": ["http://m1"]})
+
+
+def run(client, *argv):
+    stdout = io.StringIO()
+    code = cli.main(list(argv), client=client, stdout=stdout)
+    return code, stdout.getvalue()
+
+
+def ndjson(text):
+    return [json.loads(line) for line in text.splitlines()]
+
+
+class TestLogin:
+    """login 명령 테스트"""
+
+    def test_login_success(self, client, fake_transport):
+        """
+        [성공] 로그인 성공 시 user_id 출력, 종료 코드 0
+        """
+        fake_transport.add("POST", f"{BACKEND}/auth/login",
+                           body={"message": "login_success", "data": {"user_id": 7, "nickname": "tester"}})
+
+        code, text = run(client, "login", "--email", "a@b.c", "--password", "pw")
+
+        assert code == 0
+        record = json.loads(text)
+        assert record["user_id"] == 7
+        assert fake_transport.calls[0]["json"] == {"email": "a@b.c", "password": "pw"}
+
+    def test_login_failure(self, client, fake_transport):
+        """
+        [실패] 로그인 실패 시 종료 코드 1
+        """
+        fake_transport.add("POST", f"{BACKEND}/auth/login", status=401, body={"message": "invalid_credentials"})
+
+        code, text = run(client, "login", "--email", "a@b.c", "--password", "wrong")
+
+        assert code == 1
+        assert json.loads(text)["ok"] is False
+
+
+class TestList:
+    """list 명령 테스트"""
+
+    @pytest.fixture
+    def posts(self, fake_transport):
+        posts = [{"post_id": i, "title": f"게시글 {i}"} for i in range(1, 6)]
+
+        def list_posts(call):
+            page, limit = call["params"]["page"], call["params"]["limit"]
+            return 200, {"data": {"posts": posts[(page - 1) * limit:page * limit], "total": len(posts)}}
+
+        fake_transport.add("GET", f"{BACKEND}/posts", handler=list_posts)
+        return posts
+
+    def test_single_page(self, client, posts):
+        """
+        [확인] --all 없이 한 페이지만 조회
+        """
+        code, text = run(client, "list", "--limit", "2")
+
+        assert code == 0
+        assert [p["post_id"] for p in json.loads(text)] == [1, 2]
+
+    def test_all_pages_ndjson(self, client, posts, fake_transport):
+        """
+        [확인] --all --format ndjson은 게시글 한 줄씩 전체 출력
+        """
+        code, text = run(client, "--format", "ndjson", "list", "--limit", "2", "--all")
+
+        assert code == 0
+        assert [p["post_id"] for p in ndjson(text)] == [1, 2, 3, 4, 5]
+        assert [c["params"]["page"] for c in fake_transport.calls] == [1, 2, 3]
+
+    def test_all_from_page(self, client, posts):
+        """
+        [확인] --page부터 마지막 페이지까지 순회
+        """
+        code, text = run(client, "list", "--limit", "2", "--page", "2", "--all")
+
+        assert [p["post_id"] for p in json.loads(text)] == [3, 4, 5]
+
+    def test_list_error(self, client, fake_transport):
+        """
+        [실패] 목록 조회 실패 시 오류 레코드와 종료 코드 1
+        """
+        fake_transport.add("GET", f"{BACKEND}/posts", status=500, body={"message": "error"})
+
+        code, text = run(client, "list")
+
+        assert code == 1
+        assert json.loads(text)[0]["ok"] is False
+
+
+class TestBulkCommands:
+    """여러 대상을 받는 명령 테스트"""
+
+    def test_detail_many_in_input_order(self, client, fake_transport):
+        """
+        [확인] json 형식은 입력 순서대로 배열 출력
+        """
+        for post_id in (1, 2, 3):
+            fake_transport.add("GET", f"{BACKEND}/posts/{post_id}", body={"data": {"post_id": post_id}},
+                               delay=0.01 * (4 - post_id))
+
+        code, text = run(client, "-j", "3", "detail", "1", "2", "3")
+
+        assert code == 0
+        assert [r["post_id"] for r in json.loads(text)] == [1, 2, 3]
+
+    def test_like_partial_failure(self, client, fake_transport):
+        """
+        [실패] 일부 대상 실패 시 모두 출력하고 종료 코드 1
+        """
+        fake_transport.add("POST", f"{BACKEND}/posts/1/like", body={"data": {"like_count": 1}})
+        fake_transport.add("POST", f"{BACKEND}/posts/2/like", status=404, body={"message": "post_not_found"})
+
+        code, text = run(client, "--format", "ndjson", "like", "1", "2")
+
+        assert code == 1
+        records = {r["post_id"]: r for r in ndjson(text)}
+        assert records[1]["ok"] is True
+        assert records[2]["status"] == 404
+
+    def test_single_target_prints_object(self, client, fake_transport):
+        """
+        [확인] 대상이 하나면 json 형식은 객체로 출력
+        """
+        fake_transport.add("GET", f"{BACKEND}/posts/1/comments", body={"data": {"comments": []}})
+
+        code, text = run(client, "comments", "1")
+
+        assert json.loads(text)["post_id"] == 1
+
+    def test_comment_sends_user_header(self, client, fake_transport):
+        """
+        [확인] --user-id가 X-User-Id 헤더로 전달
+        """
+        fake_transport.add("POST", f"{BACKEND}/posts/1/comments", status=201, body={"message": "ok"})
+
+        code, _ = run(client, "--user-id", "3", "comment", "1", "--content", "안녕하세요")
+
+        assert code == 0
+        call = fake_transport.calls[0]
+        assert call["headers"]["X-User-Id"] == "3"
+        assert call["json"] == {"content": "안녕하세요"}
+
+    def test_upload_reports_classification(self, client, fake_transport, tmp_path):
+        """
+        [확인] 업로드 결과에 분류 클래스 / 신뢰도 포함
+        """
+        image = tmp_path / "dog.jpg"
+        image.write_bytes(b"jpeg")
+        fake_transport.add("POST", f"{BACKEND}/posts/upload", body={"data": {
+            "image_url": "/uploads/dog.jpg",
+            "prediction": {"class_name": "dog", "confidence_score": 0.9},
+        }})
+
+        code, text = run(client, "upload", str(image))
+
+        assert code == 0
+        record = json.loads(text)
+        assert (record["class_name"], record["confidence"]) == ("dog", 0.9)
+        assert fake_transport.calls[0]["files"]["file"] == ("dog.jpg", b"jpeg", "image/jpeg")
+
+    def test_upload_missing_file(self, client, tmp_path):
+        """
+        [실패] 없는 파일은 오류 레코드로 기록
+        """
+        code, text = run(client, "upload", str(tmp_path / "missing.jpg"))
+
+        assert code == 1
+        assert json.loads(text)["ok"] is False
+
+
+class TestStatus:
+    """status 명령 테스트"""
+
+    def test_reports_each_instance(self, client, fake_transport):
+        """
+        [확인] 인스턴스별 헬스 체크 결과 출력, 실패 인스턴스가 있으면 종료 코드 1
+        """
+        fake_transport.add("GET", "http://b1/")
+        fake_transport.add("GET", "http://m1/", error="connection refused")
+
+        code, text = run(client, "--format", "ndjson", "status")
+
+        records = {r["service"]: r for r in ndjson(text)}
+        assert records["backend"]["last_status"] == 200
+        assert records["model"]["last_error"] == "connection refused"
+        assert code == 0  # 한 번 실패로는 down이 아님
@@ -0,0 +1,185 @@
+"""
+API 클라이언트 테스트 케이스
+
+테스트 대상:
+- 엔드포인트 URL / 요청 본문 / 헤더
+- js/api.js와 동일한 응답 구조 (ok, status, data)
+- 네트워크 오류 처리 (예상하지 못한 전송 계층 예외에도 레플리카 진행 중 요청 수 복구)
+"""
+import pytest
+
+from console.client import ApiClient, NETWORK_ERROR
+
+
+BACKEND = "http://localhost:8000/api"
+MODEL = "http://localhost:8001/api"
+
+
+@pytest.fixture
+def client(fake_transport, monkeypatch):
+    """가짜 전송 계층을 사용하는 클라이언트"""
+    monkeypatch.delenv("BACKEND_URLS", raising=False)
+    monkeypatch.delenv("MODEL_API_URLS", raising=False)
+    return ApiClient(transport=fake_transport)
+
+
+class TestClientRequests:
+    """요청 구성 테스트"""
+
+    def test_login_request(self, client, fake_transport, mock_login_success_response):
+        """
+        [확인] 로그인 요청
+
+        Given: 로그인 성공 응답 등록
+        When: login 호출
+        Then: 올바른 URL / 본문으로 요청하고 응답 구조 반환
+        """
+        fake_transport.add("POST", f"{BACKEND}/auth/login", body=mock_login_success_response)
+
+        result = client.login("testuser@example.com", "TestPassword123!@#")
+
+        assert result.ok is True
+        assert result.status == 200
+        assert result.data == mock_login_success_response
+        assert fake_transport.calls[0]["json"] == {
+            "email": "testuser@example.com",
+            "password": "TestPassword123!@#"
+        }
+
+    def test_posts_list_params(self, client, fake_transport, mock_posts_list_response):
+        """
+        [확인] 게시글 목록 페이지네이션 파라미터
+        """
+        fake_transport.add("GET", f"{BACKEND}/posts", body=mock_posts_list_response)
+
+        result = client.get_posts(page=3, limit=20)
+
+        assert result.ok
+        assert fake_transport.calls[0]["params"] == {"page": 3, "limit": 20}
+
+    def test_authenticated_header(self, client, fake_transport):
+        """
+        [확인] 로그인 상태에서 X-User-Id 헤더 포함
+        """
+        client.user_id = 123
+        fake_transport.add("POST", f"{BACKEND}/posts/1/like", body={"data": {"liked": True}})
+
+        client.toggle_like(1)
+
+        assert fake_transport.calls[0]["headers"]["X-User-Id"] == "123"
+
+    def test_anonymous_header(self, client, fake_transport):
+        """
+        [확인] 비로그인 상태에서는 X-User-Id 헤더 없음
+        """
+        client.get_post(1)
+
+        assert "X-User-Id" not in fake_transport.calls[0]["headers"]
+
+    def test_model_api_request(self, client, fake_transport):
+        """
+        [확인] Gemini 감정 분석은 Model API로 요청
+        """
+        fake_transport.add("POST", f"{MODEL}/sentiment/gemini", body={"label": "positive", "confidence": 0.9})
+
+        result = client.analyze_sentiment_gemini("좋아요")
+
+        assert result.data["label"] == "positive"
+        assert fake_transport.calls[0]["json"] == {"text": "좋아요", "explain": False}
+
+    def test_timeout_applied(self, client, fake_transport):
+        """
+        [확인] 모든 요청에 타임아웃 적용
+        """
+        client.get_posts()
+
+        assert fake_transport.calls[0]["timeout"] == client.timeout
+
+
+class TestClientErrors:
+    """에러 응답 처리 테스트"""
+
+    def test_network_error(self, client, fake_transport):
+        """
+        [실패] 네트워크 오류
+
+        Given: 연결 실패
+        When: 요청
+        Then: status 0, network_error (api.js와 동일)
+        """
+        fake_transport.add("GET", f"{BACKEND}/posts", error="connection refused")
+
+        result = client.get_posts()
+
+        assert result.ok is False
+        assert result.status == 0
+        assert result.data == NETWORK_ERROR
+
+    def test_http_error(self, client, fake_transport):
+        """
+        [실패] 4xx 응답은 ok False, 상태 코드 유지
+        """
+        fake_transport.add("GET", f"{BACKEND}/posts/999", status=404, body={"message": "post_not_found", "data": None})
+
+        result = client.get_post(999)
+
+        assert result.ok is False
+        assert result.status == 404
+        assert result.data["message"] == "post_not_found"
+
+    def test_non_json_body(self, client, fake_transport):
+        """
+        [확인] JSON이 아닌 본문은 data None
+        """
+        fake_transport.add("DELETE", f"{BACKEND}/posts/1", status=204)
+
+        result = client.delete_post(1)
+
+        assert result.ok is True
+        assert result.data is None
+
+
+    @pytest.mark.parametrize("call", [
+        lambda client: client.get_posts(),
+        lambda client: list(client.stream_posts()),
+    ])
+    def test_unexpected_transport_error_releases_replica(self, call):
+        """
+        [실패] 전송 계층이 TransportError가 아닌 예외를 던져도 진행 중 요청 수는 복구되고 예외는 전파
+        Given: send / stream이 KeyError를 던지는 전송 계층
+        Then: replica_snapshot의 outstanding 0
+        """
+        class Broken:
+            def send(self, *args, **kwargs):
+                raise KeyError("bug")
+
+            def stream(self, *args, **kwargs):
+                raise KeyError("bug")
+
+        client = ApiClient(transport=Broken(), urls={"backend": ["http://b1"], "model": ["http://m1"]})
+
+        with pytest.raises(KeyError):
+            call(client)
+
+        assert [replica["outstanding"] for replica in client.replica_snapshot()["backend"]] == [0]
+
+
+class TestClientConfig:
+    """서비스 URL 설정 테스트"""
+
+    def test_default_base_urls(self, client):
+        """
+        [확인] 기본 URL은 conftest 상수와 동일
+        """
+        assert client.base_url() == BACKEND
+        assert client.base_url("model") == MODEL
+
+    def test_env_override(self, fake_transport, monkeypatch):
+        """
+        [확인] 환경 변수로 인스턴스 목록 지정
+        """
+        monkeypatch.setenv("MODEL_API_URLS", "http://10.0.0.1:8001/, http://10.0.0.2:8001")
+
+        client = ApiClient(transport=fake_transport)
+
+        assert client.urls["model"] == ["http://10.0.0.1:8001", "http://10.0.0.2:8001"]
@@ -0,0 +1,186 @@
+"""
+열 단위(Arrow IPC) 스냅샷 저장소 테스트 케이스
+
+테스트 대상:
+- 스냅샷 → 저장소 → 스냅샷 왕복 (게시글 / 댓글 필드 보존)
+- 메모리 매핑 읽기 (열 버퍼가 파일을 그대로 참조), 사전 인코딩 닉네임
+- 모더레이션 대상 선택이 moderation.select와 같음
+- CLI columnar
+"""
+import io
+import json
+import os
+
+import pytest
+
+from console import cli, columnar, moderation, snapshot
+from console.moderation import ModerationFilter
+
+pa = pytest.importorskip("pyarrow")
+
+
+@pytest.fixture
+def board(standin_client):
+    """게시글 80개 대역을 크롤링한 스냅샷"""
+    return snapshot.crawl(standin_client(posts=80, users=12, comments_mean=3.0), page_size=25)
+
+
+@pytest.fixture
+def store(board, tmp_path):
+    path = columnar.write(board, str(tmp_path / f"board{columnar.SUFFIX}"), batch_size=50)
+    return columnar.open_store(path)
+
+
+class TestWrite:
+    """쓰기 / 읽기 테스트"""
+
+    def test_round_trip(self, board, store):
+        """
+        [확인] 저장소를 다시 스냅샷 dict로 바꾸면 원래 게시글 / 댓글과 같음
+        """
+        restored = store.to_board()
+
+        assert restored["posts"] == board["posts"]
+        assert restored["comments"] == board["comments"]
+        assert restored["taken_at"] == board["taken_at"]
+
+    def test_batches_and_dictionary(self, board, store):
+        """
+        [확인] batch_size 행씩 나뉘어 기록되고 닉네임은 사전 인코딩
+        Given: 게시글 80개, batch_size 50
+        Then: 게시글 열은 청크 2개, 닉네임 사전은 사용자 수 이하
+        """
+        nickname = store.posts.column("nickname")
+
+        assert store.posts.column("post_id").num_chunks == 2
+        assert pa.types.is_dictionary(nickname.type)
+        assert len(nickname.chunk(0).dictionary) <= 12
+
+    def test_memory_mapped(self, tmp_path):
+        """
+        [확인] 열 때 열 데이터를 복사하지 않음 (메모리 매핑된 파일을 그대로 참조)
+        Given: 게시글 2만 개 저장소 (posts.arrow 1MB 이상)
+        Then: 열어도 Arrow 메모리 할당은 작은 사전 크기 정도만 늘어남
+        """
+        posts = [{"post_id": i, "user_id": i % 50, "nickname": f"n{i % 50}", "view_count": i}
+                 for i in range(20_000)]
+        path = columnar.write({"posts": posts, "comments": []}, str(tmp_path / "big.columnar"))
+        allocated = pa.total_allocated_bytes()
+
+        store = columnar.open_store(path)
+        store.posts.column("view_count")
+
+        assert os.path.getsize(os.path.join(path, columnar.POSTS_FILE)) > 1_000_000
+        assert pa.total_allocated_bytes() - allocated < 4096
+
+    def test_text_is_separate(self, store):
+        """
+        [확인] 텍스트는 처음 사용할 때 열고, 숫자 / 사전 열 테이블에는 없음
+        """
+        assert store._post_text is None
+        assert "title" not in store.posts.column_names
+
+        assert store.post_text.num_rows == store.posts.num_rows
+
+    def test_existing_directory(self, board, store):
+        """
+        [실패] 이미 있는 저장소 경로에는 쓰지 않음
+        """
+        with pytest.raises(FileExistsError):
+            columnar.write(board, store.directory)
+
+    def test_failed_write_leaves_nothing(self, tmp_path):
+        """
+        [실패] 쓰는 중 예외가 나면 저장소 디렉터리가 생기지 않음
+        """
+        path = str(tmp_path / f"broken{columnar.SUFFIX}")
+
+        with pytest.raises(Exception):
+            columnar.write({"posts": [{"post_id": "not-a-number"}], "comments": []}, path, batch_size=1)
+
+        assert os.listdir(tmp_path) == []
+
+    def test_list_stores(self, store, tmp_path):
+        """
+        [확인] .columnar 디렉터리만 목록에 포함
+        """
+        (tmp_path / "board.json").write_text("{}")
+
+        assert columnar.list_stores(str(tmp_path)) == [store.directory]
+        assert columnar.is_store(store.directory)
+
+
+class TestSelect:
+    """모더레이션 대상 선택 테스트"""
+
+    @pytest.mark.parametrize("flt", [
+        ModerationFilter(author="nickname-placeholder"),
+        ModerationFilter(sentiment="negative"),
+        ModerationFilter(sentiment="positive", target=moderation.COMMENTS),
+        ModerationFilter(keyword="좋"),
+        ModerationFilter(keyword="산책", target=moderation.POSTS),
+        ModerationFilter(keyword="#1", target=moderation.POSTS),
+    ])
+    def test_same_as_moderation_select(self, board, store, flt):
+        """
+        [확인] 열 연산 선택 결과가 dict 스냅샷 선택 결과와 같음 (순서 / 항목 내용, 삭제 / 수정 작업 포함)
+        """
+        if flt.author:
+            flt = flt._replace(author=board["posts"][0]["nickname"])
+
+        for action in (moderation.DELETE, moderation.EDIT):
+            expected = moderation.select(board, flt, action)
+            actual = store.select(flt, action)
+
+            assert actual == expected
+            assert actual
+
+    def test_keyword_ignores_case(self, tmp_path):
+        """
+        [확인] 키워드는 대소문자 구분 없이 제목 / 내용에서 검색
+        """
+        board = {"posts": [{"post_id": 1, "title": "SPAM", "content": "x"},
+                           {"post_id": 2, "title": "t", "content": "Buy spam"},
+                           {"post_id": 3, "title": "t", "content": "ok"}],
+                 "comments": [{"comment_id": 1, "post_id": 3, "content": "sPaM"}]}
+        store = columnar.open_store(columnar.write(board, str(tmp_path / "small.columnar")))
+
+        targets = store.select(ModerationFilter(keyword="Spam"))
+
+        assert [(t.kind, t.post_id) for t in targets] == [("posts", 1), ("posts", 2), ("comments", 3)]
+
+    def test_empty_filter(self, store):
+        """
+        [실패] 조건이 없으면 선택하지 않음 (전체 삭제 방지)
+        """
+        assert store.select(ModerationFilter()) == []
+
+
+class TestCli:
+    """CLI 테스트"""
+
+    def test_columnar_from_snapshot(self, board, tmp_path):
+        """
+        [확인] columnar - 스냅샷 파일 옆에 같은 이름의 .columnar 저장소 생성
+        """
+        path = snapshot.save(board, str(tmp_path / "board.json"))
+        stdout = io.StringIO()
+
+        code = cli.main(["columnar", path], stdout=stdout)
+
+        result = json.loads(stdout.getvalue())
+        assert code == 0
+        assert result["path"] == str(tmp_path / f"board{columnar.SUFFIX}")
+        assert (result["posts"], result["comments"]) == (len(board["posts"]), len(board["comments"]))
+
+    def test_columnar_exists(self, board, store):
+        """
+        [실패] 대상 저장소가 이미 있으면 오류 출력
+        """
+        path = snapshot.save(board, store.directory[:-len(columnar.SUFFIX)] + ".json")
+        stdout = io.StringIO()
+
+        code = cli.main(["columnar", path], stdout=stdout)
+
+        assert code != 0
+        assert json.loads(stdout.getvalue())["ok"] is False
@@ -250,3 +250,47 @@ class TestCommentPermissions:
         # 로그인하지 않으면 댓글 작성 불가
         can_create_comment = is_logged_in
         assert can_create_comment == False
+
+
+class TestCommentApiReplay:
+    """녹화된 카세트로 ApiClient 댓글 API 재생 테스트"""
+
+    def test_get_comments_with_sentiment(self, replay_client):
+        """[성공] 댓글 목록의 각 댓글에 감성 분석 결과 포함"""
+        response = replay_client("comments", user_id=1).get_comments(1)
+
+        comments = response.data["data"]["comments"]
+        assert len(comments) == 2
+        for comment in comments:
+            assert comment["sentiment"]["label"] in ["positive", "negative", "neutral"]
+
+    def test_create_update_delete(self, replay_client):
+        """[성공] 댓글 작성 → 수정 → 삭제"""
+        client = replay_client("comments", user_id=1)
+
+        created = client.create_comment(1, "새 댓글 내용")
+        comment_id = created.data["data"]["comment_id"]
+        updated = client.update_comment(1, comment_id, "수정된 댓글 내용")
+        deleted = client.delete_comment(1, comment_id)
+
+        assert created.status == 201
+        assert updated.data["message"] == "update_comment_success"
+        assert deleted.data["message"] == "delete_comment_success"
+
+    def test_update_other_users_comment_forbidden(self, replay_client):
+        """[실패] 다른 사용자의 댓글 수정은 403"""
+        response = replay_client("comments", user_id=1).update_comment(1, 1, "남의 댓글 수정")
+
+        assert response.status == 403
+
+    def test_comments_of_missing_post(self, replay_client):
+        """[실패] 없는 게시글의 댓글 조회는 404"""
+        response = replay_client("comments", user_id=1).get_comments(999)
+
+        assert response.status == 404
+
+    def test_gemini_sentiment(self, replay_client):
+        """[성공] Gemini 감성 분석 (Model API)"""
+        response = replay_client("comments").analyze_sentiment_gemini("정말 좋은 글이에요!")
+
+        assert response.data["label"] == "positive"
@@ -0,0 +1,201 @@
+"""
+적응형 동시성 제한 테스트 케이스
+
+테스트 대상:
+- 지연 시간이 일정할 때 limit 증가
+- 지연 시간 증가 / 429 / 503 시 limit 감소
+- 슬롯 대기
+- bulk_map 동시 실행 및 진행 상황 보고
+"""
+import threading
+import time
+
+import pytest
+
+from console.client import ApiClient
+from console.concurrency import AdaptiveLimiter, bulk_map
+
+
+def saturate(limiter: AdaptiveLimiter):
+    """limit만큼 슬롯을 점유한 상태로 만듦 (증가 조건 충족)"""
+    limiter.in_flight = int(limiter.limit)
+
+
+class TestAdaptiveLimiter:
+    """AIMD 조절 테스트"""
+
+    def test_grows_while_latency_flat(self):
+        """
+        [확인] 지연 시간이 일정하면 limit 증가
+
+        Given: 초기 limit 4
+        When: 동일 지연 시간 성공 50회 (슬롯 포화 상태)
+        Then: limit 증가
+        """
+        limiter = AdaptiveLimiter(initial=4, max_limit=64)
+        for _ in range(50):
+            saturate(limiter)
+            limiter.record(0.05, 200)
+
+        assert limiter.snapshot()["limit"] > 4
+
+    def test_no_growth_when_underused(self):
+        """
+        [확인] 슬롯을 거의 쓰지 않으면 limit 유지
+        """
+        limiter = AdaptiveLimiter(initial=8)
+        for _ in range(50):
+            limiter.in_flight = 1
+            limiter.record(0.05, 200)
+
+        assert limiter.snapshot()["limit"] == 8
+
+    def test_respects_max_limit(self):
+        """
+        [확인] max_limit을 넘지 않음
+        """
+        limiter = AdaptiveLimiter(initial=4, max_limit=6)
+        for _ in range(500):
+            saturate(limiter)
+            limiter.record(0.05, 200)
+
+        assert limiter.snapshot()["limit"] == 6
+
+    def test_backs_off_on_latency_inflation(self):
+        """
+        [확인] 지연 시간이 기준의 tolerance배를 넘으면 limit 감소
+        """
+        limiter = AdaptiveLimiter(initial=10, tolerance=2.0)
+        limiter.record(0.05, 200)
+
+        limiter.record(0.5, 200)
+
+        assert limiter.limit < 10
+        assert limiter.snapshot()["inflated"] == 1
+
+    @pytest.mark.parametrize("status", [429, 503, 0])
+    def test_backs_off_on_throttle(self, status):
+        """
+        [확인] 429 / 503 / 네트워크 오류 시 limit 절반
+        """
+        limiter = AdaptiveLimiter(initial=16, backoff=0.5)
+
+        limiter.record(0.01, status)
+
+        assert limiter.snapshot()["limit"] == 8
+        assert limiter.snapshot()["throttled"] == 1
+
+    def test_respects_min_limit(self):
+        """
+        [확인] min_limit 아래로 내려가지 않음
+        """
+        limiter = AdaptiveLimiter(initial=2, min_limit=1)
+        for _ in range(10):
+            limiter.record(0.01, 429)
+
+        assert limiter.snapshot()["limit"] == 1
+
+    def test_acquire_blocks_at_limit(self):
+        """
+        [확인] limit에 도달하면 슬롯 획득 대기
+        """
+        limiter = AdaptiveLimiter(initial=1)
+        assert limiter.acquire(timeout=0.1)
+
+        assert limiter.acquire(timeout=0.05) is False
+
+        limiter.release()
+        assert limiter.acquire(timeout=0.1)
+
+
+class TestClientLimiters:
+    """클라이언트 서비스별 제한기 테스트"""
+
+    def test_limits_reported_per_service(self, fake_transport):
+        """
+        [확인] 서비스별 limit 상태 보고
+        """
+        client = ApiClient(transport=fake_transport, urls={"backend": ["http://b1"], "model": ["http://m1"]})
+        fake_transport.add("POST", "http://m1/api/sentiment/gemini", status=429, body={})
+
+        client.analyze_sentiment_gemini("텍스트")
+        snapshot = client.limiter_snapshot()
+
+        assert set(snapshot) == {"backend", "model"}
+        assert snapshot["model"]["throttled"] == 1
+        assert snapshot["backend"]["throttled"] == 0
+
+    def test_in_flight_bounded_by_limit(self, fake_transport):
+        """
+        [확인] 실제 동시 요청 수가 limit을 넘지 않음
+
+        Given: limit 2로 고정된 backend 제한기
+        When: 10개 요청을 8개 스레드로 실행
+        Then: 전송 계층 동시 호출 수 최대 2
+        """
+        client = ApiClient(transport=fake_transport, urls={"backend": ["http://b1"], "model": ["http://m1"]})
+        client.limiters["backend"] = AdaptiveLimiter(initial=2, max_limit=2)
+        fake_transport.add("GET", "http://b1/api/posts/1", body={}, delay=0.02)
+
+        active = {"now": 0, "peak": 0}
+        lock = threading.Lock()
+        original_send = fake_transport.send
+
+        def tracking_send(*args, **kwargs):
+            with lock:
+                active["now"] += 1
+                active["peak"] = max(active["peak"], active["now"])
+            try:
+                return original_send(*args, **kwargs)
+            finally:
+                with lock:
+                    active["now"] -= 1
+
+        fake_transport.send = tracking_send
+        bulk_map(lambda _: client.get_post(1), range(10), workers=8)
+
+        assert active["peak"] <= 2
+
+
+class TestBulkMap:
+    """대량 작업 실행 테스트"""
+
+    def test_results_in_input_order(self):
+        """
+        [확인] 결과는 입력 순서 유지
+        """
+        results = bulk_map(lambda x: x * 2, [3, 1, 2], workers=3)
+
+        assert results == [6, 2, 4]
+
+    def test_errors_reported_per_item(self):
+        """
+        [확인] 항목별 예외는 결과에 담기고 on_result로 보고
+        """
+        reported = []
+
+        def fn(x):
+            if x == 2:
+                raise ValueError("bad")
+            return x
+
+        results = bulk_map(fn, [1, 2, 3], on_result=lambda i, item, result, error: reported.append((i, error is None)))
+
+        assert isinstance(results[1], ValueError)
+        assert sorted(reported) == [(0, True), (1, False), (2, True)]
+
+    def test_cancel_skips_pending(self):
+        """
+        [확인] 취소 후 시작하지 않은 항목은 건너뜀
+        """
+        cancel = threading.Event()
+
+        def fn(x):
+            cancel.set()
+            time.sleep(0.01)
+            return x
+
+        results = bulk_map(fn, range(20), workers=1, cancel=cancel)
+
+        assert results[0] == 0
+        assert results[1:] == [None] * 19
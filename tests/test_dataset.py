@@ -0,0 +1,99 @@
+"""
+대용량 게시판 데이터 생성 테스트 케이스
+
+테스트 대상:
+- seed에 따른 결정적 생성, 청크 간 ID 연속성
+- 댓글 수 / 조회수 분포의 치우침
+- CLI dataset 명령과 --standin 사용
+"""
+import io
+import json
+from collections import Counter
+
+import pytest
+
+from console import cli, dataset
+from console.dataset import DatasetConfig
+
+
+def collect(config):
+    posts, comments = [], []
+    for chunk in dataset.generate(config):
+        posts.extend(chunk.posts)
+        comments.extend(chunk.comments)
+    return posts, comments
+
+
+class TestGenerate:
+    """생성 테스트"""
+
+    def test_deterministic(self):
+        """
+        [확인] 같은 설정이면 같은 데이터, seed가 다르면 다른 데이터
+        """
+        config = DatasetConfig(posts=300, users=20, comments_mean=4.0)
+
+        assert collect(config) == collect(config)
+        assert collect(config) != collect(config._replace(seed=1))
+
+    def test_ids_continue_across_chunks(self, monkeypatch):
+        """
+        [확인] 여러 청크에 걸쳐 post_id / comment_id가 1부터 연속이고 댓글 수가 comment_count와 일치
+        """
+        monkeypatch.setattr(dataset, "CHUNK_SIZE", 7)
+        posts, comments = collect(DatasetConfig(posts=50, users=10, comments_mean=3.0))
+
+        assert [post[0] for post in posts] == list(range(1, 51))
+        assert [comment[0] for comment in comments] == list(range(1, len(comments) + 1))
+        per_post = Counter(comment[1] for comment in comments)
+        assert all(per_post[post[0]] == post[8] for post in posts)
+        assert all(comment[4] >= posts[comment[1] - 1][9] for comment in comments)
+
+    def test_skew(self):
+        """
+        [확인] 댓글은 소수 게시글에 몰리고, 평균은 comments_mean 근처
+        Given: 게시글 5000개, 평균 댓글 10개
+        Then: 상위 10% 게시글이 댓글의 40% 이상
+        """
+        posts, _ = collect(DatasetConfig(posts=5000, users=500, comments_mean=10.0))
+        counts = sorted((post[8] for post in posts), reverse=True)
+
+        assert sum(counts[:500]) > 0.4 * sum(counts)
+        assert 6 < sum(counts) / len(counts) < 14
+        assert max(post[7] for post in posts) > 20 * sorted(post[7] for post in posts)[2500]
+
+    def test_invalid_alpha(self):
+        """
+        [실패] alpha <= 1은 평균이 무한
+        """
+        with pytest.raises(ValueError):
+            next(dataset.generate(DatasetConfig(alpha=1.0)))
+
+
+class TestCli:
+    """CLI 테스트"""
+
+    def test_dataset_then_standin(self, tmp_path):
+        """
+        [확인] dataset으로 만든 SQLite 파일을 --standin으로 조회
+        """
+        path = str(tmp_path / "board.db")
+        stdout = io.StringIO()
+
+        assert cli.main(["dataset", "--sqlite", path, "--posts", "120", "--users", "10"], stdout=stdout) == 0
+        assert json.loads(stdout.getvalue())["posts"] == 120
+
+        stdout = io.StringIO()
+        assert cli.main(["--standin", path, "list", "--page", "2", "--limit", "50"], stdout=stdout) == 0
+        posts = json.loads(stdout.getvalue())
+        assert [post["post_id"] for post in posts] == list(range(70, 20, -1))
+
+    def test_existing_file(self, tmp_path):
+        """
+        [실패] 이미 있는 파일에는 적재하지 않음
+        """
+        path = tmp_path / "board.db"
+        path.write_bytes(b"")
+        stdout = io.StringIO()
+
+        assert cli.main(["dataset", "--sqlite", str(path), "--posts", "10"], stdout=stdout) == 1
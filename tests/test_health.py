@@ -0,0 +1,199 @@
+"""
+백그라운드 헬스 체크 테스트 케이스
+
+테스트 대상:
+- 모든 인스턴스 동시 확인
+- 타임아웃 / 연결 실패 / 5xx 처리
+- 가용성 및 지연 시간 이력
+- 상태 판정 (healthy / degraded / down)
+"""
+import time
+
+import pytest
+
+from console.health import HealthProber, percentile
+
+
+TARGETS = {
+    "backend": ["http://b1:8000"],
+    "model": ["http://m1:8001", "http://m2:8001"],
+}
+
+
+@pytest.fixture
+def prober(fake_transport):
+    """가짜 전송 계층을 사용하는 헬스 체커"""
+    for urls in TARGETS.values():
+        for url in urls:
+            fake_transport.add("GET", f"{url}/", body={"message": "ok"})
+    return HealthProber(targets=TARGETS, transport=fake_transport, interval=0.01,
+                        timeout=0.5, history=5, down_after=2)
+
+
+class TestProbeRound:
+    """확인 라운드 테스트"""
+
+    def test_probes_every_instance(self, prober, fake_transport):
+        """
+        [확인] Backend 및 모든 Model API 인스턴스 확인
+        """
+        results = prober.probe_once()
+
+        assert len(results) == 3
+        assert {call["url"] for call in fake_transport.calls} == {
+            "http://b1:8000/", "http://m1:8001/", "http://m2:8001/"
+        }
+        assert all(call["timeout"] == 0.5 for call in fake_transport.calls)
+
+    def test_probes_run_concurrently(self, prober, fake_transport):
+        """
+        [확인] 인스턴스를 동시에 확인
+
+        Given: 각 인스턴스 응답 0.1초 지연
+        When: 한 라운드 확인
+        Then: 전체 소요 시간이 순차 실행(0.3초)보다 짧음
+        """
+        for urls in TARGETS.values():
+            for url in urls:
+                fake_transport.add("GET", f"{url}/", body={}, delay=0.1)
+
+        started = time.perf_counter()
+        prober.probe_once()
+
+        assert time.perf_counter() - started < 0.25
+
+    def test_connection_failure(self, prober, fake_transport):
+        """
+        [실패] 연결 실패는 status 0 실패로 기록
+        """
+        fake_transport.add("GET", "http://m2:8001/", error="timed out")
+
+        results = prober.probe_once()
+        result = results[("model", "http://m2:8001")]
+
+        assert result.ok is False
+        assert result.status == 0
+        assert result.error == "timed out"
+
+    def test_server_error(self, prober, fake_transport):
+        """
+        [실패] 5xx 응답은 실패로 기록
+        """
+        fake_transport.add("GET", "http://b1:8000/", status=503, body={})
+
+        result = prober.probe_once()[("backend", "http://b1:8000")]
+
+        assert result.ok is False
+        assert result.status == 503
+
+    def test_listener_called(self, prober):
+        """
+        [확인] 확인 결과마다 리스너 호출
+        """
+        seen = []
+        prober.add_listener(lambda service, url, result: seen.append((service, url, result.ok)))
+
+        prober.probe_once()
+
+        assert sorted(seen) == [
+            ("backend", "http://b1:8000", True),
+            ("model", "http://m1:8001", True),
+            ("model", "http://m2:8001", True),
+        ]
+
+
+class TestHealthHistory:
+    """이력 및 상태 판정 테스트"""
+
+    def test_initial_state_unknown(self, prober):
+        """
+        [확인] 확인 전 상태는 unknown
+        """
+        assert prober.state("backend", "http://b1:8000") == "unknown"
+
+    def test_healthy_after_success(self, prober):
+        """
+        [확인] 성공 후 healthy, 가용성 100%
+        """
+        prober.probe_once()
+        summary = {s["url"]: s for s in prober.snapshot()}["http://b1:8000"]
+
+        assert summary["state"] == "healthy"
+        assert summary["availability"] == 1.0
+        assert summary["latency_p50_ms"] is not None
+
+    def test_degraded_then_down(self, prober, fake_transport):
+        """
+        [확인] 연속 실패에 따라 degraded → down
+        """
+        prober.probe_once()
+        fake_transport.add("GET", "http://m1:8001/", error="refused")
+
+        prober.probe_once()
+        assert prober.state("model", "http://m1:8001") == "degraded"
+
+        prober.probe_once()
+        assert prober.state("model", "http://m1:8001") == "down"
+        assert prober.state("model", "http://m2:8001") == "healthy"
+
+    def test_recovers_after_success(self, prober, fake_transport):
+        """
+        [확인] 실패 후 다시 성공하면 연속 실패 횟수 초기화
+        """
+        fake_transport.add("GET", "http://m1:8001/", error="refused")
+        prober.probe_once()
+        prober.probe_once()
+        fake_transport.add("GET", "http://m1:8001/", body={})
+
+        prober.probe_once()
+        summary = {s["url"]: s for s in prober.snapshot()}["http://m1:8001"]
+
+        assert summary["consecutive_failures"] == 0
+        assert summary["availability"] == pytest.approx(1 / 3)
+        assert summary["state"] == "degraded"
+
+    def test_rolling_history(self, prober):
+        """
+        [확인] 최근 history개만 유지
+        """
+        for _ in range(8):
+            prober.probe_once()
+
+        assert len(prober.history("backend", "http://b1:8000")) == 5
+
+    def test_slow_instance_degraded(self, prober, fake_transport):
+        """
+        [확인] p95 지연 시간이 기준을 넘으면 degraded
+        """
+        prober.slow_threshold = 0.01
+        fake_transport.add("GET", "http://b1:8000/", body={}, delay=0.03)
+
+        prober.probe_once()
+
+        assert prober.state("backend", "http://b1:8000") == "degraded"
+
+
+class TestBackgroundProbing:
+    """백그라운드 실행 테스트"""
+
+    def test_start_and_stop(self, prober):
+        """
+        [확인] start 후 주기적으로 확인하고 stop으로 중지
+        """
+        prober.start()
+        deadline = time.time() + 2
+        while len(prober.history("backend", "http://b1:8000")) < 2 and time.time() < deadline:
+            time.sleep(0.01)
+        prober.stop()
+
+        assert len(prober.history("backend", "http://b1:8000")) >= 2
+        assert prober.running is False
+
+
+class TestPercentile:
+    """백분위수 헬퍼 테스트"""
+
+    def test_percentile(self):
+        assert percentile([], 0.5) is None
+        assert percentile([3.0, 1.0, 2.0], 0.5) == 2.0
+        assert percentile([1.0, 2.0, 3.0, 4.0], 0.95) == 4.0
@@ -0,0 +1,215 @@
+"""
+중복 이미지 분류 결과 캐시 테스트 케이스
+
+테스트 대상:
+- 같은 파일은 두 번째부터 업로드 / 분류 요청 없이 저장된 결과 사용
+- 분류 실패 / 업로드 실패는 저장하지 않음
+- dHash: 크기 변경 / 재압축한 이미지는 가까움, 다른 이미지는 멂 (PIL 필요)
+- 단색 이미지처럼 의미 없는 dHash는 거의 같은 이미지 비교에서 제외
+- 캐시 파일 재사용, 10만 장 조회 시간
+- CLI upload --image-cache
+"""
+import io
+import json
+import time
+
+import pytest
+
+from console import cli, imagecache
+from console.client import ApiClient, ApiResponse, TransportResponse
+from console.imagecache import Fingerprint, ImageCache
+
+
+class FakeUploader:
+    """upload_post_image 호출 수를 세는 클라이언트 대역"""
+
+    def __init__(self, prediction=("Dog", 0.97), status=200):
+        self.calls = 0
+        self.prediction = prediction
+        self.status = status
+
+    def upload_post_image(self, filename, content, content_type):
+        self.calls += 1
+        if self.status != 200:
+            return ApiResponse(False, self.status, {"message": "server_error"})
+        data = {"image_url": f"/uploads/posts/{self.calls}.jpg"}
+        if self.prediction:
+            data["prediction"] = {"class_name": self.prediction[0], "confidence_score": self.prediction[1]}
+        else:
+            data["prediction_error"] = "model_unavailable"
+        return ApiResponse(True, 200, {"message": "upload_success", "data": data})
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = ImageCache(str(tmp_path / "images.sqlite"))
+    yield cache
+    cache.close()
+
+
+def encode(image, fmt="JPEG", **options):
+    buffer = io.BytesIO()
+    image.save(buffer, fmt, **options)
+    return buffer.getvalue()
+
+
+def gradient(width, height, flip=False):
+    """가로 / 세로 방향 무늬가 있는 이미지"""
+    Image = pytest.importorskip("PIL.Image")
+    image = Image.new("RGB", (width, height))
+    image.putdata([
+        ((x * 255 // width) ^ (y * 97 // height), (y * 255 // height), ((x + y) * 127 // (width + height)))
+        for y in range(height) for x in range(width)
+    ])
+    return image.transpose(Image.Transpose.FLIP_LEFT_RIGHT) if flip else image
+
+
+class TestUpload:
+    """업로드 캐시 테스트"""
+
+    def test_same_file_skips_upload(self, cache):
+        """
+        [확인] 같은 파일을 다시 올리면 요청 없이 처음 결과 사용
+        """
+        client = FakeUploader()
+        content = b"not an image but same bytes"
+
+        first = cache.upload(client, "a.jpg", content, "image/jpeg")
+        second = cache.upload(client, "b.jpg", content, "image/jpeg")
+
+        assert client.calls == 1
+        assert not imagecache.is_cached(first)
+        assert imagecache.is_cached(second)
+        assert second.data["data"]["image_url"] == first.data["data"]["image_url"]
+        assert second.data["data"]["prediction"] == {"class_name": "Dog", "confidence_score": 0.97}
+        assert cache.stats() == {"images": 1, "hits": 1}
+
+    @pytest.mark.parametrize("prediction,status", [(None, 200), (("Dog", 0.9), 500)])
+    def test_failures_not_cached(self, cache, prediction, status):
+        """
+        [실패] 분류 실패 / 업로드 실패는 저장하지 않고 다음에 다시 요청
+        """
+        client = FakeUploader(prediction, status)
+
+        cache.upload(client, "a.jpg", b"x", "image/jpeg")
+        cache.upload(client, "a.jpg", b"x", "image/jpeg")
+
+        assert client.calls == 2
+        assert len(cache) == 0
+
+    def test_persisted(self, cache):
+        """
+        [확인] 캐시 파일을 다시 열어도 저장된 결과 사용 (dHash 목록 포함)
+        """
+        cache.store(Fingerprint("a" * 64, 0x0F0F_0F0F_0F0F_0F0F), "/uploads/1.jpg", "Cat", 0.8)
+        cache.close()
+
+        reopened = ImageCache(cache.path)
+        hit = reopened.lookup(Fingerprint("b" * 64, 0x0F0F_0F0F_0F0F_0F0E))
+
+        assert hit == imagecache.CacheHit("/uploads/1.jpg", "Cat", 0.8, 1)
+        reopened.close()
+
+
+class TestNearDuplicate:
+    """거의 같은 이미지 테스트"""
+
+    def test_distance_threshold(self, cache):
+        """
+        [확인] dHash 거리가 max_distance 이하인 가장 가까운 이미지 사용, 초과하면 없음
+        Given: 저장된 dHash 2개, max_distance 5
+        """
+        base = 0x1234_5678_9ABC_DEF0
+        cache.store(Fingerprint("a" * 64, base), "/uploads/a.jpg", "Dog", 0.9)
+        cache.store(Fingerprint("b" * 64, base ^ 0b111), "/uploads/b.jpg", "Cat", 0.9)
+
+        assert cache.lookup(Fingerprint("c" * 64, base ^ 0b11)).image_url == "/uploads/b.jpg"
+        assert cache.lookup(Fingerprint("d" * 64, base ^ 0b1111_1100_0000)) is None
+
+    def test_degenerate_hash_exact_only(self, cache):
+        """
+        [확인] 비트가 모두 같은 dHash(단색 등)는 거의 같은 이미지 비교에 쓰지 않음
+        """
+        cache.store(Fingerprint("a" * 64, 0), "/uploads/white.png", "Cat", 0.5)
+
+        assert cache.lookup(Fingerprint("b" * 64, 0)) is None
+        assert cache.lookup(Fingerprint("c" * 64, 1)) is None
+        assert cache.lookup(Fingerprint("a" * 64, 0)).image_url == "/uploads/white.png"
+
+    def test_resized_and_recompressed(self, cache):
+        """
+        [확인] 크기를 줄이고 다시 압축한 사진은 캐시 결과 사용, 좌우 반전한 다른 사진은 새로 업로드
+        """
+        original = gradient(320, 240)
+        client = FakeUploader()
+
+        cache.upload(client, "a.jpg", encode(original, quality=95), "image/jpeg")
+        resized = cache.upload(client, "b.jpg", encode(original.resize((160, 120)), quality=60), "image/jpeg")
+        png = cache.upload(client, "c.png", encode(original, "PNG"), "image/png")
+        flipped = cache.upload(client, "d.jpg", encode(gradient(320, 240, flip=True)), "image/jpeg")
+
+        assert imagecache.is_cached(resized) and imagecache.is_cached(png)
+        assert not imagecache.is_cached(flipped)
+        assert client.calls == 2
+
+    def test_unreadable_image(self):
+        """
+        [실패] 이미지가 아닌 내용은 dHash 없음 (sha256만 사용)
+        """
+        pytest.importorskip("PIL")
+
+        assert imagecache.fingerprint(b"not an image").phash is None
+
+
+class TestPerformance:
+    """조회 시간 테스트"""
+
+    def test_lookup_100k(self, cache):
+        """
+        [확인] 저장된 dHash 10만 개에서 거의 같은 이미지 조회가 0.2초 안에 끝남
+        """
+        import random
+
+        rng = random.Random(0)
+        cache._hashes = [(rng.getrandbits(64), f"{i:064x}") for i in range(100_000)]
+
+        started = time.perf_counter()
+        hit = cache.lookup(Fingerprint("f" * 64, rng.getrandbits(64)))
+        elapsed = time.perf_counter() - started
+
+        assert hit is None
+        assert elapsed < 0.2
+
+
+class TestCli:
+    """CLI 테스트"""
+
+    def test_upload_with_cache(self, tmp_path):
+        """
+        [확인] --image-cache로 같은 파일을 두 번 올리면 한 번만 요청
+        """
+        calls = []
+
+        class Transport:
+            def send(self, method, url, *, params=None, json_body=None, files=None, headers=None, timeout=None):
+                calls.append(url)
+                body = {"message": "upload_success", "data": {
+                    "image_url": "/uploads/posts/1.jpg", "prediction": {"class_name": "Cat", "confidence_score": 0.9}}}
+                return TransportResponse(200, json.dumps(body).encode(), {"Content-Type": "application/json"})
+
+        client = ApiClient(transport=Transport(), urls={"backend": ["http://b1"], "model": ["http://m1"]})
+        image = tmp_path / "cat.jpg"
+        image.write_bytes(b"\xff\xd8 same bytes")
+        cache_path = str(tmp_path / "images.sqlite")
+
+        results = []
+        for _ in range(2):
+            stdout = io.StringIO()
+            code = cli.main(["--user-id", "1", "upload", str(image), "--image-cache", cache_path],
+                            client=client, stdout=stdout)
+            assert code == 0
+            results.append(json.loads(stdout.getvalue()))
+
+        assert len(calls) == 1
+        assert [result["cached"] for result in results] == [False, True]
+        assert results[1]["class_name"] == "Cat"
@@ -0,0 +1,154 @@
+"""
+백그라운드 작업 실행기 테스트 케이스
+
+테스트 대상:
+- 작업 등록 / 완료 / 실패
+- 진행 상황 보고
+- 취소
+- 결과 저장 및 재시작 후 조회
+"""
+import threading
+
+import pytest
+
+from console.jobs import CANCELLED, FAILED, SUCCEEDED, JobRunner
+
+
+@pytest.fixture
+def runner(tmp_path):
+    """임시 디렉터리에 결과를 저장하는 실행기"""
+    runner = JobRunner(max_workers=2, results_dir=str(tmp_path / "jobs"))
+    yield runner
+    runner.shutdown()
+
+
+class TestJobLifecycle:
+    """작업 실행 테스트"""
+
+    def test_job_succeeds(self, runner):
+        """
+        [성공] 작업 결과 반환
+
+        Given: 인자를 더하는 작업
+        When: 등록 후 완료 대기
+        Then: succeeded 상태와 결과
+        """
+        job_id = runner.submit("덧셈", lambda ctx, a, b: a + b, 1, 2)
+
+        job = runner.wait(job_id, timeout=5)
+
+        assert job.status == SUCCEEDED
+        assert job.result == 3
+        assert job.finished_at >= job.started_at
+
+    def test_job_fails(self, runner):
+        """
+        [실패] 예외가 나면 failed 상태와 오류 메시지
+        """
+        def fail(ctx):
+            raise RuntimeError("boom")
+
+        job = runner.wait(runner.submit("실패", fail), timeout=5)
+
+        assert job.status == FAILED
+        assert "boom" in job.error
+
+    def test_progress_reported(self, runner):
+        """
+        [확인] 진행 상황 보고
+        """
+        checkpoint = threading.Event()
+        release = threading.Event()
+
+        def work(ctx):
+            ctx.progress(done=0, total=4, message="처리 중")
+            ctx.progress(advance=3)
+            checkpoint.set()
+            release.wait(5)
+
+        job_id = runner.submit("진행", work)
+        checkpoint.wait(5)
+        job = runner.get(job_id)
+
+        assert job.done == 3
+        assert job.fraction == pytest.approx(0.75)
+        assert job.message == "처리 중"
+        release.set()
+        runner.wait(job_id, timeout=5)
+
+    def test_list_newest_first(self, runner):
+        """
+        [확인] 최근 등록한 작업부터 조회
+        """
+        first = runner.submit("첫 번째", lambda ctx: None)
+        second = runner.submit("두 번째", lambda ctx: None)
+        runner.wait(first, 5)
+        runner.wait(second, 5)
+
+        assert [job.id for job in runner.list()][:2] == [second, first]
+
+
+class TestJobCancellation:
+    """작업 취소 테스트"""
+
+    def test_cancel_running_job(self, runner):
+        """
+        [확인] 실행 중인 작업이 취소를 확인하면 cancelled
+        """
+        started = threading.Event()
+
+        def work(ctx):
+            started.set()
+            while True:
+                ctx.check_cancelled()
+                ctx.cancel_event.wait(0.01)
+
+        job_id = runner.submit("긴 작업", work)
+        started.wait(5)
+
+        assert runner.cancel(job_id) is True
+        assert runner.wait(job_id, timeout=5).status == CANCELLED
+
+    def test_cancel_finished_job(self, runner):
+        """
+        [실패] 이미 끝난 작업은 취소 불가
+        """
+        job_id = runner.submit("짧은 작업", lambda ctx: 1)
+        runner.wait(job_id, 5)
+
+        assert runner.cancel(job_id) is False
+
+    def test_cancel_unknown_job(self, runner):
+        """
+        [실패] 없는 작업 ID
+        """
+        assert runner.cancel("missing") is False
+
+
+class TestJobPersistence:
+    """결과 저장 테스트"""
+
+    def test_results_survive_restart(self, tmp_path):
+        """
+        [확인] 끝난 작업은 새 실행기에서도 조회 가능
+        """
+        results_dir = str(tmp_path / "jobs")
+        runner = JobRunner(results_dir=results_dir)
+        job_id = runner.submit("저장", lambda ctx: {"posts": 3})
+        runner.wait(job_id, 5)
+        runner.shutdown()
+
+        restarted = JobRunner(results_dir=results_dir)
+        job = restarted.get(job_id)
+        restarted.shutdown()
+
+        assert job.status == SUCCEEDED
+        assert job.result == {"posts": 3}
+
+    def test_non_json_result(self, runner):
+        """
+        [확인] JSON으로 저장할 수 없는 결과는 repr로 저장
+        """
+        job_id = runner.submit("객체", lambda ctx: object())
+
+        assert runner.wait(job_id, 5).status == SUCCEEDED
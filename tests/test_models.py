@@ -0,0 +1,179 @@
+"""
+API 응답 모델 테스트 케이스
+
+테스트 대상:
+- 녹화된 응답(카세트) 디코딩 → Post / Comment / User / Prediction / Sentiment
+- dict 호환 읽기, dict / JSON 변환
+- 게시글 목록 메모리 사용량 (dict 대비)
+- typed 클라이언트로 크롤링 / 스냅샷 저장
+"""
+import gc
+import json
+import tracemalloc
+
+import pytest
+
+from console import models, snapshot
+from console.models import Comment, Post, Prediction, Sentiment, User
+
+
+def listing(count):
+    """게시글 count개짜리 목록 응답 본문"""
+    posts = [{
+        "post_id": i, "title": f"제목 {i}", "content": f"내용 {i}", "user_id": i % 100,
+        "nickname": f"작성자{i % 100}", "image_url": None, "image_class": "Dog" if i % 2 else "Cat",
+        "like_count": i % 50, "view_count": i % 200, "comment_count": i % 7,
+        "created_at": "2024-01-01T12:00:00",
+    } for i in range(count)]
+    body = {"message": "get_posts_success", "data": {"posts": posts, "total": count, "page": 1, "limit": count}}
+    return json.dumps(body, ensure_ascii=False).encode()
+
+
+def held_bytes(decode, content):
+    """decode 결과를 들고 있는 동안의 메모리 (bytes)"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = decode(content)
+        held, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return held
+
+
+class TestDecode:
+    """디코딩 테스트"""
+
+    def test_posts_listing(self, replay_client):
+        """
+        [확인] 게시글 목록의 각 항목은 Post, 나머지 구조(total 등)는 dict
+        """
+        response = replay_client("posts").typed().get_posts(1, 10)
+
+        data = response.data["data"]
+        assert data["total"] == 2
+        assert all(isinstance(post, Post) for post in data["posts"])
+        assert data["posts"][1].image_class == "Dog"
+        assert data["posts"][0].get("like_count") == 5
+
+    def test_comments_with_sentiment(self, replay_client):
+        """
+        [확인] 댓글은 Comment, 댓글의 sentiment는 Sentiment
+        """
+        response = replay_client("comments").typed().get_comments(1)
+
+        comment = response.data["data"]["comments"][0]
+        assert isinstance(comment, Comment)
+        assert isinstance(comment.sentiment, Sentiment)
+        assert comment.sentiment.label == "positive"
+
+    def test_user_and_prediction(self, replay_client):
+        """
+        [확인] 로그인 응답은 User, 업로드 응답의 prediction은 Prediction
+        """
+        login = replay_client("auth").typed().login("testuser@example.com", "TestPassword123!@#")
+        upload = replay_client("posts", mode="template", user_id=1).typed().upload_post_image(
+            "dog.jpg", b"\x00" * 64, "image/jpeg")
+
+        assert login.data["data"] == User(1, "테스트유저", "/uploads/profile/1.png")
+        assert upload.data["data"]["prediction"] == Prediction("Dog", 0.97)
+
+    def test_untyped_client_unchanged(self, replay_client):
+        """
+        [확인] typed()를 쓰지 않으면 기존처럼 dict
+        """
+        client = replay_client("posts")
+        client.typed()
+
+        assert isinstance(client.get_posts(1, 10).data["data"]["posts"][0], dict)
+
+    def test_invalid_body(self):
+        """
+        [실패] JSON이 아닌 본문은 None
+        """
+        assert models.decode(b"<html>") is None
+        assert models.decode(b"") is None
+
+
+class TestModel:
+    """모델 동작 테스트"""
+
+    def test_dict_compatible_reads(self):
+        """
+        [확인] get / [] / in / dict()가 dict와 같게 동작 (값이 None인 필드 포함)
+        """
+        post = Post.from_dict({"post_id": 1, "title": "t", "image_url": None})
+
+        assert post.get("image_url", "x") is None
+        assert post.get("unknown", "x") == "x"
+        assert post["title"] == "t"
+        assert "nickname" in post and "unknown" not in post
+        assert dict(post)["post_id"] == 1
+        with pytest.raises(KeyError):
+            post["unknown"]
+
+    def test_round_trip(self):
+        """
+        [확인] dict → 모델 → dict (중첩 sentiment 포함, 알 수 없는 필드는 버림)
+        """
+        data = {"comment_id": 1, "content": "c", "author_id": 2, "author_nickname": "n",
+                "created_at": "2024-01-01T00:00:00", "sentiment": {"label": "neutral", "confidence": 0.5},
+                "post_id": 3}
+
+        comment = Comment.from_dict({**data, "extra": True})
+
+        assert comment.to_dict() == data
+        assert json.loads(json.dumps(comment, default=models.to_json)) == data
+
+    def test_no_instance_dict(self):
+        """
+        [확인] 인스턴스 dict가 없고 반복 문자열은 공유
+        """
+        first = models.decode(listing(4))["data"]["posts"]
+
+        assert not hasattr(first[0], "__dict__")
+        assert first[0].nickname is models.decode(listing(4))["data"]["posts"][0].nickname
+
+    def test_to_json_rejects_other_objects(self):
+        """
+        [실패] 모델이 아닌 객체는 TypeError (json.dump 기본 동작과 같음)
+        """
+        with pytest.raises(TypeError):
+            json.dumps({"x": object()}, default=models.to_json)
+
+
+class TestMemory:
+    """메모리 사용량 테스트"""
+
+    def test_listing_uses_less_memory(self):
+        """
+        [확인] 게시글 2만 개 목록을 모델로 들고 있으면 dict의 60% 미만
+        """
+        content = listing(20_000)
+
+        as_dicts = held_bytes(json.loads, content)
+        as_models = held_bytes(models.decode, content)
+
+        assert as_models < as_dicts * 0.6
+
+
+class TestTypedCrawl:
+    """typed 클라이언트 크롤링 테스트"""
+
+    def test_crawl_and_save(self, standin_client, tmp_path):
+        """
+        [확인] typed 클라이언트 크롤링 결과는 모델이고, 저장한 스냅샷은 dict 크롤링과 같음
+        """
+        client = standin_client(posts=30, comments_mean=2.0)
+
+        typed = snapshot.crawl(client.typed(), page_size=10)
+        plain = snapshot.crawl(client, page_size=10)
+        path = snapshot.save(typed, str(tmp_path / "typed.json"))
+
+        assert isinstance(typed["posts"][0], Post)
+        assert all(isinstance(comment, Comment) and comment.post_id for comment in typed["comments"])
+        loaded = snapshot.load(path)
+        assert loaded["posts"] == plain["posts"]
+        assert sorted(loaded["comments"], key=lambda c: c["comment_id"]) == \
+            sorted(plain["comments"], key=lambda c: c["comment_id"])
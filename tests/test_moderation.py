@@ -0,0 +1,208 @@
+"""
+대량 모더레이션 테스트 케이스
+
+테스트 대상:
+- 조건(작성자 / 감성 라벨 / 키워드) 매칭
+- 대상 선택 (삭제할 게시글의 댓글 제외)
+- 삭제 / 수정 요청 URL
+- 항목별 부분 실패 보고 / 취소
+"""
+import threading
+
+import pytest
+
+from console import moderation
+from console.client import ApiClient
+from console.moderation import ModerationFilter
+
+
+BACKEND = "http://b1/api"
+
+
+@pytest.fixture
+def client(fake_transport):
+    return ApiClient(transport=fake_transport, urls={"backend": ["http://b1"], "model": ["http://m1"]})
+
+
+@pytest.fixture
+def board():
+    return {
+        "taken_at": 0.0,
+        "posts": [
+            {"post_id": 1, "title": "광고 글", "content": "싸게 팝니다", "nickname": "spammer",
+             "sentiment": {"label": "neutral"}},
+            {"post_id": 2, "title": "일상", "content": "좋은 하루", "nickname": "user",
+             "sentiment": {"label": "positive"}},
+        ],
+        "comments": [
+            {"comment_id": 10, "post_id": 1, "content": "광고 댓글", "nickname": "spammer"},
+            {"comment_id": 20, "post_id": 2, "content": "최악이에요", "nickname": "troll",
+             "sentiment": {"label": "negative"}},
+            {"comment_id": 21, "post_id": 2, "content": "광고 링크", "nickname": "spammer"},
+        ],
+        "errors": [],
+    }
+
+
+class TestModerationFilter:
+    """조건 매칭 테스트"""
+
+    def test_matches_author(self):
+        """
+        [확인] 작성자 닉네임 일치 (nickname / author_nickname)
+        """
+        flt = ModerationFilter(author="spammer")
+
+        assert flt.matches({"nickname": "spammer"})
+        assert flt.matches({"author_nickname": "spammer"})
+        assert not flt.matches({"nickname": "user"})
+
+    def test_matches_sentiment_and_keyword(self):
+        """
+        [확인] 감성 라벨 + 키워드(대소문자 무시) 모두 만족해야 일치
+        """
+        flt = ModerationFilter(sentiment="negative", keyword="SPAM")
+
+        assert flt.matches({"content": "this is spam", "sentiment": {"label": "negative"}})
+        assert not flt.matches({"content": "this is spam", "sentiment": {"label": "positive"}})
+        assert not flt.matches({"content": "hello", "sentiment": {"label": "negative"}})
+        assert not flt.matches({"content": "spam"})
+
+
+class TestSelect:
+    """대상 선택 테스트"""
+
+    def test_empty_filter_selects_nothing(self, board):
+        """
+        [확인] 조건이 없으면 아무것도 선택하지 않음 (전체 삭제 방지)
+        """
+        assert moderation.select(board, ModerationFilter()) == []
+
+    def test_skips_comments_of_deleted_posts(self, board):
+        """
+        [확인] 선택된 게시글에 속한 댓글은 대상에서 제외
+        """
+        targets = moderation.select(board, ModerationFilter(author="spammer"))
+
+        assert [(t.kind, t.post_id, t.comment_id) for t in targets] == [
+            ("posts", 1, None),
+            ("comments", 2, 21),
+        ]
+
+    def test_edit_keeps_comments_of_matched_posts(self, board):
+        """
+        [확인] 수정 작업은 게시글이 남으므로 선택된 게시글에 속한 댓글도 대상
+        """
+        targets = moderation.select(board, ModerationFilter(author="spammer"), moderation.EDIT)
+
+        assert [(t.kind, t.post_id, t.comment_id) for t in targets] == [
+            ("posts", 1, None),
+            ("comments", 1, 10),
+            ("comments", 2, 21),
+        ]
+
+    def test_target_comments_only(self, board):
+        """
+        [확인] 댓글만 대상으로 지정하면 게시글은 선택하지 않음
+        """
+        targets = moderation.select(board, ModerationFilter(keyword="광고", target=moderation.COMMENTS))
+
+        assert [(t.kind, t.comment_id) for t in targets] == [("comments", 10), ("comments", 21)]
+
+
+class TestRun:
+    """일괄 처리 테스트"""
+
+    def test_delete_requests(self, client, board, fake_transport):
+        """
+        [성공] 게시글 / 댓글 삭제 요청 URL
+        """
+        fake_transport.add("DELETE", f"{BACKEND}/posts/1", status=204)
+        fake_transport.add("DELETE", f"{BACKEND}/posts/2/comments/21", status=204)
+        targets = moderation.select(board, ModerationFilter(author="spammer"))
+
+        result = moderation.run(client, targets, moderation.DELETE, workers=2)
+
+        assert result["succeeded"] == 2
+        assert result["failed"] == 0
+        urls = sorted(c["url"] for c in fake_transport.calls if c["method"] == "DELETE")
+        assert urls == [f"{BACKEND}/posts/1", f"{BACKEND}/posts/2/comments/21"]
+
+    def test_edit_requests(self, client, board, fake_transport):
+        """
+        [성공] 수정 작업은 내용을 대체 문구로 PATCH (게시글이 남으므로 그 아래 댓글도 수정)
+        """
+        fake_transport.add("PATCH", f"{BACKEND}/posts/1", body={"message": "ok"})
+        fake_transport.add("PATCH", f"{BACKEND}/posts/1/comments/10", body={"message": "ok"})
+        fake_transport.add("PATCH", f"{BACKEND}/posts/2/comments/21", body={"message": "ok"})
+        targets = moderation.select(board, ModerationFilter(author="spammer"), moderation.EDIT)
+
+        result = moderation.run(client, targets, moderation.EDIT, replacement="숨김", workers=2)
+
+        assert result["succeeded"] == 3
+        patches = {c["url"]: c["json"] for c in fake_transport.calls if c["method"] == "PATCH"}
+        assert patches[f"{BACKEND}/posts/1"]["content"] == "숨김"
+        assert patches[f"{BACKEND}/posts/1"]["title"] == "광고 글"
+        assert patches[f"{BACKEND}/posts/1/comments/10"]["content"] == "숨김"
+        assert patches[f"{BACKEND}/posts/2/comments/21"]["content"] == "숨김"
+
+    def test_partial_failure_reported_per_item(self, client, board, fake_transport):
+        """
+        [실패] 일부 항목 실패 시 나머지는 계속 처리, 항목별 상태 / 오류 기록
+        Given: 게시글 삭제는 403, 댓글 삭제는 전송 오류
+        """
+        fake_transport.add("DELETE", f"{BACKEND}/posts/1", status=403, body={"message": "forbidden"})
+        fake_transport.add("DELETE", f"{BACKEND}/posts/2/comments/21", error="connection reset")
+        fake_transport.add("DELETE", f"{BACKEND}/posts/1/comments/10", status=204)
+        targets = moderation.select(board, ModerationFilter(author="spammer", target=moderation.COMMENTS))
+        targets = moderation.select(board, ModerationFilter(author="spammer", target=moderation.POSTS)) + targets
+
+        result = moderation.run(client, targets, moderation.DELETE, workers=2)
+
+        assert (result["succeeded"], result["failed"], result["skipped"]) == (1, 2, 0)
+        items = {(i["post_id"], i["comment_id"]): i for i in result["items"]}
+        assert items[(1, None)]["http_status"] == 403
+        assert items[(1, None)]["error"] == "forbidden"
+        assert items[(2, 21)]["status"] == "failed"
+        assert items[(2, 21)]["http_status"] == 0
+        assert items[(1, 10)]["status"] == "succeeded"
+
+    def test_cancelled_items_skipped(self, client, board):
+        """
+        [확인] 시작 전에 취소되면 모든 항목 skipped
+        """
+        cancel = threading.Event()
+        cancel.set()
+        targets = moderation.select(board, ModerationFilter(author="spammer"))
+
+        result = moderation.run(client, targets, moderation.DELETE, cancel=cancel)
+
+        assert result["skipped"] == len(targets)
+        assert all(item["status"] == "skipped" for item in result["items"])
+
+    def test_progress_reported(self, client, board, fake_transport):
+        """
+        [확인] 전체 개수와 처리 개수 보고
+        """
+        fake_transport.add("DELETE", f"{BACKEND}/posts/1", status=204)
+        fake_transport.add("DELETE", f"{BACKEND}/posts/2/comments/21", status=204)
+        state = {"done": 0, "total": None}
+
+        def progress(done=None, total=None, message=None, advance=0):
+            if total is not None:
+                state["total"] = total
+            if done is not None:
+                state["done"] = done
+            state["done"] += advance
+
+        targets = moderation.select(board, ModerationFilter(author="spammer"))
+        moderation.run(client, targets, moderation.DELETE, progress=progress)
+
+        assert state == {"done": 2, "total": 2}
+
+    def test_unknown_action(self, client):
+        """
+        [실패] 지원하지 않는 작업은 ValueError
+        """
+        with pytest.raises(ValueError):
+            moderation.run(client, [], "ban")
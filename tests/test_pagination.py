@@ -0,0 +1,153 @@
+"""
+페이지 깊이 프로파일러 테스트 케이스
+
+테스트 대상:
+- 로그 간격 페이지 선택
+- 대역(standin) 위에서 limit별 측정, 응답 크기 기록
+- 니 판정 / 선형 회귀
+- CLI paginate
+"""
+import io
+import json
+import time
+
+import pytest
+
+from console import cli, pagination
+from console.pagination import DepthPoint
+
+
+def point(offset, latency_ms, limit=10, status=200):
+    return DepthPoint(limit, offset // limit + 1, offset, latency_ms, latency_ms, 100, limit, status)
+
+
+class OffsetCostTransport:
+    """오프셋에 비례해 느려지는 목록 조회 (O(offset) Backend 흉내)"""
+
+    def __init__(self, inner, seconds_per_row):
+        self.inner = inner
+        self.seconds_per_row = seconds_per_row
+
+    def send(self, method, url, *, params=None, **kwargs):
+        if params:
+            time.sleep((params["page"] - 1) * params["limit"] * self.seconds_per_row)
+        return self.inner.send(method, url, params=params, **kwargs)
+
+
+class TestSweep:
+    """측정 테스트"""
+
+    def test_log_pages(self):
+        """
+        [확인] 첫 / 마지막 페이지를 포함한 로그 간격
+        """
+        pages = pagination.log_pages(1000, 4)
+
+        assert pages == [1, 10, 100, 1000]
+        assert pagination.log_pages(1) == [1]
+
+    def test_sweep_covers_each_limit(self, standin_client):
+        """
+        [확인] limit별로 마지막 페이지까지 측정하고 응답 크기 / 항목 수 기록
+        Given: 게시글 200개
+        When: limit 10, 100 / 페이지 5개
+        Then: limit 100은 1~2페이지, 마지막 페이지 항목 수는 나머지 개수
+        """
+        client = standin_client(posts=200)
+        progress = []
+
+        points = pagination.sweep(client, [10, 100], points=5, samples=1,
+                                  progress=lambda **kw: progress.append(kw))
+
+        assert [(p.limit, p.page) for p in points if p.limit == 100] == [(100, 1), (100, 2)]
+        assert max(p.page for p in points if p.limit == 10) == 20
+        assert all(p.status == 200 and p.bytes > 0 for p in points)
+        assert progress[0] == {"done": 0, "total": len(points), "message": "페이지 깊이 측정 중"}
+
+    def test_rejects_limit_out_of_range(self, standin_client):
+        """
+        [실패] Streamlit 입력 범위(1~100) 밖의 limit
+        """
+        with pytest.raises(ValueError):
+            pagination.sweep(standin_client(posts=5), [0, 101])
+
+    def test_detects_offset_cost(self, standin_client):
+        """
+        [확인] 오프셋 비례 지연이 있으면 니와 양의 기울기 검출
+        """
+        client = standin_client(posts=2000)
+        client.transport = OffsetCostTransport(client.transport, 2e-6)
+
+        points = pagination.sweep(client, [100], points=6, samples=1)
+        knee = pagination.analyze(points)[0]
+
+        assert knee.knee_page is not None
+        assert knee.ms_per_1k_rows > 1
+        assert knee.slowdown > 2
+
+
+class TestAnalyze:
+    """분석 테스트"""
+
+    def test_knee_is_start_of_sustained_slowdown(self):
+        """
+        [확인] 한 번 튄 값은 무시하고, 이후 계속 기준의 2배 이상인 첫 지점이 니
+        """
+        points = [point(0, 10), point(100, 25), point(1000, 11), point(10000, 22), point(100000, 90)]
+
+        knee = pagination.find_knee(points)
+
+        assert knee.knee_offset == 10000
+        assert knee.slowdown == 9.0
+
+    def test_flat_has_no_knee(self):
+        """
+        [확인] 깊이와 무관한 지연 시간이면 니 없음
+        """
+        knee = pagination.find_knee([point(o, 10 + (o % 3) * 0.1) for o in (0, 10, 100, 1000, 10000)])
+
+        assert knee.knee_page is None
+        assert abs(knee.ms_per_1k_rows) < 0.01
+
+    def test_linear_fit(self):
+        """
+        [확인] 직선 데이터의 기울기 / R²
+        """
+        intercept, slope, r2 = pagination.linear_fit([0, 1, 2, 3], [1, 3, 5, 7])
+
+        assert (intercept, slope, r2) == (1.0, 2.0, 1.0)
+
+    def test_failed_points_ignored(self):
+        """
+        [실패] 실패한 측정만 있는 limit는 분석 결과에서 제외
+        """
+        assert pagination.analyze([point(0, 5, status=500)]) == []
+
+    def test_chart_data(self):
+        """
+        [확인] limit별 열, 오프셋별 값
+        """
+        data = pagination.chart_data([point(10, 2.0), point(0, 1.0), point(0, 3.0, limit=5)])
+
+        assert data == {"limit=5": {0: 3.0}, "limit=10": {0: 1.0, 10: 2.0}}
+
+
+class TestCli:
+    """CLI 테스트"""
+
+    def test_paginate(self, tmp_path):
+        """
+        [확인] paginate - 측정 지점과 limit별 분석 출력
+        """
+        path = str(tmp_path / "board.db")
+        assert cli.main(["dataset", "--sqlite", path, "--posts", "300", "--users", "10"],
+                        stdout=io.StringIO()) == 0
+        stdout = io.StringIO()
+
+        code = cli.main(["--standin", path, "--format", "ndjson", "paginate", "--limits", "10", "50",
+                         "--points", "4", "--samples", "1"], stdout=stdout)
+
+        records = [json.loads(line) for line in stdout.getvalue().splitlines()]
+        assert code == 0
+        assert {r["limit"] for r in records if r["kind"] == "knee"} == {10, 50}
+        assert max(r["page"] for r in records if r["kind"] == "point" and r["limit"] == 10) == 30
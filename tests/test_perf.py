@@ -0,0 +1,107 @@
+"""
+흐름 성능 측정 / 회귀 판정 테스트 케이스
+
+테스트 대상:
+- 요청 수 집계 (CountingTransport)
+- 측정 (시간, 처리량, 메모리 할당)
+- 기준값 비교 (허용 증가율, 절대 여유값)
+- 기준값 저장 / 로드
+"""
+from console import perf
+
+
+def measurement(**overrides):
+    values = {"name": "flow", "wall_ms": 10.0, "ops_per_sec": 100.0, "requests": 2, "alloc_kb": 100.0, "runs": 5}
+    values.update(overrides)
+    return perf.FlowMeasurement(**values)
+
+
+class TestMeasure:
+    """측정 테스트"""
+
+    def test_counts_requests_per_run(self, fake_transport):
+        """
+        [확인] 요청 수는 반복 실행 한 번 기준
+        """
+        counter = perf.CountingTransport(fake_transport)
+
+        result = perf.measure_flow("two", lambda: [counter.send("GET", "http://b1/"),
+                                                   counter.send("GET", "http://b1/")], counter, repeat=3)
+
+        assert result.requests == 2
+        assert result.runs == 3
+        assert counter.by_endpoint == {"GET http://b1/": 2}
+
+    def test_measures_allocations(self):
+        """
+        [확인] 흐름 안의 메모리 할당 측정
+        """
+        result = perf.measure_flow("alloc", lambda: bytearray(512 * 1024), repeat=1)
+
+        assert result.alloc_kb >= 500
+        assert result.wall_ms >= 0
+        assert result.ops_per_sec > 0
+
+
+class TestCompare:
+    """기준값 비교 테스트"""
+
+    def test_no_baseline(self):
+        """
+        [확인] 기준값이 없으면 회귀 없음
+        """
+        assert perf.compare(measurement(), None) == []
+
+    def test_request_increase_is_regression(self):
+        """
+        [실패] 요청 수는 하나만 늘어도 회귀
+        """
+        regressions = perf.compare(measurement(requests=3), {"requests": 2})
+
+        assert len(regressions) == 1
+        assert "requests" in regressions[0]
+
+    def test_wall_within_tolerance(self):
+        """
+        [확인] 허용 증가율 / 절대 여유값 안의 시간 증가는 통과
+        """
+        assert perf.compare(measurement(wall_ms=19.0), {"wall_ms": 10.0}) == []
+        assert perf.compare(measurement(wall_ms=4.0), {"wall_ms": 0.1}) == []
+
+    def test_wall_regression(self):
+        """
+        [실패] 허용 증가율을 넘는 시간 증가는 회귀
+        """
+        regressions = perf.compare(measurement(wall_ms=30.0), {"wall_ms": 10.0}, {"wall_ms": 0.5})
+
+        assert len(regressions) == 1
+        assert "wall_ms" in regressions[0]
+
+    def test_alloc_regression(self):
+        """
+        [실패] 메모리 할당 증가율 초과
+        """
+        assert perf.compare(measurement(alloc_kb=200.0), {"alloc_kb": 100.0})
+
+
+class TestBaselineFile:
+    """기준값 파일 테스트"""
+
+    def test_save_merges_with_existing(self, tmp_path):
+        """
+        [확인] 저장 시 기존 흐름 기준값은 유지하고 측정한 흐름만 갱신
+        """
+        path = str(tmp_path / "baseline.json")
+        perf.save_baseline(path, [measurement(name="a"), measurement(name="b")])
+        perf.save_baseline(path, [measurement(name="b", requests=5)])
+
+        flows = perf.load_baseline(path)
+
+        assert set(flows) == {"a", "b"}
+        assert flows["b"]["requests"] == 5
+
+    def test_missing_file(self, tmp_path):
+        """
+        [확인] 기준값 파일이 없으면 빈 dict
+        """
+        assert perf.load_baseline(str(tmp_path / "missing.json")) == {}
@@ -0,0 +1,104 @@
+"""
+성능 회귀 게이트 - 주요 사용자 흐름
+
+녹화된 카세트(tests/cassettes/flows.json)를 재생하는 ApiClient로
+프론트엔드(js/posts.js, js/auth.js)와 같은 순서의 요청을 보내고,
+흐름별 시간 / 요청 수 / 메모리 할당을 tests/perf_baseline.json과 비교합니다.
+
+기준값 갱신: python -m pytest -m perf --perf-update
+"""
+import pytest
+
+from console import perf
+from console.cassette import TEMPLATE
+
+
+pytestmark = pytest.mark.perf
+
+
+@pytest.fixture
+def flow_client(replay_client):
+    """요청 수를 세는 카세트 재생 클라이언트"""
+    client = replay_client("flows", mode=TEMPLATE, user_id=1)
+    client.transport = perf.CountingTransport(client.transport)
+    return client
+
+
+class TestCriticalFlows:
+    """주요 흐름 성능 테스트"""
+
+    def test_login(self, perf_flow, flow_client, test_user_credentials):
+        """
+        [확인] 로그인: 요청 1회
+
+        Given: 로그인 성공 카세트
+        When: 로그인 흐름 측정
+        Then: 기준값 대비 회귀 없음
+        """
+        def flow():
+            response = flow_client.login(test_user_credentials["email"], test_user_credentials["password"])
+            assert response.data["message"] == "login_success"
+
+        measurement = perf_flow("login", flow, flow_client.transport)
+
+        assert measurement.requests == 1
+
+    def test_list_posts(self, perf_flow, flow_client):
+        """
+        [확인] 게시글 목록: 요청 1회 (js/posts.js loadPosts)
+        """
+        def flow():
+            response = flow_client.get_posts(1, 20)
+            assert response.ok
+
+        measurement = perf_flow("list_posts", flow, flow_client.transport)
+
+        assert measurement.requests == 1
+
+    def test_view_post(self, perf_flow, flow_client):
+        """
+        [확인] 게시글 상세: 조회수 증가 + 상세 조회 (js/posts.js viewPost)
+        """
+        def flow():
+            flow_client.increment_view_count(1)
+            response = flow_client.get_post(1)
+            assert response.ok
+
+        measurement = perf_flow("view_post", flow, flow_client.transport)
+
+        assert measurement.requests == 2
+
+    def test_comment(self, perf_flow, flow_client, test_comment_data):
+        """
+        [확인] 댓글 작성: 작성 후 게시글 다시 로드 (js/posts.js submitComment)
+        """
+        def flow():
+            response = flow_client.create_comment(1, test_comment_data["content"])
+            assert response.status == 201
+            flow_client.increment_view_count(1)
+            flow_client.get_post(1)
+
+        measurement = perf_flow("comment", flow, flow_client.transport)
+
+        assert measurement.requests == 3
+
+    def test_upload_and_post(self, perf_flow, flow_client, test_post_data):
+        """
+        [확인] 이미지 업로드(분류) 후 게시글 작성 (js/posts.js)
+        """
+        image = b"\xff\xd8\xff" + b"0" * 4096
+
+        def flow():
+            upload = flow_client.upload_post_image("dog.jpg", image, "image/jpeg")
+            data = upload.data["data"]
+            response = flow_client.create_post(
+                test_post_data["title"],
+                test_post_data["content"],
+                image_url=data["image_url"],
+                image_class=data["prediction"]["class_name"],
+            )
+            assert response.status == 201
+
+        measurement = perf_flow("upload", flow, flow_client.transport)
+
+        assert measurement.requests == 2
@@ -285,3 +285,52 @@ class TestPagination:
         assert "page" in pagination
         assert "limit" in pagination
         assert "total" in pagination
+
+
+class TestPostApiReplay:
+    """녹화된 카세트로 ApiClient 게시글 API 재생 테스트"""
+
+    def test_get_posts(self, replay_client):
+        """[성공] 게시글 목록 조회"""
+        response = replay_client("posts", user_id=1).get_posts(1, 10)
+
+        assert response.ok
+        assert response.data["message"] == "get_posts_success"
+        assert [post["post_id"] for post in response.data["data"]["posts"]] == [1, 2]
+
+    def test_get_post_not_found(self, replay_client):
+        """[실패] 없는 게시글은 404"""
+        response = replay_client("posts", user_id=1).get_post(999)
+
+        assert not response.ok
+        assert response.status == 404
+        assert response.data["message"] == "post_not_found"
+
+    def test_create_post(self, replay_client):
+        """[성공] 게시글 작성은 201과 새 post_id"""
+        response = replay_client("posts", user_id=1).create_post("새 게시글", "새 게시글 내용")
+
+        assert response.status == 201
+        assert response.data["data"]["post_id"] == 3
+
+    def test_update_other_users_post_forbidden(self, replay_client):
+        """[실패] 다른 사용자의 게시글 수정은 403"""
+        response = replay_client("posts", user_id=1).update_post(2, "수정 제목", "수정 내용")
+
+        assert response.status == 403
+
+    def test_like_template_match(self, replay_client):
+        """[확인] template 방식은 다른 게시글 ID에도 녹화된 응답을 재생"""
+        response = replay_client("posts", mode="template", user_id=1).toggle_like(42)
+
+        assert response.ok
+        assert response.data["data"]["liked"] is True
+
+    def test_upload_classification(self, replay_client):
+        """[성공] 이미지 업로드 응답에 분류 결과 포함"""
+        response = replay_client("posts", mode="template", user_id=1).upload_post_image(
+            "cat.jpg", b"\xff\xd8\xff", "image/jpeg")
+
+        prediction = response.data["data"]["prediction"]
+        assert prediction["class_name"] == "Dog"
+        assert 0 <= prediction["confidence_score"] <= 1
@@ -0,0 +1,188 @@
+"""
+rerun 프로파일러 테스트 케이스
+
+테스트 대상:
+- 구간별 네트워크 / 이미지 / 렌더링 시간 분해
+- 최근 N회 이력 유지
+- cProfile 통계 저장
+- 비활성화 시 측정 무시
+- fragment 데코레이터 (fragment rerun 별도 측정, 전체 rerun 안에서는 구간)
+"""
+import pstats
+import time
+
+import pytest
+
+from console.profiling import IMAGE, NETWORK, ProfilingTransport, RerunProfiler
+
+
+def run_once(profiler, network=0.0, image=0.0):
+    """가짜 rerun 한 번 실행"""
+    profiler.begin()
+    with profiler.section("게시글"):
+        profiler.record(NETWORK, network)
+        with profiler.measure(IMAGE):
+            time.sleep(image)
+    return profiler.end()
+
+
+class TestRerunBreakdown:
+    """시간 분해 테스트"""
+
+    def test_breakdown_by_category(self):
+        """
+        [확인] 구간 시간을 네트워크 / 이미지 / 렌더링으로 분해
+        """
+        profiler = RerunProfiler(use_cprofile=False)
+
+        profile = run_once(profiler, network=0.0, image=0.01)
+        row = profile.breakdown()[0]
+
+        assert row["section"] == "게시글"
+        assert row["image_ms"] >= 10
+        assert row["total_ms"] >= row["image_ms"]
+        assert row["render_ms"] == pytest.approx(row["total_ms"] - row["network_ms"] - row["image_ms"])
+
+    def test_network_from_transport(self, fake_transport):
+        """
+        [확인] ProfilingTransport가 요청 시간과 요청 수 기록
+        """
+        profiler = RerunProfiler(use_cprofile=False)
+        transport = ProfilingTransport(fake_transport, profiler)
+        fake_transport.add("GET", "http://b1/api/posts", body={}, delay=0.01)
+
+        profiler.begin()
+        with profiler.section("게시글"):
+            transport.send("GET", "http://b1/api/posts")
+        profile = profiler.end()
+
+        assert profile.requests == 1
+        assert profile.breakdown()[0]["network_ms"] >= 10
+
+    def test_record_outside_section(self):
+        """
+        [확인] 구간 밖 측정값은 (기타) 구간으로 기록
+        """
+        profiler = RerunProfiler(use_cprofile=False)
+        profiler.begin()
+        profiler.record(NETWORK, 0.5)
+        profile = profiler.end()
+
+        assert "(기타)" in profile.sections
+
+    def test_disabled_profiler_ignores(self):
+        """
+        [확인] 비활성화 상태에서는 기록하지 않음
+        """
+        profiler = RerunProfiler(enabled=False)
+
+        assert run_once(profiler) is None
+        assert len(profiler.history) == 0
+
+
+class TestRerunHistory:
+    """이력 / 캡처 테스트"""
+
+    def test_keeps_last_n(self):
+        """
+        [확인] 최근 keep회만 유지
+        """
+        profiler = RerunProfiler(keep=3, use_cprofile=False)
+        for _ in range(5):
+            run_once(profiler)
+
+        assert len(profiler.history) == 3
+
+    def test_dump_stats(self, tmp_path):
+        """
+        [확인] 최근 rerun들의 cProfile 통계를 pstats 파일로 저장
+        """
+        profiler = RerunProfiler(keep=2)
+        for _ in range(3):
+            run_once(profiler)
+        path = tmp_path / "console.pstats"
+
+        captured = profiler.dump_stats(str(path))
+
+        assert captured == 2
+        assert pstats.Stats(str(path)).total_calls > 0
+
+    def test_dump_without_stats(self, tmp_path):
+        """
+        [확인] cProfile 통계가 없으면 저장하지 않음
+        """
+        profiler = RerunProfiler(use_cprofile=False)
+        run_once(profiler)
+
+        assert profiler.dump_stats(str(tmp_path / "x.pstats")) == 0
+        assert not (tmp_path / "x.pstats").exists()
+
+    def test_unfinished_rerun_discarded(self):
+        """
+        [확인] end() 없이 다시 begin()하면 이전 rerun은 버리고 새로 측정
+        """
+        profiler = RerunProfiler(keep=5)
+        profiler.begin()
+        profiler.begin()
+        profiler.end()
+
+        assert len(profiler.history) == 1
+
+
+class TestFragment:
+    """fragment rerun 측정 테스트"""
+
+    def test_fragment_rerun_profiled(self, fake_transport):
+        """
+        [확인] fragment만 다시 실행되면 별도 rerun으로 측정하고 fragment_history에 보관
+        Given: 전체 rerun이 끝난 뒤 fragment 함수 호출 (요청 1건)
+        """
+        profiler = RerunProfiler(use_cprofile=False)
+        transport = ProfilingTransport(fake_transport, profiler)
+        fake_transport.add("GET", "http://b1/api/jobs", body={})
+
+        @profiler.fragment("작업 목록")
+        def jobs_fragment():
+            transport.send("GET", "http://b1/api/jobs")
+            return "rendered"
+
+        run_once(profiler)
+        assert jobs_fragment() == "rendered"
+
+        [profile] = profiler.fragment_history
+        assert profile.fragment == "작업 목록"
+        assert profile.requests == 1
+        assert [row["section"] for row in profile.breakdown()] == ["작업 목록"]
+        assert len(profiler.history) == 1
+        assert profiler.current is None
+
+    def test_inside_full_rerun_is_section(self):
+        """
+        [확인] 전체 rerun의 구간 안에서 호출되면 새 rerun 없이 중첩 구간으로 측정
+        """
+        profiler = RerunProfiler(use_cprofile=False)
+        fragment = profiler.fragment("좋아요")(lambda: None)
+
+        profiler.begin()
+        with profiler.section("게시글"):
+            fragment()
+        profile = profiler.end()
+
+        assert {row["section"] for row in profile.breakdown()} == {"게시글", "좋아요"}
+        assert not profiler.fragment_history
+
+    def test_fragment_error_ends_rerun(self):
+        """
+        [실패] fragment 함수가 예외를 던져도 측정은 종료
+        """
+        profiler = RerunProfiler(use_cprofile=False)
+
+        @profiler.fragment("댓글")
+        def broken():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            broken()
+
+        assert profiler.current is None
+        assert len(profiler.fragment_history) == 1
@@ -0,0 +1,173 @@
+"""
+우선순위 토큰 버킷 테스트 케이스
+
+테스트 대상:
+- 충전 속도 / 버스트
+- INTERACTIVE 우선 처리, BATCH 대기 (버리지 않음)
+- 429 응답 시 발급 중지
+- 클라이언트 Gemini 호출 연동
+"""
+import threading
+import time
+
+import pytest
+
+from console.client import ApiClient, retry_after
+from console.ratelimit import BATCH, INTERACTIVE, PriorityTokenBucket
+
+
+class TestTokenBucket:
+    """토큰 버킷 기본 동작 테스트"""
+
+    def test_invalid_rate(self):
+        """
+        [실패] rate는 0보다 커야 함
+        """
+        with pytest.raises(ValueError):
+            PriorityTokenBucket(rate=0)
+
+    def test_burst_available_immediately(self):
+        """
+        [확인] 버스트만큼은 즉시 발급
+        """
+        bucket = PriorityTokenBucket(rate=1, burst=3)
+
+        assert all(bucket.acquire(timeout=0) for _ in range(3))
+        assert bucket.acquire(timeout=0) is False
+
+    def test_refill_rate(self):
+        """
+        [확인] 초당 rate개씩 충전
+        """
+        bucket = PriorityTokenBucket(rate=50, burst=1)
+        bucket.acquire()
+
+        started = time.perf_counter()
+        bucket.acquire()
+
+        assert 0.01 < time.perf_counter() - started < 0.2
+
+    def test_pause_blocks_grants(self):
+        """
+        [확인] pause 동안 발급 중지
+        """
+        bucket = PriorityTokenBucket(rate=1000, burst=10)
+
+        bucket.pause(0.05)
+
+        assert bucket.acquire(timeout=0.01) is False
+        assert bucket.acquire(timeout=0.2) is True
+
+
+class TestPriorityQueue:
+    """우선순위 대기열 테스트"""
+
+    def test_interactive_jumps_ahead_of_batch(self):
+        """
+        [확인] 대기 중인 BATCH보다 나중에 온 INTERACTIVE가 먼저 토큰을 받음
+
+        Given: 토큰 소진, BATCH 3개 대기
+        When: INTERACTIVE 요청 도착
+        Then: INTERACTIVE가 BATCH보다 먼저 발급됨
+        """
+        bucket = PriorityTokenBucket(rate=20, burst=1)
+        bucket.acquire()
+        order = []
+
+        def worker(name, priority):
+            bucket.acquire(priority)
+            order.append(name)
+
+        threads = [threading.Thread(target=worker, args=(f"batch{i}", BATCH)) for i in range(3)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.01)
+        interactive = threading.Thread(target=worker, args=("interactive", INTERACTIVE))
+        interactive.start()
+        for thread in threads + [interactive]:
+            thread.join()
+
+        assert order[0] == "interactive"
+        assert sorted(order[1:]) == ["batch0", "batch1", "batch2"]
+
+    def test_batch_queued_not_dropped(self):
+        """
+        [확인] BATCH 요청은 모두 결국 발급됨
+        """
+        bucket = PriorityTokenBucket(rate=200, burst=1)
+        done = []
+        threads = [threading.Thread(target=lambda: done.append(bucket.acquire(BATCH))) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert done == [True] * 5
+        assert bucket.snapshot()["granted"]["batch"] == 5
+
+    def test_timeout_leaves_queue(self):
+        """
+        [확인] 시간 초과한 요청은 대기열에서 제거
+        """
+        bucket = PriorityTokenBucket(rate=1, burst=1)
+        bucket.acquire()
+
+        assert bucket.acquire(BATCH, timeout=0.01) is False
+        assert bucket.snapshot()["waiting"] == {"interactive": 0, "batch": 0}
+
+
+class TestClientRateLimit:
+    """클라이언트 연동 테스트"""
+
+    @pytest.fixture
+    def client(self, fake_transport, monkeypatch):
+        monkeypatch.setenv("GEMINI_RATE_PER_MINUTE", "6000")
+        monkeypatch.setenv("GEMINI_BURST", "2")
+        return ApiClient(transport=fake_transport, urls={"backend": ["http://b1"], "model": ["http://m1"]})
+
+    def test_gemini_bucket_configured(self, client):
+        """
+        [확인] 환경 변수로 Gemini 호출 속도 설정
+        """
+        snapshot = client.rate_limit_snapshot()["/sentiment/gemini"]
+
+        assert snapshot["rate"] == pytest.approx(100)
+        assert snapshot["burst"] == 2
+
+    def test_batch_priority_recorded(self, client, fake_transport):
+        """
+        [확인] 우선순위별 발급 수 기록
+        """
+        fake_transport.add("POST", "http://m1/api/sentiment/gemini", body={"label": "positive"})
+
+        client.analyze_sentiment_gemini("좋아요")
+        client.analyze_sentiment_gemini("좋아요", priority=BATCH)
+        granted = client.rate_limit_snapshot()["/sentiment/gemini"]["granted"]
+
+        assert granted == {"interactive": 1, "batch": 1}
+
+    def test_upstream_429_pauses_bucket(self, client, fake_transport):
+        """
+        [확인] 429 응답을 받으면 토큰 발급 일시 중지
+        """
+        fake_transport.add("POST", "http://m1/api/sentiment/gemini", status=429, body={})
+
+        client.analyze_sentiment_gemini("텍스트")
+
+        assert client.rate_limit_snapshot()["/sentiment/gemini"]["paused_for"] > 0
+
+    def test_other_endpoints_not_limited(self, client, fake_transport):
+        """
+        [확인] 기존 /sentiment 엔드포인트는 속도 제한 대상 아님
+        """
+        client.analyze_sentiment("text")
+
+        assert "/sentiment" not in client.rate_limits
+
+    def test_retry_after_header(self):
+        """
+        [확인] Retry-After 헤더 파싱
+        """
+        assert retry_after({"Retry-After": "3"}, default=1.0) == 3.0
+        assert retry_after({"retry-after": "soon"}, default=1.0) == 1.0
+        assert retry_after({}, default=0.5) == 0.5
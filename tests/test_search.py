@@ -0,0 +1,211 @@
+"""
+전문 검색 색인 테스트 케이스
+
+테스트 대상:
+- 문자 n-gram 토큰화 / 검색어 식
+- 단어 안의 부분 문자열, 한 글자, 여러 단어 검색
+- 증분 갱신 (바뀐 항목만 다시 색인, 사라진 항목 삭제)
+- select가 moderation.select와 같은 대상
+- CLI index / search
+"""
+import io
+import json
+
+import pytest
+
+from console import cli, columnar, moderation, search, snapshot
+from console.moderation import ModerationFilter
+
+
+def post(post_id, title, content="", nickname="작성자", **fields):
+    return {"post_id": post_id, "title": title, "content": content, "nickname": nickname,
+            "created_at": f"2024-01-{post_id:02d}T12:00:00", **fields}
+
+
+def comment(comment_id, post_id, content, nickname="댓글러", label="positive"):
+    return {"comment_id": comment_id, "post_id": post_id, "content": content, "author_nickname": nickname,
+            "created_at": "2024-02-01T12:00:00", "sentiment": {"label": label, "confidence": 0.9}}
+
+
+BOARD = {
+    "posts": [
+        post(1, "오늘의 산책로", "공원에서 강아지와 산책했어요"),
+        post(2, "고양이 간식 추천", "츄르 말고 다른 간식?", nickname="냥집사"),
+        post(3, "Dog Photo #12", "우리 집 막내"),
+    ],
+    "comments": [
+        comment(1, 1, "산책 부러워요"),
+        comment(2, 2, "간식은 적당히!", label="negative"),
+        comment(3, 3, "귀여워요 ㅎㅎ", nickname="냥집사"),
+    ],
+}
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = search.SearchIndex(str(tmp_path / "search.sqlite"))
+    index.update(BOARD)
+    yield index
+    index.close()
+
+
+def ids(targets):
+    return [(target.kind, target.post_id, target.comment_id) for target in targets]
+
+
+class TestTokenize:
+    """토큰화 테스트"""
+
+    def test_grams(self):
+        """
+        [확인] 단어별 bigram + 마지막 글자, 소문자, 문장 부호 / 밑줄은 구분자
+        """
+        assert search.grams("산책로 A_b") == "산책 책로 로 a b"
+        assert search.grams("#12!") == "12 2"
+
+    def test_match_expression(self):
+        """
+        [확인] 단어는 bigram 구, 한 글자는 접두어, 여러 단어는 AND
+        """
+        assert search.match_expression("산책로 개") == '"산책 책로" AND "개"*'
+        assert search.match_expression("!!") is None
+
+
+class TestSearch:
+    """검색 테스트"""
+
+    @pytest.mark.parametrize("query,expected", [
+        ("책로", [("posts", 1, None)]),
+        ("간식", [("posts", 2, None), ("comments", 2, 2)]),
+        ("공원 강아지", [("posts", 1, None)]),
+        ("DOG", [("posts", 3, None)]),
+        ("#12", [("posts", 3, None)]),
+        ("츄", [("posts", 2, None)]),
+        ("산책 간식", []),
+    ])
+    def test_queries(self, index, query, expected):
+        """
+        [확인] 단어 안의 부분 문자열 / 대소문자 무시 / 한 글자 / 여러 단어 검색
+        """
+        assert sorted(ids(index.search(query))) == sorted(expected)
+
+    def test_filters(self, index):
+        """
+        [확인] 종류 / 작성자 조건
+        """
+        assert ids(index.search("간식", kind=moderation.COMMENTS)) == [("comments", 2, 2)]
+        assert ids(index.search("간식", author="냥집사")) == [("posts", 2, None)]
+
+    def test_items(self, index):
+        """
+        [확인] 결과 항목은 스냅샷 항목과 같은 키 (게시글 nickname, 댓글 author_nickname / sentiment)
+        """
+        [hit] = index.search("부러워요")
+
+        assert hit.item["author_nickname"] == "댓글러"
+        assert hit.item["sentiment"] == {"label": "positive"}
+
+    def test_no_words(self, index):
+        """
+        [실패] 검색할 단어가 없으면 빈 목록
+        """
+        assert index.search("?!") == []
+
+
+class TestUpdate:
+    """증분 갱신 테스트"""
+
+    def test_incremental(self, index):
+        """
+        [확인] 바뀐 항목만 다시 색인하고 사라진 항목은 지움
+        Given: 게시글 1 제목 수정, 댓글 3 삭제, 게시글 4 추가
+        Then: 이전 토큰으로는 찾을 수 없고 새 토큰으로 찾음
+        """
+        board = {
+            "posts": [post(1, "오늘의 놀이터", "공원에서 강아지와 산책했어요")] + BOARD["posts"][1:]
+            + [post(4, "새 글")],
+            "comments": BOARD["comments"][:2],
+        }
+
+        stats = index.update(board)
+
+        assert (stats["added"], stats["updated"], stats["removed"], stats["unchanged"]) == (1, 1, 1, 4)
+        assert index.search("산책로") == []
+        assert ids(index.search("놀이터")) == [("posts", 1, None)]
+        assert index.search("귀여워요") == []
+        assert index.count() == {moderation.POSTS: 4, moderation.COMMENTS: 2}
+
+    def test_unchanged(self, index):
+        """
+        [확인] 같은 스냅샷으로 다시 갱신하면 변경 없음
+        """
+        stats = index.update(BOARD)
+
+        assert stats["unchanged"] == 6 and stats["added"] == stats["updated"] == stats["removed"] == 0
+
+
+class TestSelect:
+    """모더레이션 대상 선택 테스트"""
+
+    @pytest.mark.parametrize("flt", [
+        ModerationFilter(keyword="간식"),
+        ModerationFilter(keyword="간식은 적당히!"),
+        ModerationFilter(keyword="산책", target=moderation.COMMENTS),
+        ModerationFilter(author="냥집사"),
+        ModerationFilter(sentiment="negative"),
+        ModerationFilter(keyword="!"),
+        ModerationFilter(),
+    ])
+    def test_same_as_moderation(self, index, flt):
+        """
+        [확인] moderation.select와 같은 대상 (문장 부호가 포함된 키워드, 삭제 시 게시글과 함께 처리되는 댓글 제외 포함)
+        """
+        for action in (moderation.DELETE, moderation.EDIT):
+            assert ids(index.select(flt, action)) == ids(moderation.select(BOARD, flt, action))
+
+    def test_crawled_board(self, standin_client, tmp_path):
+        """
+        [확인] 크롤링한 스냅샷에서도 키워드 / 작성자 조건이 moderation.select와 같음
+        """
+        board = snapshot.crawl(standin_client(posts=60, users=8, comments_mean=3.0), page_size=25)
+        index = search.SearchIndex(str(tmp_path / "crawl.sqlite"))
+        index.update(board)
+
+        for flt in [ModerationFilter(keyword="산책"), ModerationFilter(keyword="#1"),
+                    ModerationFilter(author=board["posts"][0]["nickname"])]:
+            for action in (moderation.DELETE, moderation.EDIT):
+                assert ids(index.select(flt, action)) == ids(moderation.select(board, flt, action))
+
+
+class TestCli:
+    """CLI 테스트"""
+
+    def test_index_and_search(self, tmp_path):
+        """
+        [확인] index로 색인을 만들고 search로 검색 (열 단위 저장소 입력 포함)
+        """
+        pytest.importorskip("pyarrow")
+        source = columnar.write({"taken_at": 1.0, **BOARD}, str(tmp_path / f"board{columnar.SUFFIX}"))
+        path = str(tmp_path / "search.sqlite")
+
+        stdout = io.StringIO()
+        code = cli.main(["index", source, "--index", path], stdout=stdout)
+        stats = json.loads(stdout.getvalue())
+        assert code == 0
+        assert (stats["added"], stats["posts"], stats["comments"]) == (6, 3, 3)
+
+        stdout = io.StringIO()
+        code = cli.main(["search", "간식", "--index", path, "--kind", "posts"], stdout=stdout)
+        assert code == 0
+        assert [hit["post_id"] for hit in json.loads(stdout.getvalue())] == [2]
+
+    def test_search_without_index(self, tmp_path):
+        """
+        [실패] 색인 파일이 없으면 오류 출력
+        """
+        stdout = io.StringIO()
+
+        code = cli.main(["search", "간식", "--index", str(tmp_path / "none.sqlite")], stdout=stdout)
+
+        assert code != 0
+        assert json.loads(stdout.getvalue())["ok"] is False
@@ -0,0 +1,270 @@
+"""
+시드 데이터 적재 테스트 케이스
+
+테스트 대상:
+- 결정적 생성 계획 (닉네임 규칙, 멱법칙 분포, 좋아요 중복 없음)
+- 사용자 → 게시글 → 댓글 → 좋아요 적재와 매니페스트
+- 재개 시 완료된 항목 건너뛰기 / 설정이 다른 매니페스트 거부
+- 단계 중간에 강제 종료된 뒤 재개해도 게시글 / 댓글 중복 없음, 좋아요 상태 유지
+"""
+import io
+import json
+import re
+import threading
+from collections import Counter
+
+import pytest
+
+from console import cli, seed, validators
+from console.client import ApiClient, TransportResponse
+from console.seed import SeedConfig
+
+
+class Killed(BaseException):
+    """프로세스 강제 종료 대역 (bulk_map이 잡지 않음)"""
+
+
+class FakeBackend:
+    """
+    ID를 차례로 발급하고 좋아요를 토글하는 가짜 백엔드 전송 계층
+
+    kill_at=(패턴, n, applied): 패턴에 맞는 n번째 요청에서 Killed를 던지고 이후 요청도 모두 Killed
+    (applied면 요청을 처리한 뒤 응답만 잃음)
+    """
+
+    def __init__(self, fail_signup_at: int = None, kill_at=None):
+        self.calls = []
+        self.fail_signup_at = fail_signup_at
+        self.kill_at = kill_at
+        self.killed = False
+        self.users = {}
+        self.likes = set()
+        self.next_id = {"post": 0, "comment": 0}
+        self._lock = threading.Lock()
+
+    def _reply(self, status, body):
+        return TransportResponse(status, json.dumps(body).encode(), {"Content-Type": "application/json"})
+
+    def _issue(self, kind):
+        self.next_id[kind] += 1
+        return self.next_id[kind]
+
+    def send(self, method, url, *, params=None, json_body=None, files=None, headers=None, timeout=None):
+        with self._lock:
+            if self.killed:
+                raise Killed()
+            self.calls.append((method, url, (headers or {}).get("X-User-Id")))
+            if self.kill_at is None or self.count(self.kill_at[0]) != self.kill_at[1]:
+                return self._handle(url, json_body, headers)
+            if self.kill_at[2]:
+                self._handle(url, json_body, headers)
+            self.killed = True
+            raise Killed()
+
+    def _handle(self, url, json_body, headers):
+        path = url.split("/api", 1)[1]
+        if path == "/users/profile/upload":
+            return self._reply(201, {"data": {"profile_image_url": "http://img/p.png"}})
+        if path == "/auth/signup":
+            email = json_body["email"]
+            if email in self.users:
+                return self._reply(409, {"message": "duplicate_email"})
+            if self.fail_signup_at is not None and len(self.users) == self.fail_signup_at:
+                self.fail_signup_at = None
+                return self._reply(500, {"message": "server_error"})
+            self.users[email] = len(self.users) + 1
+            return self._reply(201, {"data": {"user_id": self.users[email]}})
+        if path == "/auth/login":
+            return self._reply(200, {"data": {"user_id": self.users[json_body["email"]]}})
+        if path == "/posts/upload":
+            return self._reply(201, {"data": {"image_url": "http://img/x.png",
+                                              "prediction": {"class_name": "cat"}}})
+        if path == "/posts":
+            return self._reply(201, {"data": {"post_id": self._issue("post")}})
+        if re.fullmatch(r"/posts/\d+/comments", path):
+            return self._reply(201, {"data": {"comment_id": self._issue("comment")}})
+        if re.fullmatch(r"/posts/\d+/like", path):
+            pair = (path, headers["X-User-Id"])
+            self.likes ^= {pair}
+            return self._reply(200, {"data": {"liked": pair in self.likes}})
+        return self._reply(404, {"message": "not_found"})
+
+    def count(self, pattern):
+        return sum(1 for method, url, _ in self.calls if method == "POST" and re.search(pattern, url))
+
+
+def make_client(backend):
+    return ApiClient(transport=backend, urls={"backend": ["http://b1"], "model": ["http://m1"]})
+
+
+CONFIG = SeedConfig(users=6, posts=10, comments=40, likes=15, image_ratio=0.5, seed=3)
+
+
+class TestPlan:
+    """생성 계획 테스트"""
+
+    def test_nicknames_are_valid_and_unique(self):
+        """
+        [확인] 닉네임은 검증 규칙(공백 없음, 10자 이하)을 만족하고 서로 다름
+        """
+        names = [seed.nickname(i) for i in range(0, seed.MAX_USERS, 997)]
+
+        assert all(validators.validate_nickname(name)["valid"] for name in names)
+        assert len(set(names)) == len(names)
+        assert validators.validate_password(seed.user_spec(CONFIG, 0)["password"])["valid"]
+
+    def test_deterministic(self):
+        """
+        [확인] 같은 설정이면 같은 계획
+        """
+        assert seed.build_plan(CONFIG) == seed.build_plan(CONFIG)
+        assert seed.build_plan(CONFIG) != seed.build_plan(CONFIG._replace(seed=4))
+
+    def test_power_law_and_unique_likes(self):
+        """
+        [확인] 댓글이 일부 게시글에 몰리고, 좋아요 (게시글, 사용자) 쌍은 중복 없음
+        Given: 게시글 200개, 댓글 5000개
+        Then: 상위 10% 게시글이 댓글의 절반 이상
+        """
+        plan = seed.build_plan(SeedConfig(users=50, posts=200, comments=5000, likes=500))
+
+        counts = sorted(Counter(post for post, _, _ in plan["comments"]).values(), reverse=True)
+        assert sum(counts[:20]) > 2500
+        assert len(set(plan["likes"])) == len(plan["likes"]) == 500
+
+    def test_rejects_invalid_user_count(self):
+        """
+        [실패] 사용자 수 0
+        """
+        with pytest.raises(ValueError):
+            seed.build_plan(CONFIG._replace(users=0))
+
+    def test_png(self):
+        """
+        [확인] 생성 이미지는 PNG 시그니처로 시작
+        """
+        assert seed.solid_png(2, 2, (1, 2, 3)).startswith(b"\x89PNG\r\n\x1a\n")
+
+
+class TestRun:
+    """적재 / 재개 테스트"""
+
+    def test_creates_everything(self, tmp_path):
+        """
+        [성공] 사용자 / 게시글 / 댓글 / 좋아요 생성과 매니페스트 기록
+        """
+        backend = FakeBackend()
+        path = str(tmp_path / "manifest.json")
+        progress = []
+
+        summary = seed.run(make_client(backend), CONFIG, path, workers=4,
+                           progress=lambda **kw: progress.append(kw))
+
+        assert summary == {"manifest": path, "users": 6, "posts": 10, "comments": 40, "likes": 15, "errors": 0}
+        assert backend.count(r"/auth/signup$") == 6
+        assert backend.count(r"/profile/upload$") == 6
+        assert backend.count(r"/posts/upload$") == sum(p[3] for p in seed.build_plan(CONFIG)["posts"])
+        manifest = json.loads(open(path, encoding="utf-8").read())
+        assert manifest["config"] == CONFIG._asdict()
+        assert sorted(manifest["posts"].values()) == list(range(1, 11))
+        assert {"total": 40, "done": 0, "message": "comments 생성 중"} in progress
+
+    def test_posts_are_written_as_author(self, tmp_path):
+        """
+        [확인] 게시글은 계획된 작성자의 X-User-Id로 작성
+        """
+        backend = FakeBackend()
+        seed.run(make_client(backend), CONFIG._replace(comments=0, likes=0), str(tmp_path / "m.json"), workers=1)
+
+        users = {i: backend.users[seed.user_spec(CONFIG, i)["email"]] for i in range(CONFIG.users)}
+        writers = [int(user) for method, url, user in backend.calls if url.endswith("/api/posts")]
+        assert writers == [users[post[0]] for post in seed.build_plan(CONFIG)["posts"]]
+
+    def test_resume_skips_done_items(self, tmp_path):
+        """
+        [확인] 실패한 사용자만 다시 만들고, 좋아요는 다시 토글하지 않음
+        Given: 첫 실행에서 세 번째 회원가입이 500
+        When: 같은 매니페스트로 다시 실행
+        Then: 두 번째 실행은 나머지 항목만 요청하고 오류 없이 완료
+        """
+        path = str(tmp_path / "manifest.json")
+        first = FakeBackend(fail_signup_at=2)
+        summary = seed.run(make_client(first), CONFIG, path, workers=1)
+        assert summary["users"] == 5
+        assert summary["errors"] > 0
+        liked_first = len(json.load(open(path, encoding="utf-8"))["likes"])
+
+        second = FakeBackend()
+        second.users = dict(first.users)
+        second.next_id = dict(first.next_id)
+        summary = seed.run(make_client(second), CONFIG, path, workers=4)
+
+        assert summary["errors"] == 0
+        assert (summary["users"], summary["likes"]) == (6, 15)
+        assert second.count(r"/auth/signup$") == 1
+        assert second.count(r"/like$") == 15 - liked_first
+
+    @pytest.mark.parametrize("kill_at", [
+        (r"/comments$", 17, False),
+        (r"/like$", 8, False),
+        (r"/like$", 8, True),
+    ])
+    def test_resume_after_kill(self, tmp_path, kill_at):
+        """
+        [확인] 단계 중간에 강제 종료된 뒤 재개해도 게시글 / 댓글 중복 없이 모든 좋아요가 눌린 상태
+        Given: 댓글 / 좋아요 단계 중간에 프로세스 종료 (단계 끝 매니페스트 저장 없음),
+               마지막 경우는 서버가 좋아요를 처리한 뒤 응답을 받기 전에 종료
+        When: 같은 매니페스트로 다시 실행
+        Then: 게시글 10개, 댓글 40개, 좋아요 15쌍이 모두 liked
+        """
+        path = str(tmp_path / "manifest.json")
+        backend = FakeBackend(kill_at=kill_at)
+        with pytest.raises(Killed):
+            seed.run(make_client(backend), CONFIG, path, workers=1)
+
+        backend.kill_at, backend.killed = None, False
+        summary = seed.run(make_client(backend), CONFIG, path, workers=4)
+
+        assert summary["errors"] == 0
+        assert (summary["posts"], summary["comments"], summary["likes"]) == (10, 40, 15)
+        assert backend.next_id == {"post": 10, "comment": 40}
+        assert len(backend.likes) == 15
+        if kill_at[2]:
+            # 응답을 잃은 좋아요는 재개 시 취소된 뒤 한 번 더 토글
+            assert backend.count(r"/like$") == 15 + 2
+
+    def test_config_mismatch(self, tmp_path):
+        """
+        [실패] 다른 설정의 매니페스트로 재개
+        """
+        path = str(tmp_path / "manifest.json")
+        seed.run(make_client(FakeBackend()), CONFIG._replace(comments=0, likes=0), path)
+
+        with pytest.raises(ValueError):
+            seed.run(make_client(FakeBackend()), CONFIG, path)
+
+    def test_cancel_saves_manifest(self, tmp_path):
+        """
+        [확인] 취소되면 남은 항목은 건너뛰고 매니페스트는 저장
+        """
+        cancel = threading.Event()
+        cancel.set()
+        path = tmp_path / "manifest.json"
+
+        summary = seed.run(make_client(FakeBackend()), CONFIG, str(path), cancel=cancel)
+
+        assert summary["users"] == 0
+        assert path.exists()
+
+    def test_cli(self, tmp_path):
+        """
+        [확인] CLI seed - 요약 출력
+        """
+        stdout = io.StringIO()
+        path = str(tmp_path / "manifest.json")
+
+        code = cli.main(["seed", "--users", "3", "--posts", "4", "--comments", "5", "--likes", "2",
+                         "--manifest", path], client=make_client(FakeBackend()), stdout=stdout)
+
+        assert code == 0
+        assert json.loads(stdout.getvalue())["posts"] == 4
@@ -0,0 +1,127 @@
+"""
+게시판 스냅샷 테스트 케이스
+
+테스트 대상:
+- 게시글 목록 페이지 순회
+- 게시글별 댓글 수집
+- 진행 상황 보고 / 오류 기록
+- 저장 / 로드
+"""
+import pytest
+
+from console import snapshot
+from console.client import ApiClient
+
+
+BACKEND = "http://b1/api"
+
+
+def make_post(post_id):
+    return {"post_id": post_id, "title": f"게시글 {post_id}", "content": "내용", "nickname": "작성자"}
+
+
+@pytest.fixture
+def board(fake_transport):
+    """게시글 5개, 게시글마다 댓글 post_id개"""
+    posts = [make_post(i) for i in range(1, 6)]
+
+    def list_posts(call):
+        page, limit = call["params"]["page"], call["params"]["limit"]
+        items = posts[(page - 1) * limit:page * limit]
+        return 200, {"message": "get_posts_success", "data": {"posts": items, "total": len(posts)}}
+
+    fake_transport.add("GET", f"{BACKEND}/posts", handler=list_posts)
+    for post in posts:
+        comments = [{"comment_id": post["post_id"] * 100 + i, "content": "댓글"} for i in range(post["post_id"])]
+        fake_transport.add("GET", f"{BACKEND}/posts/{post['post_id']}/comments",
+                           body={"data": {"comments": comments}})
+    return posts
+
+
+@pytest.fixture
+def client(fake_transport):
+    return ApiClient(transport=fake_transport, urls={"backend": ["http://b1"], "model": ["http://m1"]})
+
+
+class TestCrawl:
+    """크롤링 테스트"""
+
+    def test_pages_through_posts(self, client, board, fake_transport):
+        """
+        [확인] 페이지 크기 2로 게시글 5개 수집 (3페이지)
+        """
+        posts = snapshot.fetch_all_posts(client, page_size=2)
+
+        assert [snapshot.post_id_of(p) for p in posts] == [1, 2, 3, 4, 5]
+        pages = [c["params"]["page"] for c in fake_transport.calls if c["url"].endswith("/posts")]
+        assert pages == [1, 2, 3]
+
+    def test_collects_comments_with_post_id(self, client, board):
+        """
+        [확인] 게시글별 댓글 수집, 각 댓글에 post_id 포함
+        """
+        result = snapshot.crawl(client, page_size=2, workers=4)
+
+        assert len(result["posts"]) == 5
+        assert len(result["comments"]) == 1 + 2 + 3 + 4 + 5
+        assert {c["post_id"] for c in result["comments"]} == {1, 2, 3, 4, 5}
+        assert result["errors"] == []
+
+    def test_progress_reported(self, client, board):
+        """
+        [확인] 댓글 수집 진행 상황 보고
+        """
+        state = {"done": 0, "total": None}
+
+        def progress(done=None, total=None, message=None, advance=0):
+            if total is not None:
+                state["total"] = total
+            if done is not None:
+                state["done"] = done
+            state["done"] += advance
+
+        snapshot.crawl(client, progress=progress)
+
+        assert state == {"done": 5, "total": 5}
+
+    def test_comment_errors_recorded(self, client, board, fake_transport):
+        """
+        [실패] 댓글 조회 실패는 errors에 기록하고 계속 진행
+        """
+        fake_transport.add("GET", f"{BACKEND}/posts/3/comments", status=500, body={})
+
+        result = snapshot.crawl(client)
+
+        assert len(result["errors"]) == 1
+        assert 3 not in {c["post_id"] for c in result["comments"]}
+
+    def test_list_failure_raises(self, client, fake_transport):
+        """
+        [실패] 게시글 목록 조회 실패
+        """
+        fake_transport.add("GET", f"{BACKEND}/posts", status=500, body={})
+
+        with pytest.raises(snapshot.SnapshotError):
+            snapshot.crawl(client)
+
+
+class TestSnapshotFiles:
+    """저장 / 로드 테스트"""
+
+    def test_save_and_load(self, tmp_path):
+        """
+        [확인] 한글 포함 스냅샷 저장 후 동일하게 로드
+        """
+        data = {"taken_at": 1.0, "posts": [make_post(1)], "comments": [], "errors": []}
+        path = snapshot.save(data, str(tmp_path / "snaps" / "board.json"))
+
+        assert snapshot.load(path) == data
+        assert snapshot.list_snapshots(str(tmp_path / "snaps")) == [path]
+
+    def test_id_helpers(self):
+        """
+        [확인] post_id / id 모두 지원
+        """
+        assert snapshot.post_id_of({"post_id": 1}) == 1
+        assert snapshot.post_id_of({"id": 2}) == 2
+        assert snapshot.comment_id_of({"comment_id": 3}) == 3
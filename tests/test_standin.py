@@ -0,0 +1,112 @@
+"""
+로컬 Backend 대역 테스트 케이스
+
+테스트 대상:
+- 메모리 / SQLite 저장소가 같은 응답을 만듦
+- 목록 / 상세 / 댓글 조회, 좋아요 / 조회수 / 작성 요청 (Backend 응답 형식)
+- 대역 위에서 스냅샷 크롤링
+"""
+import pytest
+
+from console import snapshot, validators
+from console.client import ApiClient
+from console.dataset import DatasetConfig
+from console.standin import MemoryStore, SqliteStore, StandinTransport
+
+
+DATASET = DatasetConfig(posts=150, users=30, comments_mean=4.0, seed=7)
+
+
+@pytest.fixture
+def sqlite_store(tmp_path):
+    store = SqliteStore.from_dataset(DATASET, str(tmp_path / "board.db"))
+    yield store
+    store.close()
+
+
+def client_of(store, user_id=None):
+    return ApiClient(user_id=user_id, transport=StandinTransport(store),
+                     urls={"backend": ["http://b1"], "model": ["http://m1"]})
+
+
+class TestStores:
+    """저장소 일치 테스트"""
+
+    def test_memory_and_sqlite_agree(self, sqlite_store):
+        """
+        [확인] 같은 데이터셋이면 목록 / 상세 / 댓글 응답이 같음
+        """
+        memory = MemoryStore.from_dataset(DATASET)
+
+        assert memory.post_count() == sqlite_store.post_count() == 150
+        assert memory.comment_count() == sqlite_store.comment_count()
+        assert memory.list_posts(40, 30) == sqlite_store.list_posts(40, 30)
+        for post_id in (1, 75, 150):
+            assert memory.get_post(post_id) == sqlite_store.get_post(post_id)
+            assert memory.list_comments(post_id) == sqlite_store.list_comments(post_id)
+
+    @pytest.mark.parametrize("kind", ["memory", "sqlite"])
+    def test_writes(self, kind, sqlite_store):
+        """
+        [확인] 좋아요 토글 / 조회수 / 게시글 / 댓글 작성이 이후 조회에 반영
+        """
+        store = MemoryStore.from_dataset(DATASET) if kind == "memory" else sqlite_store
+        client = client_of(store, user_id=3)
+        before = client.get_post(10).data["data"]
+
+        liked = client.toggle_like(10).data["data"]
+        client.increment_view_count(10)
+        client.create_comment(10, "새 댓글")
+        post_id = client.create_post("제목", "내용").data["data"]["post_id"]
+
+        after = client.get_post(10).data["data"]
+        assert liked == {"liked": True, "like_count": before["like_count"] + 1}
+        assert after["view_count"] == before["view_count"] + 1
+        assert after["comment_count"] == before["comment_count"] + 1
+        assert client.get_comments(10).data["data"]["comments"][-1]["content"] == "새 댓글"
+        assert post_id == 151
+        assert client.get_posts(1, 1).data["data"]["posts"][0]["title"] == "제목"
+        assert client.toggle_like(10).data["data"]["liked"] is False
+
+
+class TestTransport:
+    """요청 / 응답 형식 테스트"""
+
+    def test_posts_response_shape(self, standin_client):
+        """
+        [확인] 목록 / 댓글 응답이 응답 구조 검사를 통과
+        """
+        client = standin_client(posts=30)
+
+        posts = client.get_posts(2, 10).data
+        comments = client.get_comments(posts["data"]["posts"][0]["post_id"]).data
+
+        assert validators.check_posts_response(posts) == []
+        assert validators.check_comments_response(comments) == []
+        assert (posts["data"]["total"], posts["data"]["page"]) == (30, 2)
+        assert [post["post_id"] for post in posts["data"]["posts"]] == list(range(20, 10, -1))
+
+    def test_errors(self, standin_client):
+        """
+        [실패] 없는 게시글 404, 로그인 없이 좋아요 401, 잘못된 페이지 400
+        """
+        client = standin_client(posts=5)
+
+        assert client.get_post(99).data["message"] == "post_not_found"
+        assert client.get_comments(99).status == 404
+        assert client.toggle_like(1).status == 401
+        assert client.get_posts(0, 10).status == 400
+        assert client.delete_post(1).status == 404
+
+    def test_crawl(self, standin_client):
+        """
+        [확인] 대역 위에서 전체 크롤링 - 게시글 / 댓글 수가 저장소와 일치
+        """
+        client = standin_client(posts=120, comments_mean=3.0)
+        store = client.transport.store
+
+        board = snapshot.crawl(client, page_size=25, workers=4)
+
+        assert len(board["posts"]) == 120
+        assert len(board["comments"]) == store.comment_count()
+        assert board["errors"] == []
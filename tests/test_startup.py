@@ -0,0 +1,157 @@
+"""
+콘솔 시작 시간 예산 테스트 케이스
+
+콘솔 파드는 자주 재시작되므로 cold start 시간이 사용자에게 그대로 보입니다.
+
+테스트 대상:
+- console 모듈 import 시간 예산 (-X importtime 측정)
+- 무거운 의존성이 import 시점에 로드되지 않는지
+- test_streamlit.py 최상위 import 목록
+- test_streamlit.py가 최상위에서 import하는 console 모듈 전체의 import 시간 / 지연 import
+"""
+import ast
+import os
+import subprocess
+import sys
+
+import pytest
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 모듈별 cold import 예산 (ms) - 측정값의 여유를 둔 상한
+IMPORT_BUDGETS_MS = {
+    "console.client": 150,
+    "console.health": 200,
+    "console.models": 100,
+    "console.profiling": 150,
+}
+
+# test_streamlit.py가 최상위에서 import하는 console 모듈 전체의 cold import 예산 (ms)
+CONSOLE_IMPORTS_BUDGET_MS = 250
+
+# 첫 사용 시점까지 import하면 안 되는 모듈
+LAZY_MODULES = ["requests", "PIL", "numpy", "pandas", "pyarrow", "streamlit", "json", "sqlite3", "pstats"]
+
+# test_streamlit.py 최상위에서 import하면 안 되는 모듈
+FORBIDDEN_TOP_LEVEL = {"requests", "PIL", "numpy", "pandas", "pyarrow"}
+
+
+def import_time_ms(module: str) -> float:
+    """새 인터프리터에서 module의 누적 import 시간 (ms)"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in reversed(result.stderr.splitlines()):
+        parts = [part.strip() for part in line.split("|")]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1]) / 1000
+    raise AssertionError(f"import time not found for {module}")
+
+
+def streamlit_console_imports():
+    """test_streamlit.py 최상위의 console 모듈 import 목록 (from console import x → console.x)"""
+    with open(os.path.join(ROOT, "test_streamlit.py"), encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    modules = set()
+    for node in tree.body:
+        if isinstance(node, ast.ImportFrom) and node.module == "console":
+            modules.update(f"console.{alias.name}" for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and node.module.startswith("console."):
+            modules.add(node.module)
+        elif isinstance(node, ast.Import):
+            modules.update(alias.name for alias in node.names if alias.name.startswith("console."))
+    return sorted(modules)
+
+
+def group_import_ms(modules) -> float:
+    """새 인터프리터에서 modules를 함께 import하는 데 걸린 시간 (ms)"""
+    code = (
+        "import time; started = time.perf_counter(); "
+        f"import {', '.join(modules)}; "
+        "print((time.perf_counter() - started) * 1000)"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT,
+                            capture_output=True, text=True, check=True)
+    return float(result.stdout)
+
+
+def loaded_modules(module: str):
+    """module import 후 로드된 LAZY_MODULES"""
+    code = (
+        f"import sys, {module}; "
+        f"print(','.join(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT,
+                            capture_output=True, text=True, check=True)
+    return [m for m in result.stdout.strip().split(",") if m]
+
+
+class TestImportBudget:
+    """import 시간 예산 테스트"""
+
+    @pytest.mark.parametrize("module,budget_ms", sorted(IMPORT_BUDGETS_MS.items()))
+    def test_import_within_budget(self, module, budget_ms):
+        """
+        [확인] cold import 시간이 예산 이내
+
+        Given: 새 Python 프로세스
+        When: 모듈 import (3회 중 최솟값)
+        Then: 예산(ms) 이내
+        """
+        elapsed = min(import_time_ms(module) for _ in range(3))
+
+        assert elapsed < budget_ms, f"{module} import {elapsed:.1f}ms > budget {budget_ms}ms"
+
+    @pytest.mark.parametrize("module", sorted(IMPORT_BUDGETS_MS))
+    def test_heavy_modules_not_loaded(self, module):
+        """
+        [확인] 무거운 의존성은 import 시점에 로드하지 않음
+        """
+        assert loaded_modules(module) == []
+
+
+class TestStreamlitImports:
+    """Streamlit 콘솔 최상위 import 테스트"""
+
+    def test_console_imports_within_budget(self):
+        """
+        [확인] 콘솔 시작 시 실제로 import하는 console 모듈 전체가 예산 이내
+
+        Given: test_streamlit.py 최상위의 console import 목록
+        When: 새 Python 프로세스에서 함께 import (3회 중 최솟값)
+        Then: CONSOLE_IMPORTS_BUDGET_MS 이내
+        """
+        modules = streamlit_console_imports()
+        assert "console.client" in modules and "console.sync" in modules
+
+        elapsed = min(group_import_ms(modules) for _ in range(3))
+
+        assert elapsed < CONSOLE_IMPORTS_BUDGET_MS, (
+            f"console imports {elapsed:.1f}ms > budget {CONSOLE_IMPORTS_BUDGET_MS}ms")
+
+    def test_console_imports_keep_heavy_modules_lazy(self):
+        """
+        [확인] 콘솔 시작 시 import하는 console 모듈 전체를 불러와도 json / sqlite3 등은 로드하지 않음
+        """
+        assert loaded_modules(", ".join(streamlit_console_imports())) == []
+
+    def test_no_heavy_top_level_imports(self):
+        """
+        [확인] test_streamlit.py는 PIL / requests 등을 최상위에서 import하지 않음
+        """
+        with open(os.path.join(ROOT, "test_streamlit.py"), encoding="utf-8") as f:
+            tree = ast.parse(f.read())
+
+        top_level = set()
+        for node in tree.body:
+            if isinstance(node, ast.Import):
+                top_level.update(alias.name.split(".")[0] for alias in node.names)
+            elif isinstance(node, ast.ImportFrom) and node.module:
+                top_level.add(node.module.split(".")[0])
+
+        assert not top_level & FORBIDDEN_TOP_LEVEL
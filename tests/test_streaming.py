@@ -0,0 +1,223 @@
+"""
+목록 응답 스트리밍 디코딩 테스트 케이스
+
+테스트 대상:
+- 청크 경계(UTF-8 다중 바이트, 숫자 중간 포함)와 관계없이 json.loads와 같은 결과
+- 첫 항목은 본문 전체를 받기 전에 반환, 버퍼 크기 제한
+- ApiClient.stream_posts / stream_comments (stream()이 없는 전송 계층 포함)
+- 측정 / 녹화용 전송 계층 래퍼를 거쳐도 스트리밍 유지
+- snapshot.iter_posts 페이지 순회
+"""
+import json
+
+import pytest
+
+from console import snapshot
+from console.client import ApiClient, StreamResponse, TransportError
+from console.models import Post
+from console.streaming import COMPACT_AT, ArrayStream
+
+
+BODY = {
+    "message": "get_posts_success",
+    "data": {
+        "posts": [{"post_id": i, "title": "제목 " * i, "score": 1.25e3, "tags": [], "x": None}
+                  for i in range(40)],
+        "total": 1234567,
+        "page": 1,
+    },
+}
+
+
+def split(content, size):
+    return [content[i:i + size] for i in range(0, len(content), size)]
+
+
+class ChunkTransport:
+    """본문을 size바이트씩 내보내는 스트리밍 전송 계층 (보낸 청크 수 기록)"""
+
+    def __init__(self, body, size=16, status=200):
+        self.content = json.dumps(body, ensure_ascii=False).encode()
+        self.size = size
+        self.status = status
+        self.sent = 0
+
+    def stream(self, method, url, **kwargs):
+        def chunks():
+            for chunk in split(self.content, self.size):
+                self.sent += 1
+                yield chunk
+        return StreamResponse(self.status, {}, chunks())
+
+
+def make_client(transport):
+    return ApiClient(transport=transport, urls={"backend": ["http://b1"], "model": ["http://m1"]})
+
+
+class TestArrayStream:
+    """스트리밍 디코더 테스트"""
+
+    @pytest.mark.parametrize("size", [1, 2, 3, 5, 64, 1 << 20])
+    def test_any_chunk_size(self, size):
+        """
+        [확인] 청크 크기와 관계없이 항목 / 나머지 구조가 json.loads와 같음
+        Given: 한글(3바이트) / 지수 표기 숫자가 청크 경계에 걸릴 수 있는 본문
+        """
+        content = json.dumps(BODY, ensure_ascii=False).encode()
+
+        stream = ArrayStream(split(content, size), ("data", "posts"))
+        items = list(stream)
+
+        assert items == BODY["data"]["posts"]
+        assert stream.meta == {"message": "get_posts_success", "data": {"total": 1234567, "page": 1}}
+
+    def test_first_item_before_body_complete(self):
+        """
+        [확인] 첫 항목은 본문 일부만 받은 상태에서 반환
+        """
+        transport = ChunkTransport(BODY, size=64)
+        chunks = transport.stream("GET", "").chunks
+
+        first = next(iter(ArrayStream(chunks, ("data", "posts"))))
+
+        assert first["post_id"] == 0
+        assert transport.sent < len(split(transport.content, 64)) / 4
+
+    def test_buffer_is_bounded(self):
+        """
+        [확인] 큰 목록도 버퍼는 읽은 부분을 버려 일정 크기 이하로 유지
+        Given: 게시글 2만 개 (본문 수 MB), 4KB 청크
+        """
+        body = {"data": {"posts": [{"post_id": i, "content": "내용" * 20} for i in range(20_000)]}}
+        content = json.dumps(body, ensure_ascii=False).encode()
+
+        stream = ArrayStream(split(content, 4096), ("data", "posts"))
+        count = sum(1 for _ in stream)
+
+        assert count == 20_000
+        assert len(content) > 1_000_000
+        assert stream.peak_buffer < COMPACT_AT + 2 * 4096
+
+    def test_missing_or_null_array(self):
+        """
+        [확인] 대상 배열이 없거나 null이면 항목 없이 meta만
+        """
+        stream = ArrayStream([b'{"message": "x", "data": null}'], ("data", "posts"))
+
+        assert list(stream) == []
+        assert stream.meta == {"message": "x", "data": None}
+
+    @pytest.mark.parametrize("content", [b'{"data": {"posts": [1, 2', b'{"data": {"posts": [1} }', b"[1] x"])
+    def test_invalid_json(self, content):
+        """
+        [실패] 잘리거나 잘못된 본문은 반복 중 ValueError
+        """
+        with pytest.raises(ValueError):
+            list(ArrayStream([content], ("data", "posts") if content.startswith(b"{") else ()))
+
+    def test_object_hook(self):
+        """
+        [확인] object_hook으로 항목을 모델로 디코딩
+        """
+        from console.models import to_model
+
+        stream = ArrayStream([json.dumps(BODY).encode()], ("data", "posts"), to_model)
+
+        assert all(isinstance(item, Post) for item in stream)
+
+
+class TestClientStream:
+    """ApiClient 스트리밍 테스트"""
+
+    def test_stream_posts(self):
+        """
+        [확인] stream_posts - 항목 반복 후 meta에 total
+        """
+        response = make_client(ChunkTransport(BODY)).stream_posts(1, 40)
+
+        assert response.ok and response.status == 200
+        assert [post["post_id"] for post in response] == list(range(40))
+        assert response.meta["data"]["total"] == 1234567
+
+    def test_error_response(self):
+        """
+        [실패] 2xx가 아니면 반복 결과는 비어 있고 data에 오류 본문
+        """
+        response = make_client(ChunkTransport({"message": "post_not_found", "data": None}, status=404)) \
+            .stream_comments(99)
+
+        assert not response.ok
+        assert list(response) == []
+        assert response.data["message"] == "post_not_found"
+
+    def test_network_error(self):
+        """
+        [실패] 연결 실패는 status 0, network_error
+        """
+        class Broken:
+            def send(self, *args, **kwargs):
+                raise TransportError("refused")
+
+        response = make_client(Broken()).stream_posts()
+
+        assert (response.ok, response.status, response.data["message"]) == (False, 0, "network_error")
+
+    def test_transport_without_stream(self, replay_client):
+        """
+        [확인] stream()이 없는 전송 계층(카세트 재생)은 본문 전체를 한 번에 디코딩해 같은 결과
+        """
+        client = replay_client("comments")
+
+        streamed = list(client.stream_comments(1))
+
+        assert streamed == client.get_comments(1).data["data"]["comments"]
+
+    @pytest.mark.parametrize("wrapper", ["profiling", "counting", "recording", "sizing"])
+    def test_wrapped_transport_streams(self, wrapper):
+        """
+        [확인] 래퍼 전송 계층도 안쪽 stream()을 호출하고, 본문을 다 읽으면 측정 / 기록은 send()와 같음
+        Given: 64바이트 청크 전송 계층을 ProfilingTransport / CountingTransport / RecordingTransport /
+               SizingTransport로 감쌈
+        Then: 첫 항목은 본문 일부만 받은 상태에서 반환
+        """
+        from console.cassette import RecordingTransport
+        from console.pagination import SizingTransport
+        from console.perf import CountingTransport
+        from console.profiling import ProfilingTransport, RerunProfiler
+
+        inner = ChunkTransport(BODY, size=64)
+        profiler = RerunProfiler(use_cprofile=False)
+        profiler.begin()
+        transport = {
+            "profiling": lambda: ProfilingTransport(inner, profiler),
+            "counting": lambda: CountingTransport(inner),
+            "recording": lambda: RecordingTransport(inner),
+            "sizing": lambda: SizingTransport(inner),
+        }[wrapper]()
+
+        response = make_client(transport).stream_posts(1, 40)
+        items = iter(response)
+        assert next(items)["post_id"] == 0
+        assert inner.sent < len(split(inner.content, 64)) / 4
+        assert len(list(items)) == 39
+
+        if wrapper == "profiling":
+            assert profiler.end().requests == 1
+        elif wrapper == "counting":
+            assert transport.count == 1
+        elif wrapper == "recording":
+            [interaction] = transport.cassette.interactions
+            assert interaction["response"]["json"] == BODY
+        else:
+            assert transport.last_bytes == len(inner.content)
+
+    def test_iter_posts_pages(self, standin_client):
+        """
+        [확인] snapshot.iter_posts - 페이지를 넘겨 가며 게시글 단위로 전체 순회
+        """
+        client = standin_client(posts=45)
+
+        posts = list(snapshot.iter_posts(client.typed(), page_size=10))
+
+        assert [post.post_id for post in posts] == list(range(45, 0, -1))
+        assert len(list(snapshot.iter_posts(client, page_size=10, all_pages=False))) == 10
@@ -0,0 +1,190 @@
+"""
+증분 스냅샷 동기화 테스트 케이스
+
+테스트 대상:
+- 첫 동기화는 전체 크롤링, 이후에는 바뀐 게시글의 댓글만 조회
+- 증분 동기화 결과가 전체 크롤링과 같음 (새 게시글 / 좋아요 / 댓글 / 삭제)
+- 변경 로그 추가, 잘린 줄 무시, 압축
+"""
+import io
+import json
+
+import pytest
+
+from console import cli, snapshot, sync
+from console.perf import CountingTransport
+from console.sync import BoardState, SyncStore
+
+
+@pytest.fixture
+def board(standin_client):
+    """게시글 60개 대역과 요청 수 집계"""
+    client = standin_client(user_id=1, posts=60, comments_mean=2.0)
+    counter = CountingTransport(client.transport)
+    client.transport = counter
+    return client, counter
+
+
+def comment_requests(counter):
+    return sum(count for endpoint, count in counter.by_endpoint.items() if endpoint.endswith("/comments"))
+
+
+def same_as_crawl(client, store):
+    """동기화 상태가 전체 크롤링과 같은지"""
+    crawled = BoardState.from_snapshot(snapshot.crawl(client, page_size=25))
+    state = store.load()
+    return state.posts == crawled.posts and state.comments == crawled.comments
+
+
+class TestSync:
+    """동기화 테스트"""
+
+    def test_first_sync_is_full_crawl(self, board, tmp_path):
+        """
+        [확인] 기준 스냅샷이 없으면 전체 크롤링
+        """
+        client, counter = board
+        store = SyncStore(str(tmp_path))
+
+        stats = sync.sync(client, store, page_size=25)
+
+        assert stats["full"] is True
+        assert stats["posts"] == 60
+        assert comment_requests(counter) == 60
+        assert store.exists() and store.delta_count() == 0
+
+    def test_unchanged_board_fetches_no_comments(self, board, tmp_path):
+        """
+        [성공] 바뀐 것이 없으면 목록만 조회하고 변경은 동기화 기록 하나
+        """
+        client, counter = board
+        store = SyncStore(str(tmp_path))
+        sync.sync(client, store, page_size=25)
+        counter.reset()
+
+        stats = sync.sync(client, store, page_size=25, recheck_every=0)
+
+        assert comment_requests(counter) == 0
+        assert counter.count == 3
+        assert (stats["new"], stats["updated"], stats["deleted"], stats["deltas"]) == (0, 0, 0, 1)
+
+    def test_incremental_matches_full_crawl(self, board, tmp_path):
+        """
+        [확인] 새 게시글 / 좋아요 / 댓글 작성 후 증분 동기화 결과가 전체 크롤링과 같음
+        Given: 첫 동기화 이후 게시글 1개 작성, 게시글 5 좋아요, 게시글 7 댓글 작성
+        Then: 댓글은 게시글 7만 조회 (새 게시글은 댓글 0개라 조회 안 함)
+        """
+        client, counter = board
+        store = SyncStore(str(tmp_path))
+        sync.sync(client, store, page_size=25)
+        client.create_post("새 글", "내용")
+        client.toggle_like(5)
+        client.create_comment(7, "새 댓글")
+        counter.reset()
+
+        stats = sync.sync(client, store, page_size=25, recheck_every=0)
+
+        assert (stats["new"], stats["updated"], stats["comments_fetched"]) == (1, 2, 1)
+        assert comment_requests(counter) == 1
+        assert same_as_crawl(client, store)
+
+    def test_deleted_posts(self, board, tmp_path):
+        """
+        [확인] 목록에서 사라진 게시글은 댓글과 함께 삭제
+        """
+        client, _ = board
+        store = SyncStore(str(tmp_path))
+        sync.sync(client, store, page_size=25)
+        memory = client.transport.inner.store
+        memory.post_user.pop()
+        memory.comment_start.pop()
+
+        stats = sync.sync(client, store, page_size=25, recheck_every=0)
+
+        assert stats["deleted"] == 1
+        assert 60 not in store.load().posts
+        assert 60 not in store.load().comments
+
+    def test_recheck_rotates_through_posts(self, board, tmp_path):
+        """
+        [확인] recheck_every번 동기화하면 모든 게시글의 댓글을 한 번씩 다시 확인
+        """
+        client, counter = board
+        store = SyncStore(str(tmp_path))
+        sync.sync(client, store, page_size=25)
+        counter.reset()
+
+        fetched = sum(sync.sync(client, store, page_size=25, recheck_every=4)["comments_fetched"]
+                      for _ in range(4))
+
+        assert fetched == 60
+
+    def test_compaction(self, board, tmp_path):
+        """
+        [확인] 변경 로그가 compact_after줄을 넘으면 기준 스냅샷으로 합치고 로그 비움
+        """
+        client, _ = board
+        store = SyncStore(str(tmp_path), compact_after=3)
+        sync.sync(client, store, page_size=25)
+        for post_id in (1, 2, 3):
+            client.toggle_like(post_id)
+
+        stats = sync.sync(client, store, page_size=25, recheck_every=0)
+
+        assert stats["compacted"] is True
+        assert store.delta_count() == 0
+        assert same_as_crawl(client, store)
+
+
+class TestSyncStore:
+    """저장소 테스트"""
+
+    def test_truncated_last_line_ignored(self, tmp_path):
+        """
+        [실패] 기록 중 중단되어 잘린 마지막 줄은 무시
+        """
+        store = SyncStore(str(tmp_path))
+        store.compact(BoardState.from_snapshot({"taken_at": 1.0, "posts": [{"post_id": 1, "title": "a"}],
+                                                "comments": []}))
+        store.append([{"op": "post", "post": {"post_id": 1, "title": "b"}}])
+        with open(store.delta_path, "a", encoding="utf-8") as f:
+            f.write('{"op": "post_delete", "po')
+
+        state = store.load()
+
+        assert state.posts[1]["title"] == "b"
+
+    def test_apply_is_idempotent(self):
+        """
+        [확인] 같은 변경을 두 번 적용해도 결과가 같음 (압축 중 중단 대비)
+        """
+        deltas = [
+            {"op": "post", "post": {"post_id": 2}},
+            {"op": "comments", "post_id": 2, "comments": [{"comment_id": 1, "post_id": 2}]},
+            {"op": "post_delete", "post_id": 1},
+        ]
+        once = BoardState.from_snapshot({"posts": [{"post_id": 1}], "comments": []})
+        twice = BoardState.from_snapshot({"posts": [{"post_id": 1}], "comments": []})
+        for delta in deltas:
+            once.apply(delta)
+        for delta in deltas + deltas:
+            twice.apply(delta)
+
+        assert once.to_snapshot() == twice.to_snapshot()
+        assert [p["post_id"] for p in once.to_snapshot()["posts"]] == [2]
+
+    def test_cli_sync_and_export(self, tmp_path):
+        """
+        [확인] CLI sync - 두 번째 실행은 증분, --export로 스냅샷 파일 저장
+        """
+        path = str(tmp_path / "board.db")
+        cli.main(["dataset", "--sqlite", path, "--posts", "40", "--users", "5"], stdout=io.StringIO())
+        args = ["--standin", path, "sync", "--dir", str(tmp_path / "sync")]
+
+        first, second = io.StringIO(), io.StringIO()
+        assert cli.main(args, stdout=first) == 0
+        assert cli.main(args + ["--export", str(tmp_path / "out.json")], stdout=second) == 0
+
+        assert json.loads(first.getvalue())["full"] is True
+        assert json.loads(second.getvalue())["full"] is False
+        assert len(snapshot.load(str(tmp_path / "out.json"))["posts"]) == 40
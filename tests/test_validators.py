@@ -0,0 +1,127 @@
+"""
+입력 / 응답 유효성 검사 모듈 테스트 케이스
+
+테스트 대상:
+- console.validators 입력 검증 (conftest fixture와 동일한 함수)
+- 게시글 / 댓글 목록 응답 구조 검사
+- 정규식 구현과의 결과 일치 (사전 컴파일 / 한 번 훑기 구현)
+"""
+import re
+
+from console import bench, validators
+
+
+def reference_password(password):
+    """정규식 6회 검사 방식의 기준 구현"""
+    if not password:
+        return {"valid": False, "errors": ["비밀번호를 입력해주세요"]}
+    errors = []
+    if len(password) < 8:
+        errors.append("8자 이상이어야 합니다")
+    if len(password) > 20:
+        errors.append("20자 이하여야 합니다")
+    if not re.search(r'[A-Z]', password):
+        errors.append("대문자가 필요합니다")
+    if not re.search(r'[a-z]', password):
+        errors.append("소문자가 필요합니다")
+    if not re.search(r'[0-9]', password):
+        errors.append("숫자가 필요합니다")
+    if not re.search(r'[!@#$%^&*()\-_=+\[\]{}|;:\'",.<>/?`~]', password):
+        errors.append("특수문자가 필요합니다")
+    return {"valid": len(errors) == 0, "errors": errors}
+
+
+class TestInputValidators:
+    """입력 검증 테스트"""
+
+    def test_fixtures_share_module_functions(self, email_validator, password_validator, nickname_validator):
+        """
+        [확인] conftest fixture는 console.validators 함수를 그대로 사용
+        """
+        assert email_validator is validators.validate_email
+        assert password_validator is validators.validate_password
+        assert nickname_validator is validators.validate_nickname
+
+    def test_email_rejects_non_string(self):
+        """
+        [실패] 문자열이 아닌 이메일
+        """
+        assert not validators.validate_email(None)
+        assert not validators.validate_email(123)
+
+    def test_password_collects_all_errors(self):
+        """
+        [실패] 규칙 위반을 모두 수집
+        """
+        result = validators.validate_password("abc")
+
+        assert not result["valid"]
+        assert result["errors"] == [
+            "8자 이상이어야 합니다",
+            "대문자가 필요합니다",
+            "숫자가 필요합니다",
+            "특수문자가 필요합니다",
+        ]
+
+
+class TestResponseChecks:
+    """응답 구조 검사 테스트"""
+
+    def test_posts_response_ok(self, mock_posts_list_response):
+        """
+        [성공] 정상 게시글 목록 응답 (id를 post_id 대신 사용하는 응답 포함)
+        """
+        assert validators.check_posts_response(mock_posts_list_response) == []
+
+    def test_posts_response_missing_field(self, mock_posts_list_response):
+        """
+        [실패] 게시글 필수 필드 누락 위치 보고
+        """
+        del mock_posts_list_response["data"]["posts"][1]["title"]
+
+        assert validators.check_posts_response(mock_posts_list_response) == ["posts[1].title 없음"]
+
+    def test_envelope_problems(self):
+        """
+        [실패] 봉투 구조 / message 불일치
+        """
+        assert validators.check_envelope([]) == ["응답이 객체가 아닙니다"]
+        assert validators.check_envelope({"message": "x"}) == ["data 없음"]
+        assert validators.check_posts_response({"message": "error", "data": None})
+
+    def test_comments_response(self):
+        """
+        [확인] 댓글 목록 응답 검사
+        """
+        body = {"message": "get_comments_success", "data": {"comments": [{"comment_id": 1}]}}
+
+        assert validators.check_comments_response(body) == ["comments[0].content 없음"]
+
+
+class TestRegexParity:
+    """정규식 구현과의 결과 일치 테스트"""
+
+    EDGE_PASSWORDS = [
+        "Ａbcdefg1!",      # 전각 대문자는 대문자가 아님
+        "Abcdefg٣!",       # 아라비아 숫자는 숫자가 아님
+        "Abcdefg1\\",     # 역슬래시는 특수문자가 아님
+        "Abcdefg1-",
+        "Abcdefg1]",
+        "ABCDEFG1!",
+        "비밀번호Aa1!",
+    ]
+
+    def test_password_matches_regex_implementation(self):
+        """
+        [확인] 생성 코퍼스 + 경계 입력에서 정규식 구현과 같은 결과 / 오류 순서
+        """
+        for password in bench.password_corpus(5000, seed=3) + self.EDGE_PASSWORDS:
+            assert validators.validate_password(password) == reference_password(password), password
+
+    def test_email_matches_regex_implementation(self):
+        """
+        [확인] 사전 컴파일한 패턴과 re.fullmatch 결과 일치 (끝 줄바꿈은 JavaScript처럼 거부)
+        """
+        for email in bench.email_corpus(5000, seed=3) + ["a@b.co\n", "a@b.c"]:
+            assert validators.validate_email(email) == bool(re.fullmatch(validators.EMAIL_PATTERN, email)), email
+        assert not validators.validate_email("a@b.co\n")